@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Branch-wide component diff benchmark against the local API stand-in.
+
+Serves ComponentMetadata for the components of two branches and answers
+ComponentDiffRequest with a synthetic diff after a fixed latency. Compares
+the changed components of the feature branch with main three ways: one
+``create_component_diff_request`` after another (as the version compare
+examples do), ComponentDiffEngine.diff over the same version pairs, and the
+same diff again, which the engine answers from its cache. Then runs
+ComponentDiffEngine.diff_branches, which resolves the versions itself, and
+checks that every approach reports the same changes.
+
+Usage:
+    python benchmarks/component_diff_engine.py
+    python benchmarks/component_diff_engine.py --components 2000 --latency 0.1
+"""
+
+import argparse
+import os
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import ComponentDiffEngine, RateLimiter
+from boomi.helpers.component_diff import generic_diff_of
+from boomi.models import ComponentDiffRequest
+
+from local_api import LocalApi
+
+
+def branch_metadata(components: int):
+    """Main and feature branch metadata: 60% unchanged, 30% changed, 5% new, 5% removed."""
+    main, feature = [], []
+    for index in range(components):
+        record = {"@type": "ComponentMetadata", "componentId": f"component-{index:05d}", "version": 3,
+                  "name": f"Component {index}", "type": ("process", "transform.map", "profile.json")[index % 3],
+                  "currentVersion": "true", "deleted": "false"}
+        bucket = index % 20
+        if bucket < 19:
+            main.append(dict(record, branchId="main"))
+        if bucket == 19:
+            feature.append(dict(record, branchId="feature", version=1))
+        elif bucket == 18:
+            continue
+        else:
+            feature.append(dict(record, branchId="feature", version=3 if bucket < 12 else 4 + bucket % 3))
+    return main, feature
+
+
+def diff_response(request):
+    body = request.json()
+    seed = zlib.crc32(f"{body['componentId']}:{body['sourceVersion']}:{body['targetVersion']}".encode())
+    additions = [{"type": "element", "changedParticleName": "shape",
+                  "elementKey": {"elementName": "shape", "key-part": {"attribute": "name", "value": f"shape{i}"}},
+                  "newValue": "<shape/>"} for i in range(seed % 4)]
+    modifications = [{"type": "attribute", "changedParticleName": "x",
+                      "elementKey": {"elementName": "shape"}, "newValue": str(i + 1), "oldValue": str(i)}
+                     for i in range(1 + seed % 3)]
+    document = {"@type": "ComponentDiffResponse", "message": "ok",
+                "GenericDiff": {"addition": {"total": len(additions), "change": additions},
+                                "deletion": {"total": 0},
+                                "modification": {"total": len(modifications), "change": modifications}}}
+    return 200, "application/json", {"ComponentDiffResponse": document}
+
+
+def totals(response):
+    generic_diff = generic_diff_of(response)
+    return tuple(getattr(getattr(generic_diff, kind, None), "total", 0) or 0
+                 for kind in ("addition", "deletion", "modification"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--components", type=int, default=400, help="Components on the branches")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every API response")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    main_branch, feature_branch = branch_metadata(args.components)
+    versions = {(record["branchId"], record["componentId"]): record["version"]
+                for record in main_branch + feature_branch}
+    pairs = [
+        (record["componentId"], record["version"], versions[("feature", record["componentId"])])
+        for record in main_branch
+        if ("feature", record["componentId"]) in versions
+        and versions[("feature", record["componentId"])] != record["version"]
+    ]
+
+    with LocalApi(latency=args.latency) as api:
+        api.add_query_object("ComponentMetadata", main_branch + feature_branch, "componentId")
+        api.route("POST", "/ComponentDiffRequest", diff_response)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+
+        started = time.monotonic()
+        serial = {
+            component_id: totals(sdk.component_diff_request.create_component_diff_request(
+                ComponentDiffRequest(component_id=component_id, source_version=source, target_version=target)
+            ))
+            for component_id, source, target in pairs
+        }
+        serial_elapsed = time.monotonic() - started
+
+        engine = ComponentDiffEngine(sdk, max_workers=args.workers, rate_limiter=RateLimiter(None))
+        report = engine.diff(pairs)
+        cached = engine.diff(pairs)
+        branches = ComponentDiffEngine(sdk, max_workers=args.workers, rate_limiter=RateLimiter(None)).diff_branches(
+            "main", "feature"
+        )
+
+    def by_component(diff_report):
+        return {
+            diff.component_id: tuple(diff.totals[kind] for kind in ("addition", "deletion", "modification"))
+            for diff in diff_report
+            if diff.status == "changed"
+        }
+
+    print(f"components         {args.components} ({len(pairs)} with differing versions)")
+    print(f"serial             {serial_elapsed:6.2f} s {len(pairs):5d} requests")
+    print(f"engine             {report.elapsed:6.2f} s {report.requests:5d} requests "
+          f"{serial_elapsed / report.elapsed:6.1f}x")
+    print(f"engine, cached     {cached.elapsed:6.2f} s {cached.requests:5d} requests, {cached.cache_hits} cache hits")
+    print(f"diff_branches      {branches.elapsed:6.2f} s {branches.requests:5d} requests ({branches.counts()})")
+    print(f"changes            {report.totals()}")
+    exact = (
+        report.ok
+        and by_component(report) == by_component(cached) == by_component(branches) == serial
+        and cached.requests == 0
+        and branches.counts().get("added") == branches.counts().get("removed") == args.components // 20
+        and sum(counts.get("addition", 0) for counts in report.by_element().values()) == report.totals()["addition"]
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+HTTP compression benchmark against the local API stand-in on an emulated slow link.
+
+Runs three transfer-heavy workloads with compression off and on:
+
+* query   - pages through AuditLog records (large JSON responses),
+* update  - sends large EnvironmentExtensions updates (large JSON requests),
+* download - streams connector documents to files (large XML downloads).
+
+The server gzips responses for clients that accept it and every body costs
+``size / bandwidth`` seconds, so the report shows the bytes on the wire and the
+wall-clock time of each workload. The results of both runs are checked to be
+identical.
+
+Usage:
+    python benchmarks/compression_transfer.py
+    python benchmarks/compression_transfer.py --bandwidth 500000 --records 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi, Compression
+from boomi.helpers import iter_query
+from boomi.models import AuditLogQueryConfig, ConnectorDocument, EnvironmentExtensions
+
+from local_api import LocalApi, audit_log_records
+
+
+def extensions_document(environment_id: str, connections: int = 20, fields: int = 10):
+    return {
+        "environmentId": environment_id,
+        "id": environment_id,
+        "partial": False,
+        "connections": {
+            "connection": [
+                {
+                    "id": f"connection-{c}",
+                    "name": f"Connection {c}",
+                    "field": [
+                        {"id": f"field-{f}", "value": f"https://host-{c}.example.com/path/{f}", "useDefault": False}
+                        for f in range(fields)
+                    ],
+                }
+                for c in range(connections)
+            ]
+        },
+    }
+
+
+def document_payload(size: int) -> bytes:
+    line = "<Order><Id>{:08d}</Id><Customer>ACME Corporation</Customer><Status>SHIPPED</Status></Order>\n"
+    lines, total, index = [], 0, 0
+    while total < size:
+        text = line.format(index)
+        lines.append(text)
+        total += len(text)
+        index += 1
+    return "".join(lines).encode("utf-8")
+
+
+def run(args, compression: Compression, server_compress: bool, payload: bytes):
+    results = {}
+    with LocalApi(latency=args.latency, compress=server_compress, bandwidth=args.bandwidth) as api:
+        api.add_query_object("AuditLog", audit_log_records(args.records), "date")
+        api.route(
+            "POST",
+            "/EnvironmentExtensions/*",
+            lambda request: (200, "application/json", {
+                "@type": "EnvironmentExtensions",
+                "environmentId": request.json()["environmentId"],
+            }),
+        )
+        api.route(
+            "POST",
+            "/ConnectorDocument",
+            lambda request: (200, "application/json", {
+                "@type": "ConnectorDocumentDownload",
+                "statusCode": "202",
+                "url": f"{api.base_url}/download/{request.json()['genericConnectorRecordId']}",
+            }),
+        )
+        api.route("GET", "/download/*", lambda request: (200, "application/xml", payload))
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url, compression=compression)
+
+        def _measure(name, workload):
+            received, sent = api.bytes_received, api.bytes_sent
+            started = time.monotonic()
+            output = workload()
+            results[name] = (
+                time.monotonic() - started,
+                api.bytes_received - received + api.bytes_sent - sent,
+                output,
+            )
+
+        _measure("query", lambda: [record.document_id for record in iter_query(sdk.audit_log, AuditLogQueryConfig())])
+        _measure(
+            "update",
+            lambda: [
+                sdk.environment_extensions.update_environment_extensions(
+                    f"environment-{e}", EnvironmentExtensions._unmap(extensions_document(f"environment-{e}"))
+                ).environment_id
+                for e in range(args.updates)
+            ],
+        )
+
+        def _download():
+            with tempfile.TemporaryDirectory() as directory:
+                sizes = []
+                for d in range(args.downloads):
+                    path = os.path.join(directory, f"document-{d}.xml")
+                    sdk.connector_document.download_connector_document_to_file(
+                        path,
+                        request_body=ConnectorDocument(generic_connector_record_id=f"record-{d}"),
+                        initial_delay=0.0,
+                    )
+                    with open(path, "rb") as file:
+                        sizes.append(file.read() == payload)
+                return sizes
+
+        _measure("download", _download)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=5_000, help="AuditLog records to page through")
+    parser.add_argument("--updates", type=int, default=20, help="EnvironmentExtensions updates to send")
+    parser.add_argument("--downloads", type=int, default=5, help="Connector documents to download")
+    parser.add_argument("--document-bytes", type=int, default=1024 * 1024)
+    parser.add_argument("--bandwidth", type=float, default=2_000_000, help="Emulated link speed in bytes/s")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds added to every API response")
+    args = parser.parse_args()
+
+    payload = document_payload(args.document_bytes)
+    plain = run(args, Compression(responses=False), False, payload)
+    compressed = run(args, Compression(responses=True, requests=True, min_request_size=1024), True, payload)
+
+    print(f"{'workload':<10} {'plain':>22} {'compressed':>22} {'bytes':>8} {'speedup':>8}")
+    exact = True
+    for name in ("query", "update", "download"):
+        plain_elapsed, plain_bytes, plain_output = plain[name]
+        elapsed, wire_bytes, output = compressed[name]
+        print(
+            f"{name:<10} {plain_elapsed:>7.2f} s {plain_bytes / 1e6:>8.2f} MB "
+            f"{elapsed:>7.2f} s {wire_bytes / 1e6:>8.2f} MB "
+            f"{wire_bytes / plain_bytes:>7.0%} {plain_elapsed / elapsed:>7.1f}x"
+        )
+        exact = exact and output == plain_output and all(output)
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
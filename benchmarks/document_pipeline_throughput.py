@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Connector-document retrieval benchmark against the local API stand-in.
+
+Retrieves every connector document of a set of executions twice: once hop by
+hop (ExecutionConnector query, GenericConnectorRecord query, ConnectorDocument
+download, one request at a time, as in
+examples/09_monitor_validate/full_document_retrieval_chain.py) and once with
+ConnectorDocumentPipeline, then reports both wall-clock times and checks that
+the downloaded files are identical.
+
+Usage:
+    python benchmarks/document_pipeline_throughput.py
+    python benchmarks/document_pipeline_throughput.py --executions 1000 --latency 0.05
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import ConnectorDocumentPipeline, RateLimiter, iter_query
+from boomi.models import (
+    ConnectorDocument,
+    ExecutionConnectorQueryConfig,
+    ExecutionConnectorQueryConfigQueryFilter,
+    ExecutionConnectorSimpleExpression,
+    GenericConnectorRecordGroupingExpression,
+    GenericConnectorRecordQueryConfig,
+    GenericConnectorRecordQueryConfigQueryFilter,
+    GenericConnectorRecordSimpleExpression,
+)
+
+from local_api import LocalApi
+
+
+def connector_records(executions: int, connectors: int):
+    return [
+        {
+            "@type": "ExecutionConnector",
+            "actionType": "Send" if c else "Get",
+            "connectorType": "http",
+            "errorCount": 1,
+            "executionId": f"execution-{e}",
+            "id": f"connector-{e}-{c}",
+            "isStartShape": c == 0,
+            "recordType": "tracked",
+            "successCount": 1,
+        }
+        for e in range(executions)
+        for c in range(connectors)
+    ]
+
+
+def document_records(executions: int, connectors: int, documents: int):
+    return [
+        {
+            "@type": "GenericConnectorRecord",
+            "connectionName": "HTTP Client",
+            "executionConnectorId": f"connector-{e}-{c}",
+            "executionId": f"execution-{e}",
+            "id": f"record-{e}-{c}-{d}",
+            "operationName": "POST order",
+            "status": "ERROR" if d == 0 else "SUCCESS",
+        }
+        for e in range(executions)
+        for c in range(connectors)
+        for d in range(documents)
+    ]
+
+
+def sequential(sdk: Boomi, execution_ids, directory: str) -> None:
+    """Walk the chain one request at a time."""
+    for execution_id in execution_ids:
+        connectors = iter_query(
+            sdk.execution_connector,
+            ExecutionConnectorQueryConfig(
+                query_filter=ExecutionConnectorQueryConfigQueryFilter(
+                    expression=ExecutionConnectorSimpleExpression(
+                        operator="EQUALS", property="executionId", argument=[execution_id]
+                    )
+                )
+            ),
+        )
+        for connector in connectors:
+            records = iter_query(
+                sdk.generic_connector_record,
+                GenericConnectorRecordQueryConfig(
+                    query_filter=GenericConnectorRecordQueryConfigQueryFilter(
+                        expression=GenericConnectorRecordGroupingExpression(
+                            operator="and",
+                            nested_expression=[
+                                GenericConnectorRecordSimpleExpression(
+                                    operator="EQUALS", property="executionId", argument=[execution_id]
+                                ),
+                                GenericConnectorRecordSimpleExpression(
+                                    operator="EQUALS",
+                                    property="executionConnectorId",
+                                    argument=[connector.id_],
+                                ),
+                            ],
+                        )
+                    )
+                ),
+            )
+            for record in records:
+                path = os.path.join(directory, execution_id, record.id_)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                sdk.connector_document.download_connector_document_to_file(
+                    path, request_body=ConnectorDocument(generic_connector_record_id=record.id_)
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--executions", type=int, default=100)
+    parser.add_argument("--connectors", type=int, default=2, help="Connectors per execution")
+    parser.add_argument("--documents", type=int, default=3, help="Documents per connector")
+    parser.add_argument("--document-bytes", type=int, default=256 * 1024)
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds added to every API response")
+    parser.add_argument("--workers", type=int, default=8, help="Download workers")
+    args = parser.parse_args()
+
+    payload = os.urandom(args.document_bytes)
+    execution_ids = [f"execution-{e}" for e in range(args.executions)]
+
+    with LocalApi(latency=args.latency) as api:
+        api.add_query_object("ExecutionConnector", connector_records(args.executions, args.connectors))
+        api.add_query_object(
+            "GenericConnectorRecord", document_records(args.executions, args.connectors, args.documents)
+        )
+        api.route(
+            "POST",
+            "/ConnectorDocument",
+            lambda request: (200, "application/json", {
+                "@type": "ConnectorDocumentDownload",
+                "statusCode": "202",
+                "url": f"{api.base_url}/download/{request.json()['genericConnectorRecordId']}",
+            }),
+        )
+        api.route("GET", "/download/*", lambda request: (200, "application/octet-stream", payload))
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        documents = args.executions * args.connectors * args.documents
+
+        with tempfile.TemporaryDirectory() as sequential_directory, \
+                tempfile.TemporaryDirectory() as pipeline_directory:
+            started = time.monotonic()
+            sequential(sdk, execution_ids, sequential_directory)
+            sequential_elapsed = time.monotonic() - started
+
+            pipeline = ConnectorDocumentPipeline(
+                sdk,
+                pipeline_directory,
+                download_workers=args.workers,
+                initial_delay=0.0,
+                rate_limiter=RateLimiter(None),
+            )
+            report = pipeline.run(execution_ids)
+
+            print(f"documents          {documents} x {args.document_bytes / 1024:.0f} KiB")
+            print(f"sequential         {sequential_elapsed:.2f} s ({documents / sequential_elapsed:,.0f} documents/s)")
+            print(f"pipeline           {report.elapsed:.2f} s ({documents / report.elapsed:,.0f} documents/s)")
+            print(f"speedup            {sequential_elapsed / report.elapsed:.1f}x")
+
+            expected = {
+                os.path.relpath(os.path.join(root, name), sequential_directory)
+                for root, _, names in os.walk(sequential_directory)
+                for name in names
+            }
+            actual = {
+                os.path.relpath(os.path.join(root, name), pipeline_directory)
+                for root, _, names in os.walk(pipeline_directory)
+                for name in names
+            }
+            exact = (
+                not report.failures
+                and report.downloaded == documents
+                and expected == actual
+                and len(actual) == documents
+            )
+            print(f"output check       {'ok' if exact else 'FAILED'} ({report})")
+            if not exact:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+ExecutionRecord analytics and columnar export benchmark against the local
+API stand-in.
+
+Serves the same synthetic ExecutionRecord history twice: once with plain
+numbers and once with the duration and document sizes in the API's long
+form (``["Long", 1234]``). Folds both into ``ExecutionAnalytics`` straight
+from the raw query pages, and exports both with ``iter_column_batches``;
+reports records/s of each.
+
+Verifies that both forms produce the same per-process report, histogram and
+columns, so long values are neither dropped, nulled nor fail the run.
+
+Usage:
+    python benchmarks/execution_analytics.py
+    python benchmarks/execution_analytics.py --records 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import ExecutionAnalytics, iter_column_batches
+
+from local_api import LocalApi, execution_records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000, help="ExecutionRecord records served")
+    args = parser.parse_args()
+
+    results = {}
+    for form, long_form in (("plain", False), ("long", True)):
+        with LocalApi() as api:
+            api.add_query_object("ExecutionRecord", execution_records(args.records, long_form=long_form),
+                                 "executionTime")
+            sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+
+            analytics = ExecutionAnalytics()
+            started = time.perf_counter()
+            analytics.add_query(sdk.execution_record)
+            analytics_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            batches = list(iter_column_batches(sdk.execution_record, chunk_size=None))
+            results[form] = (analytics, analytics_time, batches, time.perf_counter() - started)
+
+    print(f"records            {args.records} ExecutionRecord records")
+    for form, (_, analytics_time, _, export_time) in results.items():
+        print(f"  {form:16} analytics {args.records / analytics_time:9.0f} records/s  "
+              f"columnar {args.records / export_time:9.0f} records/s")
+
+    plain, long = results["plain"][0], results["long"][0]
+    plain_batch, long_batch = results["plain"][2][0], results["long"][2][0]
+    executions = sum(summary["executions"] for summary in plain.report().values())
+    exact = (
+        executions == args.records
+        and long.report() == plain.report()
+        and long.histogram() == plain.histogram()
+        and all(summary["elapsed_p50"] for summary in long.report().values())
+        and long_batch.to_pydict() == plain_batch.to_pydict()
+        and long_batch["execution_duration"].count() == args.records
+        and not long_batch.invalid
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Environment extensions sync benchmark against the local API stand-in.
+
+Serves extensions documents (connections with fields, properties and process
+property components) for many environments and brings them to a desired state
+twice: once by re-pushing the full desired document to every environment, one
+request at a time, and once with EnvironmentExtensionsSync, which fetches
+concurrently and sends partial updates to the environments that differ. Then
+runs the sync again to show that unchanged environments are skipped from the
+cache, and checks that both approaches end in the same state.
+
+Usage:
+    python benchmarks/extensions_sync.py
+    python benchmarks/extensions_sync.py --environments 500 --changed-share 0.05 --latency 0.05
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import time
+
+from boomi import Boomi
+from boomi.helpers import EnvironmentExtensionsSync, RateLimiter
+from boomi.models import EnvironmentExtensions
+
+from local_api import LocalApi
+
+
+def extensions_document(environment_id: str, connections: int, fields: int, properties: int):
+    return {
+        "@type": "EnvironmentExtensions",
+        "environmentId": environment_id,
+        "id": environment_id,
+        "connections": {
+            "@type": "Connections",
+            "connection": [
+                {
+                    "@type": "Connection",
+                    "id": f"connection-{c}",
+                    "name": f"Connection {c}",
+                    "field": [
+                        {
+                            "@type": "Field",
+                            "id": f"field-{f}",
+                            "value": f"value-{c}-{f}",
+                            "useDefault": False,
+                            "usesEncryption": False,
+                            "componentOverride": False,
+                        }
+                        for f in range(fields)
+                    ],
+                }
+                for c in range(connections)
+            ],
+        },
+        "properties": {
+            "@type": "Properties",
+            "property": [{"@type": "Property", "name": f"property.{p}", "value": f"{p}"} for p in range(properties)],
+        },
+        "processProperties": {
+            "@type": "OverrideProcessProperties",
+            "ProcessProperty": [
+                {
+                    "@type": "OverrideProcessProperty",
+                    "id": "process-properties-1",
+                    "name": "Settings",
+                    "ProcessPropertyValue": [
+                        {"@type": "ProcessPropertyValue", "key": f"key-{k}", "value": f"{k}", "useDefault": False}
+                        for k in range(10)
+                    ],
+                }
+            ],
+        },
+    }
+
+
+def desired_document(document, changed: bool):
+    desired = copy.deepcopy(document)
+    for key in ("@type", "environmentId", "id"):
+        desired.pop(key)
+    if changed:
+        desired["connections"]["connection"][0]["field"][0]["value"] = "https://new.example.com"
+        desired["properties"]["property"][-1]["value"] = "changed"
+        desired["processProperties"]["ProcessProperty"][0]["ProcessPropertyValue"][3]["value"] = "changed"
+    return desired
+
+
+def merge_by(current, desired, identity, nested=None):
+    merged = {item[identity]: item for item in current}
+    for item in desired:
+        if item[identity] in merged and nested:
+            target = dict(merged[item[identity]])
+            for key, value in item.items():
+                if key in nested:
+                    target[key] = merge_by(target.get(key, []), value, *nested[key])
+                else:
+                    target[key] = value
+            merged[item[identity]] = target
+        else:
+            merged[item[identity]] = item
+    return list(merged.values())
+
+
+def strip_types(value):
+    if isinstance(value, dict):
+        return {key: strip_types(item) for key, item in value.items() if not key.startswith("@")}
+    if isinstance(value, list):
+        return [strip_types(item) for item in value]
+    return value
+
+
+SECTIONS = (
+    ("connections", "connection", "id", {"field": ("id",)}),
+    ("properties", "property", "name", None),
+    ("processProperties", "ProcessProperty", "id", None),
+)
+
+
+class Account:
+    """The extensions stored by the stand-in account."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def serve(self, api: LocalApi) -> None:
+        def _get(request):
+            id_ = request.path.rsplit("/", 1)[1]
+            with self._lock:
+                return 200, "application/json", copy.deepcopy(self.documents[id_])
+
+        def _update(request):
+            id_ = request.path.rsplit("/", 1)[1]
+            body = request.json()
+            with self._lock:
+                self.bytes_received += len(request.body)
+                document = self.documents[id_]
+                if not body.get("partial"):
+                    document = {"@type": "EnvironmentExtensions", "environmentId": id_, "id": id_}
+                for section, list_key, identity, nested in SECTIONS:
+                    if section in body:
+                        target = document.setdefault(section, {list_key: []})
+                        target[list_key] = merge_by(
+                            target.get(list_key, []), body[section][list_key], identity, nested
+                        )
+                self.documents[id_] = document
+                return 200, "application/json", document
+
+        api.route("GET", "/EnvironmentExtensions/*", _get)
+        api.route("POST", "/EnvironmentExtensions/*", _update)
+
+    def state(self):
+        with self._lock:
+            return json.dumps(strip_types(self.documents), sort_keys=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--environments", type=int, default=100)
+    parser.add_argument("--connections", type=int, default=20, help="Connections per environment")
+    parser.add_argument("--fields", type=int, default=10, help="Fields per connection")
+    parser.add_argument("--properties", type=int, default=100, help="Properties per environment")
+    parser.add_argument("--changed-share", type=float, default=0.1, help="Share of environments that drifted")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every API response")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    environment_ids = [f"environment-{e}" for e in range(args.environments)]
+    documents = {
+        id_: extensions_document(id_, args.connections, args.fields, args.properties) for id_ in environment_ids
+    }
+    changed = set(environment_ids[: int(args.environments * args.changed_share)])
+    desired = {id_: desired_document(documents[id_], id_ in changed) for id_ in environment_ids}
+
+    full_push = Account(copy.deepcopy(documents))
+    with LocalApi(latency=args.latency) as api:
+        full_push.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        started = time.monotonic()
+        for id_ in environment_ids:
+            sdk.environment_extensions.update_environment_extensions(
+                id_, EnvironmentExtensions._unmap(dict(desired[id_], partial=False))
+            )
+        full_elapsed = time.monotonic() - started
+
+    synced = Account(copy.deepcopy(documents))
+    with LocalApi(latency=args.latency) as api, tempfile.TemporaryDirectory() as directory:
+        synced.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        sync = EnvironmentExtensionsSync(
+            sdk,
+            max_workers=args.workers,
+            cache_path=os.path.join(directory, "cache.json"),
+            rate_limiter=RateLimiter(None),
+        )
+        report = sync.apply(desired)
+        requests = sum(api.request_counts.values())
+
+        rerun = EnvironmentExtensionsSync(
+            sdk, cache_path=os.path.join(directory, "cache.json"), rate_limiter=RateLimiter(None)
+        ).apply(desired)
+        rerun_requests = sum(api.request_counts.values()) - requests
+
+    print(f"environments       {args.environments} ({len(changed)} drifted)")
+    print(f"full push          {full_elapsed:.2f} s, {args.environments} requests, "
+          f"{full_push.bytes_received / 1e6:.2f} MB sent")
+    print(f"sync               {report.elapsed:.2f} s, {requests} requests, "
+          f"{synced.bytes_received / 1e6:.3f} MB sent")
+    print(f"cached rerun       {rerun.elapsed:.3f} s, {rerun_requests} requests ({rerun.counts()})")
+    print(f"speedup            {full_elapsed / report.elapsed:.1f}x")
+    exact = (
+        report.ok
+        and report.counts() == {"updated": len(changed), "unchanged": args.environments - len(changed)}
+        and rerun.counts() == {"cached": args.environments}
+        and synced.state() == full_push.state()
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'} ({report})")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Folder tree materialization benchmark against the local API stand-in.
+
+Serves the Folder query over a synthetic account hierarchy. Builds the tree
+the way the folder structure example walks it, one ``query_folder`` per
+parent folder, and with FolderTreeCache, which reads every folder with one
+paged sweep. Then resolves component placements by path: with a
+``fullPath`` query per placement, and from the cached tree, including
+placements under folders that do not exist yet (created with ``ensure``).
+Verifies both trees hold the same folders and paths, and that every
+placement resolves to the same folder.
+
+Usage:
+    python benchmarks/folder_tree.py
+    python benchmarks/folder_tree.py --fanout 8 --depth 4 --latency 0.05
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import FolderTreeCache, RateLimiter, iter_query
+from boomi.models import FolderQueryConfig, FolderQueryConfigQueryFilter, FolderSimpleExpression
+
+from local_api import LocalApi
+
+ROOT_ID = "Rjo3NzI1MjQ"
+ACCOUNT = "Example Account"
+
+
+def account_folders(fanout: int, depth: int, deleted_every: int = 25) -> List[Dict[str, Any]]:
+    """A root folder with ``fanout`` children per folder, ``depth`` levels deep."""
+    folders = [{"@type": "Folder", "id": ROOT_ID, "name": ACCOUNT, "fullPath": ACCOUNT, "deleted": "false"}]
+    level = [folders[0]]
+    for _ in range(depth):
+        next_level = []
+        for parent in level:
+            for child in range(fanout):
+                name = f"Folder {child}"
+                folder = {"@type": "Folder", "id": f"{parent['id']}.{child}", "name": name,
+                          "parentId": parent["id"], "parentName": parent["name"],
+                          "fullPath": f"{parent['fullPath']}/{name}",
+                          "deleted": "true" if len(folders) % deleted_every == 0 else "false"}
+                folders.append(folder)
+                next_level.append(folder)
+        level = next_level
+    return folders
+
+
+def query(property_: str, argument: str) -> FolderQueryConfig:
+    return FolderQueryConfig(query_filter=FolderQueryConfigQueryFilter(
+        expression=FolderSimpleExpression(operator="EQUALS", property=property_, argument=[argument])))
+
+
+def per_parent_tree(sdk: Any) -> Dict[str, str]:
+    """The per-parent walk: one query for each folder's children."""
+    paths = {ROOT_ID: ACCOUNT}
+    pending = [ROOT_ID]
+    while pending:
+        parent_id = pending.pop()
+        for folder in iter_query(sdk.folder, query("parentId", parent_id)):
+            paths[folder.id_] = folder.full_path
+            pending.append(folder.id_)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fanout", type=int, default=5, help="Child folders per folder")
+    parser.add_argument("--depth", type=int, default=4, help="Folder levels below the account root")
+    parser.add_argument("--placements", type=int, default=300, help="Components placed by path")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every API response")
+    args = parser.parse_args()
+
+    folders = account_folders(args.fanout, args.depth)
+    live_paths = [folder["fullPath"] for folder in folders if folder["deleted"] == "false"]
+    rng = random.Random(3)
+    placements = [rng.choice(live_paths)[len(ACCOUNT) + 1:] for _ in range(args.placements)]
+    new_paths = [f"Folder 0/Folder {args.fanout}/Inbound", "Releases/2026/Q4"]
+    created = []
+
+    def _create(request):
+        body = request.json()
+        parent = next(folder for folder in folders if folder["id"] == body["parentId"])
+        folder = {"@type": "Folder", "id": f"{parent['id']}.new{len(created)}", "name": body["name"],
+                  "parentId": parent["id"], "fullPath": f"{parent['fullPath']}/{body['name']}", "deleted": "false"}
+        created.append(folder)
+        folders.append(folder)
+        return 200, "application/json", folder
+
+    with LocalApi(latency=args.latency) as api:
+        api.add_query_object("Folder", folders)
+        api.route("POST", "/Folder", _create)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+
+        started = time.perf_counter()
+        walked = per_parent_tree(sdk)
+        walk_time = time.perf_counter() - started
+        walk_requests = sum(api.request_counts.values())
+
+        cache = FolderTreeCache(sdk, ttl=600, rate_limiter=RateLimiter(None))
+        started = time.perf_counter()
+        tree = cache.tree
+        sweep_time = time.perf_counter() - started
+        sweep_requests = cache.requests
+
+        before = sum(api.request_counts.values())
+        started = time.perf_counter()
+        queried = [next(iter_query(sdk.folder, query("fullPath", f"{ACCOUNT}/{path}"))).id_ for path in placements]
+        query_time = time.perf_counter() - started
+        query_requests = sum(api.request_counts.values()) - before
+
+        started = time.perf_counter()
+        placed = [cache.place({"name": f"Component {index}"}, path)["folderId"] for index, path in enumerate(placements)]
+        place_time = time.perf_counter() - started
+        cached_requests = cache.requests
+
+        ensured = [cache.ensure(path) for path in new_paths + new_paths]
+        subtree_started = time.perf_counter()
+        subtree = tree.subtree_ids("Folder 0")
+        subtree_time = time.perf_counter() - subtree_started
+
+    print(f"folders            {len(tree)} ({len(live_paths)} live), fanout {args.fanout}, depth {args.depth}")
+    print(f"  per-parent walk  {walk_time:8.2f} s {walk_requests:6d} requests")
+    print(f"  paged sweep      {sweep_time:8.2f} s {sweep_requests:6d} requests {walk_time / sweep_time:6.1f}x")
+    print(f"placements         {args.placements} components by path")
+    print(f"  fullPath query   {query_time:8.2f} s {query_requests:6d} requests")
+    print(f"  cached tree      {place_time * 1e3:8.2f} ms {cached_requests - sweep_requests:5d} requests")
+    print(f"  ensure           {len(created)} folders created for {len(new_paths)} new paths, twice")
+    print(f"  subtree          {len(subtree)} folders below Folder 0 in {subtree_time * 1e3:.2f} ms")
+
+    walked_live = {id_: path for id_, path in walked.items() if id_ in tree and not tree.get(id_).deleted}
+    exact = (
+        all(tree.get(id_).path == path for id_, path in walked.items())
+        and set(walked) == {node.id_ for node in tree} - {folder["id"] for folder in created}
+        and placed == queried
+        and len(created) == 5
+        and [node.id_ for node in ensured[:2]] == [node.id_ for node in ensured[2:]]
+        and all(tree.find(path) is node for path, node in zip(new_paths, ensured))
+        and set(subtree) <= set(walked_live) | {folder["id"] for folder in created}
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+JSON codec benchmark: response decoding, query paging and streamed pages.
+
+* decode - one large AuditLog query page decoded the way the transport used
+  to (``response.text`` then ``json.loads``), from bytes with the standard
+  library, and from bytes with the default codec (``orjson`` when installed);
+* paging - ``iter_raw_query_pages`` over the local API stand-in with zero
+  latency, with the standard library codec and with the default codec;
+* stream - one very large page read whole with ``iter_raw_query_pages`` and
+  decoded while it downloads with ``iter_raw_query_records``; reports the
+  peak memory allocated by each.
+
+Every variant is checked to decode the same records, and a float array fed
+to ``JsonArrayStream`` one byte at a time is checked to decode in full.
+
+Usage:
+    python benchmarks/json_codec.py
+    python benchmarks/json_codec.py --records 100000 --page-records 20000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi, JsonCodec, set_json_codec
+from boomi.helpers import iter_raw_query_pages, iter_raw_query_records
+from boomi.net.transport.json_codec import JsonArrayStream, get_json_codec
+
+from local_api import LocalApi, audit_log_records
+
+
+def best_of(repeat: int, function):
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def page_document(records):
+    return {"@type": "QueryResult", "numberOfResults": len(records), "result": records}
+
+
+def paging_run(records, page_size: int, codec):
+    set_json_codec(codec)
+    try:
+        with LocalApi(page_size=page_size) as api:
+            api.add_query_object("AuditLog", records, "date")
+            sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+            return best_of(
+                3,
+                lambda: [
+                    record["documentId"]
+                    for page in iter_raw_query_pages(sdk.audit_log)
+                    for record in page["result"]
+                ],
+            )
+    finally:
+        set_json_codec(None)
+
+
+def stream_run(payload: bytes, streamed: bool):
+    with LocalApi() as api:
+        api.route("POST", "/AuditLog/query", lambda request: (200, "application/json", payload))
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+
+        def _read():
+            if streamed:
+                return [record["documentId"] for record in iter_raw_query_records(sdk.audit_log)]
+            return [
+                record["documentId"]
+                for page in iter_raw_query_pages(sdk.audit_log)
+                for record in page["result"]
+            ]
+
+        elapsed, ids = best_of(3, _read)
+        # Peak memory is measured in a separate, slower traced run.
+        tracemalloc.start()
+        _read()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50_000, help="AuditLog records to page through")
+    parser.add_argument("--page-size", type=int, default=1_000, help="Records per query page")
+    parser.add_argument("--page-records", type=int, default=20_000, help="Records in the decode/stream page")
+    args = parser.parse_args()
+
+    records = audit_log_records(args.records)
+    payload = json.dumps(page_document(records[: args.page_records])).encode("utf-8")
+    default = get_json_codec()
+    stdlib = JsonCodec()
+    print(f"codec              {default.name}")
+
+    legacy_time, legacy = best_of(9, lambda: json.loads(payload.decode("utf-8")))
+    stdlib_time, from_bytes = best_of(9, lambda: stdlib.loads(payload))
+    codec_time, decoded = best_of(9, lambda: default.loads(payload))
+    megabytes = len(payload) / 1e6
+    print(f"decode             {megabytes:.1f} MB page")
+    print(f"  text + json      {legacy_time * 1e3:8.1f} ms {megabytes / legacy_time:8.0f} MB/s")
+    print(f"  bytes, json      {stdlib_time * 1e3:8.1f} ms {megabytes / stdlib_time:8.0f} MB/s")
+    print(f"  bytes, {default.name:<9} {codec_time * 1e3:8.1f} ms {megabytes / codec_time:8.0f} MB/s "
+          f"{legacy_time / codec_time:5.1f}x")
+
+    stdlib_paging, stdlib_ids = paging_run(records, args.page_size, stdlib)
+    codec_paging, codec_ids = paging_run(records, args.page_size, default)
+    print(f"paging             {args.records} records, {args.page_size} per page")
+    print(f"  json             {stdlib_paging:8.2f} s {args.records / stdlib_paging:8.0f} records/s")
+    print(f"  {default.name:<16} {codec_paging:8.2f} s {args.records / codec_paging:8.0f} records/s "
+          f"{stdlib_paging / codec_paging:5.1f}x")
+
+    whole_time, whole_peak, whole_ids = stream_run(payload, streamed=False)
+    stream_time, stream_peak, stream_ids = stream_run(payload, streamed=True)
+    print(f"stream             {args.page_records} records in one {megabytes:.1f} MB page")
+    print(f"  whole page       {whole_time:8.2f} s {whole_peak / 1e6:8.1f} MB peak")
+    print(f"  streamed         {stream_time:8.2f} s {stream_peak / 1e6:8.1f} MB peak")
+
+    # Numbers cut after ".", "e" or a sign must wait for the next chunk.
+    floats = [1.5, -2.25e-3, 3e+10, 0.0, -7, 12345.678E2, 4]
+    document = json.dumps({"result": floats, "numberOfResults": len(floats)}).encode("utf-8")
+    byte_chunks = [document[index:index + 1] for index in range(len(document))]
+    chunked = JsonArrayStream(byte_chunks, key="result")
+    bare = JsonArrayStream([b"[1.", b"5, 2e", b"3, -", b"4]"], key=None)
+    chunking = (
+        list(chunked) == floats
+        and chunked.fields == {"numberOfResults": len(floats)}
+        and list(bare) == [1.5, 2e3, -4]
+    )
+    print(f"1-byte chunks      {'ok' if chunking else 'FAILED'} ({len(floats)} floats)")
+
+    exact = (
+        chunking
+        and legacy == from_bytes == decoded
+        and stdlib_ids == codec_ids == [record["documentId"] for record in sorted(records, key=lambda r: r["date"])]
+        and whole_ids == stream_ids == [record["documentId"] for record in records[: args.page_records]]
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
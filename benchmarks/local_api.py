@@ -0,0 +1,331 @@
+"""Local, in-process stand-in for the Boomi Platform API used by the benchmarks.
+
+The server speaks just enough of the REST surface for the helpers under
+benchmark: ``{Object}/query`` and ``{Object}/queryMore`` with filter
+evaluation and paging over synthetic records, plus custom routes. It adds an
+optional fixed latency per request, and optionally gzips responses and
+emulates a link bandwidth, so results can be compared both with and without
+network cost.
+
+Usage:
+    with LocalApi(latency=0.005) as api:
+        api.add_query_object("AuditLog", audit_log_records(10_000), "date")
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+"""
+
+import gzip
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+Handler = Callable[["LocalRequest"], Tuple[int, str, Any]]
+
+
+class LocalRequest:
+    """One request received by :class:`LocalApi`."""
+
+    def __init__(self, method: str, path: str, headers: Any, body: bytes):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body or b"null")
+
+
+class LocalApi:
+    """
+    A threaded HTTP server emulating the Platform API on ``127.0.0.1``.
+
+    :ivar float latency: Seconds added to every response.
+    :ivar int page_size: Results per query page.
+    :ivar bool compress: Gzip responses of at least 1 KiB for clients accepting gzip.
+    :ivar Optional[float] bandwidth: Emulated link speed in bytes/s; request and
+        response bodies add ``size / bandwidth`` seconds to every response.
+    :ivar Dict[str, int] request_counts: Requests served per route.
+    :ivar int bytes_received: Request body bytes received, as sent on the wire.
+    :ivar int bytes_sent: Response body bytes sent, as sent on the wire.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        page_size: int = 100,
+        compress: bool = False,
+        bandwidth: Optional[float] = None,
+    ):
+        self.latency = latency
+        self.page_size = page_size
+        self.compress = compress
+        self.bandwidth = bandwidth
+        self.request_counts: Dict[str, int] = {}
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self._routes: Dict[Tuple[str, str], Handler] = {}
+        self._query_tokens: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+        self._token_counter = itertools.count()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """The base URL to pass to ``Boomi(base_url=...)``."""
+        return f"http://127.0.0.1:{self._server.server_port}/api/rest/v1/local"
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        """
+        Register a handler for ``method`` requests whose path ends with ``path``.
+
+        A path ending in ``/*`` matches every request below that prefix (e.g.
+        ``/download/*``). The handler returns ``(status, content_type, body)``; a ``dict`` or
+        ``list`` body is JSON-encoded.
+        """
+        self._routes[(method, path)] = handler
+
+    def add_query_object(
+        self, object_name: str, records: Iterable[Dict[str, Any]], sort_key: Optional[str] = None
+    ) -> None:
+        """Serve ``{object_name}/query`` and ``/queryMore`` over ``records``."""
+        records = list(records)
+        if sort_key:
+            records.sort(key=lambda record: record.get(sort_key) or "")
+
+        def _query(request: LocalRequest) -> Tuple[int, str, Any]:
+            query = request.json() or {}
+            expression = (query.get("QueryFilter") or {}).get("expression")
+            matches = [record for record in records if matches_expression(record, expression)]
+            return 200, "application/json", self._page(object_name, matches)
+
+        def _query_more(request: LocalRequest) -> Tuple[int, str, Any]:
+            token = request.body.decode("utf-8")
+            with self._lock:
+                entry = self._query_tokens.pop(token, None)
+            if entry is None:
+                return 400, "application/json", {"message": "Invalid query token"}
+            return 200, "application/json", self._page(object_name, entry[1])
+
+        self.route("POST", f"/{object_name}/query", _query)
+        self.route("POST", f"/{object_name}/queryMore", _query_more)
+
+    def start(self) -> "LocalApi":
+        api = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                wire_bytes = len(body)
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                path = self.path.split("?", 1)[0]
+                request = LocalRequest(self.command, path, self.headers, body)
+                status, content_type, payload = api._dispatch(request)
+                if isinstance(payload, (dict, list)):
+                    payload = json.dumps(payload).encode("utf-8")
+                elif isinstance(payload, str):
+                    payload = payload.encode("utf-8")
+                encoded = (
+                    api.compress
+                    and len(payload) >= 1024
+                    and "gzip" in (self.headers.get("Accept-Encoding") or "")
+                )
+                if encoded:
+                    payload = gzip.compress(payload, compresslevel=6)
+                wire_bytes += len(payload)
+                with api._lock:
+                    api.bytes_received += wire_bytes - len(payload)
+                    api.bytes_sent += len(payload)
+                delay = api.latency + (wire_bytes / api.bandwidth if api.bandwidth else 0.0)
+                if delay:
+                    time.sleep(delay)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                if encoded:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        class _Server(ThreadingHTTPServer):
+            # The default backlog of 5 refuses connections under concurrent load.
+            request_queue_size = 256
+
+        self._server = _Server(("127.0.0.1", 0), _RequestHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalApi":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _dispatch(self, request: LocalRequest) -> Tuple[int, str, Any]:
+        for (method, suffix), handler in self._routes.items():
+            if method != request.method:
+                continue
+            if suffix.endswith("/*"):
+                matched = suffix[:-1] in request.path
+            else:
+                matched = request.path.endswith(suffix)
+            if matched:
+                with self._lock:
+                    self.request_counts[suffix] = self.request_counts.get(suffix, 0) + 1
+                return handler(request)
+        return 404, "application/json", {"message": f"No route for {request.path}"}
+
+    def _page(self, object_name: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        page, rest = records[: self.page_size], records[self.page_size :]
+        response: Dict[str, Any] = {
+            "@type": "QueryResult",
+            "numberOfResults": len(records),
+            "result": page,
+        }
+        if rest:
+            token = f"{object_name}-{next(self._token_counter)}"
+            with self._lock:
+                self._query_tokens[token] = (object_name, rest)
+            response["queryToken"] = token
+        return response
+
+
+def matches_expression(record: Dict[str, Any], expression: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a Platform API query expression against one record."""
+    if not expression:
+        return True
+    operator = expression.get("operator", "").upper()
+    if "nestedExpression" in expression:
+        nested = expression.get("nestedExpression") or []
+        combine = all if operator == "AND" else any
+        return combine(matches_expression(record, item) for item in nested)
+
+    value = record.get(expression.get("property"))
+    arguments = expression.get("argument") or []
+    text = "" if value is None else str(value)
+    if operator == "EQUALS":
+        return text.lower() == str(arguments[0]).lower()
+    if operator == "NOT_EQUALS":
+        return text.lower() != str(arguments[0]).lower()
+    if operator == "GREATER_THAN":
+        return text > arguments[0]
+    if operator == "GREATER_THAN_OR_EQUAL":
+        return text >= arguments[0]
+    if operator == "LESS_THAN":
+        return text < arguments[0]
+    if operator == "LESS_THAN_OR_EQUAL":
+        return text <= arguments[0]
+    if operator == "BETWEEN":
+        return arguments[0] <= text <= arguments[1]
+    if operator == "LIKE":
+        return str(arguments[0]).strip("%").lower() in text.lower()
+    if operator == "IS_NULL":
+        return value is None
+    if operator == "IS_NOT_NULL":
+        return value is not None
+    return True
+
+
+def _timestamp(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+def audit_log_records(count: int, start: float = 1704067200, spacing: float = 2.0) -> List[Dict[str, Any]]:
+    """Synthetic AuditLog records, one every ``spacing`` seconds from ``start``."""
+    actions = ["EDIT", "CREATE", "DELETE", "EXECUTE", "DEPLOY"]
+    return [
+        {
+            "@type": "AuditLog",
+            "AuditLogProperty": [{"name": "componentId", "value": f"component-{i % 500}"}],
+            "accountId": "local",
+            "action": actions[i % len(actions)],
+            "containerId": f"container-{i % 20}",
+            "date": _timestamp(start + i * spacing),
+            "documentId": f"document-{i}",
+            "level": "INFO",
+            "message": f"Audit entry {i}",
+            "modifier": "COMPONENT",
+            "source": "API",
+            "type": "as.component",
+            "userId": f"user{i % 15}@example.com",
+        }
+        for i in range(count)
+    ]
+
+
+def event_records(count: int, start: float = 1704067200, spacing: float = 2.0) -> List[Dict[str, Any]]:
+    """Synthetic Event records, one every ``spacing`` seconds from ``start``."""
+    return [
+        {
+            "@type": "Event",
+            "accountId": "local",
+            "atomId": f"atom-{i % 5}",
+            "atomName": f"Atom {i % 5}",
+            "eventDate": _timestamp(start + i * spacing),
+            "eventId": f"event-{i}",
+            "eventLevel": "ERROR" if i % 10 == 0 else "INFO",
+            "eventType": "process.execution",
+            "executionId": f"execution-{i}",
+            "processId": f"process-{i % 40}",
+            "processName": f"Process {i % 40}",
+            "recordDate": _timestamp(start + i * spacing + 1),
+            "status": "ERROR" if i % 10 == 0 else "COMPLETE",
+            "title": "Process execution",
+        }
+        for i in range(count)
+    ]
+
+
+def execution_records(
+    count: int, start: float = 1704067200, spacing: float = 2.0, long_form: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Synthetic ExecutionRecord records, one every ``spacing`` seconds from ``start``.
+
+    With ``long_form`` the duration and document sizes are sent as the API
+    sends long values, e.g. ``["Long", 1234]``.
+    """
+    records = [
+        {
+            "@type": "ExecutionRecord",
+            "account": "local",
+            "atomId": f"atom-{i % 5}",
+            "atomName": f"Atom {i % 5}",
+            "executionDuration": 50 + (i * 37) % 5000,
+            "executionId": f"execution-{i}",
+            "executionTime": _timestamp(start + i * spacing),
+            "executionType": "exec_listener",
+            "inboundDocumentCount": i % 12,
+            "inboundDocumentSize": (i % 12) * 1024,
+            "inboundErrorDocumentCount": 1 if i % 25 == 0 else 0,
+            "outboundDocumentCount": i % 9,
+            "outboundDocumentSize": (i % 9) * 2048,
+            "processId": f"process-{i % 40}",
+            "processName": f"Process {i % 40}",
+            "recordedDate": _timestamp(start + i * spacing + 1),
+            "status": "ERROR" if i % 25 == 0 else "COMPLETE",
+        }
+        for i in range(count)
+    ]
+    if long_form:
+        for record in records:
+            for key in ("executionDuration", "inboundDocumentSize", "outboundDocumentSize"):
+                record[key] = ["Long", record[key]]
+    return records
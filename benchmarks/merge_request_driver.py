@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Merge request driver benchmark against the local API stand-in.
+
+Serves merge requests that move through DRAFTING, DRAFTED, MERGING and
+MERGED on a clock (a share of them fail to draft or to merge) and drives a
+release train of them twice: once the way callers do it by hand (one thread
+per merge creating it, polling ``get_merge_request`` until it is drafted,
+executing MERGE and polling again until it settles), and once with
+MergeRequestDriver, which polls all pending merges with bulk calls. Both use
+the same poll interval and rate limit; the final stage of every merge is
+checked to be the same.
+
+Usage:
+    python benchmarks/merge_request_driver.py
+    python benchmarks/merge_request_driver.py --merges 200 --rate 10 --draft 2 --merge 3
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import MergeRequestDriver, RateLimiter
+from boomi.models import MergeRequest
+
+from local_api import LocalApi
+
+SETTLED = ("MERGED", "FAILED_TO_DRAFT", "FAILED_TO_MERGE")
+
+
+class Account:
+    """The merge requests of the stand-in account, advanced by the clock."""
+
+    def __init__(self, draft: float, merge: float):
+        self.draft = draft
+        self.merge = merge
+        self.merges = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def serve(self, api: LocalApi) -> None:
+        def _create(request):
+            body = request.json()
+            with self._lock:
+                id_ = f"merge-{next(self._ids)}"
+                self.merges[id_] = {"body": body, "created": time.monotonic(), "executed": None}
+                return 200, "application/json", self._document(id_)
+
+        def _get(request):
+            with self._lock:
+                return 200, "application/json", self._document(request.path.rsplit("/", 1)[1])
+
+        def _bulk(request):
+            entries = []
+            with self._lock:
+                for index, item in enumerate(request.json()["request"]):
+                    if item["id"] not in self.merges:
+                        entries.append({"index": index, "id": item["id"], "statusCode": 400,
+                                        "errorMessage": "Unknown merge request"})
+                        continue
+                    entries.append({"@type": "BulkResponse", "index": index, "id": item["id"], "statusCode": 200,
+                                    "Result": self._document(item["id"])})
+            return 200, "application/json", {"@type": "BulkResult", "response": entries}
+
+        def _execute(request):
+            id_ = request.path.rsplit("/", 1)[1]
+            with self._lock:
+                document = self._document(id_)
+                if document["stage"] not in ("DRAFTED", "REVIEWING"):
+                    return 400, "application/json", {"message": f"Cannot merge in stage {document['stage']}"}
+                self.merges[id_]["executed"] = time.monotonic()
+                return 200, "application/json", self._document(id_)
+
+        api.route("POST", "/MergeRequest/bulk", _bulk)
+        api.route("POST", "/MergeRequest/execute/*", _execute)
+        api.route("GET", "/MergeRequest/*", _get)
+        api.route("POST", "/MergeRequest", _create)
+
+    def _document(self, id_: str):
+        merge = self.merges[id_]
+        now = time.monotonic()
+        note = merge["body"].get("note", "")
+        if now - merge["created"] < self.draft:
+            stage = "DRAFTING"
+        elif note == "conflict-draft":
+            stage = "FAILED_TO_DRAFT"
+        elif merge["executed"] is None:
+            stage = "DRAFTED"
+        elif now - merge["executed"] < self.merge:
+            stage = "MERGING"
+        else:
+            stage = "FAILED_TO_MERGE" if note == "conflict-merge" else "MERGED"
+        return dict(merge["body"], **{"@type": "MergeRequest", "id": id_, "stage": stage, "MergeRequestDetails": {}})
+
+    def stages(self):
+        with self._lock:
+            return sorted((merge["body"]["sourceBranchId"], self._document(id_)["stage"])
+                          for id_, merge in self.merges.items())
+
+
+def release_train(count: int, failing_share: float):
+    failing = int(count * failing_share)
+    bodies = []
+    for index in range(count):
+        note = ""
+        if index < failing:
+            note = "conflict-draft" if index % 2 else "conflict-merge"
+        bodies.append({"sourceBranchId": f"branch-{index}", "destinationBranchId": "main",
+                       "strategy": "OVERRIDE", "priorityBranch": "SOURCE", "note": note})
+    return bodies
+
+
+def by_hand(sdk, body, poll_interval: float, rate_limiter: RateLimiter) -> str:
+    rate_limiter.acquire()
+    merge = sdk.merge_request.create_merge_request(MergeRequest._unmap(dict(body, MergeRequestDetails={})))
+    executed = False
+    while True:
+        time.sleep(poll_interval)
+        rate_limiter.acquire()
+        stage = sdk.merge_request.get_merge_request(merge.id_).stage
+        if stage in SETTLED:
+            return stage
+        if stage == "DRAFTED" and not executed:
+            rate_limiter.acquire()
+            sdk.merge_request.execute_merge_request(
+                merge.id_, MergeRequest._unmap({"MergeRequestDetails": {}, "id": merge.id_, "mergeRequestAction": "MERGE"})
+            )
+            executed = True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--merges", type=int, default=60, help="Merge requests in the release train")
+    parser.add_argument("--failing-share", type=float, default=0.1, help="Share of merges that fail")
+    parser.add_argument("--draft", type=float, default=1.0, help="Seconds a merge request spends drafting")
+    parser.add_argument("--merge", type=float, default=1.5, help="Seconds a merge request spends merging")
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    parser.add_argument("--rate", type=float, default=20.0, help="Requests per second allowed (0: unlimited)")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds added to every API response")
+    args = parser.parse_args()
+
+    bodies = release_train(args.merges, args.failing_share)
+
+    manual = Account(args.draft, args.merge)
+    with LocalApi(latency=args.latency) as api:
+        manual.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        rate_limiter = RateLimiter(args.rate or None)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=args.merges) as pool:
+            list(pool.map(lambda body: by_hand(sdk, body, args.poll_interval, rate_limiter), bodies))
+        manual_elapsed = time.monotonic() - started
+        manual_requests = sum(api.request_counts.values())
+        manual_polls = api.request_counts["/MergeRequest/*"]
+
+    driven = Account(args.draft, args.merge)
+    with LocalApi(latency=args.latency) as api:
+        driven.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        events = []
+        driver = MergeRequestDriver(
+            sdk,
+            poll_interval=args.poll_interval,
+            max_poll_interval=args.poll_interval * 4,
+            timeout=60,
+            on_stage=lambda merge, previous, stage: events.append(stage),
+            rate_limiter=RateLimiter(args.rate or None),
+        )
+        report = driver.run(bodies)
+
+    print(f"merges             {args.merges} ({int(args.merges * args.failing_share)} failing)")
+    print(f"by hand            {manual_elapsed:6.2f} s {manual_requests:6d} requests, {manual_polls} polls")
+    print(f"driver             {report.elapsed:6.2f} s {report.requests:6d} requests, {report.rounds} polls "
+          f"({report.counts()})")
+    print(f"speedup            {manual_elapsed / report.elapsed:.1f}x, {manual_polls / report.rounds:.1f}x fewer polls")
+    for stage, timing in sorted(report.stage_timings().items()):
+        print(f"  {stage:<16} {timing['count']:4d} merges, mean {timing['mean']:5.2f} s, max {timing['max']:5.2f} s")
+    failing = int(args.merges * args.failing_share)
+    exact = (
+        driven.stages() == manual.stages()
+        and report.counts() == {"merged": args.merges - failing, "failed": failing}
+        and all(merge.stage in SETTLED for merge in report)
+        and events.count("MERGED") == args.merges - failing
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Component metadata batch resolver benchmark against the local API stand-in.
+
+Serves ComponentMetadata GET and bulk GET over synthetic components. Resolves
+the same ids (with repeats, as reference walks produce) four ways: one
+``get_component_metadata`` per id from a thread pool, as most call sites do
+today; ComponentMetadataLoader.resolve from the same threads; resolve_async
+from BoomiAsync tasks; and a rerun answered from the loader's cache. Verifies
+every approach resolves every id to the same component, and unknown ids to
+``None``.
+
+Usage:
+    python benchmarks/metadata_loader.py
+    python benchmarks/metadata_loader.py --lookups 5000 --threads 64 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi, BoomiAsync
+from boomi.helpers import ComponentMetadataLoader, RateLimiter
+
+from local_api import LocalApi
+
+
+def metadata(component_id: str):
+    return {"@type": "ComponentMetadata", "componentId": component_id, "version": 2,
+            "name": f"Component {component_id[-5:]}", "type": "process", "currentVersion": "true"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=2000, help="Component id lookups")
+    parser.add_argument("--components", type=int, default=1500, help="Distinct components looked up")
+    parser.add_argument("--threads", type=int, default=32, help="Threads making lookups")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every API response")
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    known = {f"component-{index:05d}" for index in range(args.components)}
+    ids = [rng.choice(sorted(known)) for _ in range(args.lookups - 10)] + [f"missing-{index}" for index in range(10)]
+    rng.shuffle(ids)
+
+    def _get(request):
+        component_id = request.path.rsplit("/", 1)[1]
+        if component_id not in known:
+            return 400, "application/json", {"message": f"Component {component_id} not found"}
+        return 200, "application/json", metadata(component_id)
+
+    def _bulk(request):
+        entries = []
+        for index, item in enumerate(request.json()["request"]):
+            if item["id"] in known:
+                entries.append({"@type": "BulkResponse", "index": index, "id": item["id"], "statusCode": 200,
+                                "Result": metadata(item["id"])})
+            else:
+                entries.append({"index": index, "id": item["id"], "statusCode": 400,
+                                "errorMessage": f"Component {item['id']} not found"})
+        return 200, "application/json", {"@type": "BulkResult", "response": entries}
+
+    def _name(result):
+        return getattr(result, "name", None)
+
+    def _one_by_one(component_id):
+        try:
+            return sdk.component_metadata.get_component_metadata(component_id)
+        except Exception:
+            return None
+
+    with LocalApi(latency=args.latency) as api:
+        api.route("POST", "/ComponentMetadata/bulk", _bulk)
+        api.route("GET", "/ComponentMetadata/*", _get)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        async_sdk = BoomiAsync(access_token="local", account_id="local", base_url=api.base_url)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as pool:
+            single = [_name(result) for result in pool.map(_one_by_one, ids)]
+        single_time = time.perf_counter() - started
+        single_requests = sum(api.request_counts.values())
+
+        loader = ComponentMetadataLoader(sdk, rate_limiter=RateLimiter(None))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as pool:
+            threaded = [_name(result) for result in pool.map(loader.resolve, ids)]
+        threaded_time = time.perf_counter() - started
+        threaded_requests = loader.requests
+
+        async_loader = ComponentMetadataLoader(async_sdk, rate_limiter=RateLimiter(None))
+
+        async def _resolve_all():
+            return await asyncio.gather(*(async_loader.resolve_async(component_id) for component_id in ids))
+
+        started = time.perf_counter()
+        tasks = [_name(result) for result in asyncio.run(_resolve_all())]
+        tasks_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as pool:
+            cached = [_name(result) for result in pool.map(loader.resolve, ids)]
+        cached_time = time.perf_counter() - started
+
+    print(f"lookups            {len(ids)} of {len(set(ids))} distinct ids from {args.threads} threads")
+    print(f"  one by one       {single_time:8.2f} s {single_requests:6d} requests")
+    print(f"  loader threads   {threaded_time:8.2f} s {threaded_requests:6d} requests "
+          f"{single_time / threaded_time:6.1f}x")
+    print(f"  loader tasks     {tasks_time:8.2f} s {async_loader.requests:6d} requests "
+          f"{single_time / tasks_time:6.1f}x")
+    print(f"  cached rerun     {cached_time:8.2f} s {loader.requests - threaded_requests:6d} requests")
+
+    exact = (
+        single == threaded == tasks == cached
+        and all((name is None) == component_id.startswith("missing") for component_id, name in zip(ids, single))
+        and loader.requests == threaded_requests
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Model construction, argument casting and validation micro-benchmark.
+
+Runs the client-side work of hot loops that build many requests or hydrate
+many results, without any HTTP:
+
+* building nested query configs (a oneOf expression with enum fields);
+* hydrating Atom query pages (enum fields and a list of enum values);
+* ``@cast_models`` dispatch of a service method called with API JSON dicts;
+* ``Validator`` construction and validation, as every service call does.
+
+Reports microseconds per operation. Run it on two revisions to compare them.
+Verifies the built models map to the expected JSON, and that invalid enum
+values and patterns are still rejected.
+
+Usage:
+    python benchmarks/model_validation.py
+    python benchmarks/model_validation.py --repeat 50000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from boomi.models import (
+    AtomQueryResponse,
+    ExecutionRecordQueryConfig,
+    FolderQueryConfig,
+    FolderQueryConfigQueryFilter,
+    FolderSimpleExpression,
+)
+from boomi.models.utils.cast_models import cast_models
+from boomi.services.utils.validator import Validator
+
+
+class QueryCaller:
+    """Stands in for a generated service: cast, validate, return."""
+
+    @cast_models
+    def query_execution_record(self, request_body: ExecutionRecordQueryConfig = None):
+        Validator(ExecutionRecordQueryConfig).is_optional().validate(request_body)
+        return request_body
+
+
+def atom_page(size: int):
+    return {
+        "@type": "QueryResult",
+        "numberOfResults": size,
+        "result": [
+            {"@type": "Atom", "id": f"atom-{index}", "name": f"Atom {index}", "status": "ONLINE",
+             "type": ["ATOM", "MOLECULE", "CLOUD"][index % 3], "hostName": f"host-{index}",
+             "capabilities": ["GATEWAY", "BROKER"][: index % 3], "currentVersion": "24.10.0"}
+            for index in range(size)
+        ],
+    }
+
+
+def per_op(repeat: int, function) -> float:
+    started = time.perf_counter()
+    for index in range(repeat):
+        function(index)
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20000, help="Operations per measurement")
+    args = parser.parse_args()
+
+    page = atom_page(100)
+    query_json = {"query_filter": {"expression": {"operator": "BETWEEN", "property": "executionTime",
+                                                 "argument": ["2026-10-01T00:00:00Z", "2026-10-19T00:00:00Z"]}}}
+    caller = QueryCaller()
+
+    def _config(index):
+        return FolderQueryConfig(query_filter=FolderQueryConfigQueryFilter(
+            expression=FolderSimpleExpression(operator="EQUALS", property="name", argument=[f"Folder {index}"])))
+
+    def _validate(index):
+        Validator(str).validate(f"id-{index}")
+        Validator(int).min(1).max(1000).validate(index % 1000 + 1)
+        Validator(str).pattern(r"^[a-z]+-\d+$").validate(f"id-{index}")
+
+    config_time = per_op(args.repeat, _config)
+    page_time = per_op(max(1, args.repeat // 100), lambda index: AtomQueryResponse._unmap(page))
+    cast_time = per_op(args.repeat, lambda index: caller.query_execution_record(query_json))
+    validate_time = per_op(args.repeat, _validate)
+
+    print(f"query config       {config_time:8.2f} us per nested config")
+    print(f"atom page          {page_time:8.1f} us per 100 atoms ({page_time / 100:.2f} us per atom)")
+    print(f"cast_models        {cast_time:8.2f} us per call with a query dict")
+    print(f"Validator          {validate_time / 3:8.2f} us per validation")
+
+    def _rejects(function):
+        try:
+            function()
+        except ValueError:
+            return True
+        return False
+
+    hydrated = AtomQueryResponse._unmap(page)
+    exact = (
+        _config(7)._map()["QueryFilter"]["expression"]
+        == {"@type": "FolderSimpleExpression", "argument": ["Folder 7"], "operator": "EQUALS", "property": "name"}
+        and [atom._map()["capabilities"] for atom in hydrated.result[:3]] == [[], ["GATEWAY"], ["GATEWAY", "BROKER"]]
+        and caller.query_execution_record(query_json)._map()["QueryFilter"]["expression"]["operator"] == "BETWEEN"
+        and _rejects(lambda: FolderSimpleExpression(operator="BOGUS", property="name", argument=["x"]))
+        and _rejects(lambda: AtomQueryResponse._unmap({"result": [{"id": "a", "capabilities": ["BOGUS"]}]}))
+        and _rejects(lambda: Validator(str).pattern(r"^[a-z]+$").validate("ID-1"))
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Release promotion benchmark against the local API stand-in.
+
+Promotes a set of packages to many environments twice: once environment by
+environment (a DeployedPackage query and a create per pair, one request at a
+time, as in examples/07_package_deploy/promote_package_to_environment.py) and
+once with DeploymentPromoter. A share of the environments already runs the
+release, so the promoter only deploys the delta. Finally one environment is
+made to reject deployments and the run is checked to roll every other
+environment back to its previous package.
+
+Usage:
+    python benchmarks/promotion_rollout.py
+    python benchmarks/promotion_rollout.py --environments 200 --packages 3 --latency 0.05
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import DeploymentPromoter, RateLimiter
+from boomi.models import (
+    DeployedPackage,
+    DeployedPackageGroupingExpression,
+    DeployedPackageQueryConfig,
+    DeployedPackageQueryConfigQueryFilter,
+    DeployedPackageSimpleExpression,
+)
+
+from local_api import LocalApi, matches_expression
+
+
+class Deployments:
+    """The deployment state of the stand-in account."""
+
+    def __init__(self, packages, environment_ids, current_share: float):
+        self.packages = {package["packageId"]: package for package in packages}
+        for package in packages:
+            self.packages[f"{package['componentId']}-old"] = dict(package, packageId=f"{package['componentId']}-old")
+        self.rejecting = set()
+        self.records = []
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        for package in packages:
+            for index, environment_id in enumerate(environment_ids):
+                current = index < len(environment_ids) * current_share
+                self.deploy(package["packageId"] if current else f"{package['componentId']}-old", environment_id)
+
+    def deploy(self, package_id, environment_id):
+        component_id = self.packages[package_id]["componentId"]
+        with self._lock:
+            for record in self.records:
+                if record["componentId"] == component_id and record["environmentId"] == environment_id:
+                    record["active"] = False
+            record = {
+                "@type": "DeployedPackage",
+                "deploymentId": f"deployment-{next(self._ids)}",
+                "packageId": package_id,
+                "componentId": component_id,
+                "environmentId": environment_id,
+                "active": True,
+                "deployedDate": f"2024-01-01T00:00:{len(self.records) % 60:02d}Z",
+                "listenerStatus": "RUNNING",
+                "version": len(self.records),
+            }
+            self.records.append(record)
+            return record
+
+    def active(self):
+        with self._lock:
+            return {
+                (record["componentId"], record["environmentId"]): record["packageId"]
+                for record in self.records
+                if record["active"]
+            }
+
+    def serve(self, api: LocalApi) -> None:
+        def _create(request):
+            body = request.json()
+            if body["environmentId"] in self.rejecting:
+                return 400, "application/json", {"message": "Environment is locked"}
+            return 200, "application/json", self.deploy(body["packageId"], body["environmentId"])
+
+        def _delete(request):
+            deployment_id = request.path.rsplit("/", 1)[1]
+            with self._lock:
+                for record in self.records:
+                    if record["deploymentId"] == deployment_id:
+                        record["active"] = False
+            return 200, "application/json", {}
+
+        def _query(request):
+            expression = (request.json().get("QueryFilter") or {}).get("expression")
+            with self._lock:
+                matches = [dict(record) for record in self.records if matches_expression(record, expression)]
+            return 200, "application/json", {"@type": "QueryResult", "numberOfResults": len(matches),
+                                             "result": matches}
+
+        def _bulk(request):
+            ids = [item["id"] for item in request.json()["request"]]
+            return 200, "application/json", {
+                "@type": "BulkResult",
+                "response": [
+                    {"index": index, "id": id_, "statusCode": 200, "Result": self.packages[id_]}
+                    for index, id_ in enumerate(ids)
+                ],
+            }
+
+        api.route("POST", "/DeployedPackage/query", _query)
+        api.route("POST", "/DeployedPackage", _create)
+        api.route("DELETE", "/DeployedPackage/*", _delete)
+        api.route("POST", "/PackagedComponent/bulk", _bulk)
+
+
+def sequential(sdk: Boomi, packages, environment_ids) -> None:
+    """Check and deploy every package / environment pair one request at a time."""
+    for package in packages:
+        for environment_id in environment_ids:
+            result = sdk.deployed_package.query_deployed_package(
+                DeployedPackageQueryConfig(
+                    query_filter=DeployedPackageQueryConfigQueryFilter(
+                        expression=DeployedPackageGroupingExpression(
+                            operator="and",
+                            nested_expression=[
+                                DeployedPackageSimpleExpression(
+                                    operator="EQUALS", property="componentId", argument=[package["componentId"]]
+                                ),
+                                DeployedPackageSimpleExpression(
+                                    operator="EQUALS", property="environmentId", argument=[environment_id]
+                                ),
+                                DeployedPackageSimpleExpression(
+                                    operator="EQUALS", property="active", argument=["true"]
+                                ),
+                            ],
+                        )
+                    )
+                )
+            )
+            if any(deployment.package_id == package["packageId"] for deployment in result.result or []):
+                continue
+            sdk.deployed_package.create_deployed_package(
+                DeployedPackage(
+                    package_id=package["packageId"], environment_id=environment_id, listener_status="RUNNING"
+                )
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--environments", type=int, default=40)
+    parser.add_argument("--packages", type=int, default=2)
+    parser.add_argument("--current-share", type=float, default=0.25,
+                        help="Share of environments already running the release")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every API response")
+    parser.add_argument("--parallel", type=int, default=10, help="Deployments in flight at once")
+    args = parser.parse_args()
+
+    packages = [
+        {
+            "@type": "PackagedComponent",
+            "packageId": f"package-{p}",
+            "componentId": f"component-{p}",
+            "componentType": "process",
+            "packageVersion": "2.0",
+        }
+        for p in range(args.packages)
+    ]
+    package_ids = [package["packageId"] for package in packages]
+    environment_ids = [f"environment-{e}" for e in range(args.environments)]
+    pairs = args.packages * args.environments
+
+    sequential_state = Deployments(packages, environment_ids, args.current_share)
+    with LocalApi(latency=args.latency) as api:
+        sequential_state.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        started = time.monotonic()
+        sequential(sdk, packages, environment_ids)
+        sequential_elapsed = time.monotonic() - started
+        sequential_requests = sum(api.request_counts.values())
+
+    promoter_state = Deployments(packages, environment_ids, args.current_share)
+    with LocalApi(latency=args.latency) as api:
+        promoter_state.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        promoter = DeploymentPromoter(sdk, max_parallel=args.parallel, rate_limiter=RateLimiter(None))
+        report = promoter.promote(package_ids, environment_ids)
+        promoter_requests = sum(api.request_counts.values())
+
+    print(f"pairs              {pairs} ({len(report.to_deploy)} to deploy)")
+    print(f"sequential         {sequential_elapsed:.2f} s, {sequential_requests} requests")
+    print(f"promoter           {report.elapsed:.2f} s, {promoter_requests} requests")
+    print(f"speedup            {sequential_elapsed / report.elapsed:.1f}x")
+    exact = report.ok and promoter_state.active() == sequential_state.active()
+    print(f"output check       {'ok' if exact else 'FAILED'} ({report})")
+
+    rollback_state = Deployments(packages, environment_ids, args.current_share)
+    before = rollback_state.active()
+    rollback_state.rejecting.add(environment_ids[-1])
+    with LocalApi(latency=args.latency) as api:
+        rollback_state.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        promoter = DeploymentPromoter(sdk, max_parallel=args.parallel, rate_limiter=RateLimiter(None))
+        report = promoter.promote(package_ids, environment_ids)
+    restored = report.rolled_back and not report.ok and rollback_state.active() == before
+    print(f"rollback check     {'ok' if restored else 'FAILED'} ({report})")
+    if not (exact and restored):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Raw response body benchmark against the local API stand-in.
+
+Serves a large component XML (``application/xml`` without a charset, as the
+Component endpoints answer) and measures, for ``get_component``:
+
+* the raw path, whose response body is now never decoded or parsed;
+* the same response with its body decoded, which every response paid for
+  before ``Response.body`` became lazy (requests guesses the charset of the
+  whole body, then decodes a full ``str`` copy).
+
+Reports wall-clock time and peak traced memory of each, and the cost of
+cutting every shape element out of the body from the bytes and from the
+``memoryview`` returned by ``send_request_raw(view=True)``. Verifies the raw
+bytes are identical to what the server sent and that the lazily parsed body
+equals the decoded text.
+
+Usage:
+    python benchmarks/raw_response.py
+    python benchmarks/raw_response.py --megabytes 64
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.net.environment.environment import Environment
+from boomi.net.transport.serializer import Serializer
+
+from local_api import LocalApi
+
+
+def component_xml(megabytes: float) -> bytes:
+    shape = (
+        '<shape image="map_icon" name="shape{0}" shapetype="map" userlabel="Map {0} – ünïcode" x="{0}.0" y="96.0">'
+        '<configuration><map mapId="map-{0:06d}"/></configuration></shape>\n'
+    )
+    shapes = []
+    size, index = 0, 0
+    while size < megabytes * 1e6:
+        index += 1
+        shapes.append(shape.format(index))
+        size += len(shapes[-1])
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<bns:Component xmlns:bns="http://api.platform.boomi.com/" componentId="process-1" version="7" '
+        'name="Large process" type="process"><bns:object><process><shapes>\n'
+        + "".join(shapes)
+        + "</shapes></process></bns:object></bns:Component>\n"
+    ).encode("utf-8")
+
+
+def measure(repeat: int, function):
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(timings), peak, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megabytes", type=float, default=16, help="Size of the served component XML")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    xml = component_xml(args.megabytes)
+
+    with LocalApi() as api:
+        api.route("GET", "/Component/*", lambda request: (200, "application/xml", xml))
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        service = sdk.component
+
+        def _request():
+            return (
+                Serializer(f"{service.base_url or Environment.DEFAULT.url}/Component/process-1",
+                           [service.get_access_token(), service.get_basic_auth()])
+                .add_header("Accept", "application/xml")
+                .serialize()
+                .set_method("GET")
+            )
+
+        raw_time, raw_peak, raw = measure(args.repeat, lambda: service.get_component("process-1"))
+        decoded_time, decoded_peak, decoded = measure(
+            args.repeat, lambda: service._request_handler.send(_request()).body
+        )
+        view, _, _ = service.send_request_raw(_request(), view=True)
+
+    offsets = []
+    start = raw.find(b"<shape ")
+    while start != -1:
+        end = raw.index(b"</shape>", start) + len(b"</shape>")
+        offsets.append((start, end))
+        start = raw.find(b"<shape ", end)
+    slice_time, slice_peak, _ = measure(args.repeat, lambda: [raw[start:end] for start, end in offsets])
+    view_time, view_peak, _ = measure(args.repeat, lambda: [view[start:end] for start, end in offsets])
+
+    megabytes = len(xml) / 1e6
+    print(f"component          {megabytes:.1f} MB application/xml")
+    print(f"  raw              {raw_time * 1e3:8.1f} ms  peak {raw_peak / 1e6:7.1f} MB")
+    print(f"  decoded body     {decoded_time * 1e3:8.1f} ms  peak {decoded_peak / 1e6:7.1f} MB "
+          f"({decoded_time / raw_time:.1f}x time, {decoded_peak / raw_peak:.1f}x memory)")
+    print(f"shapes             {len(offsets)} elements cut out of the body")
+    print(f"  bytes slices     {slice_time * 1e3:8.1f} ms  peak {slice_peak / 1e6:7.1f} MB")
+    print(f"  memoryview       {view_time * 1e3:8.1f} ms  peak {view_peak / 1e6:7.1f} MB")
+
+    exact = (
+        raw == xml
+        and isinstance(view, memoryview) and view.readonly and view == xml
+        and decoded == xml.decode("utf-8")
+        and all(view[start:end] == raw[start:end] for start, end in offsets[:100])
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
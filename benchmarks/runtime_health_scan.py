@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Fleet health scan benchmark against the local API stand-in.
+
+Serves a synthetic fleet of runtimes whose async operations (AtomCounters,
+AtomDiskSpace, ListQueues, ListenerStatus) answer 202 for the first polls of
+every token, then takes a RuntimeHealthMonitor snapshot of the whole fleet.
+Reports the scan time against the time the same probes take one after the
+other, per-probe latency, and the effect of the cache on a second snapshot.
+
+Usage:
+    python benchmarks/runtime_health_scan.py
+    python benchmarks/runtime_health_scan.py --runtimes 1000 --latency 0.05 --pending-polls 2
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import RateLimiter, RuntimeHealthMonitor
+
+from local_api import LocalApi
+
+ASYNC_OPERATIONS = {
+    "AtomCounters": lambda atom_id: {
+        "@type": "AtomCounters",
+        "atomId": atom_id,
+        "counter": [{"name": "executions.active", "value": 3}, {"name": "threads", "value": 42}],
+    },
+    "AtomDiskSpace": lambda atom_id: {"@type": "AtomDiskSpace", "quotaLimit": "10 GB", "totalSize": "1 GB"},
+    "ListQueues": lambda atom_id: {
+        "@type": "ListQueues",
+        "QueueRecord": [{"queueName": "orders", "messagesCount": 1, "deadLettersCount": 0}],
+    },
+    "ListenerStatus": lambda atom_id: {"@type": "ListenerStatus", "listenerId": "listener-1", "status": "listening"},
+}
+
+
+def runtimes(count: int):
+    return [
+        {
+            "@type": "Atom",
+            "id": f"atom-{i}",
+            "name": f"Runtime {i}",
+            "status": "ONLINE",
+            "type": "ATOM",
+            "isCloudAttachment": i % 3 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def serve_fleet(api: LocalApi, count: int, pending_polls: int) -> None:
+    api.add_query_object("Atom", runtimes(count))
+    api.add_query_object(
+        "DeployedExpiredCertificate",
+        [{"@type": "DeployedExpiredCertificate", "containerId": "atom-7", "certificateName": "partner.pem",
+          "expirationDate": "2024-01-01T00:00:00Z"}],
+    )
+    polls = {}
+    tokens = itertools.count()
+    lock = threading.Lock()
+
+    def _start(operation):
+        def _handler(request):
+            if operation == "ListenerStatus":
+                atom_id = request.json()["QueryFilter"]["expression"]["argument"][0]
+            else:
+                atom_id = request.path.rsplit("/", 1)[1]
+            token = f"{operation}.{atom_id}.{next(tokens)}"
+            return 200, "application/json", {"@type": "AsyncOperationTokenResult", "asyncToken": {"token": token}}
+        return _handler
+
+    def _response(request):
+        token = request.path.rsplit("/", 1)[1]
+        operation, atom_id, _ = token.split(".")
+        with lock:
+            polls[token] = polls.get(token, 0) + 1
+            pending = polls[token] <= pending_polls
+        if pending:
+            return 202, "application/json", {"@type": "AsyncOperationResult", "responseStatusCode": 202}
+        return 200, "application/json", {
+            "@type": "AsyncOperationResult",
+            "responseStatusCode": 200,
+            "numberOfResults": 1,
+            "result": [ASYNC_OPERATIONS[operation](atom_id)],
+        }
+
+    for operation in ASYNC_OPERATIONS:
+        api.route("GET", f"/async/{operation}/response/*", _response)
+    for operation in ("AtomCounters", "AtomDiskSpace", "ListQueues"):
+        api.route("GET", f"/async/{operation}/*", _start(operation))
+    api.route("POST", "/async/ListenerStatus/query", _start("ListenerStatus"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runtimes", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every API response")
+    parser.add_argument("--pending-polls", type=int, default=1, help="202 answers before each async result")
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, default=32)
+    args = parser.parse_args()
+
+    with LocalApi(latency=args.latency) as api:
+        serve_fleet(api, args.runtimes, args.pending_polls)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+
+        with RuntimeHealthMonitor(
+            sdk,
+            max_workers=args.workers,
+            poll_interval=args.poll_interval,
+            rate_limiter=RateLimiter(None),
+        ) as monitor:
+            first = monitor.snapshot()
+            requests = sum(api.request_counts.values())
+            second = monitor.snapshot()
+
+        # Sequential cost: every request waits for the previous one, and every
+        # pending poll waits out the poll interval.
+        polls = sum(probe.polls for runtime in first for probe in runtime.probes.values() if not probe.cached)
+        probes = sum(1 for runtime in first for probe in runtime.probes.values() if probe.name != "certificates")
+        sequential = requests * args.latency + polls * args.poll_interval
+
+        print(f"runtimes           {len(first)}")
+        print(f"requests           {requests} ({probes} async probes, {polls} polls)")
+        print(f"sequential (est.)  {sequential:.2f} s")
+        print(f"snapshot           {first.elapsed:.2f} s")
+        print(f"cached snapshot    {second.elapsed:.2f} s")
+        for name, stats in sorted(first.probe_latency().items()):
+            print(f"  {name:<16} mean {stats['mean'] * 1000:7.1f} ms   max {stats['max'] * 1000:7.1f} ms")
+
+        failed = [probe for runtime in first for probe in runtime.probes.values() if not probe.ok]
+        unhealthy = [runtime.atom_id for runtime in first.unhealthy()]
+        exact = len(first) == args.runtimes and not failed and unhealthy == ["atom-7"]
+        print(f"snapshot check     {'ok' if exact else 'FAILED'} ({len(failed)} failed probes, unhealthy {unhealthy})")
+        if not exact:
+            for runtime in first:
+                for probe in runtime.probes.values():
+                    if not probe.ok:
+                        print(f"  {runtime.atom_id} {probe.name}: {probe.error!r}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
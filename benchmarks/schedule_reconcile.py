@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Process schedule reconciliation benchmark against the local API stand-in.
+
+Serves ProcessSchedules for many (process, runtime) pairs and brings them to a
+desired state twice: once the way a schedule-as-code job without a diff does
+it (get, then update, for every pair, one at a time), and once with
+ProcessScheduleReconciler, which reads the schedules with bulk GETs and sends
+bulk UPDATEs for the drifted pairs only. The desired cron fields are written
+differently from the stored ones (``*/15`` against ``0,15,30,45``, ``1-7``
+against ``*``), so a plain string comparison would see drift everywhere. Then
+runs the reconciler again to show that a no-op run costs only bulk GETs, and
+checks that both approaches end in the same state.
+
+Usage:
+    python benchmarks/schedule_reconcile.py
+    python benchmarks/schedule_reconcile.py --pairs 5000 --drifted-share 0.02 --latency 0.05
+"""
+
+import argparse
+import copy
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import ProcessScheduleReconciler, RateLimiter, normalize_schedules
+from boomi.helpers.schedules import process_schedules_id
+from boomi.models import ProcessSchedules
+
+from local_api import LocalApi
+
+
+def stored_schedules(process_id: str, atom_id: str):
+    return {
+        "@type": "ProcessSchedules",
+        "id": process_schedules_id(atom_id, process_id),
+        "atomId": atom_id,
+        "processId": process_id,
+        "Schedule": [
+            {"@type": "Schedule", "minutes": "0,15,30,45", "hours": "8,9,10,11,12,13,14,15,16,17,18",
+             "daysOfWeek": "2,3,4,5,6", "daysOfMonth": "*", "months": "*", "years": "*"},
+            {"@type": "Schedule", "minutes": "0", "hours": "2", "daysOfWeek": "*",
+             "daysOfMonth": "*", "months": "*", "years": "*"},
+        ],
+        "Retry": {"@type": "ScheduleRetry", "maxRetry": 5},
+    }
+
+
+def desired_schedules(drifted: bool):
+    schedules = [
+        {"minutes": "0", "hours": "2", "daysOfWeek": "1-7", "daysOfMonth": "*", "months": "*", "years": "*"},
+        {"minutes": "*/15", "hours": "8-18", "daysOfWeek": "2-6", "daysOfMonth": "*", "months": "*", "years": "*"},
+    ]
+    if drifted:
+        schedules[1]["hours"] = "7-19"
+    return schedules
+
+
+class Account:
+    """The ProcessSchedules stored by the stand-in account."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self._lock = threading.Lock()
+
+    def serve(self, api: LocalApi) -> None:
+        def _store(body):
+            document = dict(body, **{"@type": "ProcessSchedules"})
+            document.setdefault("Retry", self.documents[body["id"]].get("Retry"))
+            self.documents[body["id"]] = document
+            return document
+
+        def _bulk(request):
+            body = request.json()
+            entries = []
+            with self._lock:
+                for index, item in enumerate(body["request"]):
+                    id_ = item["id"]
+                    if id_ not in self.documents:
+                        entries.append({"index": index, "id": id_, "statusCode": 400, "errorMessage": "Unknown id"})
+                        continue
+                    result = copy.deepcopy(self.documents[id_] if body["type"] == "GET" else _store(item))
+                    entries.append({"@type": "BulkResponse", "index": index, "id": id_, "statusCode": 200,
+                                    "Result": result})
+            return 200, "application/json", {"@type": "BulkResult", "response": entries}
+
+        def _get(request):
+            with self._lock:
+                return 200, "application/json", copy.deepcopy(self.documents[request.path.rsplit("/", 1)[1]])
+
+        def _update(request):
+            with self._lock:
+                return 200, "application/json", copy.deepcopy(_store(request.json()))
+
+        api.route("POST", "/ProcessSchedules/bulk", _bulk)
+        api.route("GET", "/ProcessSchedules/*", _get)
+        api.route("POST", "/ProcessSchedules/*", _update)
+
+    def state(self):
+        with self._lock:
+            return {
+                id_: (normalize_schedules(document.get("Schedule")), document.get("Retry", {}).get("maxRetry"))
+                for id_, document in self.documents.items()
+            }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=500, help="(process, runtime) pairs")
+    parser.add_argument("--drifted-share", type=float, default=0.05, help="Share of pairs that drifted")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds added to every API response")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    pairs = [(f"process-{p}", f"atom-{p % 10}") for p in range(args.pairs)]
+    drifted = set(pairs[: int(args.pairs * args.drifted_share)])
+    desired = {pair: desired_schedules(pair in drifted) for pair in pairs}
+    documents = {process_schedules_id(atom, process): stored_schedules(process, atom) for process, atom in pairs}
+
+    naive = sum(
+        1
+        for (process, atom), schedules in desired.items()
+        if sorted(map(sorted, (s.items() for s in schedules)))
+        != sorted(map(sorted, ({k: v for k, v in s.items() if k != "@type"}.items()
+                               for s in documents[process_schedules_id(atom, process)]["Schedule"])))
+    )
+
+    pushed = Account(copy.deepcopy(documents))
+    with LocalApi(latency=args.latency) as api:
+        pushed.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        started = time.monotonic()
+        for (process, atom), schedules in desired.items():
+            id_ = process_schedules_id(atom, process)
+            current = sdk.process_schedules.get_process_schedules(id_)
+            sdk.process_schedules.update_process_schedules(
+                id_,
+                ProcessSchedules._unmap(
+                    {"id": id_, "atomId": atom, "processId": process, "Schedule": schedules,
+                     "Retry": current.retry._map()}
+                ),
+            )
+        push_elapsed = time.monotonic() - started
+
+    reconciled = Account(copy.deepcopy(documents))
+    with LocalApi(latency=args.latency) as api:
+        reconciled.serve(api)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        reconciler = ProcessScheduleReconciler(sdk, max_workers=args.workers, rate_limiter=RateLimiter(None))
+        report = reconciler.apply(desired)
+        rerun = reconciler.apply(desired)
+
+    print(f"pairs              {args.pairs} ({len(drifted)} drifted, {naive} differ as plain strings)")
+    print(f"get + update       {push_elapsed:.2f} s, {2 * args.pairs} requests")
+    print(f"reconciler         {report.elapsed:.2f} s, {report.requests} requests ({report.counts()})")
+    print(f"no-op rerun        {rerun.elapsed:.2f} s, {rerun.requests} requests ({rerun.counts()})")
+    print(f"speedup            {push_elapsed / report.elapsed:.1f}x")
+    exact = (
+        report.ok
+        and report.counts() == {"updated": len(drifted), "unchanged": args.pairs - len(drifted)}
+        and rerun.counts() == {"unchanged": args.pairs}
+        and reconciled.state() == pushed.state()
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Streamed response decoding benchmark against the local API stand-in.
+
+Serves a ``text/event-stream`` of JSON events (multi-byte text, CRLF line
+endings, comments and multi-line ``data`` fields) and a large UTF-8 text
+log, and streams both through ``stream_request`` at several chunk sizes.
+The old path decoded every chunk on its own and split it on ``\\n``, so a
+character, line or event straddling a chunk boundary was lost or raised
+``UnicodeDecodeError``; it is replayed over the same bytes for comparison.
+
+Reports events/s and MB/s per chunk size, and the same stream consumed from
+``stream_request_async``. Verifies every chunk size yields exactly the
+events and text the server sent.
+
+Usage:
+    python benchmarks/stream_decoding.py
+    python benchmarks/stream_decoding.py --events 100000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.net.environment.environment import Environment
+from boomi.net.transport.serializer import Serializer
+
+from local_api import LocalApi
+
+CHUNK_SIZES = (7, 64, 1024, 8192, 65536)
+
+
+def event_stream(count: int):
+    events, lines = [], [": stream opened"]
+    for index in range(count):
+        event = {"index": index, "executionId": f"execution-{index:07d}",
+                 "message": f"Schritt {index} abgeschloß – ✓ {'é' * (index % 5)}"}
+        events.append(event)
+        if index % 10 == 0:
+            # A multi-line data field: the lines are joined with "\n".
+            text = json.dumps(event, ensure_ascii=False, indent=1)
+            lines.extend(f"data: {line}" for line in text.split("\n"))
+        else:
+            lines.append(f"data: {json.dumps(event, ensure_ascii=False)}")
+        lines.append(f"id: {index}")
+        lines.append("")
+    return events, ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+
+def text_log(megabytes: float) -> str:
+    lines, size, index = [], 0, 0
+    while size < megabytes * 1e6:
+        lines.append(f"2026-10-19T12:00:{index % 60:02d}Z INFO Übertragung {index} – 完了 ✓\n")
+        size += len(lines[-1])
+        index += 1
+    return "".join(lines)
+
+
+def legacy_events(payload: bytes, chunk_size: int):
+    """The old per-chunk decode: returns (events parsed, chunks that failed to decode)."""
+    events, failures = [], 0
+    for start in range(0, len(payload), chunk_size):
+        try:
+            text = payload[start:start + chunk_size].decode()
+        except UnicodeDecodeError:
+            failures += 1
+            continue
+        for line in text.split("\n"):
+            if "data: " in line:
+                try:
+                    events.append(json.loads(line[line.index("data: ") + 6:]))
+                except ValueError:
+                    pass
+    return events, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000, help="Server-sent events streamed")
+    parser.add_argument("--megabytes", type=float, default=2, help="Size of the streamed text log")
+    args = parser.parse_args()
+
+    events, sse = event_stream(args.events)
+    log = text_log(args.megabytes)
+    log_bytes = log.encode("utf-8")
+
+    with LocalApi() as api:
+        api.route("GET", "/ExecutionRecord/events", lambda request: (200, "text/event-stream; charset=utf-8", sse))
+        api.route("GET", "/ExecutionRecord/log", lambda request: (200, "text/plain; charset=utf-8", log_bytes))
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        service = sdk.execution_record
+
+        def _request(path: str):
+            return (
+                Serializer(f"{service.base_url or Environment.DEFAULT.url}/ExecutionRecord/{path}",
+                           [service.get_access_token(), service.get_basic_auth()])
+                .serialize()
+                .set_method("GET")
+            )
+
+        results = {}
+        for chunk_size in CHUNK_SIZES:
+            service.set_stream_chunk_size(chunk_size)
+            started = time.perf_counter()
+            streamed = [body for body, _, _ in service.stream_request(_request("events"))]
+            event_time = time.perf_counter() - started
+            started = time.perf_counter()
+            text = "".join(body for body, _, _ in service.stream_request(_request("log")))
+            text_time = time.perf_counter() - started
+            results[chunk_size] = (streamed, event_time, text, text_time)
+
+        service.set_stream_chunk_size(8192)
+
+        async def _consume():
+            return [body async for body, _, _ in service.stream_request_async(_request("events"))]
+
+        started = time.perf_counter()
+        streamed_async = asyncio.run(_consume())
+        async_time = time.perf_counter() - started
+
+    print(f"events             {len(events)} server-sent events, {len(sse) / 1e6:.1f} MB")
+    for chunk_size, (streamed, event_time, _, _) in results.items():
+        legacy, failures = legacy_events(sse, chunk_size)
+        print(f"  chunk {chunk_size:6d}     {event_time * 1e3:8.1f} ms {len(streamed) / event_time:9.0f} events/s  "
+              f"old decode kept {len(legacy):6d} ({failures} chunks failed)")
+    print(f"  async 8192       {async_time * 1e3:8.1f} ms {len(streamed_async) / async_time:9.0f} events/s")
+    print(f"text               {len(log_bytes) / 1e6:.1f} MB text/plain")
+    for chunk_size, (_, _, _, text_time) in results.items():
+        print(f"  chunk {chunk_size:6d}     {text_time * 1e3:8.1f} ms {len(log_bytes) / 1e6 / text_time:9.1f} MB/s")
+
+    exact = (
+        all(streamed == events and text == log for streamed, _, text, _ in results.values())
+        and streamed_async == events
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Local raw-XML component diff benchmark.
+
+Builds a large synthetic process component (shapes with configuration,
+dragpoints and documented properties) and a next version of it with planted
+changes: moved and reconfigured shapes, added and removed shapes, edited
+notes, reordered shapes and a renamed namespace prefix (which is not a
+change). Measures ``diff_component_xml`` on the pair, on identical versions
+and on versions differing only in their namespace prefix, next to parsing both versions into ElementTree trees and the
+line-based ``difflib`` comparison the version compare examples use, and checks
+that exactly the planted changes are reported, with element values that are
+byte-exact slices of the inputs.
+
+Then diffs many cached version pairs with ComponentDiffEngine twice against
+the local API stand-in: through ComponentDiffRequest calls, and locally from
+an ``xml_source``; both must report the same changes.
+
+Usage:
+    python benchmarks/xml_diff.py
+    python benchmarks/xml_diff.py --shapes 20000 --pairs 500
+"""
+
+import argparse
+import difflib
+import gc
+import os
+import random
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from boomi import Boomi
+from boomi.helpers import ComponentDiffEngine, RateLimiter, diff_component_xml
+
+from local_api import LocalApi
+
+
+def best_of(repeat: int, function):
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def shape(index: int, x: int, note: str) -> str:
+    return (
+        f'      <shape image="map_icon" name="shape{index}" shapetype="map" userlabel="Map {index}" '
+        f'x="{x}.0" y="{index % 40 * 96}.0">\n'
+        f"        <configuration>\n"
+        f'          <map mapId="map-{index:06d}">\n'
+        f'            <property key="retries" value="{index % 5}"/>\n'
+        f'            <property key="timeout" value="{1000 + index}"/>\n'
+        f"            <note>{note}</note>\n"
+        f"          </map>\n"
+        f"        </configuration>\n"
+        f"        <dragpoints>\n"
+        f'          <dragpoint name="shape{index}.dragpoint1" toShape="shape{index + 1}" x="{x + 60}.0" y="0.0"/>\n'
+        f"        </dragpoints>\n"
+        f"      </shape>\n"
+    )
+
+
+def process_xml(shapes, prefix: str = "bns", version: int = 1) -> bytes:
+    body = "".join(shapes)
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<{prefix}:Component xmlns:{prefix}="http://api.platform.boomi.com/" '
+        f'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" componentId="process-1" version="{version}" '
+        f'name="Order sync" type="process" folderId="Rjo3NzI1MjQ" folderName="Integrations">\n'
+        f"  <{prefix}:encryptedValues/>\n"
+        f"  <{prefix}:description>Synchronizes orders</{prefix}:description>\n"
+        f"  <{prefix}:object>\n"
+        f'    <process allowSimultaneous="false" enableUserLog="false" processLogOnErrorsOnly="false">\n'
+        f"      <shapes>\n{body}      </shapes>\n"
+        f"    </process>\n"
+        f"  </{prefix}:object>\n"
+        f"</{prefix}:Component>\n"
+    ).encode("utf-8")
+
+
+def versions(count: int, changed: int, seed: int = 7):
+    """Two versions and the number of each kind of planted change."""
+    rng = random.Random(seed)
+    before = {index: shape(index, index * 10, f"Shape {index} ünïcode") for index in range(1, count + 1)}
+    after = dict(before)
+    picks = rng.sample(range(1, count + 1), changed * 4)
+    moved, renoted, removed = picks[:changed], picks[changed : 2 * changed], picks[2 * changed : 3 * changed]
+    for index in moved:
+        after[index] = shape(index, index * 10 + 5, f"Shape {index} ünïcode")
+    for index in renoted:
+        after[index] = shape(index, index * 10, f"Shape {index} reviewed")
+    for index in removed:
+        del after[index]
+    added = range(count + 1, count + 1 + changed)
+    for index in added:
+        after[index] = shape(index, index * 10, "New")
+    order = list(after)
+    rng.shuffle(order)
+    # A moved shape changes x on the shape and on its dragpoint; the version attribute changes once.
+    expected = {"addition": changed, "deletion": changed, "modification": 2 * len(moved) + len(renoted) + 1}
+    return (
+        process_xml(before.values()),
+        process_xml([after[index] for index in order], prefix="api", version=2),
+        expected,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shapes", type=int, default=5000, help="Shapes in the large process")
+    parser.add_argument("--changed", type=int, default=50, help="Shapes per kind of planted change")
+    parser.add_argument("--pairs", type=int, default=200, help="Cached version pairs diffed with the engine")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every API response")
+    args = parser.parse_args()
+
+    before, after, expected = versions(args.shapes, args.changed)
+    megabytes = (len(before) + len(after)) / 1e6
+
+    diff_time, diff = best_of(3, lambda: diff_component_xml(before, after))
+    same_time, same = best_of(3, lambda: diff_component_xml(before, bytes(before)))
+    renamed = before.replace(b"bns:", b"api:").replace(b"xmlns:bns", b"xmlns:api")
+    renamed_time, renamed_diff = best_of(3, lambda: diff_component_xml(before, renamed))
+    tree_time, _ = best_of(3, lambda: (ET.fromstring(before), ET.fromstring(after)))
+    lines_time, lines = best_of(1, lambda: list(difflib.unified_diff(
+        before.decode("utf-8").splitlines(), after.decode("utf-8").splitlines(), lineterm="")))
+
+    totals = {kind: section["total"] for kind, section in diff["GenericDiff"].items()}
+    print(f"process            {args.shapes} shapes, {megabytes:.1f} MB for both versions")
+    print(f"  diff             {diff_time * 1e3:8.1f} ms {megabytes / diff_time:6.1f} MB/s  {totals}")
+    print(f"  identical bytes  {same_time * 1e3:8.1f} ms")
+    print(f"  prefix renamed   {renamed_time * 1e3:8.1f} ms {megabytes / renamed_time:6.1f} MB/s  (no changes)")
+    print(f"  ElementTree      {tree_time * 1e3:8.1f} ms {megabytes / tree_time:6.1f} MB/s  (parse only)")
+    print(f"  difflib          {lines_time * 1e3:8.1f} ms {megabytes / lines_time:6.1f} MB/s  "
+          f"({sum(1 for line in lines if line[:1] in '+-')} changed lines)")
+
+    fragments_exact = all(
+        change["newValue"]["value"].encode("utf-8") in after
+        for change in diff["GenericDiff"]["addition"]["change"]
+    ) and all(
+        change["oldValue"]["value"].encode("utf-8") in before
+        for change in diff["GenericDiff"]["deletion"]["change"]
+    )
+
+    # Many cached pairs of smaller components: through the API and locally.
+    small = {}
+    for pair in range(args.pairs):
+        small[(f"component-{pair}", 1)], small[(f"component-{pair}", 2)], _ = versions(40, 2, seed=pair)
+    pairs = [(f"component-{pair}", 1, 2) for pair in range(args.pairs)]
+
+    def _server_diff(request):
+        body = request.json()
+        component_id = body["componentId"]
+        return 200, "application/json", {"ComponentDiffResponse": diff_component_xml(
+            small[(component_id, body["sourceVersion"])], small[(component_id, body["targetVersion"])])}
+
+    with LocalApi(latency=args.latency) as api:
+        api.route("POST", "/ComponentDiffRequest", _server_diff)
+        sdk = Boomi(access_token="local", account_id="local", base_url=api.base_url)
+        remote = ComponentDiffEngine(sdk, rate_limiter=RateLimiter(None)).diff(pairs)
+        local = ComponentDiffEngine(
+            sdk, xml_source=lambda component_id, version: small.get((component_id, version)),
+            rate_limiter=RateLimiter(None),
+        ).diff(pairs)
+    print(f"engine             {args.pairs} cached version pairs")
+    print(f"  requests         {remote.elapsed:8.2f} s {remote.requests:6d} requests")
+    print(f"  xml_source       {local.elapsed:8.2f} s {local.requests:6d} requests, {local.local} local "
+          f"{remote.elapsed / local.elapsed:6.1f}x")
+
+    exact = (
+        totals == expected
+        and all(section["total"] == 0 for section in same["GenericDiff"].values())
+        and all(section["total"] == 0 for section in renamed_diff["GenericDiff"].values())
+        and fragments_exact
+        and remote.ok and local.ok
+        and [diff.totals for diff in remote] == [diff.totals for diff in local]
+        and local.requests == 0
+    )
+    print(f"output check       {'ok' if exact else 'FAILED'}")
+    if not exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
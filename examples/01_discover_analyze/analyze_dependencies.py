@@ -70,7 +70,6 @@ import argparse
 import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Set, Tuple
-from collections import defaultdict, deque
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src'))
@@ -83,6 +82,7 @@ except ImportError:
     pass  # dotenv is optional
 
 from boomi import Boomi
+from boomi.helpers import DependencyGraphCrawler
 from boomi.models import (
     ComponentReferenceQueryConfig,
     ComponentReferenceQueryConfigQueryFilter,
@@ -109,6 +109,9 @@ class DependencyAnalyzer:
         if self.verbose:
             print("✅ SDK initialized successfully")
         
+        # Concurrent reference crawler (memoizes references across calls)
+        self.crawler = DependencyGraphCrawler(self.sdk)
+        
         # Cache for component metadata
         self.component_cache = {}
         self.dependency_cache = {}
@@ -251,121 +254,46 @@ class DependencyAnalyzer:
             }
         }
         
-        visited = set()
-        queue = deque([(component_id, 0)])
+        # Each BFS level is expanded concurrently and node metadata is
+        # fetched with bulk calls once the crawl completes.
+        crawl = self.crawler.crawl(
+            [component_id],
+            direction={'upstream': 'where_used', 'downstream': 'uses'}.get(direction, 'both'),
+            max_depth=depth,
+        )
         
-        while queue:
-            current_id, current_depth = queue.popleft()
-            
-            if current_id in visited or current_depth > depth:
-                continue
-            
-            visited.add(current_id)
-            
-            # Add node to graph
-            if current_id not in graph['nodes']:
-                graph['nodes'][current_id] = {
-                    'id': current_id,
-                    'depth': current_depth,
-                    'uses': [],
-                    'used_by': [],
-                    'metadata': self.component_cache.get(current_id, {})
+        for node_id in crawl.nodes:
+            metadata = crawl.metadata.get(node_id)
+            graph['nodes'][node_id] = {
+                'id': node_id,
+                'depth': crawl.depth[node_id],
+                'uses': sorted(crawl.uses(node_id)),
+                'used_by': sorted(crawl.used_by(node_id)),
+                'metadata': self.component_cache.get(node_id) or {
+                    'name': getattr(metadata, 'name', None),
+                    'type': getattr(getattr(metadata, 'type_', None), 'value', None),
+                    'version': crawl.versions.get(node_id),
                 }
-            
+            }
             graph['statistics']['max_depth_reached'] = max(
-                graph['statistics']['max_depth_reached'], 
-                current_depth
+                graph['statistics']['max_depth_reached'],
+                crawl.depth[node_id]
             )
-            
-            # Get dependencies based on direction
-            if direction in ['both', 'upstream']:
-                # What uses this component (upstream dependencies)
-                upstream = self.find_what_uses(current_id)
-                for comp in upstream:
-                    comp_id = comp['component_id']
-                    
-                    # Add edge
-                    edge = {'from': comp_id, 'to': current_id, 'type': 'uses'}
-                    if edge not in graph['edges']:
-                        graph['edges'].append(edge)
-                    
-                    # Update node relationships
-                    if comp_id not in graph['nodes'][current_id]['used_by']:
-                        graph['nodes'][current_id]['used_by'].append(comp_id)
-                    
-                    # Add to queue for further exploration
-                    if comp_id not in visited and current_depth < depth:
-                        queue.append((comp_id, current_depth + 1))
-            
-            if direction in ['both', 'downstream']:
-                # What this component uses (downstream dependencies)
-                downstream = self.find_what_it_uses(current_id)
-                for comp in downstream:
-                    comp_id = comp['component_id']
-                    
-                    # Add edge
-                    edge = {'from': current_id, 'to': comp_id, 'type': 'uses'}
-                    if edge not in graph['edges']:
-                        graph['edges'].append(edge)
-                    
-                    # Update node relationships
-                    if comp_id not in graph['nodes'][current_id]['uses']:
-                        graph['nodes'][current_id]['uses'].append(comp_id)
-                    
-                    # Add to queue for further exploration
-                    if comp_id not in visited and current_depth < depth:
-                        queue.append((comp_id, current_depth + 1))
+        
+        graph['edges'] = [
+            {'from': edge.parent_id, 'to': edge.child_id, 'type': 'uses'}
+            for edge in crawl.edges
+        ]
         
         # Update statistics
         graph['statistics']['total_nodes'] = len(graph['nodes'])
         graph['statistics']['total_edges'] = len(graph['edges'])
         
         # Detect circular dependencies
-        graph['statistics']['circular_dependencies'] = self._detect_cycles(graph)
+        graph['statistics']['circular_dependencies'] = crawl.find_cycles()
         
         return graph
     
-    def _detect_cycles(self, graph: Dict[str, Any]) -> List[List[str]]:
-        """Detect circular dependencies in the graph"""
-        cycles = []
-        
-        # Build adjacency list
-        adj_list = defaultdict(list)
-        for edge in graph['edges']:
-            adj_list[edge['from']].append(edge['to'])
-        
-        # DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-        path = []
-        
-        def dfs(node):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in adj_list[node]:
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    if cycle not in cycles:
-                        cycles.append(cycle)
-            
-            path.pop()
-            rec_stack.remove(node)
-            return False
-        
-        # Check all nodes
-        for node in graph['nodes']:
-            if node not in visited:
-                dfs(node)
-        
-        return cycles
-    
     def analyze_impact(self, component_id: str, change_type: str = 'modify') -> Dict[str, Any]:
         """Analyze the impact of changes to a component"""
         print(f"\n🔍 Analyzing impact of {change_type} on: {component_id}")
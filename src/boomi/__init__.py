@@ -4,9 +4,13 @@
 __all__ = [
     "Boomi",
     "BoomiAsync",
+    "Compression",
     "Environment",
+    "JsonCodec",
     "UnsafeComponentXmlSerializationError",
     "extract_component_xml_metadata",
+    "set_json_codec",
+    "split_bulk_envelope",
 ]
 
 def __getattr__(name):
@@ -16,9 +20,15 @@ def __getattr__(name):
     if name == "BoomiAsync":
         from .sdk_async import BoomiAsync as _BoomiAsync
         return _BoomiAsync
+    if name == "Compression":
+        from .net.transport.compression import Compression as _Compression
+        return _Compression
     if name == "Environment":
         from .net.environment import Environment as _Environment
         return _Environment
+    if name == "JsonCodec":
+        from .net.transport.json_codec import JsonCodec as _JsonCodec
+        return _JsonCodec
     if name == "UnsafeComponentXmlSerializationError":
         from .net.transport.request_error import (
             UnsafeComponentXmlSerializationError as _Err,
@@ -27,4 +37,10 @@ def __getattr__(name):
     if name == "extract_component_xml_metadata":
         from .net.transport.utils import extract_component_xml_metadata as _meta
         return _meta
+    if name == "set_json_codec":
+        from .net.transport.json_codec import set_json_codec as _set_codec
+        return _set_codec
+    if name == "split_bulk_envelope":
+        from .net.transport.utils import split_bulk_envelope as _split
+        return _split
     raise AttributeError(name)
@@ -0,0 +1,144 @@
+"""High-level helpers built on top of the generated services.
+
+The helpers accept the service objects of either ``Boomi`` or ``BoomiAsync``
+and share a process-wide :class:`RateLimiter` so concurrent work stays within
+the account's API rate budget.
+"""
+
+from .concurrency import (
+    PollScheduler,
+    RateLimiter,
+    chunked,
+    default_rate_limiter,
+    imap_concurrently,
+    run_concurrently,
+    set_default_rate_limiter,
+)
+from .archiver import ArchiveReport, RecordArchiver
+from .bulk import BulkExecutor, BulkItem, BulkResult
+from .columnar import (
+    CategoryColumn,
+    ColumnBatch,
+    NumericColumn,
+    StringColumn,
+    column_schema,
+    iter_column_batches,
+    write_column_batches,
+)
+from .component_diff import ComponentDiff, ComponentDiffEngine, ComponentDiffReport
+from .component_mirror import ComponentMirror, MirrorSyncReport
+from .component_export import (
+    ComponentExporter,
+    DirectorySink,
+    ExportedComponent,
+    ExportReport,
+    ZipArchiveSink,
+)
+from .document_pipeline import (
+    ConnectorDocumentPipeline,
+    DocumentPipelineReport,
+    DocumentResult,
+)
+from .dependency_graph import DependencyEdge, DependencyGraph, DependencyGraphCrawler
+from .execution_analytics import ExecutionAnalytics, LatencySketch, ProcessStatistics
+from .execution_tail import ExecutionTail, TailEvent
+from .extensions_sync import (
+    EnvironmentExtensionsSync,
+    ExtensionsChange,
+    ExtensionsSyncReport,
+    extensions_diff,
+)
+from .folder_tree import FolderNode, FolderTree, FolderTreeCache
+from .merge_requests import MergeReport, MergeRequestDriver, TrackedMerge
+from .metadata_index import ComponentMetadataIndex, IndexedComponent, IndexRefreshReport
+from .metadata_loader import ComponentMetadataLoader
+from .paging import iter_query, iter_query_pages, iter_raw_query_pages, iter_raw_query_records
+from .promotion import DeploymentPromoter, PromotionReport, PromotionTarget
+from .schedules import (
+    ProcessScheduleReconciler,
+    ScheduleChange,
+    ScheduleReconcileReport,
+    normalize_cron,
+    normalize_schedules,
+)
+from .runtime_health import (
+    FleetHealthSnapshot,
+    ProbeResult,
+    RuntimeHealth,
+    RuntimeHealthMonitor,
+)
+from .xml_diff import diff_component_xml
+
+__all__ = [
+    "ArchiveReport",
+    "BulkExecutor",
+    "BulkItem",
+    "BulkResult",
+    "CategoryColumn",
+    "ColumnBatch",
+    "ComponentDiff",
+    "ComponentDiffEngine",
+    "ComponentDiffReport",
+    "ComponentExporter",
+    "ComponentMetadataIndex",
+    "ComponentMetadataLoader",
+    "ComponentMirror",
+    "ConnectorDocumentPipeline",
+    "DependencyEdge",
+    "DependencyGraph",
+    "DependencyGraphCrawler",
+    "DeploymentPromoter",
+    "DirectorySink",
+    "DocumentPipelineReport",
+    "DocumentResult",
+    "EnvironmentExtensionsSync",
+    "ExecutionAnalytics",
+    "ExecutionTail",
+    "ExportReport",
+    "ExportedComponent",
+    "ExtensionsChange",
+    "ExtensionsSyncReport",
+    "FleetHealthSnapshot",
+    "FolderNode",
+    "FolderTree",
+    "FolderTreeCache",
+    "IndexRefreshReport",
+    "IndexedComponent",
+    "LatencySketch",
+    "MergeReport",
+    "MergeRequestDriver",
+    "MirrorSyncReport",
+    "NumericColumn",
+    "PollScheduler",
+    "ProbeResult",
+    "ProcessScheduleReconciler",
+    "ProcessStatistics",
+    "PromotionReport",
+    "PromotionTarget",
+    "RateLimiter",
+    "RecordArchiver",
+    "RuntimeHealth",
+    "RuntimeHealthMonitor",
+    "ScheduleChange",
+    "ScheduleReconcileReport",
+    "StringColumn",
+    "TailEvent",
+    "TrackedMerge",
+    "ZipArchiveSink",
+    "chunked",
+    "column_schema",
+    "default_rate_limiter",
+    "diff_component_xml",
+    "extensions_diff",
+    "imap_concurrently",
+    "run_concurrently",
+    "iter_column_batches",
+    "iter_query",
+    "iter_query_pages",
+    "iter_raw_query_pages",
+    "iter_raw_query_records",
+    "normalize_cron",
+    "normalize_schedules",
+    "set_default_rate_limiter",
+    "write_column_batches",
+]
@@ -0,0 +1,47 @@
+from typing import Any, Callable
+
+
+def field_value(item: Any, attribute: str, key: str) -> Any:
+    """
+    Read a field from a model or from the API JSON ``dict`` it was built from.
+
+    :param Any item: The model, the ``dict``, or None.
+    :param str attribute: The model attribute, e.g. ``execution_id``.
+    :param str key: The JSON key, e.g. ``executionId``.
+    :return: The value, or None when the field is absent.
+    :rtype: Any
+    """
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, attribute, None)
+
+
+def enum_value(value: Any) -> Any:
+    """
+    The plain value of an enum member; any other value unchanged.
+
+    :param Any value: An ``Enum`` member or a plain value.
+    :rtype: Any
+    """
+    return getattr(value, "value", value)
+
+
+def to_number(value: Any, cast: Callable[[Any], Any] = float) -> Any:
+    """
+    Convert a number from an API response, unwrapping its typed JSON form.
+
+    The Platform API sends long counters as ``["Long", 1234]`` pairs; the
+    value of such a pair is converted instead of the pair itself.
+
+    :param Any value: The number, its text, a ``[type, value]`` pair, or None.
+    :param Callable[[Any], Any] cast: The conversion, e.g. ``int``.
+    :return: The converted value, or None when the value is missing.
+    :rtype: Any
+    :raises TypeError: If the value is not a number.
+    :raises ValueError: If the value is text that is not a number.
+    """
+    if isinstance(value, (list, tuple)) and len(value) == 2 and isinstance(value[0], str):
+        value = value[1]
+    if value is None or value == "":
+        return None
+    return cast(value)
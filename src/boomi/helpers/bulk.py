@@ -0,0 +1,351 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from ._compat import field_value
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    chunked,
+    default_rate_limiter,
+    run_concurrently,
+    sync_method,
+)
+from .paging import service_object_name
+from ..net.transport.utils import split_bulk_envelope
+from ..services.async_.utils.to_async import to_async
+
+#: Default number of ids per bulk request (see "Bulk GET operations" in the API reference).
+DEFAULT_BULK_LIMIT = 100
+
+#: Operations whose per-call id limit is lower than :data:`DEFAULT_BULK_LIMIT`.
+BULK_LIMITS: Dict[str, int] = {
+    "bulk_component": 5,
+}
+
+
+class BulkItem:
+    """
+    The outcome of one id in a bulk operation.
+
+    :ivar str id_: The requested id.
+    :ivar Optional[int] status_code: The per-item HTTP status reported by the API.
+    :ivar Any result: The returned object (typed model, dict, or raw bytes).
+    :ivar Optional[str] error_message: The per-item error message, if any.
+    :ivar Optional[Exception] error: The exception that failed the item's whole chunk, if any.
+    """
+
+    def __init__(
+        self,
+        id_: str,
+        status_code: Optional[int] = None,
+        result: Any = None,
+        error_message: Optional[str] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.id_ = id_
+        self.status_code = (
+            int(status_code)
+            if isinstance(status_code, str) and status_code.isdigit()
+            else status_code
+        )
+        self.result = result
+        self.error_message = error_message
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the item was returned successfully.
+
+        :rtype: bool
+        """
+        return (
+            self.error is None
+            and self.error_message is None
+            and (self.status_code is None or 200 <= self.status_code < 300)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkItem(id_={self.id_!r}, status_code={self.status_code}, "
+            f"ok={self.ok}, error_message={self.error_message!r})"
+        )
+
+
+class BulkResult:
+    """
+    The merged outcome of a chunked bulk operation.
+
+    :ivar List[BulkItem] items: One item per requested id, in request order,
+        followed by any returned entries that match no requested id.
+    :ivar List[Any] responses: The raw per-chunk responses, in chunk order.
+    """
+
+    def __init__(self, items: List[BulkItem], responses: List[Any]):
+        self.items = items
+        self.responses = responses
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        """
+        The successful results keyed by id.
+
+        :rtype: Dict[str, Any]
+        """
+        return {item.id_: item.result for item in self.items if item.ok}
+
+    @property
+    def failures(self) -> List[BulkItem]:
+        """
+        The items that failed, either individually or with their chunk.
+
+        :rtype: List[BulkItem]
+        """
+        return [item for item in self.items if not item.ok]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class BulkExecutor:
+    """
+    Executes ``bulk_*`` operations for any number of ids.
+
+    The ids are de-duplicated, split into chunks of the operation's per-call
+    limit, dispatched concurrently through a shared :class:`RateLimiter`, and the
+    per-item responses are merged back into request order. A failure of an
+    individual id, or of a whole chunk, is reported on the affected
+    :class:`BulkItem` instead of failing the batch.
+
+    Example Usage:
+    ```python
+    executor = BulkExecutor()
+    result = executor.get(sdk.environment, environment_ids)
+    for item in result.failures:
+        print(item.id_, item.status_code, item.error_message)
+    ```
+
+    :ivar int max_workers: The number of chunks dispatched concurrently.
+    :ivar RateLimiter rate_limiter: The limiter shared by all dispatched chunks.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of BulkExecutor.
+
+        :param int max_workers: The number of chunks dispatched concurrently.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or default_rate_limiter()
+
+    def get(
+        self,
+        service: Any,
+        ids: Iterable[str],
+        operation: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ) -> BulkResult:
+        """
+        Run a bulk GET for all ``ids`` against ``service``.
+
+        :param Any service: A sync or async service exposing a ``bulk_*`` method,
+            e.g. ``sdk.environment``.
+        :param Iterable[str] ids: The ids to fetch. Duplicates are requested once.
+        :param Optional[str] operation: The bulk method name. Detected from the
+            service when omitted.
+        :param Optional[int] chunk_size: Ids per call. Defaults to the operation limit.
+        :return: The merged result.
+        :rtype: BulkResult
+        """
+        operation = operation or bulk_operation_name(service)
+        bulk = sync_method(service, operation)
+        request_class = bulk_request_class(service)
+        size = chunk_size or BULK_LIMITS.get(operation, DEFAULT_BULK_LIMIT)
+
+        unique_ids = list(dict.fromkeys(ids))
+
+        def _send(chunk: List[str]) -> Any:
+            return bulk(bulk_request(request_class, chunk))
+
+        return self._merge(
+            run_concurrently(
+                _send, chunked(unique_ids, size), self.max_workers, self.rate_limiter
+            )
+        )
+
+    def get_async(
+        self,
+        service: Any,
+        ids: Iterable[str],
+        operation: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Awaitable variant of :meth:`get` for use with ``BoomiAsync``.
+
+        :return: An awaitable resolving to the merged result.
+        :rtype: Awaitable[BulkResult]
+        """
+        return to_async(self.get)(service, list(ids), operation, chunk_size)
+
+    def _merge(self, outcomes: List[Any]) -> BulkResult:
+        items: List[BulkItem] = []
+        responses: List[Any] = []
+        for chunk, response, error in outcomes:
+            responses.append(response if error is None else error)
+            if error is not None:
+                items.extend(
+                    BulkItem(
+                        id_,
+                        status_code=getattr(error, "status", None),
+                        error_message=str(getattr(error, "message", None) or error),
+                        error=error,
+                    )
+                    for id_ in chunk
+                )
+            else:
+                items.extend(split_bulk_response(chunk, response))
+        return BulkResult(items, responses)
+
+
+def bulk_operation_name(service: Any) -> str:
+    """
+    Find the typed ``bulk_*`` method of a service.
+
+    :param Any service: The service instance.
+    :return: The method name, e.g. ``bulk_environment``.
+    :rtype: str
+    :raises ValueError: If the service has no bulk operation.
+    """
+    names = [
+        name
+        for name in dir(type(service))
+        if name.startswith("bulk_") and not name.endswith("_raw")
+    ]
+    if len(names) != 1:
+        raise ValueError(
+            f"{type(service).__name__} does not expose a single bulk operation: {names}"
+        )
+    return names[0]
+
+
+def bulk_request_class(service: Any) -> type:
+    """
+    Resolve the ``*BulkRequest`` model that matches a service.
+
+    :param Any service: The service instance, e.g. ``EnvironmentService``.
+    :return: The request model class, e.g. ``EnvironmentBulkRequest``.
+    :rtype: type
+    :raises ValueError: If no matching model exists.
+    """
+    from .. import models
+
+    name = service_object_name(service)
+    request_class = getattr(models, f"{name}BulkRequest", None)
+    if request_class is None:
+        raise ValueError(f"No bulk request model found for {type(service).__name__}")
+    return request_class
+
+
+def bulk_request(request_class: type, ids: List[str], type_: str = "GET") -> Any:
+    """
+    Build a bulk request envelope for ``ids``.
+
+    :param type request_class: The ``*BulkRequest`` model class.
+    :param List[str] ids: The ids to include.
+    :param str type_: The bulk operation type.
+    :return: The request model.
+    """
+    from ..models import BulkId
+
+    return request_class(request=[BulkId(id_=id_) for id_ in ids], type_=type_)
+
+
+def split_bulk_response(ids: List[str], response: Any) -> List[BulkItem]:
+    """
+    Split one bulk response into per-id items, aligned with the requested ``ids``.
+
+    Entries are matched by their ``index`` when present, then by ``id``; only
+    when the entries carry neither are they matched by position. Ids missing
+    from the response are reported as failed items, and entries that match no
+    id are appended as failed items.
+
+    :param List[str] ids: The ids sent in the request, in order.
+    :param Any response: A typed ``*BulkResponse``, its raw ``dict``, or a raw
+        XML envelope. Envelope entries are returned as
+        :class:`~boomi.net.transport.utils.BulkEnvelopeEntry` results.
+    :return: One item per requested id, followed by any unattributed entries.
+    :rtype: List[BulkItem]
+    """
+    if isinstance(response, (bytes, bytearray, str)):
+        # Raw-XML operations (the component family) return one opaque
+        # envelope per call; split it into exact per-entry byte slices.
+        entries = [
+            {
+                "id": entry.id_,
+                "statusCode": entry.status_code,
+                "errorMessage": entry.error_message,
+                "Result": entry,
+            }
+            for entry in split_bulk_envelope(response)
+        ]
+        return _match_entries(ids, entries)
+
+    entries = (
+        response.get("response")
+        if isinstance(response, dict)
+        else getattr(response, "response", None)
+    ) or []
+    return _match_entries(ids, entries)
+
+
+def _match_entries(ids: List[str], entries: List[Any]) -> List[BulkItem]:
+    by_id: Dict[str, BulkItem] = {}
+    unmatched: List[BulkItem] = []
+    # Position is only trusted when no entry says which id it belongs to.
+    positional = True
+    for entry in entries:
+        index = field_value(entry, "index", "index")
+        id_ = field_value(entry, "id_", "id")
+        if index is not None or id_ is not None:
+            positional = False
+        if isinstance(index, int) and 0 <= index < len(ids):
+            key = ids[index]
+        elif id_ in ids:
+            key = id_
+        else:
+            key = None
+
+        item = BulkItem(
+            key or id_,
+            status_code=field_value(entry, "status_code", "statusCode"),
+            result=field_value(entry, "result", "Result"),
+            error_message=field_value(entry, "error_message", "errorMessage"),
+        )
+        if key is None or key in by_id:
+            unmatched.append(item)
+        else:
+            by_id[key] = item
+
+    items = []
+    for id_ in ids:
+        if id_ not in by_id and unmatched and positional:
+            item = unmatched.pop(0)
+            item.id_ = id_
+            by_id[id_] = item
+        items.append(
+            by_id.get(id_)
+            or BulkItem(id_, error_message="No entry returned for this id")
+        )
+    for item in unmatched:
+        # An entry that cannot be attributed is kept, but never as a success.
+        item.error_message = item.error_message or "Entry matches no requested id"
+        items.append(item)
+    return items
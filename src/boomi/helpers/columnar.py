@@ -0,0 +1,488 @@
+import csv
+import json
+import os
+from array import array
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple
+
+from ._compat import to_number
+from .concurrency import RateLimiter
+from .paging import iter_raw_query_pages, page_results, service_object_name
+
+#: Column kinds. ``int``/``float``/``bool`` are stored in typed arrays,
+#: ``category`` is dictionary-encoded and ``string`` keeps plain values.
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+CATEGORY = "category"
+STRING = "string"
+
+_TYPECODES = {INT: "q", FLOAT: "d", BOOL: "b"}
+
+#: Default columns per query object: ``(column name, response key, kind)``.
+COLUMN_SCHEMAS: Dict[str, List[Tuple[str, str, str]]] = {
+    "ExecutionRecord": [
+        ("execution_id", "executionId", STRING),
+        ("execution_time", "executionTime", STRING),
+        ("recorded_date", "recordedDate", STRING),
+        ("status", "status", CATEGORY),
+        ("execution_type", "executionType", CATEGORY),
+        ("process_id", "processId", CATEGORY),
+        ("process_name", "processName", CATEGORY),
+        ("atom_id", "atomId", CATEGORY),
+        ("atom_name", "atomName", CATEGORY),
+        ("execution_duration", "executionDuration", INT),
+        ("inbound_document_count", "inboundDocumentCount", INT),
+        ("inbound_document_size", "inboundDocumentSize", INT),
+        ("inbound_error_document_count", "inboundErrorDocumentCount", INT),
+        ("outbound_document_count", "outboundDocumentCount", INT),
+        ("outbound_document_size", "outboundDocumentSize", INT),
+        ("parent_execution_id", "parentExecutionId", STRING),
+        ("top_level_execution_id", "topLevelExecutionId", STRING),
+        ("message", "message", STRING),
+    ],
+    "ExecutionSummaryRecord": [
+        ("time_block", "timeBlock", CATEGORY),
+        ("status", "status", CATEGORY),
+        ("process_id", "processID", CATEGORY),
+        ("process_name", "processName", CATEGORY),
+        ("atom_id", "atomID", CATEGORY),
+        ("atom_name", "atomName", CATEGORY),
+        ("execution_count", "executionCount", INT),
+        ("elapsed_time", "elapsedTime", INT),
+        ("max_elapsed_time", "maxElapsedTime", INT),
+        ("elapsed_var_sum", "elapsedVarSum", FLOAT),
+        ("launch_elapsed_time", "launchElapsedTime", INT),
+        ("inbound_doc_count", "inboundDocCount", INT),
+        ("inbound_doc_size", "inboundDocSize", INT),
+        ("outbound_doc_count", "outboundDocCount", INT),
+        ("outbound_doc_size", "outboundDocSize", INT),
+        ("return_doc_count", "returnDocCount", INT),
+        ("return_doc_size", "returnDocSize", INT),
+    ],
+    "AuditLog": [
+        ("date", "date", STRING),
+        ("user_id", "userId", CATEGORY),
+        ("action", "action", CATEGORY),
+        ("type", "type", CATEGORY),
+        ("level", "level", CATEGORY),
+        ("modifier", "modifier", CATEGORY),
+        ("source", "source", CATEGORY),
+        ("container_id", "containerId", CATEGORY),
+        ("document_id", "documentId", STRING),
+        ("message", "message", STRING),
+    ],
+    "Event": [
+        ("event_id", "eventId", STRING),
+        ("event_date", "eventDate", STRING),
+        ("event_type", "eventType", CATEGORY),
+        ("event_level", "eventLevel", CATEGORY),
+        ("status", "status", CATEGORY),
+        ("environment", "environment", CATEGORY),
+        ("classification", "classification", CATEGORY),
+        ("process_id", "processId", CATEGORY),
+        ("process_name", "processName", CATEGORY),
+        ("atom_id", "atomId", CATEGORY),
+        ("atom_name", "atomName", CATEGORY),
+        ("execution_id", "executionId", STRING),
+        ("error_type", "errorType", CATEGORY),
+        ("errored_step_type", "erroredStepType", CATEGORY),
+        ("error_document_count", "errorDocumentCount", INT),
+        ("inbound_document_count", "inboundDocumentCount", INT),
+        ("outbound_document_count", "outboundDocumentCount", INT),
+        ("error", "error", STRING),
+    ],
+    "ExecutionConnector": [
+        ("id", "id", STRING),
+        ("execution_id", "executionId", CATEGORY),
+        ("execution_connector", "executionConnector", CATEGORY),
+        ("connector_type", "connectorType", CATEGORY),
+        ("action_type", "actionType", CATEGORY),
+        ("record_type", "recordType", CATEGORY),
+        ("is_start_shape", "isStartShape", BOOL),
+        ("success_count", "successCount", INT),
+        ("error_count", "errorCount", INT),
+        ("size", "size", INT),
+    ],
+}
+
+
+class NumericColumn:
+    """
+    A typed ``array.array`` column with a validity mask for missing values.
+
+    Long values sent as ``["Long", 1234]`` are unwrapped. Values that cannot
+    be converted are stored as missing and counted in :attr:`invalid`.
+
+    :ivar str kind: ``int``, ``float`` or ``bool``.
+    :ivar array values: The values; missing entries hold 0.
+    :ivar bytearray valid: 1 for present entries, 0 for missing ones.
+    :ivar int invalid: The number of present values that could not be converted.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.values = array(_TYPECODES[kind])
+        self.valid = bytearray()
+        self.invalid = 0
+        self._cast = {INT: int, FLOAT: float, BOOL: _to_bool}[kind]
+
+    def append(self, value: Any) -> None:
+        try:
+            value = to_number(value, self._cast)
+        except (TypeError, ValueError):
+            self.invalid += 1
+            value = None
+        if value is None:
+            self.values.append(0)
+            self.valid.append(0)
+            return
+        self.values.append(value)
+        self.valid.append(1)
+
+    def __getitem__(self, position: int) -> Any:
+        if not self.valid[position]:
+            return None
+        value = self.values[position]
+        return bool(value) if self.kind == BOOL else value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def sum(self) -> Any:
+        """
+        Sum the present values.
+
+        :rtype: Any
+        """
+        # Missing entries are stored as 0, so they do not affect the sum.
+        return sum(self.values)
+
+    def count(self) -> int:
+        """
+        Count the present values.
+
+        :rtype: int
+        """
+        return len(self.valid) - self.valid.count(0)
+
+    def to_list(self) -> List[Any]:
+        return [self[position] for position in range(len(self))]
+
+
+class CategoryColumn:
+    """
+    A dictionary-encoded string column.
+
+    :ivar array codes: One dictionary index per row; -1 for missing values.
+    :ivar List[str] dictionary: The distinct values, in first-seen order.
+    """
+
+    def __init__(self):
+        self.codes = array("i")
+        self.dictionary: List[str] = []
+        self._lookup: Dict[str, int] = {}
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.dictionary)
+            self.dictionary.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        code = self.codes[position]
+        return None if code < 0 else self.dictionary[code]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def value_counts(self) -> Dict[str, int]:
+        """
+        Count the rows per distinct value.
+
+        :rtype: Dict[str, int]
+        """
+        counts = [0] * len(self.dictionary)
+        for code in self.codes:
+            if code >= 0:
+                counts[code] += 1
+        return dict(zip(self.dictionary, counts))
+
+    def to_list(self) -> List[Optional[str]]:
+        dictionary = self.dictionary
+        return [None if code < 0 else dictionary[code] for code in self.codes]
+
+
+class StringColumn:
+    """
+    A plain string column for high-cardinality values such as ids.
+
+    :ivar List[Optional[str]] values: The values.
+    """
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+
+    def append(self, value: Any) -> None:
+        self.values.append(None if value is None else str(value))
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        return self.values[position]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def to_list(self) -> List[Optional[str]]:
+        return list(self.values)
+
+
+class ColumnBatch:
+    """
+    A chunk of query results stored column by column.
+
+    :ivar List[str] names: The column names, in schema order.
+    :ivar Dict[str, Any] columns: The column objects keyed by name.
+    """
+
+    def __init__(self, schema: Sequence[Tuple[str, str, str]]):
+        """
+        :param Sequence[Tuple[str, str, str]] schema: ``(name, response key, kind)`` triples.
+        """
+        self._schema = list(schema)
+        self.names = [name for name, _, _ in self._schema]
+        self.columns: Dict[str, Any] = {
+            name: _new_column(kind) for name, _, kind in self._schema
+        }
+        self._appenders = [
+            (key, self.columns[name].append) for name, key, _ in self._schema
+        ]
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append one raw response record.
+
+        :param Dict[str, Any] record: A ``result`` entry of a raw query page.
+        """
+        for key, append in self._appenders:
+            append(record.get(key))
+
+    @property
+    def invalid(self) -> Dict[str, int]:
+        """
+        The numeric columns holding values that could not be converted, with
+        the number of such values (stored as missing).
+
+        :rtype: Dict[str, int]
+        """
+        return {
+            name: column.invalid
+            for name, column in self.columns.items()
+            if isinstance(column, NumericColumn) and column.invalid
+        }
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns[self.names[0]]) if self.names else 0
+
+    def iter_rows(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Decode the batch back into one ``dict`` per row.
+
+        :rtype: Generator[Dict[str, Any], None, None]
+        """
+        decoded = [(name, self.columns[name].to_list()) for name in self.names]
+        for position in range(len(self)):
+            yield {name: values[position] for name, values in decoded}
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """
+        Decode every column into a plain list.
+
+        :rtype: Dict[str, List[Any]]
+        """
+        return {name: self.columns[name].to_list() for name in self.names}
+
+    def to_arrow(self) -> Any:
+        """
+        Convert the batch into a ``pyarrow.Table``; category columns become
+        dictionary arrays without re-encoding.
+
+        :rtype: pyarrow.Table
+        :raises ImportError: If ``pyarrow`` is not installed.
+        """
+        pa = _require_pyarrow()
+        arrays = []
+        for name in self.names:
+            column = self.columns[name]
+            if isinstance(column, CategoryColumn):
+                codes = pa.array(column.codes, type=pa.int32(), mask=_null_mask(column))
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(codes, pa.array(column.dictionary, pa.string()))
+                )
+            elif isinstance(column, NumericColumn):
+                arrow_type = {INT: pa.int64(), FLOAT: pa.float64(), BOOL: pa.bool_()}[column.kind]
+                arrays.append(
+                    pa.array(column.values, type=arrow_type, mask=_null_mask(column))
+                )
+            else:
+                arrays.append(pa.array(column.values, type=pa.string()))
+        return pa.Table.from_arrays(arrays, names=self.names)
+
+
+def column_schema(
+    service: Any, columns: Optional[Sequence[str]] = None
+) -> List[Tuple[str, str, str]]:
+    """
+    Get the default column schema of a query service.
+
+    :param Any service: The service, e.g. ``sdk.execution_record``.
+    :param Optional[Sequence[str]] columns: Restrict to these column names, in this order.
+    :rtype: List[Tuple[str, str, str]]
+    :raises ValueError: If the service has no default schema or a column is unknown.
+    """
+    object_name = service_object_name(service)
+    schema = COLUMN_SCHEMAS.get(object_name)
+    if schema is None:
+        raise ValueError(f"No column schema defined for {object_name}")
+    if columns is None:
+        return list(schema)
+    by_name = {entry[0]: entry for entry in schema}
+    unknown = [name for name in columns if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown {object_name} columns: {unknown}")
+    return [by_name[name] for name in columns]
+
+
+def iter_column_batches(
+    service: Any,
+    query_config: Any = None,
+    schema: Optional[Sequence[Tuple[str, str, str]]] = None,
+    chunk_size: Optional[int] = 100_000,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Generator[ColumnBatch, None, None]:
+    """
+    Run a query and collect its results into column batches.
+
+    Raw response pages are appended straight into the columns; no result
+    model is ever built.
+
+    :param Any service: A sync or async query service, e.g. ``sdk.execution_record``.
+    :param Any query_config: The ``*QueryConfig`` (model or dict) of the first page.
+    :param Optional[Sequence[Tuple[str, str, str]]] schema: The columns. Defaults
+        to :func:`column_schema` of the service.
+    :param Optional[int] chunk_size: Rows per batch; ``None`` yields one batch
+        holding every row.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every page.
+    :return: A generator of column batches.
+    :rtype: Generator[ColumnBatch, None, None]
+    """
+    schema = list(schema) if schema is not None else column_schema(service)
+    batch = ColumnBatch(schema)
+    for page in iter_raw_query_pages(service, query_config, rate_limiter=rate_limiter):
+        for record in page_results(page):
+            batch.append(record)
+            if chunk_size and len(batch) >= chunk_size:
+                yield batch
+                batch = ColumnBatch(schema)
+    if len(batch):
+        yield batch
+
+
+def write_column_batches(
+    batches: Iterable[ColumnBatch],
+    directory: str,
+    format: str = "csv",
+    prefix: str = "part",
+) -> List[str]:
+    """
+    Write each batch to its own file: ``<directory>/<prefix>-00000.<ext>``.
+
+    Every file is written under a temporary name and renamed into place, so a
+    partially written chunk never appears under its final name.
+
+    :param Iterable[ColumnBatch] batches: The batches, e.g. from :func:`iter_column_batches`.
+    :param str directory: The target directory. Created if missing.
+    :param str format: ``csv``, ``ndjson`` or ``parquet`` (requires ``pyarrow``).
+    :param str prefix: The file name prefix.
+    :return: The written file paths, in batch order.
+    :rtype: List[str]
+    :raises ValueError: If ``format`` is not supported.
+    """
+    writers = {"csv": _write_csv, "ndjson": _write_ndjson, "parquet": _write_parquet}
+    writer = writers.get(format)
+    if writer is None:
+        raise ValueError(f"Unsupported format {format!r}, expected one of {list(writers)}")
+    if format == "parquet":
+        _require_pyarrow()
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for number, batch in enumerate(batches):
+        path = os.path.join(directory, f"{prefix}-{number:05d}.{format}")
+        temporary_path = f"{path}.partial"
+        writer(batch, temporary_path)
+        os.replace(temporary_path, path)
+        paths.append(path)
+    return paths
+
+
+def _write_csv(batch: ColumnBatch, path: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(batch.names)
+        columns = [batch.columns[name].to_list() for name in batch.names]
+        writer.writerows(zip(*columns))
+
+
+def _write_ndjson(batch: ColumnBatch, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for row in batch.iter_rows():
+            file.write(json.dumps(row, separators=(",", ":")))
+            file.write("\n")
+
+
+def _write_parquet(batch: ColumnBatch, path: str) -> None:
+    import pyarrow.parquet as pq
+
+    pq.write_table(batch.to_arrow(), path)
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Parquet output requires pyarrow: pip install 'boomi[parquet]'"
+        ) from error
+    return pyarrow
+
+
+def _null_mask(column: Any) -> Any:
+    if isinstance(column, CategoryColumn):
+        if -1 not in column.codes:
+            return None
+        return [code < 0 for code in column.codes]
+    if 0 not in column.valid:
+        return None
+    return [not valid for valid in column.valid]
+
+
+def _new_column(kind: str) -> Any:
+    if kind in _TYPECODES:
+        return NumericColumn(kind)
+    if kind == CATEGORY:
+        return CategoryColumn()
+    if kind == STRING:
+        return StringColumn()
+    raise ValueError(f"Unsupported column kind {kind!r}")
+
+
+def _to_bool(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value.lower() == "true")
+    return int(bool(value))
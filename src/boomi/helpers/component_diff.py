@@ -0,0 +1,557 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from xml.parsers.expat import ExpatError
+
+from ._compat import field_value
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    chunked,
+    default_rate_limiter,
+    run_concurrently,
+    sync_method,
+)
+from .paging import iter_query_pages, page_results
+from .xml_diff import diff_component_xml
+from ..services.async_.utils.to_async import to_async
+
+#: Number of component ids or-ed into one ComponentMetadata query.
+METADATA_QUERY_SIZE = 50
+
+#: Diff statuses.
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+ADDED = "added"
+REMOVED = "removed"
+FAILED = "failed"
+
+#: The change kinds of a ``GenericDiff``.
+CHANGE_KINDS = ("addition", "deletion", "modification")
+
+#: A diff cache key: ``(component_id, source_version, target_version)``.
+DiffKey = Tuple[str, int, int]
+
+#: Returns the raw XML of a component version when it is available locally,
+#: else ``None``; e.g. :meth:`ComponentMirror.read`.
+XmlSource = Callable[[str, int], Optional[bytes]]
+
+
+class ComponentDiff:
+    """
+    The difference between two versions of one component.
+
+    :ivar str component_id: The component id.
+    :ivar Optional[int] source_version: The version compared from, ``None`` if
+        the component is missing on the source branch.
+    :ivar Optional[int] target_version: The version compared to, ``None`` if
+        the component is missing on the target branch.
+    :ivar str status: ``changed``, ``unchanged``, ``added`` (target only),
+        ``removed`` (source only) or ``failed``.
+    :ivar Optional[str] name: The component name, when resolved from branches.
+    :ivar Optional[str] type_: The component type, when resolved from branches.
+    :ivar Any response: The ``ComponentDiffResponseCreate`` (or its raw ``dict``).
+    :ivar Dict[str, int] totals: The number of changes per kind
+        (``addition``, ``deletion``, ``modification``).
+    :ivar bool cached: Whether the response came from the cache.
+    :ivar bool local: Whether the diff was computed locally from cached XML
+        (see :func:`~boomi.helpers.xml_diff.diff_component_xml`).
+    :ivar Optional[Exception] error: The diff request error.
+    """
+
+    def __init__(
+        self,
+        component_id: str,
+        source_version: Optional[int],
+        target_version: Optional[int],
+        status: str = UNCHANGED,
+        name: Optional[str] = None,
+        type_: Optional[str] = None,
+    ):
+        self.component_id = component_id
+        self.source_version = source_version
+        self.target_version = target_version
+        self.status = status
+        self.name = name
+        self.type_ = type_
+        self.response: Any = None
+        self.totals: Dict[str, int] = dict.fromkeys(CHANGE_KINDS, 0)
+        self.cached = False
+        self.local = False
+        self.error: Optional[Exception] = None
+
+    @property
+    def key(self) -> DiffKey:
+        """
+        The cache key of the diff.
+
+        :rtype: DiffKey
+        """
+        return (self.component_id, self.source_version, self.target_version)
+
+    def changes(self) -> Iterable[Tuple[str, Any]]:
+        """
+        Every change of the diff with its kind.
+
+        :return: ``(kind, change)`` pairs; ``change`` is an ``AdditionChange``,
+            ``DeletionChange`` or ``ModificationChange`` (or its ``dict``).
+        :rtype: Iterable[Tuple[str, Any]]
+        """
+        generic_diff = generic_diff_of(self.response)
+        for kind in CHANGE_KINDS:
+            for change in _changes(field_value(generic_diff, kind, kind)):
+                yield kind, change
+
+    def _set_response(self, response: Any, cached: bool) -> None:
+        self.response = response
+        self.cached = cached
+        generic_diff = generic_diff_of(response)
+        for kind in CHANGE_KINDS:
+            section = field_value(generic_diff, kind, kind)
+            total = field_value(section, "total", "total")
+            self.totals[kind] = int(total) if total is not None else len(_changes(section))
+        self.status = CHANGED if any(self.totals.values()) else UNCHANGED
+
+    def __repr__(self) -> str:
+        return (
+            f"ComponentDiff(component_id={self.component_id!r}, source_version={self.source_version!r}, "
+            f"target_version={self.target_version!r}, status={self.status!r}, totals={self.totals})"
+        )
+
+
+class ComponentDiffReport:
+    """
+    The diffs of a :meth:`ComponentDiffEngine.diff` or :meth:`ComponentDiffEngine.diff_branches`.
+
+    :ivar List[ComponentDiff] diffs: One entry per component or requested pair.
+    :ivar int requests: The number of API calls made.
+    :ivar int cache_hits: The number of diffs answered from the cache.
+    :ivar int local: The number of diffs computed locally from cached XML.
+    :ivar float elapsed: Wall-clock seconds spent.
+    """
+
+    def __init__(self, diffs: List[ComponentDiff]):
+        self.diffs = diffs
+        self.requests = 0
+        self.cache_hits = 0
+        self.local = 0
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every diff succeeded.
+
+        :rtype: bool
+        """
+        return not self.failures
+
+    @property
+    def failures(self) -> List[ComponentDiff]:
+        """
+        The diffs whose request failed.
+
+        :rtype: List[ComponentDiff]
+        """
+        return [diff for diff in self.diffs if diff.status == FAILED]
+
+    @property
+    def changed(self) -> List[ComponentDiff]:
+        """
+        The components that differ: changed, added or removed.
+
+        :rtype: List[ComponentDiff]
+        """
+        return [diff for diff in self.diffs if diff.status in (CHANGED, ADDED, REMOVED)]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        The number of components per status.
+
+        :rtype: Dict[str, int]
+        """
+        counts: Dict[str, int] = {}
+        for diff in self.diffs:
+            counts[diff.status] = counts.get(diff.status, 0) + 1
+        return counts
+
+    def totals(self) -> Dict[str, int]:
+        """
+        The number of changes per kind across all components.
+
+        :rtype: Dict[str, int]
+        """
+        totals = dict.fromkeys(CHANGE_KINDS, 0)
+        for diff in self.diffs:
+            for kind, count in diff.totals.items():
+                totals[kind] += count
+        return totals
+
+    def by_element(self) -> Dict[str, Dict[str, int]]:
+        """
+        The number of changes per changed element name and kind, across all
+        components, e.g. ``{"shape": {"modification": 12}}``.
+
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        elements: Dict[str, Dict[str, int]] = {}
+        for diff in self.diffs:
+            for kind, change in diff.changes():
+                element_key = field_value(change, "element_key", "elementKey")
+                name = field_value(element_key, "element_name", "elementName") or field_value(
+                    change, "changed_particle_name", "changedParticleName"
+                )
+                counts = elements.setdefault(name or "", {})
+                counts[kind] = counts.get(kind, 0) + 1
+        return elements
+
+    def by_type(self) -> Dict[str, Dict[str, int]]:
+        """
+        The number of components per component type and status.
+
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        types: Dict[str, Dict[str, int]] = {}
+        for diff in self.diffs:
+            counts = types.setdefault(diff.type_ or "", {})
+            counts[diff.status] = counts.get(diff.status, 0) + 1
+        return types
+
+    def __iter__(self):
+        return iter(self.diffs)
+
+    def __len__(self) -> int:
+        return len(self.diffs)
+
+    def __repr__(self) -> str:
+        return (
+            f"ComponentDiffReport(diffs={len(self.diffs)}, counts={self.counts()}, "
+            f"requests={self.requests}, cache_hits={self.cache_hits}, local={self.local})"
+        )
+
+
+class ComponentDiffEngine:
+    """
+    Concurrent, cached component version diffs across many components.
+
+    ``create_component_diff_request`` compares two versions of one component,
+    so comparing a release or two branches means one call per component. The
+    engine sends those calls concurrently through the shared rate limiter and
+    keeps every response in an LRU cache keyed by ``(component_id,
+    source_version, target_version)``: component versions are immutable, so a
+    diff never changes and repeated comparisons (a branch compared after every
+    commit, the same release reviewed twice) only request the new pairs.
+    Identical pairs within one call are requested once.
+
+    :meth:`diff_branches` resolves the current version of each component on
+    two branches with chunked ComponentMetadata queries, diffs the components
+    whose versions differ, and reports components present on one branch only
+    as added or removed, without a diff call.
+
+    With an ``xml_source`` (such as :meth:`ComponentMirror.read`), pairs whose
+    two versions are both available locally are diffed on the client with
+    :func:`~boomi.helpers.xml_diff.diff_component_xml`, without a request.
+
+    Example Usage:
+    ```python
+    engine = ComponentDiffEngine(sdk)
+    report = engine.diff_branches("MAIN_BRANCH_ID", "FEATURE_BRANCH_ID")
+    for diff in report.changed:
+        print(diff.name, diff.status, diff.totals)
+    print(report.counts(), report.totals())
+    ```
+
+    :ivar int max_workers: Diff requests dispatched concurrently.
+    :ivar int cache_size: The number of diff responses kept.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_size: int = 4096,
+        xml_source: Optional[XmlSource] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ComponentDiffEngine.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param int max_workers: Diff requests dispatched concurrently.
+        :param int cache_size: The number of diff responses kept.
+        :param Optional[XmlSource] xml_source: Returns the raw XML of a
+            component version when it is available locally, else ``None``.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self._xml_source = xml_source
+        self._diff_request = sync_method(sdk.component_diff_request, "create_component_diff_request")
+        self._component_metadata = sdk.component_metadata
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._cache: "OrderedDict[DiffKey, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def diff(self, pairs: Iterable[Any]) -> ComponentDiffReport:
+        """
+        Diff many components, each between two versions.
+
+        :param Iterable[Any] pairs: ``(component_id, source_version, target_version)``
+            tuples, ``ComponentDiffRequest`` models or their API JSON dicts.
+        :return: One diff per pair, in order.
+        :rtype: ComponentDiffReport
+        """
+        started = time.monotonic()
+        report = ComponentDiffReport([ComponentDiff(*_diff_key(pair)) for pair in pairs])
+        self._run(report)
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def diff_branches(
+        self,
+        source_branch_id: str,
+        target_branch_id: str,
+        component_ids: Optional[Iterable[str]] = None,
+    ) -> ComponentDiffReport:
+        """
+        Diff the current versions of components on two branches.
+
+        :param str source_branch_id: The branch compared from.
+        :param str target_branch_id: The branch compared to.
+        :param Optional[Iterable[str]] component_ids: The components to compare;
+            every component current on either branch when omitted.
+        :return: One diff per component, ordered by component id.
+        :rtype: ComponentDiffReport
+        :raises ApiError: If a ComponentMetadata query fails.
+        """
+        started = time.monotonic()
+        component_ids = list(dict.fromkeys(component_ids)) if component_ids is not None else None
+        outcomes = run_concurrently(
+            lambda branch_id: self._current_versions(branch_id, component_ids),
+            [source_branch_id, target_branch_id],
+            2,
+            self._rate_limiter,
+        )
+        for _, _, error in outcomes:
+            if error is not None:
+                raise error
+        (source, source_requests), (target, target_requests) = [result for _, result, _ in outcomes]
+
+        diffs = []
+        for component_id in sorted(set(source) | set(target)):
+            before, after = source.get(component_id), target.get(component_id)
+            metadata = after or before
+            diff = ComponentDiff(
+                component_id,
+                _version(before),
+                _version(after),
+                name=field_value(metadata, "name", "name"),
+                type_=field_value(metadata, "type_", "type"),
+            )
+            if before is None:
+                diff.status = ADDED
+            elif after is None:
+                diff.status = REMOVED
+            diffs.append(diff)
+
+        report = ComponentDiffReport(diffs)
+        report.requests = source_requests + target_requests
+        self._run(report)
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def diff_async(self, pairs: Iterable[Any]):
+        """
+        Awaitable variant of :meth:`diff` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[ComponentDiffReport]
+        """
+        return to_async(self.diff)(list(pairs))
+
+    def diff_branches_async(
+        self,
+        source_branch_id: str,
+        target_branch_id: str,
+        component_ids: Optional[Iterable[str]] = None,
+    ):
+        """
+        Awaitable variant of :meth:`diff_branches` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[ComponentDiffReport]
+        """
+        return to_async(self.diff_branches)(
+            source_branch_id, target_branch_id, list(component_ids) if component_ids is not None else None
+        )
+
+    def clear_cache(self) -> None:
+        """Drop every cached diff response."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _run(self, report: ComponentDiffReport) -> None:
+        pending: Dict[DiffKey, List[ComponentDiff]] = {}
+        for diff in report.diffs:
+            if diff.status in (ADDED, REMOVED):
+                continue
+            if diff.source_version == diff.target_version:
+                continue
+            response = self._cached(diff.key)
+            if response is not None:
+                diff._set_response(response, cached=True)
+                report.cache_hits += 1
+            else:
+                pending.setdefault(diff.key, []).append(diff)
+
+        if self._xml_source is not None:
+            for key in list(pending):
+                response = self._local_diff(key)
+                if response is None:
+                    continue
+                self._store(key, response)
+                for diff in pending.pop(key):
+                    diff._set_response(response, cached=False)
+                    diff.local = True
+                    report.local += 1
+
+        for key, response, error in run_concurrently(
+            self._request, list(pending), self.max_workers, self._rate_limiter
+        ):
+            report.requests += 1
+            for diff in pending[key]:
+                if error is not None:
+                    diff.status = FAILED
+                    diff.error = error
+                else:
+                    diff._set_response(response, cached=False)
+            if error is None:
+                self._store(key, response)
+
+    def _request(self, key: DiffKey) -> Any:
+        from ..models import ComponentDiffRequest
+
+        component_id, source_version, target_version = key
+        return self._diff_request(
+            ComponentDiffRequest(
+                component_id=component_id,
+                source_version=source_version,
+                target_version=target_version,
+            )
+        )
+
+    def _local_diff(self, key: DiffKey) -> Optional[Dict[str, Any]]:
+        component_id, source_version, target_version = key
+        source = self._xml_source(component_id, source_version)
+        if source is None:
+            return None
+        target = self._xml_source(component_id, target_version)
+        if target is None:
+            return None
+        try:
+            return diff_component_xml(source, target)
+        except ExpatError:
+            # Unreadable local copies are left to the server.
+            return None
+
+    def _cached(self, key: DiffKey) -> Any:
+        with self._cache_lock:
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+            return response
+
+    def _store(self, key: DiffKey, response: Any) -> None:
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _current_versions(
+        self, branch_id: str, component_ids: Optional[List[str]]
+    ) -> Tuple[Dict[str, Any], int]:
+        current: Dict[str, Any] = {}
+        requests = 0
+        if component_ids is None:
+            chunks: Iterable[Optional[List[str]]] = [None]
+        else:
+            chunks = chunked(component_ids, METADATA_QUERY_SIZE)
+        for components in chunks:
+            for page in iter_query_pages(
+                self._component_metadata,
+                _current_versions_query(branch_id, components),
+                rate_limiter=self._rate_limiter,
+            ):
+                requests += 1
+                for metadata in page_results(page):
+                    if str(field_value(metadata, "deleted", "deleted")).lower() == "true":
+                        continue
+                    current[field_value(metadata, "component_id", "componentId")] = metadata
+        return current, requests
+
+
+def generic_diff_of(response: Any) -> Any:
+    """
+    Get the ``GenericDiff`` of a component diff response.
+
+    :param Any response: A ``ComponentDiffResponseCreate`` or
+        ``ComponentDiffResponse`` model, or the API JSON ``dict`` of either.
+    :return: The ``GenericDiff`` model or ``dict``, or ``None``.
+    :rtype: Any
+    """
+    if response is None:
+        return None
+    if isinstance(response, dict):
+        response = response.get("ComponentDiffResponse", response)
+        return response.get("GenericDiff")
+    return getattr(response, "generic_diff", None)
+
+
+def _current_versions_query(branch_id: str, component_ids: Optional[List[str]]) -> Any:
+    from ..models import (
+        ComponentMetadataGroupingExpression,
+        ComponentMetadataQueryConfig,
+        ComponentMetadataQueryConfigQueryFilter,
+        ComponentMetadataSimpleExpression,
+    )
+
+    def _equals(property: str, value: str) -> Any:
+        return ComponentMetadataSimpleExpression(operator="EQUALS", property=property, argument=[value])
+
+    expressions = [_equals("currentVersion", "true"), _equals("branchId", branch_id)]
+    if component_ids:
+        expressions.append(
+            _equals("componentId", component_ids[0])
+            if len(component_ids) == 1
+            else ComponentMetadataGroupingExpression(
+                operator="or",
+                nested_expression=[_equals("componentId", component_id) for component_id in component_ids],
+            )
+        )
+    return ComponentMetadataQueryConfig(
+        query_filter=ComponentMetadataQueryConfigQueryFilter(
+            expression=ComponentMetadataGroupingExpression(operator="and", nested_expression=expressions)
+        )
+    )
+
+
+def _diff_key(pair: Any) -> DiffKey:
+    if isinstance(pair, (list, tuple)):
+        component_id, source_version, target_version = pair
+    else:
+        component_id = field_value(pair, "component_id", "componentId")
+        source_version = field_value(pair, "source_version", "sourceVersion")
+        target_version = field_value(pair, "target_version", "targetVersion")
+    return (component_id, int(source_version), int(target_version))
+
+
+def _version(metadata: Any) -> Optional[int]:
+    version = field_value(metadata, "version", "version")
+    return int(version) if version is not None else None
+
+
+def _changes(section: Any) -> List[Any]:
+    changes = field_value(section, "change", "change")
+    if changes is None:
+        return []
+    return changes if isinstance(changes, list) else [changes]
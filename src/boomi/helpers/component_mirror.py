@@ -0,0 +1,310 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from ._compat import enum_value
+from .component_export import ComponentExporter, DirectorySink
+from .concurrency import DEFAULT_MAX_WORKERS, RateLimiter, default_rate_limiter
+from .paging import iter_query
+from ..services.async_.utils.to_async import to_async
+
+INDEX_FILE_NAME = "mirror-index.json"
+COMPONENTS_DIRECTORY_NAME = "components"
+#: The branch the mirror follows, by name.
+MAIN_BRANCH = "main"
+
+
+class MirrorSyncReport:
+    """
+    Summary of a :meth:`ComponentMirror.sync` run.
+
+    :ivar List[str] added: Components written for the first time.
+    :ivar List[str] updated: Components whose version changed.
+    :ivar List[str] deleted: Components the account reports as deleted.
+    :ivar int unchanged: Changed-metadata rows whose version was already mirrored.
+    :ivar List[Any] failures: ``ExportedComponent`` entries that could not be fetched.
+    :ivar Optional[str] high_water_mark: The ``modifiedDate`` the next run starts from.
+    """
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.updated: List[str] = []
+        self.deleted: List[str] = []
+        self.unchanged = 0
+        self.failures: List[Any] = []
+        self.high_water_mark: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"MirrorSyncReport(added={len(self.added)}, updated={len(self.updated)}, "
+            f"deleted={len(self.deleted)}, unchanged={self.unchanged}, "
+            f"failures={len(self.failures)}, high_water_mark={self.high_water_mark!r})"
+        )
+
+
+class ComponentMirror:
+    """
+    Incremental local mirror of an account's component XML, keyed on version.
+
+    Each :meth:`sync` queries ComponentMetadata for current versions modified
+    since the stored high-water mark, fetches raw XML only for new or changed
+    ``(componentId, version)`` pairs through :class:`ComponentExporter`, removes
+    components reported as deleted, and persists the index. Resyncing an
+    unchanged account costs a single metadata query page.
+
+    The mirror follows the main branch, the version a component GET returns.
+    Metadata rows of other branches are skipped, so each component has one
+    mirrored version and the version check does not flip between branches.
+
+    The mirror directory holds ``mirror-index.json`` and one
+    ``components/<componentId>.xml`` file per live component, which makes it a
+    natural git working tree for audit history.
+
+    :ivar str directory: The mirror root directory.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        directory: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ComponentMirror.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param str directory: The mirror root directory. Created if missing.
+        :param int max_workers: The number of component fetches in flight.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.directory = directory
+        self._metadata_service = sdk.component_metadata
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        # Mirrored files are parsed on their own (e.g. by diff_component_xml),
+        # so they carry the envelope's namespace declarations.
+        self._exporter = ComponentExporter(
+            sdk.component,
+            max_workers=max_workers,
+            rate_limiter=self._rate_limiter,
+            standalone=True,
+        )
+        self._sink = DirectorySink(os.path.join(directory, COMPONENTS_DIRECTORY_NAME))
+        self._index = self._load_index()
+
+    @property
+    def high_water_mark(self) -> Optional[str]:
+        """
+        The ``modifiedDate`` from which the next sync queries changes.
+
+        :rtype: Optional[str]
+        """
+        return self._index.get("high_water_mark")
+
+    @property
+    def components(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The mirrored component index keyed by component id.
+
+        Each entry holds ``version``, ``modified_date``, ``name``, ``type`` and
+        ``folder_id``; deleted components additionally carry ``deleted: True``.
+
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        return self._index["components"]
+
+    def path_for(self, component_id: str) -> str:
+        """
+        Get the local XML path of a mirrored component.
+
+        :param str component_id: The component id.
+        :rtype: str
+        """
+        return self._sink.path_for(component_id)
+
+    def read(self, component_id: str, version: Optional[int] = None) -> Optional[bytes]:
+        """
+        Read the mirrored raw XML of a component.
+
+        Usable as the ``xml_source`` of :class:`ComponentDiffEngine`, so diffs
+        against the mirrored version are computed locally.
+
+        :param str component_id: The component id.
+        :param Optional[int] version: Only return the XML if this is the mirrored version.
+        :return: The XML bytes, or ``None`` if the component (or version) is not mirrored.
+        :rtype: Optional[bytes]
+        """
+        entry = self.components.get(component_id)
+        if entry is None or entry.get("deleted"):
+            return None
+        if version is not None and entry.get("version") != version:
+            return None
+        try:
+            with open(self.path_for(component_id), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def sync(self) -> MirrorSyncReport:
+        """
+        Bring the mirror up to date with the account.
+
+        :return: The sync summary.
+        :rtype: MirrorSyncReport
+        """
+        report = MirrorSyncReport()
+        components = self.components
+        pending: Dict[str, Any] = {}
+        modified_dates: List[str] = []
+
+        for metadata in iter_query(
+            self._metadata_service,
+            self._changes_query(),
+            rate_limiter=self._rate_limiter,
+        ):
+            component_id = metadata.component_id
+            modified_date = getattr(metadata, "modified_date", None)
+            if modified_date:
+                modified_dates.append(modified_date)
+            if not _on_main_branch(metadata):
+                continue
+            known = components.get(component_id)
+
+            if getattr(metadata, "deleted", False):
+                if known is not None and not known.get("deleted"):
+                    self._remove(component_id)
+                    known.update(deleted=True, modified_date=modified_date)
+                    report.deleted.append(component_id)
+                continue
+
+            if (
+                known is not None
+                and not known.get("deleted")
+                and known.get("version") == metadata.version
+            ):
+                report.unchanged += 1
+                continue
+            pending[component_id] = metadata
+
+        fetched = set()
+        for exported in self._exporter.iter_components(list(pending)):
+            if not exported.ok:
+                report.failures.append(exported)
+                continue
+            metadata = pending[exported.component_id]
+            is_new = exported.component_id not in components or components[
+                exported.component_id
+            ].get("deleted")
+            self._sink.write(exported)
+            components[exported.component_id] = _index_entry(metadata, exported)
+            fetched.add(exported.component_id)
+            (report.added if is_new else report.updated).append(exported.component_id)
+
+        # Failed components are retried next run: never move the mark past them.
+        failed_dates = [
+            pending[component_id].modified_date
+            for component_id in pending
+            if component_id not in fetched
+            and getattr(pending[component_id], "modified_date", None)
+        ]
+        if failed_dates:
+            self._index["high_water_mark"] = min(failed_dates)
+        elif modified_dates:
+            self._index["high_water_mark"] = max(
+                modified_dates + [self.high_water_mark or ""]
+            )
+
+        report.high_water_mark = self.high_water_mark
+        self._save_index()
+        return report
+
+    def sync_async(self):
+        """
+        Awaitable variant of :meth:`sync` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[MirrorSyncReport]
+        """
+        return to_async(self.sync)()
+
+    def _changes_query(self) -> Any:
+        from ..models import (
+            ComponentMetadataGroupingExpression,
+            ComponentMetadataQueryConfig,
+            ComponentMetadataQueryConfigQueryFilter,
+            ComponentMetadataSimpleExpression,
+        )
+
+        expressions = [
+            ComponentMetadataSimpleExpression(
+                operator="EQUALS", property="currentVersion", argument=["true"]
+            )
+        ]
+        if self.high_water_mark:
+            # Inclusive: rows sharing the mark's timestamp may not have been
+            # seen yet; already-mirrored versions are skipped by the version check.
+            expressions.append(
+                ComponentMetadataSimpleExpression(
+                    operator="GREATER_THAN_OR_EQUAL",
+                    property="modifiedDate",
+                    argument=[self.high_water_mark],
+                )
+            )
+
+        expression = (
+            expressions[0]
+            if len(expressions) == 1
+            else ComponentMetadataGroupingExpression(
+                operator="and", nested_expression=expressions
+            )
+        )
+        return ComponentMetadataQueryConfig(
+            query_filter=ComponentMetadataQueryConfigQueryFilter(expression=expression)
+        )
+
+    def _remove(self, component_id: str) -> None:
+        try:
+            os.remove(self.path_for(component_id))
+        except FileNotFoundError:
+            pass
+
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, INDEX_FILE_NAME)
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as file:
+                index = json.load(file)
+        except FileNotFoundError:
+            index = {}
+        index.setdefault("high_water_mark", None)
+        index.setdefault("components", {})
+        return index
+
+    def _save_index(self) -> None:
+        path = self._index_path()
+        temporary_path = f"{path}.partial"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(self._index, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, path)
+
+
+def _on_main_branch(metadata: Any) -> bool:
+    # Accounts without Branch and Merge report no branch at all.
+    branch_name = getattr(metadata, "branch_name", None)
+    return not branch_name or branch_name.lower() == MAIN_BRANCH
+
+
+def _index_entry(metadata: Any, exported: Any) -> Dict[str, Any]:
+    # The export fetches the latest version, which may be newer than the
+    # metadata row if the component was saved in between; record what was written.
+    version = getattr(metadata, "version", None)
+    if exported.version and exported.version.isdigit():
+        version = int(exported.version)
+    type_ = getattr(metadata, "type_", None)
+    return {
+        "version": version,
+        "modified_date": getattr(metadata, "modified_date", None),
+        "name": getattr(metadata, "name", None),
+        "type": enum_value(type_),
+        "folder_id": getattr(metadata, "folder_id", None),
+    }
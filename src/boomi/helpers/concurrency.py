@@ -0,0 +1,458 @@
+import heapq
+import itertools
+import math
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import monotonic, sleep
+from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: Boomi's documented Platform API rate limit is 10 requests per second per account.
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+#: Default number of worker threads used by the helpers for concurrent dispatch.
+DEFAULT_MAX_WORKERS = 8
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket shared by concurrent helper calls.
+
+    Every call to :meth:`acquire` consumes one token; when the bucket is empty the
+    caller sleeps until a token is available. Callers reserve their slot under the
+    lock and sleep outside it, so waiting threads are released in arrival order.
+
+    :ivar float rate: The sustained number of requests allowed per second.
+    :ivar int burst: The maximum number of tokens that may accumulate.
+    """
+
+    def __init__(
+        self, rate: Optional[float] = DEFAULT_REQUESTS_PER_SECOND, burst: int = None
+    ):
+        """
+        Initialize a new instance of RateLimiter.
+
+        :param Optional[float] rate: Requests per second. ``None`` or ``0`` disables limiting.
+        :param int burst: Bucket capacity. Defaults to ``rate`` (rounded up, at least 1).
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate or 1))
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token from the bucket, blocking until it is available.
+
+        :return: The number of seconds the caller waited.
+        :rtype: float
+        """
+        if not self.rate:
+            return 0.0
+
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+
+_default_rate_limiter = RateLimiter()
+
+
+def default_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter the helpers share when none is supplied.
+
+    :return: The shared RateLimiter.
+    :rtype: RateLimiter
+    """
+    return _default_rate_limiter
+
+
+def set_default_rate_limiter(rate_limiter: RateLimiter) -> None:
+    """
+    Replace the process-wide rate limiter used by the helpers.
+
+    :param RateLimiter rate_limiter: The new shared limiter.
+    """
+    global _default_rate_limiter
+    _default_rate_limiter = rate_limiter
+
+
+def chunked(items: Iterable[T], size: int) -> Generator[List[T], None, None]:
+    """
+    Split an iterable into consecutive lists of at most ``size`` items.
+
+    :param Iterable[T] items: The items to split.
+    :param int size: The maximum chunk size.
+    :return: A generator of chunks.
+    :rtype: Generator[List[T], None, None]
+    :raises ValueError: If ``size`` is less than 1.
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be at least 1, received {size}")
+
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def imap_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limiter: Optional[RateLimiter] = None,
+    ordered: bool = True,
+) -> Generator[Tuple[T, Optional[R], Optional[Exception]], None, None]:
+    """
+    Apply ``func`` to every item on a thread pool and yield the outcomes lazily.
+
+    At most ``2 * max_workers`` calls are in flight at once and ``items`` is
+    consumed incrementally, so memory stays bounded for arbitrarily long inputs.
+    Exceptions raised by ``func`` are captured and yielded, never raised, so one
+    failing item does not abort the others.
+
+    :param Callable[[T], R] func: The function to call for each item.
+    :param Iterable[T] items: The inputs.
+    :param int max_workers: The number of worker threads.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every call.
+    :param bool ordered: Yield in input order (True) or completion order (False).
+    :return: A generator of ``(item, result, error)`` tuples.
+    :rtype: Generator[Tuple[T, Optional[R], Optional[Exception]], None, None]
+    """
+
+    def _call(item: T) -> Tuple[Optional[R], Optional[Exception]]:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return func(item), None
+        except Exception as error:
+            return None, error
+
+    window = max(1, max_workers) * 2
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        pending = deque()
+        iterator = iter(items)
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, pool.submit(_call, item)))
+
+            if not pending:
+                return
+
+            if ordered:
+                item, future = pending.popleft()
+            else:
+                index = next(
+                    (i for i, (_, f) in enumerate(pending) if f.done()), None
+                )
+                if index is None:
+                    wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                    continue
+                item, future = pending[index]
+                del pending[index]
+
+            result, error = future.result()
+            yield item, result, error
+
+
+def run_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> List[Tuple[T, Optional[R], Optional[Exception]]]:
+    """
+    Apply ``func`` to every item concurrently and collect the outcomes in input order.
+
+    :param Callable[[T], R] func: The function to call for each item.
+    :param Iterable[T] items: The inputs.
+    :param int max_workers: The number of worker threads.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every call.
+    :return: A list of ``(item, result, error)`` tuples.
+    :rtype: List[Tuple[T, Optional[R], Optional[Exception]]]
+    """
+    return list(imap_concurrently(func, items, max_workers, rate_limiter))
+
+
+def sync_method(service: Any, name: str) -> Callable[..., Any]:
+    """
+    Resolve the synchronous implementation of a service method.
+
+    Async service wrappers (``*ServiceAsync``) override every method to return a
+    coroutine. The helpers dispatch work onto their own thread pools, so they
+    bind the first implementation found on a non-async class in the MRO, the
+    same way ``ComponentService``'s ``*_raw`` forwarders bypass the async
+    overrides. This lets every helper accept either a ``Boomi`` or a
+    ``BoomiAsync`` service.
+
+    :param Any service: A sync or async service instance.
+    :param str name: The method name.
+    :return: The bound synchronous method.
+    :rtype: Callable[..., Any]
+    :raises AttributeError: If no synchronous implementation exists.
+    """
+    for klass in type(service).__mro__:
+        if klass.__name__.endswith("Async"):
+            continue
+        if name in klass.__dict__:
+            return klass.__dict__[name].__get__(service, type(service))
+    raise AttributeError(f"{type(service).__name__} has no method '{name}'")
+
+
+class PollScheduler:
+    """
+    One scheduler for many token-based asynchronous operations.
+
+    The Platform API's ``async/*`` operations return a token that has to be
+    polled until the result is ready. Instead of dedicating a sleeping thread
+    to every operation, the scheduler keeps all pending tokens in a single
+    due-time heap and dispatches each poll onto a shared worker pool only when
+    it is due, backing off exponentially between polls. Hundreds of probes can
+    therefore be in flight with a handful of threads, and every request goes
+    through the same rate limiter.
+
+    Example Usage:
+    ```python
+    with PollScheduler(max_workers=16) as scheduler:
+        future = scheduler.submit(
+            lambda: sdk.atom.async_get_atom_counters(atom_id).async_token.token,
+            sdk.atom.async_token_atom_counters,
+        )
+        counters = future.result()
+    ```
+
+    :ivar int max_workers: The number of worker threads sending requests.
+    :ivar float poll_interval: The delay before the first poll of a token.
+    :ivar float max_poll_interval: The backoff ceiling between polls.
+    :ivar float timeout: Seconds after which a pending operation fails.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        timeout: float = 120.0,
+    ):
+        """
+        Initialize a new instance of PollScheduler.
+
+        :param int max_workers: The number of worker threads sending requests.
+        :param Optional[RateLimiter] rate_limiter: Limiter acquired before every request.
+        :param float poll_interval: The delay before the first poll of a token.
+        :param float max_poll_interval: The backoff ceiling between polls.
+        :param float timeout: Seconds after which a pending operation fails with ``TimeoutError``.
+        """
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self._heap: List[Tuple[float, int, "_PollJob"]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def run(self, func: Callable[[], R]) -> "Future[R]":
+        """
+        Run a plain (non-polled) request on the worker pool.
+
+        :param Callable[[], R] func: The request.
+        :return: A future resolving to the request's result. ``future.elapsed``
+            holds the seconds the request took.
+        :rtype: Future[R]
+        """
+        future: Future = Future()
+
+        def _call() -> None:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            started = monotonic()
+            try:
+                result = func()
+            except Exception as error:
+                future.elapsed = monotonic() - started
+                future.set_exception(error)
+                return
+            future.elapsed = monotonic() - started
+            future.set_result(result)
+
+        _follow_cancel(self._pool.submit(_call), future)
+        return future
+
+    def submit(
+        self,
+        start: Callable[[], str],
+        poll: Callable[[str], R],
+        is_pending: Optional[Callable[[R], bool]] = None,
+    ) -> "Future[R]":
+        """
+        Start an asynchronous operation and poll its token until it completes.
+
+        :param Callable[[], str] start: Sends the initial request and returns the token.
+        :param Callable[[str], R] poll: Sends one poll for the token.
+        :param Optional[Callable[[R], bool]] is_pending: Whether a poll response
+            means "still running". Defaults to :func:`is_async_pending`.
+        :return: A future resolving to the first non-pending poll response.
+            ``future.polls`` holds the number of polls sent and
+            ``future.elapsed`` the seconds from the initial request to the result.
+        :rtype: Future[R]
+        """
+        job = _PollJob(start, poll, is_pending or is_async_pending, self.poll_interval)
+        job.future.polls = 0
+        job.future.elapsed = 0.0
+        _follow_cancel(self._pool.submit(self._start, job), job.future)
+        return job.future
+
+    def close(self) -> None:
+        """
+        Stop the scheduler.
+
+        The futures of operations that have not completed are cancelled, except
+        those of requests already being sent, which still complete.
+        """
+        with self._condition:
+            self._closed = True
+            pending, self._heap = self._heap, []
+            self._condition.notify()
+        for _, _, job in pending:
+            job.future.cancel()
+        # Queued requests are dropped; their futures are cancelled with them.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "PollScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _start(self, job: "_PollJob") -> None:
+        try:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            job.started = monotonic()
+            job.deadline = job.started + self.timeout
+            job.token = job.start()
+        except Exception as error:
+            job.finish(error=error)
+            return
+        self._schedule(job, job.interval)
+
+    def _poll(self, job: "_PollJob") -> None:
+        try:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            response = job.poll(job.token)
+            job.future.polls += 1
+            if not job.is_pending(response):
+                job.finish(response)
+                return
+            if monotonic() >= job.deadline:
+                raise TimeoutError(
+                    f"Operation still pending after {self.timeout}s ({job.future.polls} polls)"
+                )
+        except Exception as error:
+            job.finish(error=error)
+            return
+        job.interval = min(job.interval * 2, self.max_poll_interval)
+        self._schedule(job, job.interval)
+
+    def _schedule(self, job: "_PollJob", delay: float) -> None:
+        with self._condition:
+            if self._closed:
+                job.future.cancel()
+                return
+            heapq.heappush(self._heap, (monotonic() + delay, next(self._sequence), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    self._condition.wait(self._heap[0][0] - now if self._heap else None)
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+            try:
+                _follow_cancel(self._pool.submit(self._poll, job), job.future)
+            except RuntimeError:
+                # Closed between the pop and the submit.
+                job.future.cancel()
+                return
+
+
+def _follow_cancel(work: Future, future: Future) -> None:
+    # Cancel ``future`` when the pool drops the work item that would resolve it.
+    work.add_done_callback(lambda done: future.cancel() if done.cancelled() else None)
+
+
+class _PollJob:
+    __slots__ = ("start", "poll", "is_pending", "interval", "token", "started", "deadline", "future")
+
+    def __init__(self, start: Callable, poll: Callable, is_pending: Callable, interval: float):
+        self.start = start
+        self.poll = poll
+        self.is_pending = is_pending
+        self.interval = interval
+        self.token: Optional[str] = None
+        self.started = 0.0
+        self.deadline = 0.0
+        self.future: Future = Future()
+
+    def finish(self, response: Any = None, error: Optional[Exception] = None) -> None:
+        self.future.elapsed = monotonic() - self.started
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(response)
+
+
+def is_async_pending(response: Any) -> bool:
+    """
+    Whether an ``async/*/response/{token}`` poll reports a still-running operation.
+
+    The Platform API answers ``202`` (in ``responseStatusCode``) until the
+    result is ready.
+
+    :param Any response: The poll response (model or raw ``dict``).
+    :rtype: bool
+    """
+    if isinstance(response, dict):
+        status = response.get("responseStatusCode")
+    else:
+        status = getattr(response, "response_status_code", None)
+    return status is not None and int(status) == 202
@@ -0,0 +1,441 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ._compat import enum_value
+from .bulk import BulkExecutor
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    default_rate_limiter,
+    imap_concurrently,
+)
+from .paging import iter_query
+from ..services.async_.utils.to_async import to_async
+
+#: Follow references from a component to the components it uses.
+USES = "uses"
+#: Follow references from a component to the components that use it.
+WHERE_USED = "where_used"
+#: Follow references in both directions.
+BOTH = "both"
+
+_DIRECTIONS = (USES, WHERE_USED, BOTH)
+
+
+class DependencyEdge:
+    """
+    One reference between two components.
+
+    :ivar str parent_id: The referencing (primary) component.
+    :ivar str child_id: The referenced (secondary) component.
+    :ivar Optional[int] parent_version: The parent version that holds the reference.
+    :ivar Optional[str] type_: ``DEPENDENT`` or ``INDEPENDENT``.
+    """
+
+    def __init__(
+        self,
+        parent_id: str,
+        child_id: str,
+        parent_version: Optional[int] = None,
+        type_: Optional[str] = None,
+    ):
+        self.parent_id = parent_id
+        self.child_id = child_id
+        self.parent_version = parent_version
+        self.type_ = type_
+
+    def __repr__(self) -> str:
+        return (
+            f"DependencyEdge(parent_id={self.parent_id!r}, child_id={self.child_id!r}, "
+            f"parent_version={self.parent_version}, type_={self.type_!r})"
+        )
+
+
+class DependencyGraph:
+    """
+    An adjacency view of component references.
+
+    :ivar List[str] roots: The components the crawl started from.
+    :ivar Dict[str, int] depth: The BFS depth at which each component was reached.
+    :ivar Dict[str, Optional[int]] versions: The highest known version of each component.
+    :ivar Dict[str, Any] metadata: ``ComponentMetadata`` per component, when enriched.
+    :ivar Dict[str, Exception] errors: Components whose references could not be fetched.
+    """
+
+    def __init__(self, roots: Iterable[str] = ()):
+        self.roots = list(roots)
+        self.depth: Dict[str, int] = {root: 0 for root in self.roots}
+        self.versions: Dict[str, Optional[int]] = {root: None for root in self.roots}
+        self.metadata: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self._edges: Dict[Tuple[str, str], DependencyEdge] = {}
+        self._uses: Dict[str, Set[str]] = {}
+        self._used_by: Dict[str, Set[str]] = {}
+
+    @property
+    def nodes(self) -> List[str]:
+        """
+        Every component in the graph, in discovery order.
+
+        :rtype: List[str]
+        """
+        return list(self.depth)
+
+    @property
+    def edges(self) -> List[DependencyEdge]:
+        """
+        Every reference in the graph.
+
+        :rtype: List[DependencyEdge]
+        """
+        return list(self._edges.values())
+
+    def add_edge(self, edge: DependencyEdge) -> None:
+        """
+        Add a reference, keeping the highest parent version seen for the pair.
+
+        :param DependencyEdge edge: The reference.
+        """
+        key = (edge.parent_id, edge.child_id)
+        known = self._edges.get(key)
+        if known is None or (edge.parent_version or 0) > (known.parent_version or 0):
+            self._edges[key] = edge
+        self._uses.setdefault(edge.parent_id, set()).add(edge.child_id)
+        self._used_by.setdefault(edge.child_id, set()).add(edge.parent_id)
+        if edge.parent_version is not None:
+            current = self.versions.get(edge.parent_id)
+            self.versions[edge.parent_id] = max(current or 0, edge.parent_version)
+
+    def uses(self, component_id: str) -> Set[str]:
+        """
+        Get the components referenced by a component.
+
+        :param str component_id: The component id.
+        :rtype: Set[str]
+        """
+        return set(self._uses.get(component_id, ()))
+
+    def used_by(self, component_id: str) -> Set[str]:
+        """
+        Get the components that reference a component.
+
+        :param str component_id: The component id.
+        :rtype: Set[str]
+        """
+        return set(self._used_by.get(component_id, ()))
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Find circular references.
+
+        Each cycle is a strongly connected group of components (or a component
+        that references itself), listed in discovery order.
+
+        :return: The cycles, one list of component ids per cycle.
+        :rtype: List[List[str]]
+        """
+        order = {node: position for position, node in enumerate(self.nodes)}
+        nodes = list(order) + [node for node in self._uses if node not in order]
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        cycles: List[List[str]] = []
+
+        # Iterative Tarjan: deep reference chains must not hit the recursion limit.
+        for start in nodes:
+            if start in index:
+                continue
+            work = [(start, iter(sorted(self._uses.get(start, ()))))]
+            index[start] = low[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index:
+                        index[child] = low[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self._uses.get(child, ())))))
+                    elif child in on_stack:
+                        low[node] = min(low[node], index[child])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] != index[node]:
+                    continue
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in self._uses.get(node, ()):
+                    cycles.append(
+                        sorted(component, key=lambda member: order.get(member, len(order)))
+                    )
+        return cycles
+
+    @property
+    def has_cycles(self) -> bool:
+        """
+        Whether any circular reference exists.
+
+        :rtype: bool
+        """
+        return bool(self.find_cycles())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable representation of the graph.
+
+        :rtype: Dict[str, Any]
+        """
+        nodes = {}
+        for node in self.nodes:
+            metadata = self.metadata.get(node)
+            nodes[node] = {
+                "id": node,
+                "depth": self.depth.get(node),
+                "version": self.versions.get(node),
+                "name": getattr(metadata, "name", None),
+                "type": enum_value(getattr(metadata, "type_", None)),
+                "uses": sorted(self._uses.get(node, ())),
+                "used_by": sorted(self._used_by.get(node, ())),
+            }
+        return {
+            "roots": list(self.roots),
+            "nodes": nodes,
+            "edges": [
+                {
+                    "from": edge.parent_id,
+                    "to": edge.child_id,
+                    "parent_version": edge.parent_version,
+                    "type": edge.type_,
+                }
+                for edge in self.edges
+            ],
+            "cycles": self.find_cycles(),
+            "errors": {node: str(error) for node, error in self.errors.items()},
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"DependencyGraph(roots={len(self.roots)}, nodes={len(self.depth)}, "
+            f"edges={len(self._edges)}, errors={len(self.errors)})"
+        )
+
+
+class DependencyGraphCrawler:
+    """
+    Concurrent breadth-first crawler over ComponentReference.
+
+    Each BFS level (the frontier) is expanded concurrently: one
+    ``query_component_reference`` per frontier component, paged through
+    ``queryMore`` and throttled by the shared rate limiter. Every component is
+    expanded at most once per direction and crawl; each crawl queries the
+    references afresh, so newly saved versions are always seen. The metadata
+    of the components is fetched with chunked ``bulk_component_metadata`` calls
+    instead of one request per node.
+
+    A parent component's references are reported for each of its saved
+    versions. In both directions only the references of the parent's current
+    version are kept, so a reference removed in a later version does not show
+    up as an edge. When a parent's current version cannot be fetched, the
+    highest version reported for it is used instead.
+
+    Example Usage:
+    ```python
+    crawler = DependencyGraphCrawler(sdk)
+    graph = crawler.crawl([process_id], direction="uses", max_depth=3)
+    for cycle in graph.find_cycles():
+        print(" -> ".join(cycle))
+    ```
+
+    :ivar int max_workers: The number of reference queries in flight.
+    :ivar RateLimiter rate_limiter: The limiter shared by all calls.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of DependencyGraphCrawler.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param int max_workers: The number of reference queries in flight.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or default_rate_limiter()
+        self._reference_service = sdk.component_reference
+        self._metadata_service = sdk.component_metadata
+
+    def crawl(
+        self,
+        root_ids: Iterable[str],
+        direction: str = USES,
+        max_depth: Optional[int] = None,
+        include_metadata: bool = True,
+    ) -> DependencyGraph:
+        """
+        Crawl the reference graph reachable from ``root_ids``.
+
+        :param Iterable[str] root_ids: The components to start from.
+        :param str direction: ``"uses"``, ``"where_used"`` or ``"both"``.
+        :param Optional[int] max_depth: The number of levels to expand. Unlimited when None.
+        :param bool include_metadata: Fetch ``ComponentMetadata`` for every node.
+        :return: The crawled graph.
+        :rtype: DependencyGraph
+        :raises ValueError: If ``direction`` is not supported.
+        """
+        if direction not in _DIRECTIONS:
+            raise ValueError(
+                f"Unsupported direction {direction!r}, expected one of {_DIRECTIONS}"
+            )
+        directions = (USES, WHERE_USED) if direction == BOTH else (direction,)
+
+        graph = DependencyGraph(dict.fromkeys(root_ids))
+        # ComponentMetadata of every parent seen so far, keyed by id.
+        metadata: Dict[str, Any] = {}
+        frontier = list(graph.roots)
+        level = 0
+        while frontier and (max_depth is None or level < max_depth):
+            tasks = [(component_id, way) for component_id in frontier for way in directions]
+            found: List[Tuple[str, List[DependencyEdge]]] = []
+            # The rate limiter is acquired per query page inside _references.
+            for (component_id, way), edges, error in imap_concurrently(
+                self._references, tasks, self.max_workers
+            ):
+                if error is not None:
+                    graph.errors[component_id] = error
+                else:
+                    found.append((way, edges))
+
+            self._fetch_metadata(
+                metadata,
+                [edge.parent_id for _, edges in found for edge in edges],
+            )
+            next_frontier: List[str] = []
+            for way, edges in found:
+                for edge in _current_parent_version(edges, metadata):
+                    graph.add_edge(edge)
+                    neighbour = edge.child_id if way == USES else edge.parent_id
+                    if neighbour not in graph.depth:
+                        graph.depth[neighbour] = level + 1
+                        graph.versions.setdefault(neighbour, None)
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+            level += 1
+
+        if include_metadata and graph.depth:
+            self._fetch_metadata(metadata, graph.nodes)
+            graph.metadata.update(
+                (component_id, metadata[component_id])
+                for component_id in graph.nodes
+                if component_id in metadata
+            )
+            for component_id, component in graph.metadata.items():
+                version = getattr(component, "version", None)
+                if isinstance(version, int):
+                    graph.versions[component_id] = max(
+                        graph.versions.get(component_id) or 0, version
+                    )
+        return graph
+
+    def crawl_async(
+        self,
+        root_ids: Iterable[str],
+        direction: str = USES,
+        max_depth: Optional[int] = None,
+        include_metadata: bool = True,
+    ):
+        """
+        Awaitable variant of :meth:`crawl` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[DependencyGraph]
+        """
+        return to_async(self.crawl)(
+            list(root_ids), direction, max_depth, include_metadata
+        )
+
+    def _fetch_metadata(self, metadata: Dict[str, Any], ids: Iterable[str]) -> None:
+        # Components whose metadata cannot be fetched are left out.
+        missing = [component_id for component_id in dict.fromkeys(ids) if component_id not in metadata]
+        if missing:
+            result = BulkExecutor(self.max_workers, self.rate_limiter).get(
+                self._metadata_service, missing
+            )
+            metadata.update(result.results)
+
+    def _references(self, task: Tuple[str, str]) -> List[DependencyEdge]:
+        component_id, direction = task
+        edges: Dict[Tuple[str, str], DependencyEdge] = {}
+        for reference in iter_query(
+            self._reference_service,
+            self._references_query(component_id, direction),
+            rate_limiter=self.rate_limiter,
+        ):
+            for ref in getattr(reference, "references", None) or []:
+                edge = DependencyEdge(
+                    getattr(ref, "parent_component_id", None)
+                    or (component_id if direction == USES else None),
+                    getattr(ref, "component_id", None)
+                    or (component_id if direction == WHERE_USED else None),
+                    getattr(ref, "parent_version", None),
+                    enum_value(getattr(ref, "type_", None)),
+                )
+                if edge.parent_id is None or edge.child_id is None:
+                    continue
+                key = (edge.parent_id, edge.child_id)
+                known = edges.get(key)
+                if known is None or (edge.parent_version or 0) > (known.parent_version or 0):
+                    edges[key] = edge
+
+        return list(edges.values())
+
+    def _references_query(self, component_id: str, direction: str) -> Any:
+        from ..models import (
+            ComponentReferenceQueryConfig,
+            ComponentReferenceQueryConfigQueryFilter,
+            ComponentReferenceSimpleExpression,
+        )
+
+        return ComponentReferenceQueryConfig(
+            query_filter=ComponentReferenceQueryConfigQueryFilter(
+                expression=ComponentReferenceSimpleExpression(
+                    operator="EQUALS",
+                    property="parentComponentId" if direction == USES else "componentId",
+                    argument=[component_id],
+                )
+            )
+        )
+
+
+def _current_parent_version(
+    edges: List[DependencyEdge], metadata: Dict[str, Any]
+) -> List[DependencyEdge]:
+    # ComponentReference reports the references of every saved version of a
+    # parent; only its current version's references describe it today. The
+    # highest reported version stands in when the metadata is unavailable.
+    latest: Dict[str, int] = {}
+    for edge in edges:
+        if edge.parent_version is not None:
+            latest[edge.parent_id] = max(latest.get(edge.parent_id, 0), edge.parent_version)
+    for parent_id in latest:
+        version = getattr(metadata.get(parent_id), "version", None)
+        if isinstance(version, int):
+            latest[parent_id] = version
+    return [
+        edge
+        for edge in edges
+        if edge.parent_version is None or edge.parent_version == latest[edge.parent_id]
+    ]
@@ -0,0 +1,468 @@
+import os
+import queue
+import re
+import threading
+import time
+from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple
+
+from ._compat import field_value
+from .concurrency import RateLimiter, default_rate_limiter, sync_method
+from .paging import iter_query, service_object_name
+from ..net.transport.api_error import ApiError
+from ..services.async_.utils.to_async import to_async
+
+#: Pipeline stage names, as reported by :attr:`DocumentResult.stage`.
+CONNECTORS = "connectors"
+RECORDS = "records"
+DOWNLOAD = "download"
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+_UNSAFE_CHARACTERS = re.compile(r"[^\w.-]")
+
+
+class DocumentResult:
+    """
+    The outcome of one pipeline item.
+
+    A successful item is one downloaded (or already present) document. A failed
+    item is either a document whose download failed (``stage == "download"``)
+    or an execution / connector whose listing failed (``stage`` is
+    ``"connectors"`` or ``"records"``; ``record_id`` is then None).
+
+    :ivar str stage: The stage that produced the result.
+    :ivar str execution_id: The execution id.
+    :ivar Optional[str] execution_connector_id: The ExecutionConnector id.
+    :ivar Optional[str] record_id: The GenericConnectorRecord id.
+    :ivar Any record: The GenericConnectorRecord, when known.
+    :ivar Optional[str] path: The downloaded file.
+    :ivar int size: The file size in bytes.
+    :ivar bool skipped: True if the file already existed and was not downloaded again.
+    :ivar Optional[Exception] error: The error, for failed items.
+    """
+
+    def __init__(
+        self,
+        stage: str,
+        execution_id: str,
+        execution_connector_id: Optional[str] = None,
+        record_id: Optional[str] = None,
+        record: Any = None,
+        path: Optional[str] = None,
+        size: int = 0,
+        skipped: bool = False,
+        error: Optional[Exception] = None,
+    ):
+        self.stage = stage
+        self.execution_id = execution_id
+        self.execution_connector_id = execution_connector_id
+        self.record_id = record_id
+        self.record = record
+        self.path = path
+        self.size = size
+        self.skipped = skipped
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the document is on disk.
+
+        :rtype: bool
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (
+            f"DocumentResult(stage={self.stage!r}, execution_id={self.execution_id!r}, "
+            f"record_id={self.record_id!r}, size={self.size}, error={self.error!r})"
+        )
+
+
+class DocumentPipelineReport:
+    """
+    Summary of a :meth:`ConnectorDocumentPipeline.run` call.
+
+    :ivar int executions: Executions whose connectors were listed.
+    :ivar int connectors: ExecutionConnectors whose records were listed.
+    :ivar int records: GenericConnectorRecords that reached the download stage.
+    :ivar int downloaded: Documents downloaded.
+    :ivar int skipped: Documents already on disk.
+    :ivar int bytes_written: Bytes downloaded.
+    :ivar List[DocumentResult] failures: Failed items, in completion order.
+    :ivar float elapsed: Wall-clock seconds spent.
+    """
+
+    def __init__(self):
+        self.executions = 0
+        self.connectors = 0
+        self.records = 0
+        self.downloaded = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self.failures: List[DocumentResult] = []
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"DocumentPipelineReport(executions={self.executions}, connectors={self.connectors}, "
+            f"records={self.records}, downloaded={self.downloaded}, skipped={self.skipped}, "
+            f"failures={len(self.failures)})"
+        )
+
+
+class ConnectorDocumentPipeline:
+    """
+    Staged ExecutionRecord → ExecutionConnector → GenericConnectorRecord →
+    ConnectorDocument retrieval.
+
+    Each hop of the document retrieval chain runs as its own stage with its own
+    worker threads, and stages feed each other through bounded queues: while
+    one execution's connectors are being listed, another's records are being
+    listed and earlier documents are downloading. The bounded queues apply
+    back-pressure, so memory stays flat however many executions are fed in,
+    and every API request goes through the shared rate limiter.
+
+    Documents are streamed to ``<directory>/<execution id>/<record id>``
+    without being held in memory. A download is written to a ``.partial`` file
+    first, so with ``skip_existing`` a rerun only fetches what is missing.
+
+    Example Usage:
+    ```python
+    pipeline = ConnectorDocumentPipeline(
+        sdk, "documents", record_filter=lambda record: record.status.value == "ERROR"
+    )
+    report = pipeline.run(failed_execution_ids)
+    print(report.downloaded, report.bytes_written, len(report.failures))
+    ```
+
+    :ivar str directory: The download directory.
+    :ivar int connector_workers: Threads listing ExecutionConnectors.
+    :ivar int record_workers: Threads listing GenericConnectorRecords.
+    :ivar int download_workers: Threads downloading ConnectorDocuments.
+    :ivar int queue_size: The capacity of each inter-stage queue.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        directory: str,
+        connector_workers: int = 4,
+        record_workers: int = 4,
+        download_workers: int = 8,
+        queue_size: int = 256,
+        connector_filter: Optional[Callable[[Any], bool]] = None,
+        record_filter: Optional[Callable[[Any], bool]] = None,
+        skip_existing: bool = True,
+        max_retries: int = 10,
+        initial_delay: float = 2.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ConnectorDocumentPipeline.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param str directory: The download directory. Created if missing.
+        :param int connector_workers: Threads listing ExecutionConnectors.
+        :param int record_workers: Threads listing GenericConnectorRecords.
+        :param int download_workers: Threads downloading ConnectorDocuments.
+        :param int queue_size: The capacity of each inter-stage queue.
+        :param Optional[Callable[[Any], bool]] connector_filter: Keep only the
+            ExecutionConnectors it accepts. By default connectors that report
+            no documents are skipped.
+        :param Optional[Callable[[Any], bool]] record_filter: Download only the
+            GenericConnectorRecords it accepts.
+        :param bool skip_existing: Do not download documents already on disk.
+        :param int max_retries: Download polling attempts per document.
+        :param float initial_delay: Initial delay between download polls.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.directory = directory
+        self.connector_workers = connector_workers
+        self.record_workers = record_workers
+        self.download_workers = download_workers
+        self.queue_size = queue_size
+        self.skip_existing = skip_existing
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self._connector_filter = connector_filter or _has_documents
+        self._record_filter = record_filter
+        self._execution_connector = sdk.execution_connector
+        self._generic_connector_record = sdk.generic_connector_record
+        self._connector_document = sdk.connector_document
+        self._create_connector_document = sync_method(
+            sdk.connector_document, "create_connector_document"
+        )
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        os.makedirs(directory, exist_ok=True)
+
+    def document_path(self, execution_id: str, record_id: str) -> str:
+        """
+        Get the file a document is downloaded to.
+
+        :param str execution_id: The execution id.
+        :param str record_id: The GenericConnectorRecord id.
+        :rtype: str
+        """
+        return os.path.join(
+            self.directory,
+            _UNSAFE_CHARACTERS.sub("_", execution_id),
+            _UNSAFE_CHARACTERS.sub("_", record_id),
+        )
+
+    def iter_documents(self, executions: Iterable[Any]) -> Generator[DocumentResult, None, None]:
+        """
+        Run the pipeline and yield every result as it completes.
+
+        ``executions`` is consumed lazily. Closing the generator early stops
+        the stages once their in-flight requests finish.
+
+        :param Iterable[Any] executions: Execution ids, ``ExecutionRecord`` models or raw dicts.
+        :rtype: Generator[DocumentResult, None, None]
+        """
+        return self._iter_documents(executions, DocumentPipelineReport())
+
+    def run(self, executions: Iterable[Any]) -> DocumentPipelineReport:
+        """
+        Run the pipeline to completion.
+
+        :param Iterable[Any] executions: Execution ids, ``ExecutionRecord`` models or raw dicts.
+        :return: The run summary.
+        :rtype: DocumentPipelineReport
+        """
+        started = time.monotonic()
+        report = DocumentPipelineReport()
+        for result in self._iter_documents(executions, report):
+            if not result.ok:
+                report.failures.append(result)
+            elif result.skipped:
+                report.skipped += 1
+            else:
+                report.downloaded += 1
+                report.bytes_written += result.size
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def run_async(self, executions: Iterable[Any]):
+        """
+        Awaitable variant of :meth:`run` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[DocumentPipelineReport]
+        """
+        return to_async(self.run)(executions)
+
+    def _iter_documents(
+        self, executions: Iterable[Any], report: DocumentPipelineReport
+    ) -> Generator[DocumentResult, None, None]:
+        stop = threading.Event()
+        execution_queue: queue.Queue = queue.Queue(self.queue_size)
+        connector_queue: queue.Queue = queue.Queue(self.queue_size)
+        record_queue: queue.Queue = queue.Queue(self.queue_size)
+        results: queue.Queue = queue.Queue(self.queue_size)
+
+        def _list_connectors(execution_id: str) -> Iterable[Any]:
+            report._count("executions")
+            for connector in self._query(
+                self._execution_connector, _expression("ExecutionConnector", "executionId", execution_id)
+            ):
+                if self._connector_filter(connector):
+                    yield execution_id, field_value(connector, "id_", "id")
+
+        def _list_records(item: Tuple[str, str]) -> Iterable[Any]:
+            execution_id, connector_id = item
+            report._count("connectors")
+            expression = _all(
+                "GenericConnectorRecord",
+                _expression("GenericConnectorRecord", "executionId", execution_id),
+                _expression("GenericConnectorRecord", "executionConnectorId", connector_id),
+            )
+            for record in self._query(self._generic_connector_record, expression):
+                if self._record_filter is None or self._record_filter(record):
+                    yield execution_id, connector_id, record
+
+        def _download(item: Tuple[str, str, Any]) -> Iterable[DocumentResult]:
+            report._count("records")
+            yield self._download_document(*item)
+
+        threads = [threading.Thread(target=self._feed, args=(executions, execution_queue, stop))]
+        threads += self._stage(
+            CONNECTORS, _list_connectors, execution_queue, connector_queue, results,
+            self.connector_workers, stop,
+        )
+        threads += self._stage(
+            RECORDS, _list_records, connector_queue, record_queue, results,
+            self.record_workers, stop,
+        )
+        threads += self._stage(
+            DOWNLOAD, _download, record_queue, results, results, self.download_workers, stop
+        )
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                result = results.get()
+                if result is _DONE:
+                    return
+                yield result
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _feed(self, executions: Iterable[Any], outbox: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for execution in executions:
+                if not _put(outbox, _execution_id(execution), stop):
+                    return
+        finally:
+            _put(outbox, _DONE, stop)
+
+    def _stage(
+        self,
+        stage: str,
+        func: Callable[[Any], Iterable[Any]],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        results: queue.Queue,
+        workers: int,
+        stop: threading.Event,
+    ) -> List[threading.Thread]:
+        # The end-of-input marker is passed between a stage's workers; the last
+        # one to see it forwards it to the next stage.
+        remaining = [max(1, workers)]
+        lock = threading.Lock()
+
+        def _work() -> None:
+            try:
+                while True:
+                    item = _get(inbox, stop)
+                    if item is _DONE:
+                        _put(inbox, _DONE, stop)
+                        return
+                    if stop.is_set():
+                        return
+                    try:
+                        for output in func(item):
+                            if not _put(outbox, output, stop):
+                                return
+                    except Exception as error:
+                        if not _put(results, _failure(stage, item, error), stop):
+                            return
+            finally:
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    _put(outbox, _DONE, stop)
+
+        return [threading.Thread(target=_work) for _ in range(max(1, workers))]
+
+    def _query(self, service: Any, expression: Any) -> Generator[Any, None, None]:
+        return iter_query(
+            service,
+            _model(service, "QueryConfig")(
+                query_filter=_model(service, "QueryConfigQueryFilter")(expression=expression)
+            ),
+            rate_limiter=self._rate_limiter,
+        )
+
+    def _download_document(self, execution_id: str, connector_id: str, record: Any) -> DocumentResult:
+        from ..models import ConnectorDocument
+
+        record_id = field_value(record, "id_", "id")
+        path = self.document_path(execution_id, record_id)
+        result = DocumentResult(DOWNLOAD, execution_id, connector_id, record_id, record, path)
+        try:
+            if self.skip_existing and os.path.exists(path):
+                result.size = os.path.getsize(path)
+                result.skipped = True
+                return result
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # create + poll rather than download_connector_document_to_file, whose
+            # sync implementation would dispatch to the async create_* override.
+            self._rate_limiter.acquire()
+            download = self._create_connector_document(
+                ConnectorDocument(generic_connector_record_id=record_id)
+            )
+            if not getattr(download, "url", None):
+                raise ApiError("No download URL in response", 0, download)
+            result.size = self._connector_document._poll_download_url_to_file(
+                download.url,
+                path,
+                max_retries=self.max_retries,
+                initial_delay=self.initial_delay,
+            )
+        except Exception as error:
+            result.path = None
+            result.error = error
+        return result
+
+
+def _get(inbox: queue.Queue, stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return inbox.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def _put(outbox: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            outbox.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _failure(stage: str, item: Any, error: Exception) -> DocumentResult:
+    if isinstance(item, tuple):
+        return DocumentResult(stage, item[0], item[1], error=error)
+    return DocumentResult(stage, item, error=error)
+
+
+def _model(service: Any, suffix: str) -> Any:
+    from .. import models
+
+    return getattr(models, f"{service_object_name(service)}{suffix}")
+
+
+def _expression(object_name: str, property: str, value: str) -> Any:
+    from .. import models
+
+    return getattr(models, f"{object_name}SimpleExpression")(
+        operator="EQUALS", property=property, argument=[value]
+    )
+
+
+def _all(object_name: str, *expressions: Any) -> Any:
+    from .. import models
+
+    return getattr(models, f"{object_name}GroupingExpression")(
+        operator="and", nested_expression=list(expressions)
+    )
+
+
+def _execution_id(execution: Any) -> str:
+    if isinstance(execution, str):
+        return execution
+    return field_value(execution, "execution_id", "executionId")
+
+
+def _has_documents(connector: Any) -> bool:
+    counts = [
+        field_value(connector, "success_count", "successCount"),
+        field_value(connector, "error_count", "errorCount"),
+    ]
+    if all(count is None for count in counts):
+        return True
+    return any(count for count in counts)
@@ -0,0 +1,605 @@
+import calendar
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ._compat import enum_value, to_number
+from .concurrency import RateLimiter
+from .paging import iter_raw_query_pages, page_results
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the sketches fall back to pure Python.
+    np = None
+
+#: ExecutionRecord statuses counted as failed executions.
+ERROR_STATUSES = frozenset({"ERROR", "ABORTED"})
+
+#: Default quantiles reported per process.
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+# Batches smaller than this are cheaper to bucket in pure Python.
+_NUMPY_MIN_BATCH = 64
+
+
+class LatencySketch:
+    """
+    A mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized buckets (the DDSketch / HDR
+    layout), so every quantile estimate is within ``relative_accuracy`` of the
+    true value, memory grows with the value range rather than the number of
+    values, and sketches built over separate shards merge exactly.
+
+    :ivar float relative_accuracy: The relative error bound of quantile estimates.
+    :ivar int count: The number of values added.
+    :ivar float total: The sum of the values added.
+    :ivar Optional[float] minimum: The smallest value added.
+    :ivar Optional[float] maximum: The largest value added.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        :param float relative_accuracy: The relative error bound, between 0 and 1.
+        :raises ValueError: If ``relative_accuracy`` is out of range.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"relative_accuracy must be between 0 and 1, received {relative_accuracy}"
+            )
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inverse_log_gamma = 1 / math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """
+        Add a value.
+
+        :param float value: The value; values at or below zero share one bucket.
+        :param int weight: The number of occurrences.
+        """
+        if value > 0:
+            index = math.ceil(math.log(value) * self._inverse_log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + weight
+        else:
+            self._zero_count += weight
+        self.count += weight
+        self.total += value * weight
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """
+        Add many values, vectorized with NumPy when it is installed.
+
+        :param Iterable[float] values: The values.
+        """
+        if np is None:
+            for value in values:
+                self.add(value)
+            return
+
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        data = np.asarray(values, dtype=float)
+        if data.size < _NUMPY_MIN_BATCH:
+            for value in data.tolist():
+                self.add(value)
+            return
+
+        positive = data[data > 0]
+        self._zero_count += int(data.size - positive.size)
+        indexes, counts = np.unique(
+            np.ceil(np.log(positive) * self._inverse_log_gamma).astype(np.int64),
+            return_counts=True,
+        )
+        buckets = self._buckets
+        for index, count in zip(indexes.tolist(), counts.tolist()):
+            buckets[index] = buckets.get(index, 0) + count
+        self.count += int(data.size)
+        self.total += float(data.sum())
+        low, high = float(data.min()), float(data.max())
+        self.minimum = low if self.minimum is None else min(self.minimum, low)
+        self.maximum = high if self.maximum is None else max(self.maximum, high)
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        """
+        Fold another sketch into this one.
+
+        :param LatencySketch other: A sketch with the same relative accuracy.
+        :return: This sketch.
+        :rtype: LatencySketch
+        :raises ValueError: If the accuracies differ.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.minimum, other.maximum):
+            if value is not None:
+                self.minimum = value if self.minimum is None else min(self.minimum, value)
+                self.maximum = value if self.maximum is None else max(self.maximum, value)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        :param float q: The quantile, between 0 and 1.
+        :return: The estimate, or None for an empty sketch.
+        :rtype: Optional[float]
+        """
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.minimum
+        if q >= 1:
+            return self.maximum
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.minimum), self.maximum)
+        return self.maximum
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        The mean of the values added.
+
+        :rtype: Optional[float]
+        """
+        return self.total / self.count if self.count else None
+
+
+class ProcessStatistics:
+    """
+    Streaming execution statistics of one process.
+
+    :ivar int executions: The number of executions.
+    :ivar int errors: The number of executions with an error status.
+    :ivar Dict[str, int] statuses: Executions per status.
+    :ivar int inbound_documents: The inbound document total.
+    :ivar int outbound_documents: The outbound document total.
+    :ivar int error_documents: The inbound error document total.
+    :ivar LatencySketch elapsed: The elapsed time (ms) sketch.
+    :ivar Optional[int] first_seen: The earliest execution time (epoch seconds).
+    :ivar Optional[int] last_seen: The latest execution time (epoch seconds).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.executions = 0
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self.inbound_documents = 0
+        self.outbound_documents = 0
+        self.error_documents = 0
+        self.elapsed = LatencySketch(relative_accuracy)
+        self.first_seen: Optional[int] = None
+        self.last_seen: Optional[int] = None
+
+    @property
+    def error_rate(self) -> float:
+        """
+        The share of executions with an error status.
+
+        :rtype: float
+        """
+        return self.errors / self.executions if self.executions else 0.0
+
+    @property
+    def documents_per_second(self) -> Optional[float]:
+        """
+        The document throughput (inbound plus outbound) over the observed time span.
+
+        :rtype: Optional[float]
+        """
+        if self.first_seen is None or self.last_seen is None:
+            return None
+        span = self.last_seen - self.first_seen
+        if span <= 0:
+            return None
+        return (self.inbound_documents + self.outbound_documents) / span
+
+    def merge(self, other: "ProcessStatistics") -> "ProcessStatistics":
+        """
+        Fold another shard's statistics into these.
+
+        :param ProcessStatistics other: The other statistics.
+        :return: These statistics.
+        :rtype: ProcessStatistics
+        """
+        self.executions += other.executions
+        self.errors += other.errors
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.inbound_documents += other.inbound_documents
+        self.outbound_documents += other.outbound_documents
+        self.error_documents += other.error_documents
+        self.elapsed.merge(other.elapsed)
+        self._observe(other.first_seen)
+        self._observe(other.last_seen)
+        return self
+
+    def summary(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        Get the statistics as a plain ``dict``.
+
+        :param Iterable[float] quantiles: The elapsed-time quantiles to report.
+        :rtype: Dict[str, Any]
+        """
+        result = {
+            "executions": self.executions,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "statuses": dict(self.statuses),
+            "inbound_documents": self.inbound_documents,
+            "outbound_documents": self.outbound_documents,
+            "error_documents": self.error_documents,
+            "documents_per_second": self.documents_per_second,
+            "elapsed_mean": self.elapsed.mean,
+            "elapsed_max": self.elapsed.maximum,
+        }
+        for q in quantiles:
+            result[f"elapsed_p{_percentile_label(q)}"] = self.elapsed.quantile(q)
+        return result
+
+    def _observe(self, timestamp: Optional[int]) -> None:
+        if timestamp is None:
+            return
+        if self.first_seen is None or timestamp < self.first_seen:
+            self.first_seen = timestamp
+        if self.last_seen is None or timestamp > self.last_seen:
+            self.last_seen = timestamp
+
+
+class ExecutionAnalytics:
+    """
+    Single-pass execution analytics over ExecutionRecord or ExecutionSummaryRecord streams.
+
+    Records are folded into per-process :class:`ProcessStatistics` (elapsed-time
+    sketch, error rate, document throughput) and a time-bucketed histogram as
+    they arrive, so memory does not grow with the number of records. Instances
+    built over separate shards (for example, one per day queried in parallel)
+    combine with :meth:`merge`.
+
+    Records may be typed models, raw response dicts, or
+    :class:`~boomi.helpers.columnar.ColumnBatch` batches. An
+    ExecutionSummaryRecord contributes its mean elapsed time, weighted by its
+    execution count, to the elapsed-time sketch.
+
+    Example Usage:
+    ```python
+    analytics = ExecutionAnalytics(bucket_seconds=3600)
+    analytics.add_query(sdk.execution_record, query_config)
+    for process_id, summary in analytics.report().items():
+        print(process_id, summary["elapsed_p95"], summary["error_rate"])
+    ```
+
+    :ivar int bucket_seconds: The width of the histogram buckets.
+    :ivar Dict[str, ProcessStatistics] processes: Statistics keyed by process id.
+    :ivar Dict[str, str] process_names: The last seen name of each process.
+    :ivar Dict[int, Dict[str, int]] buckets: Histogram keyed by bucket start (epoch seconds).
+    """
+
+    def __init__(self, bucket_seconds: int = 3600, relative_accuracy: float = 0.01):
+        """
+        Initialize a new instance of ExecutionAnalytics.
+
+        :param int bucket_seconds: The width of the histogram buckets.
+        :param float relative_accuracy: The relative error bound of the elapsed-time quantiles.
+        """
+        self.bucket_seconds = bucket_seconds
+        self.relative_accuracy = relative_accuracy
+        self.processes: Dict[str, ProcessStatistics] = {}
+        self.process_names: Dict[str, str] = {}
+        self.buckets: Dict[int, Dict[str, int]] = {}
+
+    def add(self, record: Any) -> None:
+        """
+        Fold one record into the statistics.
+
+        :param Any record: An ExecutionRecord or ExecutionSummaryRecord, as a model or raw dict.
+        """
+        fields = _record_fields(record)
+        if fields["execution_count"] is not None:
+            self._add_summary(fields)
+        else:
+            self._add_execution(
+                fields["process_id"],
+                fields["process_name"],
+                fields["status"],
+                fields["execution_time"],
+                fields["execution_duration"],
+                fields["inbound_document_count"],
+                fields["outbound_document_count"],
+                fields["inbound_error_document_count"],
+            )
+
+    def add_many(self, records: Iterable[Any]) -> None:
+        """
+        Fold many records into the statistics.
+
+        :param Iterable[Any] records: Models, raw dicts, or ``ColumnBatch`` batches.
+        """
+        for record in records:
+            if hasattr(record, "columns") and hasattr(record, "names"):
+                self.add_batch(record)
+            else:
+                self.add(record)
+
+    def add_batch(self, batch: Any) -> None:
+        """
+        Fold an ExecutionRecord :class:`~boomi.helpers.columnar.ColumnBatch` into
+        the statistics, adding elapsed times per process in vectorized batches.
+
+        :param Any batch: A batch holding at least the ``process_id`` and
+            ``execution_duration`` columns.
+        """
+        columns = batch.columns
+
+        def _column(name: str) -> List[Any]:
+            return columns[name].to_list() if name in columns else [None] * len(batch)
+
+        durations: Dict[str, List[float]] = {}
+        for process_id, name, status, time, duration, inbound, outbound, errors in zip(
+            _column("process_id"),
+            _column("process_name"),
+            _column("status"),
+            _column("execution_time"),
+            _column("execution_duration"),
+            _column("inbound_document_count"),
+            _column("outbound_document_count"),
+            _column("inbound_error_document_count"),
+        ):
+            self._add_execution(process_id, name, status, time, None, inbound, outbound, errors)
+            if duration is not None:
+                durations.setdefault(process_id or "", []).append(duration)
+
+        for process_id, values in durations.items():
+            self.processes[process_id].elapsed.add_many(values)
+
+    def add_query(
+        self,
+        service: Any,
+        query_config: Any = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        """
+        Run an ExecutionRecord or ExecutionSummaryRecord query and fold every
+        result in, reading the raw pages without building models.
+
+        :param Any service: ``sdk.execution_record`` or ``sdk.execution_summary_record``.
+        :param Any query_config: The ``*QueryConfig`` (model or dict).
+        :param Optional[RateLimiter] rate_limiter: Limiter acquired before every page.
+        """
+        for page in iter_raw_query_pages(service, query_config, rate_limiter=rate_limiter):
+            for record in page_results(page):
+                self.add(record)
+
+    def merge(self, other: "ExecutionAnalytics") -> "ExecutionAnalytics":
+        """
+        Fold another shard's analytics into this one.
+
+        :param ExecutionAnalytics other: Analytics with the same bucket width.
+        :return: This instance.
+        :rtype: ExecutionAnalytics
+        :raises ValueError: If the bucket widths differ.
+        """
+        if other.bucket_seconds != self.bucket_seconds:
+            raise ValueError("Cannot merge analytics with different bucket widths")
+        for process_id, statistics in other.processes.items():
+            self._statistics(process_id).merge(statistics)
+        self.process_names.update(other.process_names)
+        for start, counts in other.buckets.items():
+            bucket = self.buckets.setdefault(start, _new_bucket())
+            for key, value in counts.items():
+                bucket[key] += value
+        return self
+
+    def report(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the per-process summaries.
+
+        :param Iterable[float] quantiles: The elapsed-time quantiles to report.
+        :return: Summaries keyed by process id, each including ``process_name``.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        quantiles = tuple(quantiles)
+        report = {}
+        for process_id, statistics in self.processes.items():
+            summary = statistics.summary(quantiles)
+            summary["process_name"] = self.process_names.get(process_id)
+            report[process_id] = summary
+        return report
+
+    def histogram(self) -> List[Tuple[int, Dict[str, int]]]:
+        """
+        Get the time buckets in chronological order.
+
+        :return: ``(bucket start epoch seconds, counts)`` pairs; counts hold
+            ``executions``, ``errors`` and ``documents``.
+        :rtype: List[Tuple[int, Dict[str, int]]]
+        """
+        return [(start, dict(self.buckets[start])) for start in sorted(self.buckets)]
+
+    def _statistics(self, process_id: str) -> ProcessStatistics:
+        statistics = self.processes.get(process_id)
+        if statistics is None:
+            statistics = self.processes[process_id] = ProcessStatistics(
+                self.relative_accuracy
+            )
+        return statistics
+
+    def _add_execution(
+        self,
+        process_id: Optional[str],
+        process_name: Optional[str],
+        status: Optional[str],
+        execution_time: Optional[str],
+        duration: Any,
+        inbound: Any,
+        outbound: Any,
+        error_documents: Any,
+        executions: int = 1,
+        errors: Optional[int] = None,
+    ) -> None:
+        process_id = process_id or ""
+        statistics = self._statistics(process_id)
+        if process_name:
+            self.process_names[process_id] = process_name
+
+        if errors is None:
+            errors = executions if status in ERROR_STATUSES else 0
+        inbound = _to_int(inbound)
+        outbound = _to_int(outbound)
+        statistics.executions += executions
+        statistics.errors += errors
+        if status:
+            statistics.statuses[status] = statistics.statuses.get(status, 0) + executions
+        statistics.inbound_documents += inbound
+        statistics.outbound_documents += outbound
+        statistics.error_documents += _to_int(error_documents)
+        duration = _to_float(duration)
+        if duration is not None:
+            statistics.elapsed.add(duration)
+
+        timestamp = parse_timestamp(execution_time)
+        statistics._observe(timestamp)
+        if timestamp is not None:
+            start = timestamp - timestamp % self.bucket_seconds
+            bucket = self.buckets.setdefault(start, _new_bucket())
+            bucket["executions"] += executions
+            bucket["errors"] += errors
+            bucket["documents"] += inbound + outbound
+
+    def _add_summary(self, fields: Dict[str, Any]) -> None:
+        executions = _to_int(fields["execution_count"])
+        if not executions:
+            return
+        status = fields["status"]
+        self._add_execution(
+            fields["process_id"],
+            fields["process_name"],
+            status,
+            fields["time_block"],
+            None,
+            fields["inbound_doc_count"],
+            fields["outbound_doc_count"],
+            None,
+            executions=executions,
+        )
+        elapsed = _to_float(fields["elapsed_time"])
+        if elapsed is not None:
+            statistics = self.processes[fields["process_id"] or ""]
+            statistics.elapsed.add(elapsed / executions, weight=executions)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[int]:
+    """
+    Convert a Platform API UTC timestamp (``2024-01-31T23:59:59Z``) to epoch seconds.
+
+    :param Optional[str] value: The timestamp.
+    :return: Epoch seconds, or None when the value is missing or malformed.
+    :rtype: Optional[int]
+    """
+    if not value or len(value) < 19:
+        return None
+    try:
+        return calendar.timegm(
+            (
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+            )
+        )
+    except ValueError:
+        return None
+
+
+def format_timestamp(epoch: float) -> str:
+    """
+    Convert epoch seconds to a Platform API UTC timestamp (``2024-01-31T23:59:59Z``).
+
+    :param float epoch: Epoch seconds.
+    :rtype: str
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+# (model attribute, response key) per field used by the analytics.
+_FIELDS = {
+    "process_id": ("process_id", ("processId", "processID")),
+    "process_name": ("process_name", ("processName",)),
+    "status": ("status", ("status",)),
+    "execution_time": ("execution_time", ("executionTime",)),
+    "execution_duration": ("execution_duration", ("executionDuration",)),
+    "inbound_document_count": ("inbound_document_count", ("inboundDocumentCount",)),
+    "outbound_document_count": ("outbound_document_count", ("outboundDocumentCount",)),
+    "inbound_error_document_count": (
+        "inbound_error_document_count",
+        ("inboundErrorDocumentCount",),
+    ),
+    "execution_count": ("execution_count", ("executionCount",)),
+    "elapsed_time": ("elapsed_time", ("elapsedTime",)),
+    "time_block": ("time_block", ("timeBlock",)),
+    "inbound_doc_count": ("inbound_doc_count", ("inboundDocCount",)),
+    "outbound_doc_count": ("outbound_doc_count", ("outboundDocCount",)),
+}
+
+
+def _record_fields(record: Any) -> Dict[str, Any]:
+    if isinstance(record, dict):
+        fields = {}
+        for name, (_, keys) in _FIELDS.items():
+            value = None
+            for key in keys:
+                value = record.get(key)
+                if value is not None:
+                    break
+            fields[name] = value
+        return fields
+    fields = {name: getattr(record, attribute, None) for name, (attribute, _) in _FIELDS.items()}
+    fields["status"] = enum_value(fields["status"])
+    return fields
+
+
+def _new_bucket() -> Dict[str, int]:
+    return {"executions": 0, "errors": 0, "documents": 0}
+
+
+def _percentile_label(q: float) -> str:
+    label = f"{q * 100:g}"
+    return label.replace(".", "_")
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return to_number(value, int) or 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(value: Any) -> Optional[float]:
+    # A malformed duration is left out rather than failing the aggregation.
+    try:
+        return to_number(value, float)
+    except (TypeError, ValueError):
+        return None
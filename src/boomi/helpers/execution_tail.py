@@ -0,0 +1,304 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional
+
+from ._compat import enum_value, field_value
+from .concurrency import RateLimiter, chunked, default_rate_limiter
+from .execution_analytics import format_timestamp, parse_timestamp
+from .paging import iter_query
+from ..services.async_.utils.to_async import to_async
+
+#: ExecutionRecord statuses of executions that have not finished yet.
+IN_FLIGHT_STATUSES = frozenset({"INPROCESS", "STARTED", "QUEUED"})
+
+#: Number of in-flight execution ids checked per status query.
+IN_FLIGHT_QUERY_SIZE = 50
+
+NEW = "new"
+UPDATED = "updated"
+
+
+class TailEvent:
+    """
+    One change reported by :class:`ExecutionTail`.
+
+    :ivar str kind: ``"new"`` for a first-seen execution, ``"updated"`` for a status transition.
+    :ivar Any record: The ExecutionRecord (model, or raw dict if it could not be hydrated).
+    :ivar str execution_id: The execution id.
+    :ivar Optional[str] status: The current status.
+    :ivar Optional[str] previous_status: The status reported by the previous poll, for updates.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        record: Any,
+        execution_id: str,
+        status: Optional[str],
+        previous_status: Optional[str] = None,
+    ):
+        self.kind = kind
+        self.record = record
+        self.execution_id = execution_id
+        self.status = status
+        self.previous_status = previous_status
+
+    def __repr__(self) -> str:
+        return (
+            f"TailEvent(kind={self.kind!r}, execution_id={self.execution_id!r}, "
+            f"status={self.status!r}, previous_status={self.previous_status!r})"
+        )
+
+
+class ExecutionTail:
+    """
+    Incremental tail of an account's execution records.
+
+    Each :meth:`poll` issues one ``executionTime >=`` query from a persisted
+    high-water cursor (minus a small overlap for records that are recorded
+    late), drops executions it has already reported, and re-queries only the
+    executions that were still in flight (``INPROCESS``, ``STARTED``,
+    ``QUEUED``) to report their status transitions. Polling cost is therefore
+    proportional to new activity, not to the size of a sliding window.
+
+    The cursor, the recently reported ids and the in-flight statuses are saved
+    to ``state_path`` after every poll, so a restarted tail resumes where it
+    stopped.
+
+    Example Usage:
+    ```python
+    tail = ExecutionTail(sdk, state_path="noc-tail.json")
+    for event in tail.follow(interval=60):
+        print(event.kind, event.execution_id, event.previous_status, "->", event.status)
+    ```
+
+    :ivar Optional[str] state_path: The JSON file holding the tail state.
+    :ivar int overlap_seconds: How far before the cursor each poll re-reads.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        state_path: Optional[str] = None,
+        initial_window_seconds: int = 900,
+        overlap_seconds: int = 120,
+        expressions: Optional[List[Any]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ExecutionTail.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param Optional[str] state_path: Where to persist the tail state. Kept in memory when None.
+        :param int initial_window_seconds: How far back the first poll reads when no state exists.
+        :param int overlap_seconds: How far before the cursor each poll re-reads.
+        :param Optional[List[Any]] expressions: Extra ``ExecutionRecordSimpleExpression``
+            filters (e.g. on ``processId`` or ``atomId``) and-ed onto every query.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.state_path = state_path
+        self.initial_window_seconds = initial_window_seconds
+        self.overlap_seconds = overlap_seconds
+        self._service = sdk.execution_record
+        self._expressions = list(expressions or [])
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._state = self._load_state()
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """
+        The latest ``executionTime`` reported so far.
+
+        :rtype: Optional[str]
+        """
+        return self._state["cursor"]
+
+    @property
+    def in_flight(self) -> Dict[str, str]:
+        """
+        The last known status of every execution still in flight, keyed by execution id.
+
+        :rtype: Dict[str, str]
+        """
+        return dict(self._state["in_flight"])
+
+    def poll(self) -> List[TailEvent]:
+        """
+        Fetch new executions and status transitions since the previous poll.
+
+        :return: The changes, new executions first in ``executionTime`` order.
+        :rtype: List[TailEvent]
+        """
+        state = self._state
+        recent: Dict[str, str] = state["recent"]
+        in_flight: Dict[str, str] = state["in_flight"]
+        events: List[TailEvent] = []
+
+        if state["cursor"]:
+            since = _shift(state["cursor"], -self.overlap_seconds)
+        else:
+            since = format_timestamp(time.time() - self.initial_window_seconds)
+
+        new_records = [
+            record
+            for record in self._query(
+                _expression("executionTime", "GREATER_THAN_OR_EQUAL", [since])
+            )
+            if _execution_id(record) not in recent
+        ]
+        new_records.sort(key=lambda record: field_value(record, "execution_time", "executionTime") or "")
+
+        for record in new_records:
+            execution_id = _execution_id(record)
+            status = _status(record)
+            execution_time = field_value(record, "execution_time", "executionTime") or since
+            recent[execution_id] = execution_time
+            if execution_time > (state["cursor"] or ""):
+                state["cursor"] = execution_time
+            if status in IN_FLIGHT_STATUSES:
+                in_flight[execution_id] = status
+            events.append(TailEvent(NEW, record, execution_id, status))
+
+        reported = {event.execution_id for event in events}
+        pending = [execution_id for execution_id in in_flight if execution_id not in reported]
+        for ids in chunked(pending, IN_FLIGHT_QUERY_SIZE):
+            for record in self._query(_any_execution_id(ids)):
+                execution_id = _execution_id(record)
+                previous = in_flight.get(execution_id)
+                status = _status(record)
+                if previous is None or status == previous:
+                    continue
+                if status in IN_FLIGHT_STATUSES:
+                    in_flight[execution_id] = status
+                else:
+                    del in_flight[execution_id]
+                events.append(TailEvent(UPDATED, record, execution_id, status, previous))
+
+        # Executions reported inside the overlap window are remembered so the
+        # next poll's re-read does not report them twice.
+        horizon = _shift(state["cursor"], -self.overlap_seconds) if state["cursor"] else None
+        if horizon:
+            for execution_id in [key for key, value in recent.items() if value < horizon]:
+                del recent[execution_id]
+        self._save_state()
+        return events
+
+    def poll_async(self):
+        """
+        Awaitable variant of :meth:`poll` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[List[TailEvent]]
+        """
+        return to_async(self.poll)()
+
+    def follow(
+        self, interval: float = 60.0, max_polls: Optional[int] = None
+    ) -> Generator[TailEvent, None, None]:
+        """
+        Poll forever (or ``max_polls`` times) and yield every change.
+
+        :param float interval: Seconds between the start of consecutive polls.
+        :param Optional[int] max_polls: Stop after this many polls.
+        :rtype: Generator[TailEvent, None, None]
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            yield from self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    async def follow_async(
+        self, interval: float = 60.0, max_polls: Optional[int] = None
+    ) -> AsyncGenerator[TailEvent, None]:
+        """
+        Async stream variant of :meth:`follow`; polls run off the event loop.
+
+        :param float interval: Seconds between the start of consecutive polls.
+        :param Optional[int] max_polls: Stop after this many polls.
+        :rtype: AsyncGenerator[TailEvent, None]
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            for event in await self.poll_async():
+                yield event
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def _query(self, expression: Any) -> Generator[Any, None, None]:
+        from ..models import (
+            ExecutionRecordGroupingExpression,
+            ExecutionRecordQueryConfig,
+            ExecutionRecordQueryConfigQueryFilter,
+        )
+
+        if self._expressions:
+            expression = ExecutionRecordGroupingExpression(
+                operator="and", nested_expression=[expression, *self._expressions]
+            )
+        return iter_query(
+            self._service,
+            ExecutionRecordQueryConfig(
+                query_filter=ExecutionRecordQueryConfigQueryFilter(expression=expression)
+            ),
+            rate_limiter=self._rate_limiter,
+        )
+
+    def _load_state(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {}
+        if self.state_path:
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as file:
+                    state = json.load(file)
+            except FileNotFoundError:
+                pass
+        state.setdefault("cursor", None)
+        state.setdefault("recent", {})
+        state.setdefault("in_flight", {})
+        return state
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        temporary_path = f"{self.state_path}.partial"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(self._state, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self.state_path)
+
+
+def _expression(property: str, operator: str, argument: List[str]) -> Any:
+    from ..models import ExecutionRecordSimpleExpression
+
+    return ExecutionRecordSimpleExpression(
+        operator=operator, property=property, argument=argument
+    )
+
+
+def _any_execution_id(execution_ids: List[str]) -> Any:
+    from ..models import ExecutionRecordGroupingExpression
+
+    expressions = [_expression("executionId", "EQUALS", [id_]) for id_ in execution_ids]
+    if len(expressions) == 1:
+        return expressions[0]
+    return ExecutionRecordGroupingExpression(operator="or", nested_expression=expressions)
+
+
+def _execution_id(record: Any) -> str:
+    return field_value(record, "execution_id", "executionId")
+
+
+def _status(record: Any) -> Optional[str]:
+    status = field_value(record, "status", "status")
+    return enum_value(status)
+
+
+def _shift(timestamp: str, seconds: int) -> str:
+    epoch = parse_timestamp(timestamp)
+    if epoch is None:
+        return timestamp
+    return format_timestamp(epoch + seconds)
@@ -0,0 +1,497 @@
+import copy
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    default_rate_limiter,
+    run_concurrently,
+)
+from ..net.environment.environment import Environment
+from ..net.transport.request_template import RequestTemplate
+from ..services.async_.utils.to_async import to_async
+
+#: Change statuses.
+CACHED = "cached"
+UNCHANGED = "unchanged"
+CHANGED = "changed"
+UPDATED = "updated"
+FAILED = "failed"
+
+_FIELD = ("id", None, False)
+_IDENTITY_KEYS = ("environmentId", "extensionGroupId", "id")
+
+#: How each part of an extensions document is diffed. A ``dict`` is an object
+#: whose keys are diffed one by one; a tuple ``(identity, nested, whole)``
+#: is a list matched by ``identity``. Elements with a ``nested`` spec are
+#: reduced to their changed children, except that ``whole`` elements (process
+#: property components) are sent complete, as the API requires.
+EXTENSIONS_SCHEMA: Dict[str, Any] = {
+    "connections": {"connection": ("id", {"field": _FIELD}, False)},
+    "operations": {"operation": ("id", {"field": _FIELD}, False)},
+    "sharedCommunications": {"sharedCommunication": ("id", {"field": _FIELD}, False)},
+    "tradingPartners": {
+        "tradingPartner": ("id", {"category": ("id", {"field": _FIELD}, False)}, False)
+    },
+    "properties": {"property": ("name", None, False)},
+    "PGPCertificates": {"PGPCertificate": ("id", None, False)},
+    "crossReferences": {"crossReference": ("id", None, False)},
+    "processProperties": {
+        "ProcessProperty": ("id", {"ProcessPropertyValue": ("key", None, False)}, True)
+    },
+}
+
+
+class ExtensionsChange:
+    """
+    The outcome of one environment in an extensions sync.
+
+    :ivar str environment_id: The extensions id (``environmentId``, or the
+        conceptual id of a multi-install integration pack).
+    :ivar str status: ``cached`` (skipped without a request), ``unchanged``,
+        ``changed`` (planned only), ``updated`` or ``failed``.
+    :ivar Optional[Dict[str, Any]] patch: The partial update, in API JSON form.
+    :ivar Optional[Exception] error: The fetch or update error.
+    """
+
+    def __init__(
+        self,
+        environment_id: str,
+        status: str,
+        patch: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.environment_id = environment_id
+        self.status = status
+        self.patch = patch
+        self.error = error
+
+    @property
+    def patch_size(self) -> int:
+        """
+        The size in bytes of the partial update as JSON.
+
+        :rtype: int
+        """
+        return len(_canonical(self.patch)) if self.patch else 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ExtensionsChange(environment_id={self.environment_id!r}, status={self.status!r}, "
+            f"patch_size={self.patch_size}, error={self.error!r})"
+        )
+
+
+class ExtensionsSyncReport:
+    """
+    The per-environment outcome of :meth:`EnvironmentExtensionsSync.apply` (or plan).
+
+    :ivar Dict[str, ExtensionsChange] changes: The changes keyed by environment id.
+    :ivar int fetched: The number of extensions documents fetched.
+    :ivar float elapsed: Wall-clock seconds spent.
+    """
+
+    def __init__(self):
+        self.changes: Dict[str, ExtensionsChange] = {}
+        self.fetched = 0
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether no environment failed.
+
+        :rtype: bool
+        """
+        return not self.failures
+
+    @property
+    def failures(self) -> List[ExtensionsChange]:
+        """
+        The environments that could not be fetched or updated.
+
+        :rtype: List[ExtensionsChange]
+        """
+        return [change for change in self.changes.values() if change.status == FAILED]
+
+    @property
+    def patches(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The partial updates keyed by environment id.
+
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        return {id_: change.patch for id_, change in self.changes.items() if change.patch}
+
+    def counts(self) -> Dict[str, int]:
+        """
+        The number of environments per status.
+
+        :rtype: Dict[str, int]
+        """
+        counts: Dict[str, int] = {}
+        for change in self.changes.values():
+            counts[change.status] = counts.get(change.status, 0) + 1
+        return counts
+
+    def __iter__(self):
+        return iter(self.changes.values())
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __repr__(self) -> str:
+        return f"ExtensionsSyncReport(environments={len(self.changes)}, counts={self.counts()}, fetched={self.fetched})"
+
+
+class EnvironmentExtensionsSync:
+    """
+    Applies desired environment extensions with minimal partial updates.
+
+    The desired state maps extension ids to an ``EnvironmentExtensions``
+    model or its API JSON form and only needs to list the values under
+    management. For each environment the current extensions are fetched
+    (concurrently, through the shared rate limiter), the desired document is
+    diffed structurally against them, and only environments with differences
+    receive an update, carrying just the changed connections, fields,
+    properties, cross reference tables and process property components with
+    ``partial=true``.
+
+    Every environment that is fetched or updated is remembered with a digest of
+    the desired state it satisfies. As long as that entry is younger than
+    ``ttl``, an environment whose desired state has not changed is skipped
+    without any request. With ``cache_path`` the cache is kept in a JSON file
+    so repeated runs of a config-as-code job share it.
+
+    Values of encrypted fields are not returned by the API, so they cannot be
+    compared; they are sent only when another attribute of their field changes,
+    or always with ``encrypted=True``.
+
+    Example Usage:
+    ```python
+    sync = EnvironmentExtensionsSync(sdk, cache_path=".extensions-cache.json")
+    report = sync.apply({
+        "ENV_ID": {"properties": {"property": [{"name": "api.url", "value": "https://example.com"}]}},
+    })
+    print(report.counts())
+    ```
+
+    :ivar int max_workers: Environments fetched or updated concurrently.
+    :ivar Optional[float] ttl: Seconds a cache entry lets an environment be skipped.
+    :ivar bool encrypted: Always send desired values of encrypted fields.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ttl: Optional[float] = 3600.0,
+        cache_path: Optional[str] = None,
+        encrypted: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of EnvironmentExtensionsSync.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param int max_workers: Environments fetched or updated concurrently.
+        :param Optional[float] ttl: Seconds a cache entry lets an environment be
+            skipped. ``0`` always fetches, ``None`` trusts the cache indefinitely.
+        :param Optional[str] cache_path: A JSON file to persist the cache in.
+        :param bool encrypted: Always send desired values of encrypted fields.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.encrypted = encrypted
+        self._service = sdk.environment_extensions
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+
+    def plan(self, desired: Mapping[str, Any], refresh: bool = False) -> ExtensionsSyncReport:
+        """
+        Compute the partial updates without sending them.
+
+        :param Mapping[str, Any] desired: Desired extensions keyed by extension id.
+        :param bool refresh: Fetch every environment, ignoring the cache.
+        :return: One change per environment; changed ones carry their patch.
+        :rtype: ExtensionsSyncReport
+        """
+        return self._sync(desired, refresh, update=False)
+
+    def apply(self, desired: Mapping[str, Any], refresh: bool = False) -> ExtensionsSyncReport:
+        """
+        Send partial updates to the environments that differ from ``desired``.
+
+        :param Mapping[str, Any] desired: Desired extensions keyed by extension id.
+        :param bool refresh: Fetch every environment, ignoring the cache.
+        :return: One change per environment.
+        :rtype: ExtensionsSyncReport
+        """
+        return self._sync(desired, refresh, update=True)
+
+    def plan_async(self, desired: Mapping[str, Any], refresh: bool = False):
+        """
+        Awaitable variant of :meth:`plan` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[ExtensionsSyncReport]
+        """
+        return to_async(self.plan)(dict(desired), refresh)
+
+    def apply_async(self, desired: Mapping[str, Any], refresh: bool = False):
+        """
+        Awaitable variant of :meth:`apply` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[ExtensionsSyncReport]
+        """
+        return to_async(self.apply)(dict(desired), refresh)
+
+    def state(self, environment_id: str) -> Optional[Dict[str, Any]]:
+        """
+        The last-known extensions of an environment, in API JSON form.
+
+        :param str environment_id: The extension id.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        entry = self._cache.get(environment_id)
+        return copy.deepcopy(entry["state"]) if entry else None
+
+    def clear_cache(self) -> None:
+        """Forget every environment, so the next run fetches all of them."""
+        self._cache.clear()
+        self._save_cache()
+
+    def _sync(self, desired: Mapping[str, Any], refresh: bool, update: bool) -> ExtensionsSyncReport:
+        started = time.monotonic()
+        report = ExtensionsSyncReport()
+        documents = {id_: extensions_json(document) for id_, document in desired.items()}
+        digests = {id_: _digest(document) for id_, document in documents.items()}
+
+        pending = []
+        for id_ in documents:
+            if not refresh and self._is_fresh(id_, digests[id_]):
+                report.changes[id_] = ExtensionsChange(id_, CACHED)
+            else:
+                pending.append(id_)
+
+        current: Dict[str, Dict[str, Any]] = {}
+        for id_, response, error in run_concurrently(
+            lambda id_: self._request("GET", id_), pending, self.max_workers, self._rate_limiter
+        ):
+            if error is not None:
+                report.changes[id_] = ExtensionsChange(id_, FAILED, error=error)
+                continue
+            report.fetched += 1
+            current[id_] = extensions_json(response)
+            patch = extensions_diff(current[id_], documents[id_], self.encrypted)
+            report.changes[id_] = ExtensionsChange(id_, CHANGED if patch else UNCHANGED, patch)
+            self._remember(id_, current[id_], digests[id_] if not patch else None)
+
+        def _send(change: ExtensionsChange) -> Any:
+            body = dict(change.patch, partial=True)
+            for key in _IDENTITY_KEYS:
+                if key in current[change.environment_id]:
+                    body.setdefault(key, current[change.environment_id][key])
+            return self._request("POST", change.environment_id, body)
+
+        changed = [change for change in report.changes.values() if change.status == CHANGED]
+        if update and changed:
+            for change, _, error in run_concurrently(
+                _send, changed, self.max_workers, self._rate_limiter
+            ):
+                if error is not None:
+                    change.status, change.error = FAILED, error
+                    continue
+                change.status = UPDATED
+                id_ = change.environment_id
+                self._remember(id_, _merge(current[id_], change.patch, EXTENSIONS_SCHEMA), digests[id_])
+
+        if pending:
+            self._save_cache()
+        report.changes = {id_: report.changes[id_] for id_ in documents}
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def _request(self, method: str, environment_id: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        # Extensions documents are diffed as JSON, so they are sent and
+        # received without hydrating EnvironmentExtensions models.
+        template = RequestTemplate.get(
+            f"{self._service.base_url or Environment.DEFAULT.url}/EnvironmentExtensions/{{id}}",
+            method,
+            None if body is None else "application/json",
+        )
+        request = template.build(
+            self._service.get_auth_headers(), path={"id": environment_id}, body=body
+        )
+        response, _, _ = self._service.send_request(request)
+        return response
+
+    def _is_fresh(self, environment_id: str, digest: str) -> bool:
+        entry = self._cache.get(environment_id)
+        if entry is None or entry.get("digest") != digest:
+            return False
+        return self.ttl is None or time.time() - entry["verified"] < self.ttl
+
+    def _remember(self, environment_id: str, state: Dict[str, Any], digest: Optional[str]) -> None:
+        self._cache[environment_id] = {"digest": digest, "state": state, "verified": time.time()}
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        temporary_path = f"{self.cache_path}.partial"
+        with open(temporary_path, "wb") as file:
+            file.write(_canonical(self._cache))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.cache_path)
+
+
+def extensions_json(extensions: Any) -> Dict[str, Any]:
+    """
+    Convert environment extensions to their API JSON form.
+
+    :param Any extensions: An ``EnvironmentExtensions`` model, a JSON ``dict``
+        or a JSON string.
+    :return: The JSON object.
+    :rtype: Dict[str, Any]
+    """
+    if extensions is None:
+        return {}
+    if isinstance(extensions, (str, bytes)):
+        return json.loads(extensions) if extensions else {}
+    if hasattr(extensions, "_map"):
+        return extensions._map()
+    return extensions
+
+
+def extensions_diff(
+    current: Any, desired: Any, encrypted: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Compute the partial update that brings ``current`` extensions to ``desired``.
+
+    Only values present in ``desired`` are compared. Lists are matched by
+    identity (``id``, or ``name`` for properties and ``key`` for process
+    property values), not by position.
+
+    :param Any current: The current extensions (model, dict or JSON string).
+    :param Any desired: The desired extensions (model, dict or JSON string).
+    :param bool encrypted: Treat desired values of encrypted fields as changed.
+    :return: The changed parts in API JSON form, or ``None`` if nothing differs.
+    :rtype: Optional[Dict[str, Any]]
+    """
+    desired = {key: value for key, value in extensions_json(desired).items() if key != "partial"}
+    return _diff_object(extensions_json(current), desired, EXTENSIONS_SCHEMA, encrypted)
+
+
+def _diff_object(current: Dict[str, Any], desired: Dict[str, Any], spec: Dict[str, Any], encrypted: bool):
+    patch = {}
+    for key, value in desired.items():
+        if key.startswith("@"):
+            continue
+        nested = spec.get(key)
+        if isinstance(nested, dict) and isinstance(value, dict):
+            changed = _diff_object(current.get(key) or {}, value, nested, encrypted)
+        elif isinstance(nested, tuple):
+            changed = _diff_list(current.get(key), value, nested, encrypted) or None
+        else:
+            changed = None if _contains(current, key, value, encrypted) else value
+        if changed is not None:
+            patch[key] = changed
+    return patch or None
+
+
+def _diff_list(current: Any, desired: Any, spec: tuple, encrypted: bool) -> List[Any]:
+    identity, nested, whole = spec
+    existing = {item.get(identity): item for item in _as_list(current) if isinstance(item, dict)}
+    changed = []
+    for item in _as_list(desired):
+        match = existing.get(item.get(identity)) if isinstance(item, dict) else None
+        if match is None:
+            changed.append(item)
+        elif nested is None:
+            if not _matches(match, item, encrypted):
+                changed.append(item)
+        else:
+            patch = _diff_object(match, item, nested, encrypted)
+            if patch is not None:
+                if whole:
+                    patch = _merge(match, item, nested)
+                else:
+                    patch[identity] = item[identity]
+                changed.append(patch)
+    return changed
+
+
+def _matches(current: Any, desired: Any, encrypted: bool) -> bool:
+    if current == desired:
+        return True
+    if isinstance(desired, dict):
+        if not isinstance(current, dict):
+            return False
+        return all(
+            _contains(current, key, value, encrypted)
+            for key, value in desired.items()
+            if not key.startswith("@")
+        )
+    if isinstance(desired, list):
+        current = _as_list(current)
+        return len(current) == len(desired) and all(
+            _matches(a, b, encrypted) for a, b in zip(current, desired)
+        )
+    return _scalar(current) == _scalar(desired)
+
+
+def _contains(current: Dict[str, Any], key: str, value: Any, encrypted: bool) -> bool:
+    if key == "value" and _scalar(current.get("usesEncryption")) == "true":
+        # The API never returns encrypted values.
+        return not encrypted
+    return _matches(current.get(key), value, encrypted)
+
+
+def _merge(current: Any, desired: Any, spec: Any) -> Any:
+    if isinstance(spec, tuple):
+        identity, nested, _ = spec
+        merged = {item.get(identity): item for item in _as_list(current) if isinstance(item, dict)}
+        for item in _as_list(desired):
+            key = item.get(identity)
+            merged[key] = _merge(merged[key], item, nested) if key in merged else item
+        return list(merged.values())
+    if isinstance(current, dict) and isinstance(desired, dict):
+        merged = dict(current)
+        for key, value in desired.items():
+            merged[key] = _merge(current[key], value, (spec or {}).get(key)) if key in current else value
+        return merged
+    return desired
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    return text.lower() if text.lower() in ("true", "false") else text
+
+
+def _canonical(document: Any) -> bytes:
+    return json.dumps(document, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _digest(document: Dict[str, Any]) -> str:
+    return hashlib.sha256(_canonical(document)).hexdigest()
@@ -0,0 +1,447 @@
+import threading
+import time
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional
+
+from ._compat import field_value
+from .concurrency import RateLimiter, default_rate_limiter, sync_method
+from .paging import iter_raw_query_pages, page_results
+from ..services.async_.utils.to_async import to_async
+
+#: Seconds a materialized tree is served before the next access refreshes it.
+DEFAULT_TTL = 300.0
+
+#: Every folder, live and deleted: ``id IS_NOT_NULL``.
+_ALL_FOLDERS_QUERY = {
+    "QueryFilter": {"expression": {"operator": "IS_NOT_NULL", "property": "id", "argument": []}}
+}
+
+
+class FolderNode:
+    """
+    One folder of a :class:`FolderTree`.
+
+    :ivar str id_: The folder id.
+    :ivar Optional[str] name: The folder name.
+    :ivar Optional[str] parent_id: The parent folder id, ``None`` for a root.
+    :ivar str path: The full path, e.g. ``Account/Integrations/Orders``.
+    :ivar bool deleted: Whether the folder is deleted.
+    :ivar Optional[FolderNode] parent: The parent node, if it is in the tree.
+    :ivar List[FolderNode] children: The child nodes, live and deleted.
+    """
+
+    __slots__ = ("id_", "name", "parent_id", "path", "deleted", "parent", "children")
+
+    def __init__(self, id_: str, name: Optional[str], parent_id: Optional[str], path: str, deleted: bool):
+        self.id_ = id_
+        self.name = name
+        self.parent_id = parent_id
+        self.path = path
+        self.deleted = deleted
+        self.parent: Optional["FolderNode"] = None
+        self.children: List["FolderNode"] = []
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of ancestors in the tree; 0 for a root.
+
+        :rtype: int
+        """
+        depth, node = 0, self.parent
+        while node is not None:
+            depth, node = depth + 1, node.parent
+        return depth
+
+    def walk(self, include_deleted: bool = False) -> Generator["FolderNode", None, None]:
+        """
+        Yield this folder and every folder below it, depth first, parents first.
+
+        :param bool include_deleted: Also yield deleted folders (and their subtrees).
+        :rtype: Generator[FolderNode, None, None]
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.deleted and not include_deleted:
+                continue
+            yield node
+            stack.extend(reversed(node.children))
+
+    def __repr__(self) -> str:
+        return f"FolderNode(id_={self.id_!r}, path={self.path!r}, deleted={self.deleted})"
+
+
+class FolderTree:
+    """
+    An in-memory folder hierarchy indexed by folder id and by full path.
+
+    Built from one flat list of folders (models or API JSON dicts), e.g. the
+    results of a single paged ``query_folder`` sweep. Id and path lookups are
+    dictionary lookups; a subtree is enumerated from its root node without
+    any further request.
+
+    Paths are compared without leading or trailing ``/``. A path that does not
+    start with the root folder (the account name) is also looked up below the
+    root, so ``Integrations/Orders`` finds ``Account/Integrations/Orders``. When
+    a live and a deleted folder share a path, the path resolves to the live one.
+
+    :ivar List[FolderNode] roots: The folders without a parent in the tree.
+    """
+
+    def __init__(self, folders: Iterable[Any] = ()):
+        """
+        Initialize a new instance of FolderTree.
+
+        :param Iterable[Any] folders: ``Folder`` models or Folder API JSON dicts.
+        """
+        self.roots: List[FolderNode] = []
+        self._by_id: Dict[str, FolderNode] = {}
+        self._by_path: Dict[str, FolderNode] = {}
+        nodes = [self._node(folder) for folder in folders]
+        for node in nodes:
+            self._by_id[node.id_] = node
+        for node in nodes:
+            self._link(node)
+        for node in nodes:
+            if not node.path:
+                node.path = self._derived_path(node)
+            self._index_path(node)
+
+    def get(self, id_: str) -> Optional[FolderNode]:
+        """
+        Get a folder by id.
+
+        :param str id_: The folder id.
+        :rtype: Optional[FolderNode]
+        """
+        return self._by_id.get(id_)
+
+    def find(self, path: str) -> Optional[FolderNode]:
+        """
+        Get a folder by full path.
+
+        :param str path: The full path, or a path below the root folder.
+        :rtype: Optional[FolderNode]
+        """
+        key = _normalize(path)
+        node = self._by_path.get(key)
+        if node is None and len(self.roots) == 1 and key:
+            node = self._by_path.get(f"{self.roots[0].path}/{key}")
+        return node
+
+    def id_for(self, path: str) -> Optional[str]:
+        """
+        Get the id of the folder at a path.
+
+        :param str path: The full path, or a path below the root folder.
+        :return: The folder id, or ``None`` if no folder has this path.
+        :rtype: Optional[str]
+        """
+        node = self.find(path)
+        return node.id_ if node is not None else None
+
+    def subtree(self, folder: str, include_deleted: bool = False) -> List[FolderNode]:
+        """
+        List a folder and every folder below it, parents before children.
+
+        :param str folder: A folder id or path.
+        :param bool include_deleted: Also list deleted folders.
+        :return: The folders, or an empty list if the folder is unknown.
+        :rtype: List[FolderNode]
+        """
+        node = self._resolve(folder)
+        return list(node.walk(include_deleted)) if node is not None else []
+
+    def subtree_ids(self, folder: str, include_deleted: bool = False) -> List[str]:
+        """
+        List the ids of a folder and every folder below it, e.g. for a
+        ``folderId`` component query.
+
+        :param str folder: A folder id or path.
+        :param bool include_deleted: Also list deleted folders.
+        :rtype: List[str]
+        """
+        return [node.id_ for node in self.subtree(folder, include_deleted)]
+
+    def add(self, folder: Any) -> FolderNode:
+        """
+        Add (or replace) one folder, e.g. right after creating it.
+
+        The parent must already be in the tree for the folder to be linked
+        below it; children are not re-linked.
+
+        :param Any folder: A ``Folder`` model or Folder API JSON dict.
+        :rtype: FolderNode
+        """
+        node = self._node(folder)
+        previous = self._by_id.get(node.id_)
+        if previous is not None:
+            node.children = previous.children
+            for child in node.children:
+                child.parent = node
+            self._unlink(previous)
+        self._by_id[node.id_] = node
+        self._link(node)
+        if not node.path:
+            node.path = self._derived_path(node)
+        self._index_path(node)
+        return node
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[FolderNode]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, folder: object) -> bool:
+        return isinstance(folder, str) and self._resolve(folder) is not None
+
+    def __repr__(self) -> str:
+        return f"FolderTree(folders={len(self._by_id)}, roots={len(self.roots)})"
+
+    def _resolve(self, folder: str) -> Optional[FolderNode]:
+        node = self._by_id.get(folder)
+        return node if node is not None else self.find(folder)
+
+    @staticmethod
+    def _node(folder: Any) -> FolderNode:
+        return FolderNode(
+            field_value(folder, "id_", "id"),
+            field_value(folder, "name", "name"),
+            field_value(folder, "parent_id", "parentId") or None,
+            _normalize(field_value(folder, "full_path", "fullPath") or ""),
+            _flag(field_value(folder, "deleted", "deleted")),
+        )
+
+    def _link(self, node: FolderNode) -> None:
+        parent = self._by_id.get(node.parent_id) if node.parent_id else None
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+        else:
+            self.roots.append(node)
+
+    def _unlink(self, node: FolderNode) -> None:
+        siblings = node.parent.children if node.parent is not None else self.roots
+        siblings[:] = [sibling for sibling in siblings if sibling is not node]
+        if self._by_path.get(node.path) is node:
+            del self._by_path[node.path]
+
+    def _derived_path(self, node: FolderNode) -> str:
+        names, current, seen = [], node, set()
+        while current is not None and current.id_ not in seen:
+            if current.path and current is not node:
+                names.append(current.path)
+                break
+            seen.add(current.id_)
+            names.append(current.name or current.id_)
+            current = current.parent
+        return "/".join(reversed(names))
+
+    def _index_path(self, node: FolderNode) -> None:
+        existing = self._by_path.get(node.path)
+        if existing is None or existing.deleted or not node.deleted:
+            self._by_path[node.path] = node
+
+
+class FolderTreeCache:
+    """
+    A folder tree of the account, materialized with one paged query and
+    refreshed after a time to live.
+
+    The first access to :attr:`tree` reads every folder with a single
+    ``query_folder`` sweep (following ``queryMore`` pages, without hydrating
+    models) and builds a :class:`FolderTree`. Later accesses are served from
+    memory until ``ttl`` seconds have passed; concurrent threads share one
+    refresh. :meth:`ensure` creates the missing folders of a path and adds
+    them to the cached tree, so placing components by path costs no query.
+
+    Example Usage:
+    ```python
+    folders = FolderTreeCache(sdk, ttl=600)
+    orders_id = folders.id_for("Integrations/Orders")
+    for folder in folders.tree.subtree("Integrations"):
+        print("  " * folder.depth, folder.name)
+    component = folders.place(component, "Integrations/Orders/Inbound", create=True)
+    ```
+
+    :ivar Optional[float] ttl: Seconds a tree is served before it is refreshed;
+        ``None`` never refreshes on its own.
+    :ivar int requests: The number of API calls made.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        ttl: Optional[float] = DEFAULT_TTL,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of FolderTreeCache.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param Optional[float] ttl: Seconds a tree is served before it is
+            refreshed; ``None`` never refreshes on its own.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.ttl = ttl
+        self.requests = 0
+        self._service = sdk.folder
+        self._create_folder = sync_method(sdk.folder, "create_folder")
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._tree: Optional[FolderTree] = None
+        self._refreshed = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def tree(self) -> FolderTree:
+        """
+        The cached folder tree, refreshed first if it is missing or expired.
+
+        :rtype: FolderTree
+        """
+        tree = self._tree
+        if tree is not None and not self._expired():
+            return tree
+        with self._lock:
+            if self._tree is None or self._expired():
+                self.refresh()
+            return self._tree
+
+    @property
+    def age(self) -> Optional[float]:
+        """
+        Seconds since the tree was materialized, or ``None`` before the first refresh.
+
+        :rtype: Optional[float]
+        """
+        return time.monotonic() - self._refreshed if self._tree is not None else None
+
+    def refresh(self) -> FolderTree:
+        """
+        Re-read every folder and replace the cached tree.
+
+        :rtype: FolderTree
+        """
+        folders: List[Dict[str, Any]] = []
+        with self._lock:
+            for page in iter_raw_query_pages(
+                self._service, _ALL_FOLDERS_QUERY, "Folder", self._rate_limiter
+            ):
+                self.requests += 1
+                folders.extend(page_results(page))
+            self._tree = FolderTree(folders)
+            self._refreshed = time.monotonic()
+            return self._tree
+
+    def refresh_async(self):
+        """
+        Awaitable variant of :meth:`refresh` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[FolderTree]
+        """
+        return to_async(self.refresh)()
+
+    def invalidate(self) -> None:
+        """Drop the cached tree; the next access refreshes it."""
+        with self._lock:
+            self._tree = None
+
+    def id_for(self, path: str) -> Optional[str]:
+        """
+        Get the id of the folder at a path from the cached tree.
+
+        :param str path: The full path, or a path below the root folder.
+        :rtype: Optional[str]
+        """
+        return self.tree.id_for(path)
+
+    def ensure(self, path: str) -> FolderNode:
+        """
+        Get the folder at a path, creating it and any missing parent folders.
+
+        Only the missing folders are created, one ``create_folder`` call each,
+        and added to the cached tree without refreshing it.
+
+        :param str path: The full path, or a path below the root folder.
+        :rtype: FolderNode
+        :raises ValueError: If the path has no existing ancestor to create it below.
+        """
+        tree = self.tree
+        node = tree.find(path)
+        if node is not None and not node.deleted:
+            return node
+        with self._lock:
+            tree = self.tree
+            names = _normalize(path).split("/")
+            parent, index = None, len(names)
+            while index > 0:
+                parent = tree.find("/".join(names[:index]))
+                if parent is not None and not parent.deleted:
+                    break
+                parent, index = None, index - 1
+            if parent is None and len(tree.roots) == 1:
+                # A path below the root folder, none of which exists yet.
+                parent = tree.roots[0]
+            if parent is None:
+                raise ValueError(f"No existing folder to create {path!r} below")
+            for name in names[index:]:
+                self._rate_limiter.acquire()
+                self.requests += 1
+                created = self._create_folder(_folder_model(name, parent.id_))
+                if not field_value(created, "full_path", "fullPath"):
+                    created = {
+                        "id": field_value(created, "id_", "id"),
+                        "name": name,
+                        "parentId": parent.id_,
+                        "fullPath": f"{parent.path}/{name}",
+                    }
+                parent = tree.add(created)
+            return parent
+
+    def ensure_async(self, path: str):
+        """
+        Awaitable variant of :meth:`ensure` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[FolderNode]
+        """
+        return to_async(self.ensure)(path)
+
+    def place(self, component: Any, path: str, create: bool = False) -> Any:
+        """
+        Set the folder of a component (model or API JSON dict) by path.
+
+        :param Any component: A ``Component`` model or Component API JSON dict.
+        :param str path: The folder's full path, or a path below the root folder.
+        :param bool create: Create the folder (and missing parents) if needed.
+        :return: The component, with its folder id set.
+        :rtype: Any
+        :raises KeyError: If no folder has this path and ``create`` is false.
+        """
+        node = self.ensure(path) if create else self.tree.find(path)
+        if node is None:
+            raise KeyError(path)
+        if isinstance(component, dict):
+            component["folderId"] = node.id_
+        else:
+            component.folder_id = node.id_
+        return component
+
+    def _expired(self) -> bool:
+        return self.ttl is not None and time.monotonic() - self._refreshed >= self.ttl
+
+
+def _folder_model(name: str, parent_id: str) -> Any:
+    from ..models import Folder
+
+    return Folder(name=name, parent_id=parent_id)
+
+
+def _normalize(path: str) -> str:
+    return "/".join(part for part in path.split("/") if part)
+
+
+def _flag(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
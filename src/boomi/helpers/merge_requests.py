@@ -0,0 +1,416 @@
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ._compat import enum_value, field_value
+from .bulk import DEFAULT_BULK_LIMIT, BulkExecutor
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    default_rate_limiter,
+    run_concurrently,
+)
+from ..net.environment.environment import Environment
+from ..net.transport.request_template import RequestTemplate
+from ..services.async_.utils.to_async import to_async
+
+#: Merge statuses.
+PENDING = "pending"
+MERGED = "merged"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+
+#: Stages the driver executes the MERGE action from.
+MERGE_STAGES = ("DRAFTED", "REVIEWING")
+#: Stages that end a merge request unsuccessfully.
+FAILED_STAGES = frozenset(
+    {"FAILED_TO_DRAFT", "FAILED_TO_REDRAFT", "FAILED_TO_MERGE", "DELETED", "REVERTED"}
+)
+
+#: Called with the merge, its previous stage (``None`` on the first
+#: observation) and its new stage.
+StageCallback = Callable[["TrackedMerge", Optional[str], str], None]
+
+
+class TrackedMerge:
+    """
+    One merge request followed by :class:`MergeRequestDriver`.
+
+    :ivar Optional[str] id_: The merge request id, ``None`` if it could not be created.
+    :ivar Optional[Dict[str, Any]] request: The body the merge request was created
+        from, ``None`` for merge requests that already existed.
+    :ivar str status: ``pending``, ``merged``, ``failed`` or ``timed_out``.
+    :ivar Optional[str] stage: The last observed stage, e.g. ``MERGING``.
+    :ivar List[Tuple[str, float]] history: Every observed stage with the seconds,
+        relative to the start of the run, at which it was first seen.
+    :ivar Dict[str, float] timings: Seconds spent in each stage. A stage that is
+        entered and left between two polls is never observed, and durations are
+        only as precise as the poll interval.
+    :ivar Any result: The last merge request document received, a
+        ``MergeRequest`` model or its API JSON ``dict``.
+    :ivar bool executed: Whether the MERGE action was accepted.
+    :ivar int polls: The number of bulk polls that returned this merge request.
+    :ivar float elapsed: Seconds from the start of the run to the final stage.
+    :ivar Optional[Exception] error: The create, execute or poll error.
+    :ivar Optional[str] error_message: The per-item error reported by a bulk poll.
+    """
+
+    def __init__(self, id_: Optional[str] = None, request: Optional[Dict[str, Any]] = None):
+        self.id_ = id_
+        self.request = request
+        self.status = PENDING
+        self.stage: Optional[str] = None
+        self.history: List[Tuple[str, float]] = []
+        self.timings: Dict[str, float] = {}
+        self.result: Any = None
+        self.executed = False
+        self.polls = 0
+        self.elapsed = 0.0
+        self.error: Optional[Exception] = None
+        self.error_message: Optional[str] = None
+        self._merge_attempted: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the merge reached a final status.
+
+        :rtype: bool
+        """
+        return self.status != PENDING
+
+    def _observe(self, stage: str, now: float) -> bool:
+        if stage == self.stage:
+            return False
+        if self.history:
+            previous, entered = self.history[-1]
+            self.timings[previous] = self.timings.get(previous, 0.0) + now - entered
+        self.history.append((stage, now))
+        self.timings.setdefault(stage, 0.0)
+        self.stage = stage
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"TrackedMerge(id_={self.id_!r}, status={self.status!r}, stage={self.stage!r}, "
+            f"error={self.error_message or self.error!r})"
+        )
+
+
+class MergeReport:
+    """
+    The final state of every merge of a :meth:`MergeRequestDriver.run`.
+
+    :ivar List[TrackedMerge] merges: One entry per merge, in submission order.
+    :ivar int requests: The number of API calls made.
+    :ivar int rounds: The number of poll rounds.
+    :ivar float elapsed: Wall-clock seconds spent.
+    """
+
+    def __init__(self, merges: List[TrackedMerge]):
+        self.merges = merges
+        self.requests = 0
+        self.rounds = 0
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every merge reached ``MERGED``.
+
+        :rtype: bool
+        """
+        return not self.failures
+
+    @property
+    def failures(self) -> List[TrackedMerge]:
+        """
+        The merges that failed or timed out.
+
+        :rtype: List[TrackedMerge]
+        """
+        return [merge for merge in self.merges if merge.status != MERGED]
+
+    def get(self, id_: str) -> Optional[TrackedMerge]:
+        """
+        Get one merge by merge request id.
+
+        :param str id_: The merge request id.
+        :rtype: Optional[TrackedMerge]
+        """
+        return next((merge for merge in self.merges if merge.id_ == id_), None)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        The number of merges per status.
+
+        :rtype: Dict[str, int]
+        """
+        counts: Dict[str, int] = {}
+        for merge in self.merges:
+            counts[merge.status] = counts.get(merge.status, 0) + 1
+        return counts
+
+    def stage_timings(self) -> Dict[str, Dict[str, float]]:
+        """
+        Time spent per stage across all merges (``count``, ``mean``, ``max``).
+
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        durations: Dict[str, List[float]] = {}
+        for merge in self.merges:
+            for stage, seconds in merge.timings.items():
+                durations.setdefault(stage, []).append(seconds)
+        return {
+            stage: {"count": len(values), "mean": sum(values) / len(values), "max": max(values)}
+            for stage, values in durations.items()
+        }
+
+    def __iter__(self):
+        return iter(self.merges)
+
+    def __len__(self) -> int:
+        return len(self.merges)
+
+    def __repr__(self) -> str:
+        return f"MergeReport(merges={len(self.merges)}, counts={self.counts()}, requests={self.requests})"
+
+
+class MergeRequestDriver:
+    """
+    Drives many merge requests to ``MERGED`` from one batched poll loop.
+
+    A merge request moves through DRAFTING, DRAFTED, REVIEWING, MERGING and
+    MERGED on its own schedule, and following one means polling
+    ``get_merge_request`` until it settles. The driver creates all merge
+    requests concurrently, then polls every pending one with chunked
+    ``bulk_merge_request`` calls (100 ids each), so a release train of 60
+    merges costs one request per poll instead of 60. The poll interval grows
+    while no stage changes and resets when one does.
+
+    When a merge request reaches DRAFTED or REVIEWING the driver executes the
+    MERGE action for it (unless ``merge`` is off). A MERGE rejected in DRAFTED
+    is tried again once the merge request is in REVIEWING. MERGED ends a merge
+    successfully; FAILED_TO_DRAFT, FAILED_TO_REDRAFT, FAILED_TO_MERGE, DELETED
+    and REVERTED end it as failed, as does the timeout.
+
+    Callbacks run on the thread calling :meth:`run`, in between poll rounds;
+    an exception raised by a callback stops the run.
+
+    Example Usage:
+    ```python
+    driver = MergeRequestDriver(
+        sdk,
+        on_stage=lambda merge, previous, stage: print(merge.id_, previous, "->", stage),
+        on_failed=lambda merge: print("failed", merge.id_, merge.stage, merge.error),
+    )
+    report = driver.run([
+        {"sourceBranchId": "FEATURE_BRANCH_ID", "destinationBranchId": "MAIN_BRANCH_ID",
+         "strategy": "OVERRIDE", "priorityBranch": "SOURCE"},
+        "EXISTING_MERGE_REQUEST_ID",
+    ])
+    print(report.counts(), report.stage_timings())
+    ```
+
+    :ivar int max_workers: Requests dispatched concurrently.
+    :ivar int chunk_size: Merge request ids per bulk poll.
+    :ivar float poll_interval: Delay before the first poll, and after a stage change.
+    :ivar float max_poll_interval: Backoff ceiling between polls.
+    :ivar float timeout: Seconds after which a pending merge fails.
+    :ivar bool merge: Execute the MERGE action once a merge request is drafted.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        chunk_size: int = DEFAULT_BULK_LIMIT,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 15.0,
+        timeout: float = 1800.0,
+        merge: bool = True,
+        on_stage: Optional[StageCallback] = None,
+        on_merged: Optional[Callable[[TrackedMerge], None]] = None,
+        on_failed: Optional[Callable[[TrackedMerge], None]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of MergeRequestDriver.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param int max_workers: Requests dispatched concurrently.
+        :param int chunk_size: Merge request ids per bulk poll.
+        :param float poll_interval: Delay before the first poll, and after a stage change.
+        :param float max_poll_interval: Backoff ceiling between polls.
+        :param float timeout: Seconds after which a pending merge fails.
+        :param bool merge: Execute the MERGE action once a merge request is drafted.
+        :param Optional[StageCallback] on_stage: Called on every observed stage change.
+        :param Optional[Callable[[TrackedMerge], None]] on_merged: Called when a merge reaches MERGED.
+        :param Optional[Callable[[TrackedMerge], None]] on_failed: Called when a merge fails or times out.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.timeout = timeout
+        self.merge = merge
+        self.on_stage = on_stage
+        self.on_merged = on_merged
+        self.on_failed = on_failed
+        self._service = sdk.merge_request
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+
+    def run(self, merges: Iterable[Any]) -> MergeReport:
+        """
+        Create the merge requests and follow them until every one is final.
+
+        :param Iterable[Any] merges: ``MergeRequest`` models or API JSON dicts to
+            create, or ids of existing merge requests to follow.
+        :return: The final state of every merge.
+        :rtype: MergeReport
+        """
+        started = time.monotonic()
+        report = MergeReport(
+            [
+                TrackedMerge(id_=merge) if isinstance(merge, str) else TrackedMerge(request=_api_json(merge))
+                for merge in merges
+            ]
+        )
+
+        def _now() -> float:
+            return time.monotonic() - started
+
+        created = [merge for merge in report.merges if merge.request is not None]
+        for merge, result, error in run_concurrently(
+            lambda merge: self._request("", merge.request),
+            created,
+            self.max_workers,
+            self._rate_limiter,
+        ):
+            report.requests += 1
+            if error is not None:
+                merge.error = error
+                self._finish(merge, FAILED, _now())
+                continue
+            merge.id_ = field_value(result, "id_", "id")
+            self._update(merge, result, _now())
+
+        interval = self.poll_interval
+        while True:
+            self._execute(report, _now)
+            pending = [merge for merge in report.merges if not merge.done]
+            if not pending:
+                break
+            remaining = self.timeout - _now()
+            if remaining <= 0:
+                for merge in pending:
+                    self._finish(merge, TIMED_OUT, _now())
+                break
+            time.sleep(min(interval, remaining))
+
+            fetched = BulkExecutor(self.max_workers, self._rate_limiter).get(
+                self._service, [merge.id_ for merge in pending], chunk_size=self.chunk_size
+            )
+            report.requests += len(fetched.responses)
+            report.rounds += 1
+            items = {item.id_: item for item in fetched}
+            changed = False
+            for merge in pending:
+                item = items[merge.id_]
+                if item.error is not None:
+                    # The whole chunk failed; poll it again next round.
+                    merge.error = item.error
+                    continue
+                if not item.ok:
+                    merge.error_message = item.error_message
+                    self._finish(merge, FAILED, _now())
+                    continue
+                merge.polls += 1
+                merge.error = None
+                changed = self._update(merge, item.result, _now()) or changed
+            interval = self.poll_interval if changed else min(interval * 2, self.max_poll_interval)
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def run_async(self, merges: Iterable[Any]):
+        """
+        Awaitable variant of :meth:`run` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[MergeReport]
+        """
+        return to_async(self.run)(list(merges))
+
+    def _execute(self, report: MergeReport, now: Callable[[], float]) -> None:
+        ready = [
+            merge
+            for merge in report.merges
+            if self.merge
+            and not merge.done
+            and not merge.executed
+            and merge.stage in MERGE_STAGES
+            and merge._merge_attempted != merge.stage
+        ]
+        for merge, result, error in run_concurrently(
+            lambda merge: self._request(
+                "/execute/{id}", {"id": merge.id_, "mergeRequestAction": "MERGE"}, merge.id_
+            ),
+            ready,
+            self.max_workers,
+            self._rate_limiter,
+        ):
+            report.requests += 1
+            merge._merge_attempted = merge.stage
+            if error is None:
+                merge.executed = True
+                self._update(merge, result, now())
+            elif merge.stage == MERGE_STAGES[-1]:
+                merge.error = error
+                self._finish(merge, FAILED, now())
+
+    def _update(self, merge: TrackedMerge, result: Any, now: float) -> bool:
+        merge.result = result
+        stage = field_value(result, "stage", "stage")
+        stage = enum_value(stage)
+        if not stage:
+            return False
+        previous = merge.stage
+        if not merge._observe(stage, now):
+            return False
+        if self.on_stage is not None:
+            self.on_stage(merge, previous, stage)
+        if stage == "MERGED":
+            self._finish(merge, MERGED, now)
+        elif stage in FAILED_STAGES:
+            self._finish(merge, FAILED, now)
+        return True
+
+    def _finish(self, merge: TrackedMerge, status: str, now: float) -> None:
+        merge.status = status
+        merge.elapsed = now
+        if merge.history and status == TIMED_OUT:
+            stage, entered = merge.history[-1]
+            merge.timings[stage] += now - entered
+        callback = self.on_merged if status == MERGED else self.on_failed
+        if callback is not None:
+            callback(merge)
+
+    def _request(self, path: str, body: Dict[str, Any], id_: Optional[str] = None) -> Any:
+        # Merge requests are followed as JSON, so they are created and
+        # executed without hydrating MergeRequest models.
+        template = RequestTemplate.get(
+            f"{self._service.base_url or Environment.DEFAULT.url}/MergeRequest{path}",
+            "POST",
+            "application/json",
+        )
+        request = template.build(
+            self._service.get_auth_headers(), path={"id": id_}, body=body
+        )
+        response, _, _ = self._service.send_request(request)
+        return response
+
+
+def _api_json(value: Any) -> Dict[str, Any]:
+    if isinstance(value, dict):
+        return dict(value)
+    return value._map()
@@ -0,0 +1,535 @@
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional
+
+from ._compat import enum_value
+from .bulk import BulkExecutor
+from .concurrency import RateLimiter, default_rate_limiter
+from .paging import iter_query
+from ..services.async_.utils.to_async import to_async
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS components (
+    component_id TEXT NOT NULL,
+    version INTEGER,
+    name TEXT,
+    type TEXT,
+    sub_type TEXT,
+    folder_id TEXT,
+    folder_name TEXT,
+    branch_id TEXT NOT NULL DEFAULT '',
+    deleted INTEGER NOT NULL DEFAULT 0,
+    modified_date TEXT,
+    modified_by TEXT,
+    created_date TEXT,
+    created_by TEXT,
+    PRIMARY KEY (component_id, branch_id)
+);
+CREATE INDEX IF NOT EXISTS components_name ON components (name);
+CREATE INDEX IF NOT EXISTS components_type ON components (type, name);
+CREATE INDEX IF NOT EXISTS components_folder ON components (folder_id);
+CREATE INDEX IF NOT EXISTS components_deleted ON components (deleted);
+CREATE TABLE IF NOT EXISTS folders (
+    folder_id TEXT PRIMARY KEY,
+    full_path TEXT,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS folders_full_path ON folders (full_path);
+"""
+
+_COLUMNS = (
+    "component_id",
+    "version",
+    "name",
+    "type",
+    "sub_type",
+    "folder_id",
+    "folder_name",
+    "branch_id",
+    "deleted",
+    "modified_date",
+    "modified_by",
+    "created_date",
+    "created_by",
+)
+
+_SELECT = (
+    "SELECT "
+    + ", ".join(f"c.{column}" for column in _COLUMNS)
+    + ", f.full_path FROM components c LEFT JOIN folders f ON f.folder_id = c.folder_id"
+)
+
+_UPSERT = (
+    f"INSERT OR REPLACE INTO components ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)})"
+)
+
+
+class IndexedComponent:
+    """
+    One row of a :class:`ComponentMetadataIndex`.
+
+    :ivar str component_id: The component id.
+    :ivar Optional[int] version: The current version.
+    :ivar Optional[str] name: The component name.
+    :ivar Optional[str] type_: The component type, e.g. ``process``.
+    :ivar Optional[str] sub_type: The connector or sub type, if any.
+    :ivar Optional[str] folder_id: The containing folder id.
+    :ivar Optional[str] folder_name: The containing folder name.
+    :ivar Optional[str] folder_path: The containing folder's full path, once folders are indexed.
+    :ivar Optional[str] branch_id: The branch of the indexed version; each
+        branch of a component is a row of its own.
+    :ivar bool deleted: Whether the component is deleted.
+    :ivar Optional[str] modified_date: The last modification timestamp.
+    :ivar Optional[str] modified_by: The user who last modified the component.
+    :ivar Optional[str] created_date: The creation timestamp.
+    :ivar Optional[str] created_by: The user who created the component.
+    """
+
+    __slots__ = _COLUMNS[:3] + ("type_",) + _COLUMNS[4:] + ("folder_path",)
+
+    def __init__(self, row: tuple):
+        (
+            self.component_id,
+            self.version,
+            self.name,
+            self.type_,
+            self.sub_type,
+            self.folder_id,
+            self.folder_name,
+            self.branch_id,
+            deleted,
+            self.modified_date,
+            self.modified_by,
+            self.created_date,
+            self.created_by,
+            self.folder_path,
+        ) = row
+        self.branch_id = self.branch_id or None
+        self.deleted = bool(deleted)
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexedComponent(component_id={self.component_id!r}, name={self.name!r}, "
+            f"type_={self.type_!r}, version={self.version}, deleted={self.deleted})"
+        )
+
+
+class IndexRefreshReport:
+    """
+    Summary of a :meth:`ComponentMetadataIndex.refresh` run.
+
+    :ivar int components: The number of component rows inserted or updated.
+    :ivar int folders: The number of folder rows inserted or updated.
+    :ivar Optional[str] high_water_mark: The ``modifiedDate`` the next refresh starts from.
+    """
+
+    def __init__(self):
+        self.components = 0
+        self.folders = 0
+        self.high_water_mark: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexRefreshReport(components={self.components}, folders={self.folders}, "
+            f"high_water_mark={self.high_water_mark!r})"
+        )
+
+
+class ComponentMetadataIndex:
+    """
+    Persistent local index of an account's ComponentMetadata, backed by SQLite.
+
+    :meth:`refresh` queries the current version of every component modified
+    since the stored ``modifiedDate`` high-water mark and upserts the rows in a
+    single transaction. Rows are keyed on the component id and branch, so each
+    branch of a component is indexed on its own. The folder table (used for
+    folder path lookups) is read in full once; later refreshes only fetch the
+    folders of changed components that are new or renamed. Lookups by id, name
+    prefix, type, folder path, branch and deleted flag are answered from
+    indexed local tables, so they work offline and without any API call once
+    the index has been populated.
+
+    Example Usage:
+    ```python
+    with ComponentMetadataIndex("metadata.db", sdk) as index:
+        index.refresh()
+        for component in index.find(name_prefix="Order", type_="process"):
+            print(component.component_id, component.folder_path)
+    ```
+
+    :ivar str path: The SQLite database path.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sdk: Any = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ComponentMetadataIndex.
+
+        :param str path: The SQLite database path. Created if missing; ``":memory:"``
+            keeps the index in memory.
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client. Only needed to
+            :meth:`refresh`; omit it to open an existing index offline.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.path = path
+        self._sdk = sdk
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    @property
+    def high_water_mark(self) -> Optional[str]:
+        """
+        The ``modifiedDate`` from which the next refresh queries changes.
+
+        :rtype: Optional[str]
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM index_state WHERE key = 'high_water_mark'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def refresh(self, folders: bool = True, reload_folders: bool = False) -> IndexRefreshReport:
+        """
+        Bring the index up to date with the account.
+
+        :param bool folders: Update the folder table for folder path lookups.
+        :param bool reload_folders: Re-read every folder instead of only the
+            new and renamed folders of changed components, e.g. to pick up a
+            renamed folder that holds no changed component.
+        :return: The refresh summary.
+        :rtype: IndexRefreshReport
+        :raises ValueError: If the index was opened without a client.
+        """
+        if self._sdk is None:
+            raise ValueError("ComponentMetadataIndex was opened without a client")
+
+        report = IndexRefreshReport()
+        high_water_mark = self.high_water_mark
+        rows = []
+        for metadata in iter_query(
+            self._sdk.component_metadata,
+            self._changes_query(high_water_mark),
+            rate_limiter=self._rate_limiter,
+        ):
+            rows.append(_component_row(metadata))
+            modified_date = getattr(metadata, "modified_date", None)
+            if modified_date and modified_date > (high_water_mark or ""):
+                high_water_mark = modified_date
+
+        folder_rows = []
+        reload_folders = reload_folders or (folders and self._folder_count() == 0)
+        if reload_folders:
+            folder_rows = [
+                _folder_row(folder)
+                for folder in iter_query(
+                    self._sdk.folder,
+                    _all_folders_query(),
+                    rate_limiter=self._rate_limiter,
+                )
+            ]
+        elif folders:
+            stale = self._stale_folders(rows)
+            if stale:
+                result = BulkExecutor(rate_limiter=self._rate_limiter).get(
+                    self._sdk.folder, stale
+                )
+                folder_rows = [_folder_row(folder) for folder in result.results.values()]
+
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, rows)
+            if reload_folders:
+                self._connection.execute("DELETE FROM folders")
+            for folder_id, full_path, deleted in folder_rows:
+                self._update_folder(folder_id, full_path, deleted)
+            report.folders = len(folder_rows)
+            if high_water_mark:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO index_state VALUES ('high_water_mark', ?)",
+                    (high_water_mark,),
+                )
+
+        report.components = len(rows)
+        report.high_water_mark = high_water_mark
+        return report
+
+    def refresh_async(self, folders: bool = True, reload_folders: bool = False):
+        """
+        Awaitable variant of :meth:`refresh` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[IndexRefreshReport]
+        """
+        return to_async(self.refresh)(folders, reload_folders)
+
+    def get(self, component_id: str, branch_id: Optional[str] = None) -> Optional[IndexedComponent]:
+        """
+        Look up a component by id.
+
+        :param str component_id: The component id.
+        :param Optional[str] branch_id: The branch. When omitted, the most
+            recently modified branch of the component.
+        :rtype: Optional[IndexedComponent]
+        """
+        if branch_id is not None:
+            rows = self._select(
+                "WHERE c.component_id = ? AND c.branch_id = ?", (component_id, branch_id)
+            )
+        else:
+            rows = self._select(
+                "WHERE c.component_id = ? ORDER BY c.modified_date DESC LIMIT 1",
+                (component_id,),
+            )
+        return rows[0] if rows else None
+
+    def find(
+        self,
+        name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        type_: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        include_subfolders: bool = False,
+        deleted: Optional[bool] = False,
+        branch_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[IndexedComponent]:
+        """
+        Find components matching every given criterion, ordered by name.
+
+        :param Optional[str] name: The exact component name.
+        :param Optional[str] name_prefix: A case-sensitive name prefix.
+        :param Optional[str] type_: The component type, e.g. ``process``.
+        :param Optional[str] folder_path: The full path of the containing folder.
+        :param bool include_subfolders: Also match components below ``folder_path``.
+        :param Optional[bool] deleted: Match deleted (True), live (False, default)
+            or all (None) components.
+        :param Optional[str] branch_id: The branch. All branches when omitted.
+        :param Optional[int] limit: The maximum number of rows.
+        :rtype: List[IndexedComponent]
+        """
+        clauses = []
+        parameters: List[Any] = []
+        if name is not None:
+            clauses.append("c.name = ?")
+            parameters.append(name)
+        if name_prefix:
+            # A range over the name index instead of LIKE, which SQLite only
+            # optimizes for case-insensitive indexes.
+            clauses.append("c.name >= ? AND c.name < ?")
+            parameters.extend([name_prefix, name_prefix + "\U0010ffff"])
+        if type_ is not None:
+            clauses.append("c.type = ?")
+            parameters.append(enum_value(type_))
+        if folder_path is not None:
+            if include_subfolders:
+                clauses.append(
+                    "c.folder_id IN (SELECT folder_id FROM folders "
+                    "WHERE full_path = ? OR (full_path > ? AND full_path < ?))"
+                )
+                parameters.extend([folder_path, folder_path + "/", folder_path + "0"])
+            else:
+                clauses.append(
+                    "c.folder_id IN (SELECT folder_id FROM folders WHERE full_path = ?)"
+                )
+                parameters.append(folder_path)
+        if deleted is not None:
+            clauses.append("c.deleted = ?")
+            parameters.append(int(deleted))
+        if branch_id is not None:
+            clauses.append("c.branch_id = ?")
+            parameters.append(branch_id)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        suffix = " LIMIT ?" if limit is not None else ""
+        if limit is not None:
+            parameters.append(limit)
+        return self._select(f"{where} ORDER BY c.name{suffix}", tuple(parameters))
+
+    def resolve(
+        self,
+        name: str,
+        type_: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        branch_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Resolve a live component name to its id.
+
+        :param str name: The exact component name.
+        :param Optional[str] type_: Restrict to a component type.
+        :param Optional[str] folder_path: Restrict to a folder.
+        :param Optional[str] branch_id: Restrict to a branch.
+        :return: The component id, or None when no live component matches.
+        :rtype: Optional[str]
+        :raises ValueError: If more than one live component matches.
+        """
+        matches = self.find(
+            name=name, type_=type_, folder_path=folder_path, branch_id=branch_id
+        )
+        # The branches of one component share its id.
+        component_ids = list(dict.fromkeys(match.component_id for match in matches))
+        if len(component_ids) > 1:
+            raise ValueError(
+                f"Component name {name!r} is ambiguous; narrow it by type_, folder_path or branch_id"
+            )
+        return component_ids[0] if component_ids else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM components").fetchone()[0]
+
+    def __enter__(self) -> "ComponentMetadataIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _folder_count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM folders").fetchone()[0]
+
+    def _stale_folders(self, rows: List[tuple]) -> List[str]:
+        # The folders of changed components that are not indexed yet, or whose
+        # indexed path does not end with the folder name the component reports.
+        names = {}
+        for row in rows:
+            folder_id, folder_name = row[5], row[6]
+            if folder_id:
+                names[folder_id] = folder_name
+        if not names:
+            return []
+        with self._lock:
+            paths = {}
+            ids = list(names)
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                paths.update(
+                    self._connection.execute(
+                        "SELECT folder_id, full_path FROM folders "
+                        f"WHERE folder_id IN ({', '.join('?' for _ in chunk)})",
+                        chunk,
+                    ).fetchall()
+                )
+        return [
+            folder_id
+            for folder_id, folder_name in names.items()
+            if folder_id not in paths
+            or (folder_name and (paths[folder_id] or "").rsplit("/", 1)[-1] != folder_name)
+        ]
+
+    def _update_folder(self, folder_id: str, full_path: Optional[str], deleted: int) -> None:
+        # Called inside the refresh transaction. A renamed or moved folder
+        # carries the paths of the indexed folders below it along.
+        row = self._connection.execute(
+            "SELECT full_path FROM folders WHERE folder_id = ?", (folder_id,)
+        ).fetchone()
+        old_path = row[0] if row else None
+        if old_path and full_path and old_path != full_path:
+            self._connection.execute(
+                "UPDATE folders SET full_path = ? || substr(full_path, ?) "
+                "WHERE full_path > ? AND full_path < ?",
+                (full_path, len(old_path) + 1, old_path + "/", old_path + "0"),
+            )
+        self._connection.execute(
+            "INSERT OR REPLACE INTO folders VALUES (?, ?, ?)",
+            (folder_id, full_path, deleted),
+        )
+
+    def _select(self, clause: str, parameters: Iterable[Any]) -> List[IndexedComponent]:
+        with self._lock:
+            rows = self._connection.execute(f"{_SELECT} {clause}", tuple(parameters))
+            return [IndexedComponent(row) for row in rows]
+
+    @staticmethod
+    def _changes_query(high_water_mark: Optional[str]) -> Any:
+        from ..models import (
+            ComponentMetadataGroupingExpression,
+            ComponentMetadataQueryConfig,
+            ComponentMetadataQueryConfigQueryFilter,
+            ComponentMetadataSimpleExpression,
+        )
+
+        expression = ComponentMetadataSimpleExpression(
+            operator="EQUALS", property="currentVersion", argument=["true"]
+        )
+        if high_water_mark:
+            # Inclusive, so rows sharing the mark's timestamp are not missed;
+            # re-reading them is an idempotent upsert.
+            expression = ComponentMetadataGroupingExpression(
+                operator="and",
+                nested_expression=[
+                    expression,
+                    ComponentMetadataSimpleExpression(
+                        operator="GREATER_THAN_OR_EQUAL",
+                        property="modifiedDate",
+                        argument=[high_water_mark],
+                    ),
+                ],
+            )
+        return ComponentMetadataQueryConfig(
+            query_filter=ComponentMetadataQueryConfigQueryFilter(expression=expression)
+        )
+
+
+def _all_folders_query() -> Any:
+    from ..models import (
+        FolderQueryConfig,
+        FolderQueryConfigQueryFilter,
+        FolderSimpleExpression,
+    )
+
+    return FolderQueryConfig(
+        query_filter=FolderQueryConfigQueryFilter(
+            expression=FolderSimpleExpression(
+                operator="IS_NOT_NULL", property="id", argument=[]
+            )
+        )
+    )
+
+
+def _folder_row(folder: Any) -> tuple:
+    return (
+        folder.id_,
+        getattr(folder, "full_path", None),
+        _flag(getattr(folder, "deleted", False)),
+    )
+
+
+def _component_row(metadata: Any) -> tuple:
+    type_ = getattr(metadata, "type_", None)
+    return (
+        metadata.component_id,
+        getattr(metadata, "version", None),
+        getattr(metadata, "name", None),
+        enum_value(type_),
+        getattr(metadata, "sub_type", None),
+        getattr(metadata, "folder_id", None),
+        getattr(metadata, "folder_name", None),
+        getattr(metadata, "branch_id", None) or "",
+        _flag(getattr(metadata, "deleted", False)),
+        getattr(metadata, "modified_date", None),
+        getattr(metadata, "modified_by", None),
+        getattr(metadata, "created_date", None),
+        getattr(metadata, "created_by", None),
+    )
+
+
+def _flag(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value.lower() == "true")
+    return int(bool(value))
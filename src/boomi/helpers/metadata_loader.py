@@ -0,0 +1,265 @@
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .bulk import DEFAULT_BULK_LIMIT, bulk_request, split_bulk_response
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    chunked,
+    default_rate_limiter,
+    run_concurrently,
+    sync_method,
+)
+from ..net.transport.api_error import ApiError
+
+#: Seconds a batch stays open for more ids before it is sent.
+DEFAULT_WINDOW = 0.005
+
+# The per-item status codes of a bulk GET for an id that does not exist.
+_NOT_FOUND = (400, 404)
+
+_LOADERS: "weakref.WeakKeyDictionary[Any, ComponentMetadataLoader]" = weakref.WeakKeyDictionary()
+_LOADERS_LOCK = threading.Lock()
+
+
+class ComponentMetadataLoader:
+    """
+    Resolves component ids to ComponentMetadata in coalesced bulk requests.
+
+    ``resolve(id)`` calls made from any number of threads or ``BoomiAsync``
+    tasks within ``window`` seconds are collected into one batch, which is sent
+    as ``bulk_component_metadata`` requests of up to ``max_batch`` ids each
+    (dispatched concurrently through the shared :class:`RateLimiter`). A batch
+    is sent early once it holds ``max_batch`` ids. Every caller waits only for
+    its own ids, an id already in flight is not requested again, and results
+    are kept in an LRU cache (ids the API reports as unknown included), so N
+    lookups cost about N / 100 requests.
+
+    :meth:`for_client` returns the loader shared by every caller of one client.
+
+    Example Usage:
+    ```python
+    loader = ComponentMetadataLoader.for_client(sdk)
+
+    # From threads
+    with ThreadPoolExecutor(32) as pool:
+        names = list(pool.map(lambda id_: loader.resolve(id_).name, component_ids))
+
+    # From BoomiAsync tasks
+    metadata = await asyncio.gather(*(loader.resolve_async(id_) for id_ in component_ids))
+    ```
+
+    :ivar float window: Seconds a batch stays open for more ids.
+    :ivar int max_batch: Ids per ``bulk_component_metadata`` request.
+    :ivar int cache_size: The number of metadata entries kept.
+    :ivar int requests: The number of bulk requests made.
+    :ivar int cache_hits: The number of ids answered from the cache.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_BULK_LIMIT,
+        cache_size: int = 10000,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ComponentMetadataLoader.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param float window: Seconds a batch stays open for more ids.
+        :param int max_batch: Ids per bulk request (the API allows 100).
+        :param int cache_size: The number of metadata entries kept.
+        :param int max_workers: Bulk requests of one batch dispatched concurrently.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.window = window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.max_workers = max_workers
+        self.requests = 0
+        self.cache_hits = 0
+        self._bulk = sync_method(sdk.component_metadata, "bulk_component_metadata")
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._batch_full = threading.Condition(self._lock)
+
+    @classmethod
+    def for_client(cls, sdk: Any, **kwargs: Any) -> "ComponentMetadataLoader":
+        """
+        Get the loader (and cache) shared by every caller of a client.
+
+        The loader is created with ``kwargs`` on first use and lives as long as
+        the client.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :rtype: ComponentMetadataLoader
+        """
+        with _LOADERS_LOCK:
+            loader = _LOADERS.get(sdk)
+            if loader is None:
+                loader = _LOADERS[sdk] = cls(sdk, **kwargs)
+            return loader
+
+    def resolve(self, component_id: str) -> Any:
+        """
+        Get the metadata of a component, batched with concurrent lookups.
+
+        :param str component_id: The component id, optionally ``id~version``.
+        :return: The ``ComponentMetadata``, or ``None`` if the API reports no
+            component with this id.
+        :rtype: Any
+        :raises ApiError: If the bulk request carrying the id failed, or reported
+            an error other than not found for it.
+        """
+        return self.resolve_many([component_id])[0]
+
+    def resolve_many(self, component_ids: Iterable[str]) -> List[Any]:
+        """
+        Get the metadata of several components, in order.
+
+        :param Iterable[str] component_ids: The component ids.
+        :return: One ``ComponentMetadata`` (or ``None``) per id.
+        :rtype: List[Any]
+        :raises ApiError: If a bulk request carrying one of the ids failed, or
+            reported an error other than not found for one of them.
+        """
+        futures, leader = self._enqueue(component_ids)
+        if leader:
+            with self._batch_full:
+                self._batch_full.wait_for(lambda: len(self._pending) >= self.max_batch, self.window)
+            self._dispatch()
+        return [future.result() for future in futures]
+
+    async def resolve_async(self, component_id: str) -> Any:
+        """
+        Awaitable variant of :meth:`resolve`; lookups of tasks running in the
+        same event loop tick (or ``window``) share one batch.
+
+        :rtype: Any
+        """
+        return (await self.resolve_many_async([component_id]))[0]
+
+    async def resolve_many_async(self, component_ids: Iterable[str]) -> List[Any]:
+        """
+        Awaitable variant of :meth:`resolve_many`.
+
+        :rtype: List[Any]
+        """
+        loop = asyncio.get_running_loop()
+        futures, leader = self._enqueue(component_ids)
+        if leader:
+            loop.call_later(self.window, loop.run_in_executor, None, self._dispatch)
+        return list(await asyncio.gather(*(asyncio.wrap_future(future) for future in futures)))
+
+    def prime(self, metadata: Iterable[Any]) -> None:
+        """
+        Add already known metadata (e.g. query results) to the cache.
+
+        :param Iterable[Any] metadata: ``ComponentMetadata`` models or API JSON dicts.
+        """
+        with self._lock:
+            for item in metadata:
+                self._store(_cache_key(item), item)
+
+    def clear(self, component_id: Optional[str] = None) -> None:
+        """
+        Drop one cached component, or the whole cache.
+
+        :param Optional[str] component_id: The component id; all when omitted.
+        """
+        with self._lock:
+            if component_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(component_id, None)
+
+    def __repr__(self) -> str:
+        return (
+            f"ComponentMetadataLoader(cached={len(self._cache)}, requests={self.requests}, "
+            f"cache_hits={self.cache_hits})"
+        )
+
+    def _enqueue(self, component_ids: Iterable[str]) -> Tuple[List[Future], bool]:
+        futures: List[Future] = []
+        with self._lock:
+            opened = bool(self._pending)
+            for component_id in component_ids:
+                if component_id in self._cache:
+                    self._cache.move_to_end(component_id)
+                    self.cache_hits += 1
+                    future: Future = Future()
+                    future.set_result(self._cache[component_id])
+                else:
+                    future = self._pending.get(component_id) or self._in_flight.get(component_id)
+                    if future is None:
+                        future = self._pending[component_id] = Future()
+                futures.append(future)
+            # The caller that opens a batch sends it; later callers only wait.
+            leader = not opened and bool(self._pending)
+            if len(self._pending) >= self.max_batch:
+                self._batch_full.notify_all()
+        return futures, leader
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._in_flight.update(batch)
+        if not batch:
+            return
+        chunks = list(chunked(list(batch), self.max_batch))
+        with self._lock:
+            self.requests += len(chunks)
+        for chunk, response, error in run_concurrently(
+            self._send, chunks, self.max_workers, self._rate_limiter
+        ):
+            items = [] if error is not None else split_bulk_response(chunk, response)
+            with self._lock:
+                for component_id in chunk:
+                    self._in_flight.pop(component_id, None)
+                for item in items:
+                    # Unknown ids are cached too; component ids are never reused.
+                    if item.ok or item.status_code in _NOT_FOUND:
+                        self._store(item.id_, item.result if item.ok else None)
+            if error is not None:
+                for component_id in chunk:
+                    batch[component_id].set_exception(error)
+                continue
+            for item in items:
+                if item.ok:
+                    batch[item.id_].set_result(item.result)
+                elif item.status_code in _NOT_FOUND:
+                    batch[item.id_].set_result(None)
+                else:
+                    batch[item.id_].set_exception(
+                        ApiError(
+                            item.error_message or f"Bulk lookup of {item.id_} failed",
+                            item.status_code,
+                        )
+                    )
+
+    def _send(self, chunk: List[str]) -> Any:
+        from ..models import ComponentMetadataBulkRequest
+
+        return self._bulk(bulk_request(ComponentMetadataBulkRequest, chunk))
+
+    def _store(self, component_id: str, metadata: Any) -> None:
+        self._cache[component_id] = metadata
+        self._cache.move_to_end(component_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+def _cache_key(metadata: Any) -> str:
+    if isinstance(metadata, dict):
+        return metadata.get("componentId")
+    return getattr(metadata, "component_id", None)
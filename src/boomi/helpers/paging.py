@@ -0,0 +1,229 @@
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+from .concurrency import RateLimiter, sync_method
+from ..net.environment.environment import Environment
+from ..net.transport.api_error import ApiError
+from ..net.transport.json_codec import JsonArrayStream
+from ..net.transport.request_template import RequestTemplate
+
+
+def service_object_name(service: Any) -> str:
+    """
+    Get the API object name a service operates on.
+
+    :param Any service: The service instance, e.g. ``ExecutionRecordServiceAsync``.
+    :return: The object name, e.g. ``ExecutionRecord``.
+    :rtype: str
+    """
+    name = type(service).__name__
+    for suffix in ("ServiceAsync", "Service"):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def query_operation_names(service: Any, name: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Find the ``query_*`` / ``query_more_*`` method pair of a service.
+
+    :param Any service: The service instance, e.g. ``sdk.component_metadata``.
+    :param Optional[str] name: The object name, e.g. ``component_metadata``.
+        Detected from the service when omitted.
+    :return: The query and queryMore method names.
+    :rtype: Tuple[str, str]
+    :raises ValueError: If the service has no single query operation.
+    """
+    if name is None:
+        names = [
+            attribute[len("query_") :]
+            for attribute in dir(type(service))
+            if attribute.startswith("query_") and not attribute.startswith("query_more_")
+        ]
+        if len(names) != 1:
+            raise ValueError(
+                f"{type(service).__name__} does not expose a single query operation: {names}"
+            )
+        name = names[0]
+    return f"query_{name}", f"query_more_{name}"
+
+
+def page_results(page: Any) -> List[Any]:
+    """
+    Get the ``result`` list of a query page (typed response or raw ``dict``).
+
+    :param Any page: The query response.
+    :rtype: List[Any]
+    """
+    if isinstance(page, dict):
+        results = page.get("result")
+    else:
+        results = getattr(page, "result", None)
+    if results is None:
+        return []
+    return results if isinstance(results, list) else [results]
+
+
+def page_query_token(page: Any) -> Optional[str]:
+    """
+    Get the ``queryToken`` of a query page (typed response or raw ``dict``).
+
+    :param Any page: The query response.
+    :rtype: Optional[str]
+    """
+    if isinstance(page, dict):
+        return page.get("queryToken")
+    return getattr(page, "query_token", None)
+
+
+def iter_query_pages(
+    service: Any,
+    query_config: Any = None,
+    name: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Generator[Any, None, None]:
+    """
+    Run a query and follow its ``queryToken`` through every ``queryMore`` page.
+
+    :param Any service: A sync or async service, e.g. ``sdk.execution_record``.
+    :param Any query_config: The ``*QueryConfig`` (model or dict) of the first page.
+    :param Optional[str] name: The object name. Detected from the service when omitted.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every page.
+    :return: A generator of query responses.
+    :rtype: Generator[Any, None, None]
+    """
+    query_name, query_more_name = query_operation_names(service, name)
+    query = sync_method(service, query_name)
+    query_more = sync_method(service, query_more_name)
+
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+    page = query(query_config)
+    while True:
+        yield page
+        token = page_query_token(page)
+        if not token:
+            return
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        page = query_more(token)
+
+
+def iter_query(
+    service: Any,
+    query_config: Any = None,
+    name: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Generator[Any, None, None]:
+    """
+    Run a query and yield every result across all pages.
+
+    :param Any service: A sync or async service, e.g. ``sdk.execution_record``.
+    :param Any query_config: The ``*QueryConfig`` (model or dict) of the first page.
+    :param Optional[str] name: The object name. Detected from the service when omitted.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every page.
+    :return: A generator of result models.
+    :rtype: Generator[Any, None, None]
+    """
+    for page in iter_query_pages(service, query_config, name, rate_limiter):
+        yield from page_results(page)
+
+
+def iter_raw_query_pages(
+    service: Any,
+    query_config: Any = None,
+    object_name: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Run a query and yield every page as the decoded response ``dict``.
+
+    The pages are never hydrated into models, which keeps large exports cheap;
+    the request is sent through the service's own handler chain (auth, retries,
+    hooks) against ``{base_url}/{object_name}/query`` and ``/queryMore``.
+
+    :param Any service: A sync or async service, e.g. ``sdk.execution_record``.
+    :param Any query_config: The ``*QueryConfig`` (model or dict) of the first page.
+    :param Optional[str] object_name: The API object name, e.g. ``ExecutionRecord``.
+        Detected from the service when omitted.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every page.
+    :return: A generator of response dicts.
+    :rtype: Generator[Dict[str, Any], None, None]
+    :raises ApiError: If a page is not a JSON object, e.g. an XML or HTML body.
+    """
+    object_name = object_name or service_object_name(service)
+    query, query_more = _query_templates(service, object_name)
+
+    def _send(template: RequestTemplate, body: Any) -> Dict[str, Any]:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        request = template.build(service.get_auth_headers(), body=body)
+        page, status, content = service.send_request(request)
+        if not isinstance(page, dict):
+            if isinstance(page, (bytes, bytearray)):
+                page = page.decode("utf-8", errors="replace")
+            raise ApiError(
+                f"Expected a JSON {object_name} query page, got {content or 'no content type'}: "
+                f"{str(page)[:1000]}",
+                status,
+            )
+        return page
+
+    page = _send(query, query_config)
+    while True:
+        yield page
+        token = page_query_token(page)
+        if not token:
+            return
+        page = _send(query_more, token)
+
+
+def iter_raw_query_records(
+    service: Any,
+    query_config: Any = None,
+    object_name: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Run a query and yield every result as a raw ``dict``, decoding each page
+    while it downloads.
+
+    Like :func:`iter_raw_query_pages`, but every page is streamed through a
+    :class:`JsonArrayStream`, so memory is bounded by one result instead of
+    one (possibly very large) page, and the first results are available before
+    the page has fully arrived.
+
+    :param Any service: A sync or async service, e.g. ``sdk.execution_record``.
+    :param Any query_config: The ``*QueryConfig`` (model or dict) of the first page.
+    :param Optional[str] object_name: The API object name, e.g. ``ExecutionRecord``.
+        Detected from the service when omitted.
+    :param Optional[RateLimiter] rate_limiter: Limiter acquired before every page.
+    :return: A generator of result dicts.
+    :rtype: Generator[Dict[str, Any], None, None]
+    """
+    object_name = object_name or service_object_name(service)
+    query, query_more = _query_templates(service, object_name)
+
+    def _stream(template: RequestTemplate, body: Any) -> JsonArrayStream:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        request = template.build(service.get_auth_headers(), body=body)
+        return JsonArrayStream(service.stream_request_raw(request), key="result")
+
+    page = _stream(query, query_config)
+    while True:
+        yield from page
+        # A single result may arrive as an object rather than a list.
+        yield from page_results(page.fields)
+        token = page_query_token(page.fields)
+        if not token:
+            return
+        page = _stream(query_more, token)
+
+
+def _query_templates(service: Any, object_name: str) -> Tuple[RequestTemplate, RequestTemplate]:
+    """The cached ``query`` and ``queryMore`` request templates of an object."""
+    base_url = f"{service.base_url or Environment.DEFAULT.url}/{object_name}"
+    return (
+        RequestTemplate.get(f"{base_url}/query", "POST", "application/json"),
+        RequestTemplate.get(f"{base_url}/queryMore", "POST", "text/plain"),
+    )
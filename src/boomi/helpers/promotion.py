@@ -0,0 +1,425 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from ._compat import field_value
+from .bulk import BulkExecutor
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    chunked,
+    default_rate_limiter,
+    run_concurrently,
+    sync_method,
+)
+from .paging import iter_query
+from ..services.async_.utils.to_async import to_async
+
+#: Number of component / environment ids or-ed into one DeployedPackage query.
+DEPLOYED_QUERY_SIZE = 50
+
+#: Planned actions.
+DEPLOY = "deploy"
+UNCHANGED = "unchanged"
+
+#: Target statuses.
+PLANNED = "planned"
+DEPLOYED = "deployed"
+FAILED = "failed"
+SKIPPED = "skipped"
+ROLLED_BACK = "rolled_back"
+ROLLBACK_FAILED = "rollback_failed"
+
+
+class PromotionTarget:
+    """
+    One package / environment pair of a promotion.
+
+    :ivar str package_id: The package to deploy.
+    :ivar str component_id: The packaged component.
+    :ivar Optional[str] package_version: The package version.
+    :ivar str environment_id: The target environment.
+    :ivar str action: ``"deploy"``, or ``"unchanged"`` if the package is already active there.
+    :ivar str status: ``planned``, ``unchanged``, ``deployed``, ``failed``,
+        ``skipped`` (not attempted after a failure), ``rolled_back`` or ``rollback_failed``.
+    :ivar Any previous: The DeployedPackage active before the promotion, if any.
+    :ivar Any deployment: The DeployedPackage created by the promotion.
+    :ivar Optional[Exception] error: The deployment error.
+    :ivar Optional[Exception] rollback_error: The rollback error.
+    :ivar float elapsed: Seconds the deployment call took.
+    """
+
+    def __init__(
+        self,
+        package_id: str,
+        component_id: str,
+        package_version: Optional[str],
+        environment_id: str,
+        previous: Any = None,
+    ):
+        self.package_id = package_id
+        self.component_id = component_id
+        self.package_version = package_version
+        self.environment_id = environment_id
+        self.previous = previous
+        if previous is not None and field_value(previous, "package_id", "packageId") == package_id:
+            self.action = UNCHANGED
+            self.status = UNCHANGED
+        else:
+            self.action = DEPLOY
+            self.status = PLANNED
+        self.deployment: Any = None
+        self.error: Optional[Exception] = None
+        self.rollback_error: Optional[Exception] = None
+        self.elapsed = 0.0
+
+    @property
+    def previous_package_id(self) -> Optional[str]:
+        """
+        The package active in the environment before the promotion.
+
+        :rtype: Optional[str]
+        """
+        return field_value(self.previous, "package_id", "packageId") if self.previous is not None else None
+
+    def __repr__(self) -> str:
+        return (
+            f"PromotionTarget(package_id={self.package_id!r}, environment_id={self.environment_id!r}, "
+            f"action={self.action!r}, status={self.status!r}, error={self.error!r})"
+        )
+
+
+class PromotionReport:
+    """
+    The per-target outcome of :meth:`DeploymentPromoter.promote` (or plan).
+
+    :ivar List[PromotionTarget] targets: One entry per package / environment pair.
+    :ivar bool rolled_back: Whether a failure triggered a rollback.
+    :ivar float elapsed: Wall-clock seconds spent.
+    """
+
+    def __init__(self, targets: List[PromotionTarget]):
+        self.targets = targets
+        self.rolled_back = False
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every target is deployed or was already up to date.
+
+        :rtype: bool
+        """
+        return all(target.status in (DEPLOYED, UNCHANGED) for target in self.targets)
+
+    @property
+    def to_deploy(self) -> List[PromotionTarget]:
+        """
+        The targets whose environment does not run the package yet.
+
+        :rtype: List[PromotionTarget]
+        """
+        return [target for target in self.targets if target.action == DEPLOY]
+
+    @property
+    def failures(self) -> List[PromotionTarget]:
+        """
+        The targets whose deployment or rollback failed.
+
+        :rtype: List[PromotionTarget]
+        """
+        return [target for target in self.targets if target.status in (FAILED, ROLLBACK_FAILED)]
+
+    def by_environment(self) -> Dict[str, List[PromotionTarget]]:
+        """
+        The targets grouped by environment id.
+
+        :rtype: Dict[str, List[PromotionTarget]]
+        """
+        grouped: Dict[str, List[PromotionTarget]] = {}
+        for target in self.targets:
+            grouped.setdefault(target.environment_id, []).append(target)
+        return grouped
+
+    def counts(self) -> Dict[str, int]:
+        """
+        The number of targets per status.
+
+        :rtype: Dict[str, int]
+        """
+        counts: Dict[str, int] = {}
+        for target in self.targets:
+            counts[target.status] = counts.get(target.status, 0) + 1
+        return counts
+
+    def __iter__(self):
+        return iter(self.targets)
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def __repr__(self) -> str:
+        return f"PromotionReport(targets={len(self.targets)}, counts={self.counts()}, rolled_back={self.rolled_back})"
+
+
+class DeploymentPromoter:
+    """
+    Promotes packaged components to many environments at once.
+
+    A promotion first computes the delta: the packages are resolved with one
+    bulk PackagedComponent GET (when given as ids), and the currently active
+    deployments of every component in every target environment are read with
+    one or-grouped DeployedPackage query (chunked only for very large
+    releases). Pairs already running the package are left untouched; the rest
+    are deployed concurrently with ``create_deployed_package``, at most
+    ``max_parallel`` at a time and throttled by the shared rate limiter.
+
+    With ``rollback`` (the default) a release is all-or-nothing: after the
+    first failure no further deployments are started, and every target
+    deployed by this promotion is reverted, to the package that was active
+    before or, for first-time deployments, by undeploying it.
+
+    Example Usage:
+    ```python
+    promoter = DeploymentPromoter(sdk, max_parallel=10)
+    report = promoter.promote(["PACKAGE_ID"], production_environment_ids, notes="Release 42")
+    for target in report.failures:
+        print(target.environment_id, target.error)
+    ```
+
+    :ivar int max_parallel: Deployments in flight at once.
+    :ivar bool rollback: Revert the release when a deployment fails.
+    :ivar str listener_status: The listener status of new deployments.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_parallel: int = DEFAULT_MAX_WORKERS,
+        rollback: bool = True,
+        listener_status: str = "RUNNING",
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of DeploymentPromoter.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param int max_parallel: Deployments in flight at once.
+        :param bool rollback: Revert the release when a deployment fails.
+        :param str listener_status: ``RUNNING`` or ``PAUSED`` for new deployments.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_parallel = max_parallel
+        self.rollback = rollback
+        self.listener_status = listener_status
+        self._packaged_component = sdk.packaged_component
+        self._deployed_package = sdk.deployed_package
+        self._create = sync_method(sdk.deployed_package, "create_deployed_package")
+        self._delete = sync_method(sdk.deployed_package, "delete_deployed_package")
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+
+    def plan(self, packages: Iterable[Any], environment_ids: Iterable[str]) -> PromotionReport:
+        """
+        Compute the delta without deploying anything.
+
+        :param Iterable[Any] packages: Package ids, ``PackagedComponent`` models or raw dicts.
+        :param Iterable[str] environment_ids: The target environments.
+        :return: One planned target per package / environment pair.
+        :rtype: PromotionReport
+        :raises ValueError: If a package id cannot be resolved.
+        """
+        started = time.monotonic()
+        packages = self._resolve_packages(packages)
+        environment_ids = list(dict.fromkeys(environment_ids))
+        active = self._active_deployments(
+            [package["component_id"] for package in packages], environment_ids
+        )
+        report = PromotionReport(
+            [
+                PromotionTarget(
+                    package["package_id"],
+                    package["component_id"],
+                    package["package_version"],
+                    environment_id,
+                    active.get((package["component_id"], environment_id)),
+                )
+                for package in packages
+                for environment_id in environment_ids
+            ]
+        )
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def promote(
+        self,
+        packages: Iterable[Any],
+        environment_ids: Iterable[str],
+        notes: Optional[str] = None,
+        force: bool = False,
+    ) -> PromotionReport:
+        """
+        Deploy ``packages`` to every environment that does not run them yet.
+
+        :param Iterable[Any] packages: Package ids, ``PackagedComponent`` models or raw dicts.
+        :param Iterable[str] environment_ids: The target environments.
+        :param Optional[str] notes: Deployment notes.
+        :param bool force: Redeploy even where the package is already active.
+        :return: The per-target outcome.
+        :rtype: PromotionReport
+        :raises ValueError: If a package id cannot be resolved.
+        """
+        started = time.monotonic()
+        report = self.plan(packages, environment_ids)
+        if force:
+            for target in report.targets:
+                target.action, target.status = DEPLOY, PLANNED
+
+        failed = threading.Event()
+
+        def _deploy(target: PromotionTarget) -> None:
+            if self.rollback and failed.is_set():
+                target.status = SKIPPED
+                return
+            deploy_started = time.monotonic()
+            try:
+                target.deployment = self._create(
+                    self._deployed_package_request(target.package_id, target.environment_id, notes)
+                )
+                target.status = DEPLOYED
+            except Exception as error:
+                target.error = error
+                target.status = FAILED
+                failed.set()
+            finally:
+                target.elapsed = time.monotonic() - deploy_started
+
+        run_concurrently(_deploy, report.to_deploy, self.max_parallel, self._rate_limiter)
+
+        if self.rollback and failed.is_set():
+            report.rolled_back = True
+            deployed = [target for target in report.targets if target.status == DEPLOYED]
+            run_concurrently(self._rollback, deployed, self.max_parallel, self._rate_limiter)
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def promote_async(
+        self,
+        packages: Iterable[Any],
+        environment_ids: Iterable[str],
+        notes: Optional[str] = None,
+        force: bool = False,
+    ):
+        """
+        Awaitable variant of :meth:`promote` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[PromotionReport]
+        """
+        return to_async(self.promote)(list(packages), list(environment_ids), notes, force)
+
+    def _rollback(self, target: PromotionTarget) -> None:
+        try:
+            if target.previous is not None:
+                self._create(
+                    self._deployed_package_request(
+                        target.previous_package_id,
+                        target.environment_id,
+                        f"Rollback of package {target.package_id}",
+                    )
+                )
+            else:
+                deployment_id = field_value(target.deployment, "deployment_id", "deploymentId")
+                if not deployment_id:
+                    raise ValueError("The deployment returned no deploymentId to undeploy")
+                self._delete(deployment_id)
+            target.status = ROLLED_BACK
+        except Exception as error:
+            target.rollback_error = error
+            target.status = ROLLBACK_FAILED
+
+    def _deployed_package_request(self, package_id: str, environment_id: str, notes: Optional[str]) -> Any:
+        from ..models import DeployedPackage
+
+        kwargs = {"notes": notes} if notes else {}
+        return DeployedPackage(
+            package_id=package_id,
+            environment_id=environment_id,
+            listener_status=self.listener_status,
+            **kwargs,
+        )
+
+    def _resolve_packages(self, packages: Iterable[Any]) -> List[Dict[str, Any]]:
+        packages = list(packages)
+        ids = [package for package in packages if isinstance(package, str)]
+        resolved = {}
+        if ids:
+            result = BulkExecutor(self.max_parallel, self._rate_limiter).get(self._packaged_component, ids)
+            if result.failures:
+                item = result.failures[0]
+                raise ValueError(f"Cannot resolve package {item.id_!r}: {item.error_message}")
+            resolved = result.results
+
+        return [
+            {
+                "package_id": field_value(package, "package_id", "packageId"),
+                "component_id": field_value(package, "component_id", "componentId"),
+                "package_version": field_value(package, "package_version", "packageVersion"),
+            }
+            for package in (resolved.get(item, item) if isinstance(item, str) else item for item in packages)
+        ]
+
+    def _active_deployments(self, component_ids: List[str], environment_ids: List[str]) -> Dict[tuple, Any]:
+        active: Dict[tuple, Any] = {}
+        component_ids = list(dict.fromkeys(component_ids))
+        if not component_ids or not environment_ids:
+            return active
+        wanted_environments = set(environment_ids)
+        for components in chunked(component_ids, DEPLOYED_QUERY_SIZE):
+            for environments in chunked(environment_ids, DEPLOYED_QUERY_SIZE):
+                for deployment in iter_query(
+                    self._deployed_package,
+                    _active_query(components, environments),
+                    rate_limiter=self._rate_limiter,
+                ):
+                    environment_id = field_value(deployment, "environment_id", "environmentId")
+                    if environment_id not in wanted_environments:
+                        continue
+                    key = (field_value(deployment, "component_id", "componentId"), environment_id)
+                    current = active.get(key)
+                    deployed_date = field_value(deployment, "deployed_date", "deployedDate") or ""
+                    if current is None or deployed_date > (
+                        field_value(current, "deployed_date", "deployedDate") or ""
+                    ):
+                        active[key] = deployment
+        return active
+
+
+def _active_query(component_ids: List[str], environment_ids: List[str]) -> Any:
+    from ..models import (
+        DeployedPackageGroupingExpression,
+        DeployedPackageQueryConfig,
+        DeployedPackageQueryConfigQueryFilter,
+        DeployedPackageSimpleExpression,
+    )
+
+    def _equals(property: str, value: str) -> Any:
+        return DeployedPackageSimpleExpression(operator="EQUALS", property=property, argument=[value])
+
+    def _any(property: str, values: List[str]) -> Any:
+        if len(values) == 1:
+            return _equals(property, values[0])
+        return DeployedPackageGroupingExpression(
+            operator="or", nested_expression=[_equals(property, value) for value in values]
+        )
+
+    return DeployedPackageQueryConfig(
+        query_filter=DeployedPackageQueryConfigQueryFilter(
+            expression=DeployedPackageGroupingExpression(
+                operator="and",
+                nested_expression=[
+                    _equals("active", "true"),
+                    _any("componentId", component_ids),
+                    _any("environmentId", environment_ids),
+                ],
+            )
+        )
+    )
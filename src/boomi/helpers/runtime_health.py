@@ -0,0 +1,551 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._compat import enum_value, field_value
+from .concurrency import PollScheduler, RateLimiter, default_rate_limiter, sync_method
+from .paging import iter_query, page_results
+from ..services.async_.utils.to_async import to_async
+
+#: Probe names, as used in :attr:`RuntimeHealth.probes`.
+COUNTERS = "counters"
+DISK_SPACE = "disk_space"
+QUEUES = "queues"
+LISTENERS = "listeners"
+CERTIFICATES = "certificates"
+
+ALL_PROBES = (COUNTERS, DISK_SPACE, QUEUES, LISTENERS, CERTIFICATES)
+
+
+class ProbeResult:
+    """
+    The outcome of one health probe of one runtime.
+
+    :ivar str name: The probe name.
+    :ivar Any value: The probe value (see the :class:`RuntimeHealth` properties).
+    :ivar float latency: Seconds from the first request to the result, polls included.
+    :ivar int polls: The number of token polls sent.
+    :ivar bool cached: True if the value was served from the cache.
+    :ivar Optional[Exception] error: The error, if the probe failed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        value: Any = None,
+        latency: float = 0.0,
+        polls: int = 0,
+        cached: bool = False,
+        error: Optional[Exception] = None,
+    ):
+        self.name = name
+        self.value = value
+        self.latency = latency
+        self.polls = polls
+        self.cached = cached
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the probe succeeded.
+
+        :rtype: bool
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (
+            f"ProbeResult(name={self.name!r}, latency={self.latency:.3f}, polls={self.polls}, "
+            f"cached={self.cached}, error={self.error!r})"
+        )
+
+
+class RuntimeHealth:
+    """
+    The consolidated health of one runtime.
+
+    :ivar Any atom: The Atom model (or raw dict).
+    :ivar str atom_id: The runtime id.
+    :ivar Optional[str] name: The runtime name.
+    :ivar Optional[str] status: ``ONLINE``, ``WARNING``, ``OFFLINE`` or ``UNKNOWN``.
+    :ivar Dict[str, ProbeResult] probes: The probe results, keyed by probe name.
+    """
+
+    def __init__(self, atom: Any):
+        self.atom = atom
+        self.atom_id: str = field_value(atom, "id_", "id")
+        self.name: Optional[str] = field_value(atom, "name", "name")
+        self.status: Optional[str] = enum_value(field_value(atom, "status", "status"))
+        self.probes: Dict[str, ProbeResult] = {}
+
+    @property
+    def counters(self) -> Dict[str, Any]:
+        """
+        The runtime counters, keyed by counter name.
+
+        :rtype: Dict[str, Any]
+        """
+        return self._probe_value(COUNTERS, {})
+
+    @property
+    def disk_space(self) -> Any:
+        """
+        The ``AtomDiskSpace`` of a cloud attachment, or None.
+
+        :rtype: Any
+        """
+        return self._probe_value(DISK_SPACE, None)
+
+    @property
+    def queues(self) -> List[Any]:
+        """
+        The ``QueueRecord`` of every message queue.
+
+        :rtype: List[Any]
+        """
+        return self._probe_value(QUEUES, [])
+
+    @property
+    def listeners(self) -> List[Any]:
+        """
+        The ``ListenerStatus`` of every listener.
+
+        :rtype: List[Any]
+        """
+        return self._probe_value(LISTENERS, [])
+
+    @property
+    def expired_certificates(self) -> List[Any]:
+        """
+        The ``DeployedExpiredCertificate`` records of certificates deployed to this runtime.
+
+        :rtype: List[Any]
+        """
+        return self._probe_value(CERTIFICATES, [])
+
+    @property
+    def latency(self) -> Dict[str, float]:
+        """
+        The latency of every probe that was sent (not served from the cache).
+
+        :rtype: Dict[str, float]
+        """
+        return {name: probe.latency for name, probe in self.probes.items() if not probe.cached}
+
+    @property
+    def issues(self) -> List[str]:
+        """
+        Human-readable problems: not online, failed probes, listeners that are
+        not listening, dead letters and expired certificates.
+
+        :rtype: List[str]
+        """
+        issues = []
+        if self.status != "ONLINE":
+            issues.append(f"status {self.status}")
+        for probe in self.probes.values():
+            if probe.error is not None:
+                issues.append(f"{probe.name} probe failed: {probe.error}")
+        for listener in self.listeners:
+            status = field_value(listener, "status", "status")
+            if status and str(status).lower() != "listening":
+                issues.append(f"listener {field_value(listener, 'listener_id', 'listenerId')} {status}")
+        for queue in self.queues:
+            dead_letters = field_value(queue, "dead_letters_count", "deadLettersCount")
+            if dead_letters:
+                issues.append(
+                    f"queue {field_value(queue, 'queue_name', 'queueName')} has {dead_letters} dead letters"
+                )
+        for certificate in self.expired_certificates:
+            issues.append(
+                f"certificate {field_value(certificate, 'certificate_name', 'certificateName')} "
+                f"expires {field_value(certificate, 'expiration_date', 'expirationDate')}"
+            )
+        return issues
+
+    @property
+    def healthy(self) -> bool:
+        """
+        Whether the runtime is online with no issues.
+
+        :rtype: bool
+        """
+        return not self.issues
+
+    def _probe_value(self, name: str, default: Any) -> Any:
+        probe = self.probes.get(name)
+        if probe is None or probe.value is None:
+            return default
+        return probe.value
+
+    def __repr__(self) -> str:
+        return (
+            f"RuntimeHealth(atom_id={self.atom_id!r}, name={self.name!r}, "
+            f"status={self.status!r}, issues={len(self.issues)})"
+        )
+
+
+class FleetHealthSnapshot:
+    """
+    The health of every runtime at one point in time.
+
+    :ivar List[RuntimeHealth] runtimes: One entry per runtime.
+    :ivar float taken_at: The epoch time the snapshot started.
+    :ivar float elapsed: Wall-clock seconds the snapshot took.
+    """
+
+    def __init__(self, runtimes: List[RuntimeHealth], taken_at: float, elapsed: float):
+        self.runtimes = runtimes
+        self.taken_at = taken_at
+        self.elapsed = elapsed
+        self._by_id = {runtime.atom_id: runtime for runtime in runtimes}
+
+    def get(self, atom_id: str) -> Optional[RuntimeHealth]:
+        """
+        Get the health of one runtime.
+
+        :param str atom_id: The runtime id.
+        :rtype: Optional[RuntimeHealth]
+        """
+        return self._by_id.get(atom_id)
+
+    def unhealthy(self) -> List[RuntimeHealth]:
+        """
+        The runtimes reporting at least one issue.
+
+        :rtype: List[RuntimeHealth]
+        """
+        return [runtime for runtime in self.runtimes if not runtime.healthy]
+
+    def probe_latency(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency statistics per probe across the fleet (``count``, ``mean``, ``max``).
+
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        latencies: Dict[str, List[float]] = {}
+        for runtime in self.runtimes:
+            for name, latency in runtime.latency.items():
+                latencies.setdefault(name, []).append(latency)
+        return {
+            name: {"count": len(values), "mean": sum(values) / len(values), "max": max(values)}
+            for name, values in latencies.items()
+        }
+
+    def __iter__(self) -> Iterator[RuntimeHealth]:
+        return iter(self.runtimes)
+
+    def __len__(self) -> int:
+        return len(self.runtimes)
+
+    def __repr__(self) -> str:
+        return (
+            f"FleetHealthSnapshot(runtimes={len(self.runtimes)}, "
+            f"unhealthy={len(self.unhealthy())}, elapsed={self.elapsed:.2f})"
+        )
+
+
+class RuntimeHealthMonitor:
+    """
+    Fleet-wide runtime health snapshots.
+
+    A snapshot lists the runtimes with ``query_atom`` and then fans out every
+    per-runtime probe at once: AtomCounters, AtomDiskSpace (cloud attachments
+    only), ListQueues and ListenerStatus are token-based ``async/*``
+    operations, so each is started and its token handed to a shared
+    :class:`PollScheduler`, which polls all pending tokens from one heap with
+    backoff instead of parking a thread per probe. Expired certificates come
+    from a single account-wide ``query_deployed_expired_certificate`` that is
+    split per runtime.
+
+    Slow-changing data (the runtime list, disk space, expired certificates) is
+    cached for a configurable TTL; counters, queues and listeners are always
+    fresh. Every probe reports its latency and poll count.
+
+    All requests share the rate limiter, which bounds how fast a large fleet
+    can be scanned: a 300-runtime scan sends well over a thousand requests.
+
+    Example Usage:
+    ```python
+    with RuntimeHealthMonitor(sdk) as monitor:
+        snapshot = monitor.snapshot()
+        for runtime in snapshot.unhealthy():
+            print(runtime.name, runtime.issues)
+        print(snapshot.probe_latency())
+    ```
+
+    :ivar Tuple[str, ...] probes: The probes run for every runtime.
+    :ivar float atom_ttl: Seconds the runtime list is cached.
+    :ivar float disk_space_ttl: Seconds disk space results are cached.
+    :ivar float certificate_ttl: Seconds the expired certificates are cached.
+    :ivar int certificate_days: Report certificates expiring within this many days.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        probes: Iterable[str] = ALL_PROBES,
+        max_workers: int = 16,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        timeout: float = 120.0,
+        atom_ttl: float = 300.0,
+        disk_space_ttl: float = 600.0,
+        certificate_ttl: float = 3600.0,
+        certificate_days: int = 30,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of RuntimeHealthMonitor.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param Iterable[str] probes: The probes to run, from :data:`ALL_PROBES`.
+        :param int max_workers: Worker threads sending requests.
+        :param float poll_interval: Delay before the first poll of an async token.
+        :param float max_poll_interval: Backoff ceiling between polls.
+        :param float timeout: Seconds after which a pending probe fails.
+        :param float atom_ttl: Seconds the runtime list is cached.
+        :param float disk_space_ttl: Seconds disk space results are cached.
+        :param float certificate_ttl: Seconds the expired certificates are cached.
+        :param int certificate_days: Report certificates expiring within this many days.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        :raises ValueError: If a probe name is unknown.
+        """
+        self.probes = tuple(probes)
+        unknown = set(self.probes) - set(ALL_PROBES)
+        if unknown:
+            raise ValueError(f"Unknown probes {sorted(unknown)}, expected some of {list(ALL_PROBES)}")
+        self.atom_ttl = atom_ttl
+        self.disk_space_ttl = disk_space_ttl
+        self.certificate_ttl = certificate_ttl
+        self.certificate_days = certificate_days
+        self._sdk = sdk
+        self._scheduler = PollScheduler(
+            max_workers=max_workers,
+            rate_limiter=rate_limiter or default_rate_limiter(),
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout=timeout,
+        )
+        self._cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+    def snapshot(self, atom_ids: Optional[Iterable[str]] = None, refresh: bool = False) -> FleetHealthSnapshot:
+        """
+        Probe every runtime (or only ``atom_ids``) concurrently.
+
+        A probe that fails is reported in its :class:`ProbeResult`; it never
+        fails the snapshot.
+
+        :param Optional[Iterable[str]] atom_ids: Restrict the snapshot to these runtimes.
+        :param bool refresh: Ignore cached values.
+        :return: The snapshot.
+        :rtype: FleetHealthSnapshot
+        """
+        taken_at = time.time()
+        started = time.monotonic()
+        if refresh:
+            self.clear_cache()
+
+        atoms = self._cached(("atoms",), self.atom_ttl, self._list_atoms)
+        if atom_ids is not None:
+            wanted = set(atom_ids)
+            atoms = [atom for atom in atoms if field_value(atom, "id_", "id") in wanted]
+        runtimes = [RuntimeHealth(atom) for atom in atoms]
+
+        certificates = None
+        if CERTIFICATES in self.probes:
+            certificates = self._launch(
+                (CERTIFICATES,),
+                self.certificate_ttl,
+                lambda: (self._scheduler.run(self._expired_certificates), list),
+            )
+        launched = [
+            (runtime, name, self._launch((name, runtime.atom_id), ttl, start))
+            for runtime in runtimes
+            for name, ttl, start in self._runtime_probes(runtime)
+        ]
+
+        for runtime, name, probe in launched:
+            runtime.probes[name] = self._finish(probe)
+        if certificates is not None:
+            result = self._finish(certificates)
+            by_container: Dict[str, List[Any]] = {}
+            for certificate in result.value or []:
+                container_id = field_value(certificate, "container_id", "containerId")
+                by_container.setdefault(container_id, []).append(certificate)
+            for runtime in runtimes:
+                runtime.probes[CERTIFICATES] = ProbeResult(
+                    CERTIFICATES,
+                    by_container.get(runtime.atom_id, []),
+                    result.latency,
+                    result.polls,
+                    result.cached,
+                    result.error,
+                )
+
+        return FleetHealthSnapshot(runtimes, taken_at, time.monotonic() - started)
+
+    def snapshot_async(self, atom_ids: Optional[Iterable[str]] = None, refresh: bool = False):
+        """
+        Awaitable variant of :meth:`snapshot` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[FleetHealthSnapshot]
+        """
+        return to_async(self.snapshot)(atom_ids, refresh)
+
+    def clear_cache(self) -> None:
+        """Drop every cached runtime list, disk space and certificate result."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Stop the poll scheduler."""
+        self._scheduler.close()
+
+    def __enter__(self) -> "RuntimeHealthMonitor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _runtime_probes(self, runtime: RuntimeHealth) -> List[Tuple[str, float, Callable[[], Any]]]:
+        from ..models import (
+            ListenerStatusQueryConfig,
+            ListenerStatusQueryConfigQueryFilter,
+            ListenerStatusSimpleExpression,
+        )
+
+        sdk = self._sdk
+        atom_id = runtime.atom_id
+        probes = []
+        if COUNTERS in self.probes:
+            probes.append((COUNTERS, 0.0, self._async_probe(
+                lambda: sync_method(sdk.atom, "async_get_atom_counters")(atom_id),
+                sync_method(sdk.atom, "async_token_atom_counters"),
+                _counters,
+            )))
+        if DISK_SPACE in self.probes and field_value(runtime.atom, "is_cloud_attachment", "isCloudAttachment"):
+            probes.append((DISK_SPACE, self.disk_space_ttl, self._async_probe(
+                lambda: sync_method(sdk.atom_disk_space, "async_get_atom_disk_space")(atom_id),
+                sync_method(sdk.atom_disk_space, "async_token_atom_disk_space"),
+                _first,
+            )))
+        if QUEUES in self.probes:
+            probes.append((QUEUES, 0.0, self._async_probe(
+                lambda: sync_method(sdk.list_queues, "async_get_list_queues")(atom_id),
+                sync_method(sdk.list_queues, "async_token_list_queues"),
+                _queue_records,
+            )))
+        if LISTENERS in self.probes:
+            query = ListenerStatusQueryConfig(
+                query_filter=ListenerStatusQueryConfigQueryFilter(
+                    expression=ListenerStatusSimpleExpression(
+                        operator="EQUALS", property="containerId", argument=[atom_id]
+                    )
+                )
+            )
+            probes.append((LISTENERS, 0.0, self._async_probe(
+                lambda: sync_method(sdk.listener_status, "async_get_listener_status")(query),
+                sync_method(sdk.listener_status, "async_token_listener_status"),
+                page_results,
+            )))
+        return probes
+
+    def _async_probe(
+        self, start: Callable[[], Any], poll: Callable[[str], Any], extract: Callable[[Any], Any]
+    ) -> Callable[[], Tuple[Future, Callable[[Any], Any]]]:
+        return lambda: (self._scheduler.submit(lambda: _token(start()), poll), extract)
+
+    def _launch(self, key: Tuple[str, ...], ttl: float, start: Callable[[], Any]) -> Any:
+        # Returns a cached ProbeResult, or the in-flight (key, ttl, future, extract).
+        if ttl > 0:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                cached: ProbeResult = entry[1]
+                return ProbeResult(cached.name, cached.value, cached.latency, cached.polls, cached=True)
+        future, extract = start()
+        return key, ttl, future, extract
+
+    def _finish(self, probe: Any) -> ProbeResult:
+        if isinstance(probe, ProbeResult):
+            return probe
+        key, ttl, future, extract = probe
+        try:
+            value = extract(future.result())
+        except Exception as error:
+            return ProbeResult(
+                key[0], latency=future.elapsed, polls=getattr(future, "polls", 0), error=error
+            )
+        result = ProbeResult(key[0], value, future.elapsed, getattr(future, "polls", 0))
+        if ttl > 0:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic() + ttl, result)
+        return result
+
+    def _cached(self, key: Tuple[str, ...], ttl: float, load: Callable[[], Any]) -> Any:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = self._scheduler.run(load).result()
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def _list_atoms(self) -> List[Any]:
+        from ..models import AtomQueryConfig
+
+        return list(iter_query(self._sdk.atom, AtomQueryConfig(), name="atom"))
+
+    def _expired_certificates(self) -> List[Any]:
+        from ..models import (
+            DeployedExpiredCertificateQueryConfig,
+            DeployedExpiredCertificateQueryConfigQueryFilter,
+            DeployedExpiredCertificateSimpleExpression,
+        )
+
+        query = DeployedExpiredCertificateQueryConfig(
+            query_filter=DeployedExpiredCertificateQueryConfigQueryFilter(
+                expression=DeployedExpiredCertificateSimpleExpression(
+                    operator="LESS_THAN_OR_EQUAL",
+                    property="expirationBoundary",
+                    argument=[str(self.certificate_days)],
+                )
+            )
+        )
+        return list(iter_query(self._sdk.deployed_expired_certificate, query, name="deployed_expired_certificate"))
+
+
+def _token(result: Any) -> str:
+    if isinstance(result, dict):
+        token = (result.get("asyncToken") or {}).get("token")
+    else:
+        token = getattr(getattr(result, "async_token", None), "token", None)
+    if not token:
+        raise ValueError(f"No async token in response: {result!r}")
+    return token
+
+
+def _counters(response: Any) -> Dict[str, Any]:
+    counters = {}
+    for atom_counters in page_results(response):
+        for counter in field_value(atom_counters, "counter", "counter") or []:
+            counters[field_value(counter, "name", "name")] = field_value(counter, "value", "value")
+    return counters
+
+
+def _first(response: Any) -> Any:
+    results = page_results(response)
+    return results[0] if results else None
+
+
+def _queue_records(response: Any) -> List[Any]:
+    return [
+        record
+        for queues in page_results(response)
+        for record in field_value(queues, "queue_record", "QueueRecord") or []
+    ]
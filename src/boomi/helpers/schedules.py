@@ -0,0 +1,501 @@
+import base64
+import re
+import time
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from .bulk import DEFAULT_BULK_LIMIT, BulkExecutor, BulkItem, split_bulk_response
+from .concurrency import (
+    DEFAULT_MAX_WORKERS,
+    RateLimiter,
+    chunked,
+    default_rate_limiter,
+    run_concurrently,
+)
+from ..net.environment.environment import Environment
+from ..net.transport.serializer import Serializer
+from ..services.async_.utils.to_async import to_async
+
+#: Change statuses.
+UNCHANGED = "unchanged"
+DRIFTED = "drifted"
+UPDATED = "updated"
+FAILED = "failed"
+
+#: The cron fields of a ``Schedule`` and their value ranges; years are unbounded.
+CRON_FIELDS: Tuple[Tuple[str, Optional[int], Optional[int]], ...] = (
+    ("minutes", 0, 59),
+    ("hours", 0, 23),
+    ("daysOfMonth", 1, 31),
+    ("months", 1, 12),
+    ("daysOfWeek", 1, 7),
+    ("years", None, None),
+)
+
+# Model attribute names accepted in dict input, mapped to their API keys.
+_API_KEYS = {
+    "days_of_month": "daysOfMonth",
+    "days_of_week": "daysOfWeek",
+    "max_retry": "maxRetry",
+    "schedule": "Schedule",
+    "retry": "Retry",
+}
+
+_CRON_TOKEN = re.compile(r"^(?:(\*)|(\d+)(?:-(\d+))?)(?:/(\d+))?$")
+
+#: A normalized schedule: one canonical value per :data:`CRON_FIELDS` entry.
+NormalizedSchedule = Tuple[str, ...]
+
+
+class ScheduleChange:
+    """
+    The outcome of one (process, runtime) pair in a reconciliation.
+
+    :ivar str process_id: The process id.
+    :ivar str atom_id: The runtime id.
+    :ivar str id_: The conceptual ProcessSchedules id.
+    :ivar str status: ``unchanged``, ``drifted`` (planned only), ``updated`` or ``failed``.
+    :ivar Optional[Tuple[NormalizedSchedule, ...]] current: The normalized current schedules.
+    :ivar Tuple[NormalizedSchedule, ...] desired: The normalized desired schedules.
+    :ivar Optional[Exception] error: The fetch or update error.
+    :ivar Optional[str] error_message: The per-item error reported by a bulk call.
+    """
+
+    def __init__(
+        self,
+        process_id: str,
+        atom_id: str,
+        desired: Tuple[NormalizedSchedule, ...],
+        status: str = UNCHANGED,
+        current: Optional[Tuple[NormalizedSchedule, ...]] = None,
+        error: Optional[Exception] = None,
+        error_message: Optional[str] = None,
+    ):
+        self.process_id = process_id
+        self.atom_id = atom_id
+        self.id_ = process_schedules_id(atom_id, process_id)
+        self.status = status
+        self.current = current
+        self.desired = desired
+        self.error = error
+        self.error_message = error_message
+
+    def __repr__(self) -> str:
+        return (
+            f"ScheduleChange(process_id={self.process_id!r}, atom_id={self.atom_id!r}, "
+            f"status={self.status!r}, error={self.error_message or self.error!r})"
+        )
+
+
+class ScheduleReconcileReport:
+    """
+    The per-pair outcome of :meth:`ProcessScheduleReconciler.apply` (or plan).
+
+    :ivar Dict[Tuple[str, str], ScheduleChange] changes: The changes keyed by
+        ``(process_id, atom_id)``.
+    :ivar int requests: The number of API calls made.
+    :ivar float elapsed: Wall-clock seconds spent.
+    """
+
+    def __init__(self):
+        self.changes: Dict[Tuple[str, str], ScheduleChange] = {}
+        self.requests = 0
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether no pair failed.
+
+        :rtype: bool
+        """
+        return not self.failures
+
+    @property
+    def failures(self) -> List[ScheduleChange]:
+        """
+        The pairs that could not be fetched or updated.
+
+        :rtype: List[ScheduleChange]
+        """
+        return [change for change in self.changes.values() if change.status == FAILED]
+
+    @property
+    def drifted(self) -> List[ScheduleChange]:
+        """
+        The pairs whose schedules differed from the desired state.
+
+        :rtype: List[ScheduleChange]
+        """
+        return [change for change in self.changes.values() if change.status in (DRIFTED, UPDATED)]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        The number of pairs per status.
+
+        :rtype: Dict[str, int]
+        """
+        counts: Dict[str, int] = {}
+        for change in self.changes.values():
+            counts[change.status] = counts.get(change.status, 0) + 1
+        return counts
+
+    def __iter__(self):
+        return iter(self.changes.values())
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __repr__(self) -> str:
+        return f"ScheduleReconcileReport(pairs={len(self.changes)}, counts={self.counts()}, requests={self.requests})"
+
+
+class ProcessScheduleReconciler:
+    """
+    Brings process run schedules to a desired state with as few calls as possible.
+
+    ``update_process_schedules`` replaces every schedule of a (process,
+    runtime) pair, so pushing the desired state costs one call per pair even
+    when nothing changed. The reconciler instead loads the current schedules
+    with chunked, concurrent ``bulk_process_schedules`` calls, compares them
+    with the desired ones after normalizing every cron field (see
+    :func:`normalize_cron`; the order of schedules does not matter), and
+    updates only the drifted pairs, with bulk UPDATE calls of up to 100
+    pairs. A chunk the bulk UPDATE rejects as a whole is retried pair by
+    pair. A run with no drift costs one bulk GET per 100 pairs.
+
+    The desired state maps ``(process_id, atom_id)`` to a list of
+    ``Schedule`` models or API JSON dicts, or to a ``ProcessSchedules``
+    model or dict. The retry policy is only compared, and replaced, when the
+    desired value has one; otherwise the current policy is kept.
+
+    Example Usage:
+    ```python
+    reconciler = ProcessScheduleReconciler(sdk)
+    report = reconciler.apply({
+        ("PROCESS_ID", "ATOM_ID"): [
+            {"minutes": "*/15", "hours": "8-18", "daysOfWeek": "2-6"},
+        ],
+        ("OTHER_PROCESS_ID", "ATOM_ID"): [],  # no schedule
+    })
+    print(report.counts())
+    ```
+
+    :ivar int max_workers: Bulk calls dispatched concurrently.
+    :ivar int chunk_size: Pairs per bulk GET or bulk UPDATE call.
+    :ivar bool bulk_update: Send updates with bulk UPDATE calls rather than
+        one update per pair.
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        chunk_size: int = DEFAULT_BULK_LIMIT,
+        bulk_update: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize a new instance of ProcessScheduleReconciler.
+
+        :param Any sdk: A ``Boomi`` or ``BoomiAsync`` client.
+        :param int max_workers: Bulk calls dispatched concurrently.
+        :param int chunk_size: Pairs per bulk GET or bulk UPDATE call.
+        :param bool bulk_update: Send updates with bulk UPDATE calls.
+        :param Optional[RateLimiter] rate_limiter: Defaults to the process-wide limiter.
+        """
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.bulk_update = bulk_update
+        self._service = sdk.process_schedules
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+
+    def plan(self, desired: Mapping[Tuple[str, str], Any]) -> ScheduleReconcileReport:
+        """
+        Find the drifted pairs without updating them.
+
+        :param Mapping[Tuple[str, str], Any] desired: Desired schedules keyed by
+            ``(process_id, atom_id)``.
+        :return: One change per pair.
+        :rtype: ScheduleReconcileReport
+        """
+        return self._reconcile(desired, update=False)
+
+    def apply(self, desired: Mapping[Tuple[str, str], Any]) -> ScheduleReconcileReport:
+        """
+        Update the pairs whose schedules differ from ``desired``.
+
+        :param Mapping[Tuple[str, str], Any] desired: Desired schedules keyed by
+            ``(process_id, atom_id)``.
+        :return: One change per pair.
+        :rtype: ScheduleReconcileReport
+        """
+        return self._reconcile(desired, update=True)
+
+    def plan_async(self, desired: Mapping[Tuple[str, str], Any]):
+        """
+        Awaitable variant of :meth:`plan` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[ScheduleReconcileReport]
+        """
+        return to_async(self.plan)(dict(desired))
+
+    def apply_async(self, desired: Mapping[Tuple[str, str], Any]):
+        """
+        Awaitable variant of :meth:`apply` for use with ``BoomiAsync``.
+
+        :rtype: Awaitable[ScheduleReconcileReport]
+        """
+        return to_async(self.apply)(dict(desired))
+
+    def _reconcile(self, desired: Mapping[Tuple[str, str], Any], update: bool) -> ScheduleReconcileReport:
+        started = time.monotonic()
+        report = ScheduleReconcileReport()
+        wanted = {pair: process_schedules_json(value) for pair, value in desired.items()}
+        for (process_id, atom_id), document in wanted.items():
+            report.changes[(process_id, atom_id)] = ScheduleChange(
+                process_id, atom_id, normalize_schedules(document.get("Schedule"))
+            )
+        by_id = {change.id_: change for change in report.changes.values()}
+
+        fetched = BulkExecutor(self.max_workers, self._rate_limiter).get(
+            self._service, list(by_id), chunk_size=self.chunk_size
+        )
+        report.requests += len(fetched.responses)
+
+        bodies: Dict[str, Dict[str, Any]] = {}
+        for item in fetched:
+            change = by_id[item.id_]
+            if not item.ok:
+                _fail(change, item)
+                continue
+            current = process_schedules_json(item.result)
+            change.current = normalize_schedules(current.get("Schedule"))
+            document = wanted[(change.process_id, change.atom_id)]
+            retry = document.get("Retry")
+            if change.current == change.desired and (retry is None or _same_retry(current.get("Retry"), retry)):
+                continue
+            change.status = DRIFTED
+            bodies[change.id_] = {
+                "@type": "ProcessSchedules",
+                "id": change.id_,
+                "atomId": change.atom_id,
+                "processId": change.process_id,
+                "Schedule": document.get("Schedule") or [],
+                "Retry": retry if retry is not None else current.get("Retry"),
+            }
+            if bodies[change.id_]["Retry"] is None:
+                del bodies[change.id_]["Retry"]
+
+        if update and bodies:
+            for item in self._update(list(bodies.values()), report):
+                change = by_id[item.id_]
+                if item.ok:
+                    change.status = UPDATED
+                else:
+                    _fail(change, item)
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def _update(self, bodies: List[Dict[str, Any]], report: ScheduleReconcileReport) -> List[BulkItem]:
+        def _send_one(body: Dict[str, Any]) -> BulkItem:
+            try:
+                self._request(body["id"], body)
+            except Exception as error:
+                return BulkItem(body["id"], status_code=getattr(error, "status", None), error=error)
+            return BulkItem(body["id"])
+
+        def _send_bulk(chunk: List[Dict[str, Any]]) -> Tuple[List[BulkItem], int]:
+            try:
+                response = self._request("bulk", {"type": "UPDATE", "request": chunk})
+            except Exception:
+                # A chunk the bulk UPDATE rejects as a whole (or an account
+                # without bulk UPDATE) falls back to one update per pair.
+                outcomes = run_concurrently(_send_one, chunk, self.max_workers, self._rate_limiter)
+                return [item for _, item, _ in outcomes], 1 + len(chunk)
+            return split_bulk_response([body["id"] for body in chunk], response), 1
+
+        if self.bulk_update:
+            chunks = list(chunked(bodies, self.chunk_size))
+            outcomes = run_concurrently(_send_bulk, chunks, self.max_workers, self._rate_limiter)
+        else:
+            chunks = [[body] for body in bodies]
+            outcomes = [
+                (chunk, ([item], 1), error)
+                for chunk, (_, item, error) in zip(
+                    chunks, run_concurrently(_send_one, bodies, self.max_workers, self._rate_limiter)
+                )
+            ]
+
+        items: List[BulkItem] = []
+        for chunk, result, error in outcomes:
+            if error is not None:
+                report.requests += 1
+                items.extend(BulkItem(body["id"], error=error) for body in chunk)
+            else:
+                report.requests += result[1]
+                items.extend(result[0])
+        return items
+
+    def _request(self, id_: str, body: Dict[str, Any]) -> Any:
+        # Schedules are compared as JSON, so updates are sent without
+        # hydrating ProcessSchedules models.
+        request = (
+            Serializer(
+                f"{self._service.base_url or Environment.DEFAULT.url}/ProcessSchedules/{{id}}",
+                [self._service.get_access_token(), self._service.get_basic_auth()],
+            )
+            .serialize()
+            .set_method("POST")
+            .set_body(body)
+        )
+        # The base64 conceptual id is sent as is, like the generated service does.
+        request.url = request.url.replace("{id}", id_)
+        response, _, _ = self._service.send_request(request)
+        return response
+
+
+def process_schedules_id(atom_id: str, process_id: str) -> str:
+    """
+    Get the conceptual ProcessSchedules id of a (process, runtime) pair.
+
+    :param str atom_id: The runtime id.
+    :param str process_id: The process id.
+    :return: The id accepted by ``get``/``update``/``bulk_process_schedules``.
+    :rtype: str
+    """
+    return base64.b64encode(f"CPS{atom_id}:{process_id}".encode("utf-8")).decode("ascii")
+
+
+def process_schedules_json(value: Any) -> Dict[str, Any]:
+    """
+    Convert desired or current schedules to the ProcessSchedules API JSON form.
+
+    :param Any value: A ``ProcessSchedules`` model or dict, or a list of
+        ``Schedule`` models or dicts.
+    :return: A dict with a ``Schedule`` list and, if given, a ``Retry`` object.
+    :rtype: Dict[str, Any]
+    """
+    if isinstance(value, (list, tuple)):
+        return {"Schedule": [_api_json(schedule) for schedule in value]}
+    document = _api_json(value) if value is not None else {}
+    document["Schedule"] = [_api_json(schedule) for schedule in _as_list(document.get("Schedule"))]
+    if document.get("Retry") is not None:
+        retry = _api_json(document["Retry"])
+        retry["Schedule"] = [_api_json(schedule) for schedule in _as_list(retry.get("Schedule"))]
+        document["Retry"] = retry
+    return document
+
+
+def normalize_cron(value: Any, low: Optional[int] = None, high: Optional[int] = None) -> str:
+    """
+    Normalize one cron field of a schedule to a canonical form.
+
+    Steps and ranges are expanded, the values sorted and de-duplicated,
+    adjacent values collapsed into ranges and the full range written as ``*``,
+    so ``*/15`` and ``0,15,30,45`` (minutes), or ``1-7`` and ``*`` (days of
+    the week) normalize to the same value. Values outside numeric cron syntax
+    are only sorted and de-duplicated.
+
+    :param Any value: The field value, e.g. ``"*/15"``. ``None`` means ``*``.
+    :param Optional[int] low: The smallest valid value, or ``None`` if unbounded.
+    :param Optional[int] high: The largest valid value, or ``None`` if unbounded.
+    :return: The canonical value.
+    :rtype: str
+    """
+    text = "*" if value is None else re.sub(r"\s+", "", str(value))
+    if text in ("", "*"):
+        return "*"
+    tokens = text.split(",")
+    values: Set[int] = set()
+    for token in tokens:
+        expanded = _expand(token, low, high)
+        if expanded is None:
+            return ",".join(sorted(set(tokens)))
+        values |= expanded
+    if low is not None and values == set(range(low, high + 1)):
+        return "*"
+    return _ranges(sorted(values))
+
+
+def normalize_schedule(schedule: Any) -> NormalizedSchedule:
+    """
+    Normalize every cron field of one schedule.
+
+    :param Any schedule: A ``Schedule`` model or API JSON dict.
+    :return: One canonical value per :data:`CRON_FIELDS` entry.
+    :rtype: NormalizedSchedule
+    """
+    schedule = _api_json(schedule)
+    return tuple(normalize_cron(schedule.get(key), low, high) for key, low, high in CRON_FIELDS)
+
+
+def normalize_schedules(schedules: Any) -> Tuple[NormalizedSchedule, ...]:
+    """
+    Normalize a list of schedules, ignoring their order and duplicates.
+
+    :param Any schedules: ``Schedule`` models or API JSON dicts.
+    :rtype: Tuple[NormalizedSchedule, ...]
+    """
+    return tuple(sorted({normalize_schedule(schedule) for schedule in _as_list(schedules)}))
+
+
+def _same_retry(current: Any, desired: Dict[str, Any]) -> bool:
+    current = current or {}
+    return str(current.get("maxRetry")) == str(desired.get("maxRetry")) and normalize_schedules(
+        current.get("Schedule")
+    ) == normalize_schedules(desired.get("Schedule"))
+
+
+def _expand(token: str, low: Optional[int], high: Optional[int]) -> Optional[Set[int]]:
+    match = _CRON_TOKEN.match(token)
+    if match is None:
+        return None
+    star, first, last, step = match.groups()
+    step = int(step) if step else 1
+    if star:
+        if low is None:
+            return None
+        start, stop = low, high
+    else:
+        start = int(first)
+        if last:
+            stop = int(last)
+        elif step > 1:
+            if high is None:
+                return None
+            stop = high
+        else:
+            stop = start
+    if step < 1 or start > stop or (low is not None and (start < low or stop > high)):
+        return None
+    return set(range(start, stop + 1, step))
+
+
+def _ranges(values: List[int]) -> str:
+    parts, index = [], 0
+    while index < len(values):
+        end = index
+        while end + 1 < len(values) and values[end + 1] == values[end] + 1:
+            end += 1
+        parts.append(str(values[index]) if end == index else f"{values[index]}-{values[end]}")
+        index = end + 1
+    return ",".join(parts)
+
+
+def _api_json(value: Any) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        value = value._map()
+    return {_API_KEYS.get(key, key): item for key, item in value.items()}
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _fail(change: ScheduleChange, item: BulkItem) -> None:
+    change.status = FAILED
+    change.error = item.error
+    change.error_message = item.error_message or (str(item.error) if item.error else None)
@@ -158,14 +158,14 @@ class Account(BaseModel):
         if over_deployed is not SENTINEL:
             self.over_deployed = over_deployed
         if status is not SENTINEL:
-            self.status = self._enum_matching(status, AccountStatus.list(), "status")
+            self.status = self._enum_matching(status, AccountStatus, "status")
         if suggestions_enabled is not SENTINEL:
             self.suggestions_enabled = suggestions_enabled
         if support_access is not SENTINEL:
             self.support_access = support_access
         if support_level is not SENTINEL:
             self.support_level = self._enum_matching(
-                support_level, SupportLevel.list(), "support_level"
+                support_level, SupportLevel, "support_level"
             )
         if widget_account is not SENTINEL:
             self.widget_account = widget_account
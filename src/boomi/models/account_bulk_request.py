@@ -64,6 +64,6 @@ class AccountBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AccountBulkRequestType.list(), "type_"
+                type_, AccountBulkRequestType, "type_"
             )
         self._kwargs = kwargs
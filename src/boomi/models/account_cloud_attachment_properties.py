@@ -303,7 +303,7 @@ class AccountCloudAttachmentProperties(BaseModel):
             self.account_disk_usage = account_disk_usage
         if as2_workload is not SENTINEL:
             self.as2_workload = self._enum_matching(
-                as2_workload, As2Workload.list(), "as2_workload"
+                as2_workload, As2Workload, "as2_workload"
             )
         if atom_input_size is not SENTINEL:
             self.atom_input_size = atom_input_size
@@ -328,14 +328,14 @@ class AccountCloudAttachmentProperties(BaseModel):
         if flow_control_parallel_process_type_override is not SENTINEL:
             self.flow_control_parallel_process_type_override = self._enum_matching(
                 flow_control_parallel_process_type_override,
-                FlowControlParallelProcessTypeOverride.list(),
+                FlowControlParallelProcessTypeOverride,
                 "flow_control_parallel_process_type_override",
             )
         if http_request_rate is not SENTINEL:
             self.http_request_rate = http_request_rate
         if http_workload is not SENTINEL:
             self.http_workload = self._enum_matching(
-                http_workload, HttpWorkload.list(), "http_workload"
+                http_workload, HttpWorkload, "http_workload"
             )
         if listener_max_concurrent_executions is not SENTINEL:
             self.listener_max_concurrent_executions = listener_max_concurrent_executions
@@ -291,7 +291,7 @@ class AccountCloudAttachmentPropertiesDefault(BaseModel):
             self.account_disk_usage = account_disk_usage
         if as2_workload is not SENTINEL:
             self.as2_workload = self._enum_matching(
-                as2_workload, As2WorkloadDefault.list(), "as2_workload"
+                as2_workload, As2WorkloadDefault, "as2_workload"
             )
         if atom_input_size is not SENTINEL:
             self.atom_input_size = atom_input_size
@@ -316,14 +316,14 @@ class AccountCloudAttachmentPropertiesDefault(BaseModel):
         if flow_control_parallel_process_type_override is not SENTINEL:
             self.flow_control_parallel_process_type_override = self._enum_matching(
                 flow_control_parallel_process_type_override,
-                FlowControlParallelProcessTypeOverrideDefault.list(),
+                FlowControlParallelProcessTypeOverrideDefault,
                 "flow_control_parallel_process_type_override",
             )
         if http_request_rate is not SENTINEL:
             self.http_request_rate = http_request_rate
         if http_workload is not SENTINEL:
             self.http_workload = self._enum_matching(
-                http_workload, HttpWorkloadDefault.list(), "http_workload"
+                http_workload, HttpWorkloadDefault, "http_workload"
             )
         if listener_max_concurrent_executions is not SENTINEL:
             self.listener_max_concurrent_executions = listener_max_concurrent_executions
@@ -67,6 +67,6 @@ class AccountCloudAttachmentQuotaBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AccountCloudAttachmentQuotaBulkRequestType.list(), "type_"
+                type_, AccountCloudAttachmentQuotaBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -62,6 +62,6 @@ class AccountCloudAttachmentSummaryBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AccountCloudAttachmentSummaryBulkRequestType.list(), "type_"
+                type_, AccountCloudAttachmentSummaryBulkRequestType, "type_"
             )
         self._kwargs = kwargs
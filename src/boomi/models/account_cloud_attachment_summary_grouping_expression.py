@@ -65,6 +65,6 @@ class AccountCloudAttachmentSummaryGroupingExpression(BaseModel):
                 nested_expression, AccountCloudAttachmentSummaryExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountCloudAttachmentSummaryGroupingExpressionOperator.list(), "operator"
+            operator, AccountCloudAttachmentSummaryGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
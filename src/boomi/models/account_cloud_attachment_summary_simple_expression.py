@@ -128,9 +128,9 @@ class AccountCloudAttachmentSummarySimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountCloudAttachmentSummarySimpleExpressionOperator.list(), "operator"
+            operator, AccountCloudAttachmentSummarySimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountCloudAttachmentSummarySimpleExpressionProperty.list(), "property"
+            property, AccountCloudAttachmentSummarySimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -94,7 +94,7 @@ class AccountGroup(BaseModel):
         if auto_subscribe_alert_level is not SENTINEL:
             self.auto_subscribe_alert_level = self._enum_matching(
                 auto_subscribe_alert_level,
-                AutoSubscribeAlertLevel.list(),
+                AutoSubscribeAlertLevel,
                 "auto_subscribe_alert_level",
             )
         if default_group is not SENTINEL:
@@ -66,6 +66,6 @@ class AccountGroupAccountGroupingExpression(BaseModel):
                 nested_expression, AccountGroupAccountExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountGroupAccountGroupingExpressionOperator.list(), "operator"
+            operator, AccountGroupAccountGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
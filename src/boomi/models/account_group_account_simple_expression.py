@@ -119,9 +119,9 @@ class AccountGroupAccountSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountGroupAccountSimpleExpressionOperator.list(), "operator"
+            operator, AccountGroupAccountSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountGroupAccountSimpleExpressionProperty.list(), "property"
+            property, AccountGroupAccountSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class AccountGroupBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AccountGroupBulkRequestType.list(), "type_"
+                type_, AccountGroupBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class AccountGroupGroupingExpression(BaseModel):
                 nested_expression, AccountGroupExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountGroupGroupingExpressionOperator.list(), "operator"
+            operator, AccountGroupGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
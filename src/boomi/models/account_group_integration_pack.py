@@ -84,7 +84,7 @@ class AccountGroupIntegrationPack(BaseModel):
         if installation_type is not SENTINEL:
             self.installation_type = self._enum_matching(
                 installation_type,
-                AccountGroupIntegrationPackInstallationType.list(),
+                AccountGroupIntegrationPackInstallationType,
                 "installation_type",
             )
         if integration_pack_id is not SENTINEL:
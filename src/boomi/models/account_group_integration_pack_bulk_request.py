@@ -67,6 +67,6 @@ class AccountGroupIntegrationPackBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AccountGroupIntegrationPackBulkRequestType.list(), "type_"
+                type_, AccountGroupIntegrationPackBulkRequestType, "type_"
             )
         self._kwargs = kwargs
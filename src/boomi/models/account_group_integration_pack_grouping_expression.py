@@ -76,7 +76,7 @@ class AccountGroupIntegrationPackGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            AccountGroupIntegrationPackGroupingExpressionOperator.list(),
+            AccountGroupIntegrationPackGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -117,12 +117,12 @@ class AccountGroupIntegrationPackSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            AccountGroupIntegrationPackSimpleExpressionOperator.list(),
+            AccountGroupIntegrationPackSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            AccountGroupIntegrationPackSimpleExpressionProperty.list(),
+            AccountGroupIntegrationPackSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -128,9 +128,9 @@ class AccountGroupSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountGroupSimpleExpressionOperator.list(), "operator"
+            operator, AccountGroupSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountGroupSimpleExpressionProperty.list(), "property"
+            property, AccountGroupSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
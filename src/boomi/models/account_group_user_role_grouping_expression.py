@@ -68,6 +68,6 @@ class AccountGroupUserRoleGroupingExpression(BaseModel):
                 nested_expression, AccountGroupUserRoleExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountGroupUserRoleGroupingExpressionOperator.list(), "operator"
+            operator, AccountGroupUserRoleGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -122,9 +122,9 @@ class AccountGroupUserRoleSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountGroupUserRoleSimpleExpressionOperator.list(), "operator"
+            operator, AccountGroupUserRoleSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountGroupUserRoleSimpleExpressionProperty.list(), "property"
+            property, AccountGroupUserRoleSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class AccountGroupingExpression(BaseModel):
                 nested_expression, AccountExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountGroupingExpressionOperator.list(), "operator"
+            operator, AccountGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -132,9 +132,9 @@ class AccountSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountSimpleExpressionOperator.list(), "operator"
+            operator, AccountSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountSimpleExpressionProperty.list(), "property"
+            property, AccountSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class AccountSsoConfigBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AccountSsoConfigBulkRequestType.list(), "type_"
+                type_, AccountSsoConfigBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -68,6 +68,6 @@ class AccountUserFederationGroupingExpression(BaseModel):
                 nested_expression, AccountUserFederationExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountUserFederationGroupingExpressionOperator.list(), "operator"
+            operator, AccountUserFederationGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
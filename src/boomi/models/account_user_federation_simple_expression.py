@@ -122,9 +122,9 @@ class AccountUserFederationSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountUserFederationSimpleExpressionOperator.list(), "operator"
+            operator, AccountUserFederationSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountUserFederationSimpleExpressionProperty.list(), "property"
+            property, AccountUserFederationSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class AccountUserRoleGroupingExpression(BaseModel):
                 nested_expression, AccountUserRoleExpression
             )
         self.operator = self._enum_matching(
-            operator, AccountUserRoleGroupingExpressionOperator.list(), "operator"
+            operator, AccountUserRoleGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
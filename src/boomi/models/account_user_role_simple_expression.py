@@ -122,9 +122,9 @@ class AccountUserRoleSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AccountUserRoleSimpleExpressionOperator.list(), "operator"
+            operator, AccountUserRoleSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AccountUserRoleSimpleExpressionProperty.list(), "property"
+            property, AccountUserRoleSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
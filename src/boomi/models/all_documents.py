@@ -53,6 +53,6 @@ class AllDocuments(BaseModel):
         """
         if document_status is not SENTINEL:
             self.document_status = self._enum_matching(
-                document_status, DocumentStatus.list(), "document_status"
+                document_status, DocumentStatus, "document_status"
             )
         self._kwargs = kwargs
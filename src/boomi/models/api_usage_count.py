@@ -69,7 +69,7 @@ class ApiUsageCount(BaseModel):
         """
         if classification is not SENTINEL:
             self.classification = self._enum_matching(
-                classification, ApiUsageCountClassification.list(), "classification"
+                classification, ApiUsageCountClassification, "classification"
             )
         if error_count is not SENTINEL:
             self.error_count = error_count
@@ -66,6 +66,6 @@ class ApiUsageCountGroupingExpression(BaseModel):
                 nested_expression, ApiUsageCountExpression
             )
         self.operator = self._enum_matching(
-            operator, ApiUsageCountGroupingExpressionOperator.list(), "operator"
+            operator, ApiUsageCountGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
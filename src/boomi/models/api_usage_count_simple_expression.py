@@ -125,9 +125,9 @@ class ApiUsageCountSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ApiUsageCountSimpleExpressionOperator.list(), "operator"
+            operator, ApiUsageCountSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ApiUsageCountSimpleExpressionProperty.list(), "property"
+            property, ApiUsageCountSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
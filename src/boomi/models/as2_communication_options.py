@@ -110,7 +110,7 @@ class As2CommunicationOptions(BaseModel):
         if communication_setting is not SENTINEL:
             self.communication_setting = self._enum_matching(
                 communication_setting,
-                As2CommunicationOptionsCommunicationSetting.list(),
+                As2CommunicationOptionsCommunicationSetting,
                 "communication_setting",
             )
         if shared_communication_channel is not SENTINEL:
@@ -66,6 +66,6 @@ class As2ConnectorRecordGroupingExpression(BaseModel):
                 nested_expression, As2ConnectorRecordExpression
             )
         self.operator = self._enum_matching(
-            operator, As2ConnectorRecordGroupingExpressionOperator.list(), "operator"
+            operator, As2ConnectorRecordGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
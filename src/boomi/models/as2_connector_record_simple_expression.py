@@ -78,7 +78,7 @@ class As2ConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, As2ConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, As2ConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -135,7 +135,7 @@ class As2MdnOptions(BaseModel):
             )
         if mdn_digest_alg is not SENTINEL:
             self.mdn_digest_alg = self._enum_matching(
-                mdn_digest_alg, MdnDigestAlg.list(), "mdn_digest_alg"
+                mdn_digest_alg, MdnDigestAlg, "mdn_digest_alg"
             )
         if mdn_ssl_cert is not SENTINEL:
             self.mdn_ssl_cert = self._define_object(mdn_ssl_cert, PublicCertificate)
@@ -145,7 +145,7 @@ class As2MdnOptions(BaseModel):
             self.signed = signed
         if synchronous is not SENTINEL:
             self.synchronous = self._enum_matching(
-                synchronous, Synchronous.list(), "synchronous"
+                synchronous, Synchronous, "synchronous"
             )
         if use_external_url is not SENTINEL:
             self.use_external_url = use_external_url
@@ -218,20 +218,20 @@ class As2MessageOptions(BaseModel):
             self.attachment_cache = attachment_cache
         if attachment_option is not SENTINEL:
             self.attachment_option = self._enum_matching(
-                attachment_option, AttachmentOption.list(), "attachment_option"
+                attachment_option, AttachmentOption, "attachment_option"
             )
         if compressed is not SENTINEL:
             self.compressed = compressed
         if data_content_type is not SENTINEL:
             self.data_content_type = self._enum_matching(
-                data_content_type, DataContentType.list(), "data_content_type"
+                data_content_type, DataContentType, "data_content_type"
             )
         if encrypted is not SENTINEL:
             self.encrypted = encrypted
         if encryption_algorithm is not SENTINEL:
             self.encryption_algorithm = self._enum_matching(
                 encryption_algorithm,
-                As2MessageOptionsEncryptionAlgorithm.list(),
+                As2MessageOptionsEncryptionAlgorithm,
                 "encryption_algorithm",
             )
         if max_document_count is not SENTINEL:
@@ -242,7 +242,7 @@ class As2MessageOptions(BaseModel):
             self.signed = signed
         if signing_digest_alg is not SENTINEL:
             self.signing_digest_alg = self._enum_matching(
-                signing_digest_alg, SigningDigestAlg.list(), "signing_digest_alg"
+                signing_digest_alg, SigningDigestAlg, "signing_digest_alg"
             )
         if subject is not SENTINEL:
             self.subject = subject
@@ -97,7 +97,7 @@ class As2SendSettings(BaseModel):
         if authentication_type is not SENTINEL:
             self.authentication_type = self._enum_matching(
                 authentication_type,
-                As2SendSettingsAuthenticationType.list(),
+                As2SendSettingsAuthenticationType,
                 "authentication_type",
             )
         if client_ssl_certificate is not SENTINEL:
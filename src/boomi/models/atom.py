@@ -255,9 +255,9 @@ class Atom(BaseModel):
         if purge_immediate is not SENTINEL:
             self.purge_immediate = purge_immediate
         if status is not SENTINEL:
-            self.status = self._enum_matching(status, AtomStatus.list(), "status")
+            self.status = self._enum_matching(status, AtomStatus, "status")
         if type_ is not SENTINEL:
-            self.type_ = self._enum_matching(type_, AtomType.list(), "type_")
+            self.type_ = self._enum_matching(type_, AtomType, "type_")
         if status_detail is not SENTINEL:
             self.status_detail = status_detail
         self._kwargs = kwargs
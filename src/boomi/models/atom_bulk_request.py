@@ -61,5 +61,5 @@ class AtomBulkRequest(BaseModel):
         if request is not SENTINEL:
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
-            self.type_ = self._enum_matching(type_, AtomBulkRequestType.list(), "type_")
+            self.type_ = self._enum_matching(type_, AtomBulkRequestType, "type_")
         self._kwargs = kwargs
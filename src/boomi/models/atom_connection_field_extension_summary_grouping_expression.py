@@ -71,7 +71,7 @@ class AtomConnectionFieldExtensionSummaryGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            AtomConnectionFieldExtensionSummaryGroupingExpressionOperator.list(),
+            AtomConnectionFieldExtensionSummaryGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -126,12 +126,12 @@ class AtomConnectionFieldExtensionSummarySimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            AtomConnectionFieldExtensionSummarySimpleExpressionOperator.list(),
+            AtomConnectionFieldExtensionSummarySimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            AtomConnectionFieldExtensionSummarySimpleExpressionProperty.list(),
+            AtomConnectionFieldExtensionSummarySimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class AtomConnectorVersionsBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AtomConnectorVersionsBulkRequestType.list(), "type_"
+                type_, AtomConnectorVersionsBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -63,6 +63,6 @@ class AtomGroupingExpression(BaseModel):
                 nested_expression, AtomExpression
             )
         self.operator = self._enum_matching(
-            operator, AtomGroupingExpressionOperator.list(), "operator"
+            operator, AtomGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -101,9 +101,9 @@ class AtomSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AtomSimpleExpressionOperator.list(), "operator"
+            operator, AtomSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AtomSimpleExpressionProperty.list(), "property"
+            property, AtomSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
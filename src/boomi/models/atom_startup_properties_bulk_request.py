@@ -67,6 +67,6 @@ class AtomStartupPropertiesBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AtomStartupPropertiesBulkRequestType.list(), "type_"
+                type_, AtomStartupPropertiesBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class AuditLogBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, AuditLogBulkRequestType.list(), "type_"
+                type_, AuditLogBulkRequestType, "type_"
             )
         self._kwargs = kwargs
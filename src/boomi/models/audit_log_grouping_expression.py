@@ -66,6 +66,6 @@ class AuditLogGroupingExpression(BaseModel):
                 nested_expression, AuditLogExpression
             )
         self.operator = self._enum_matching(
-            operator, AuditLogGroupingExpressionOperator.list(), "operator"
+            operator, AuditLogGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
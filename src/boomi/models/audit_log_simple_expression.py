@@ -137,9 +137,9 @@ class AuditLogSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, AuditLogSimpleExpressionOperator.list(), "operator"
+            operator, AuditLogSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, AuditLogSimpleExpressionProperty.list(), "property"
+            property, AuditLogSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
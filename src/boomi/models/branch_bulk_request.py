@@ -62,6 +62,6 @@ class BranchBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, BranchBulkRequestType.list(), "type_"
+                type_, BranchBulkRequestType, "type_"
             )
         self._kwargs = kwargs
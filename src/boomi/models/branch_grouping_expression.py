@@ -66,6 +66,6 @@ class BranchGroupingExpression(BaseModel):
                 nested_expression, BranchExpression
             )
         self.operator = self._enum_matching(
-            operator, BranchGroupingExpressionOperator.list(), "operator"
+            operator, BranchGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
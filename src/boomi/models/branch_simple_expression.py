@@ -90,7 +90,7 @@ class BranchSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, BranchSimpleExpressionOperator.list(), "operator"
+            operator, BranchSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -67,7 +67,7 @@ class ChangeListenerStatusRequest(BaseModel):
         :type listener_id: str, optional
         """
         if action is not SENTINEL:
-            self.action = self._enum_matching(action, Action.list(), "action")
+            self.action = self._enum_matching(action, Action, "action")
         if container_id is not SENTINEL:
             self.container_id = container_id
         if listener_id is not SENTINEL:
@@ -62,6 +62,6 @@ class CloudBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, CloudBulkRequestType.list(), "type_"
+                type_, CloudBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -65,6 +65,6 @@ class CloudGroupingExpression(BaseModel):
                 nested_expression, CloudExpression
             )
         self.operator = self._enum_matching(
-            operator, CloudGroupingExpressionOperator.list(), "operator"
+            operator, CloudGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
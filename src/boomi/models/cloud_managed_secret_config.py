@@ -70,7 +70,7 @@ class CloudManagedSecretConfig(BaseModel):
         if secrets_manager_type is not SENTINEL:
             self.secrets_manager_type = self._enum_matching(
                 secrets_manager_type,
-                SecretsManagerType.list(),
+                SecretsManagerType,
                 "secrets_manager_type",
             )
         if uses_remote_secrets_manager is not SENTINEL:
@@ -113,9 +113,9 @@ class CloudSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, CloudSimpleExpressionOperator.list(), "operator"
+            operator, CloudSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, CloudSimpleExpressionProperty.list(), "property"
+            property, CloudSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
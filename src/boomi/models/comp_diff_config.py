@@ -141,6 +141,6 @@ class CompDiffConfig(BaseModel):
             )
         if component_type is not SENTINEL:
             self.component_type = self._enum_matching(
-                component_type, CompDiffConfigComponentType.list(), "component_type"
+                component_type, CompDiffConfigComponentType, "component_type"
             )
         self._kwargs = kwargs
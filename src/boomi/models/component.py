@@ -283,7 +283,7 @@ class Component(BaseModel):
         if sub_type is not SENTINEL:
             self.sub_type = sub_type
         if type_ is not SENTINEL:
-            self.type_ = self._enum_matching(type_, ComponentType.list(), "type_")
+            self.type_ = self._enum_matching(type_, ComponentType, "type_")
         if version is not SENTINEL:
             self.version = version
         if encrypted_values is not SENTINEL:
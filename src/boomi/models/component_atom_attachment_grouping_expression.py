@@ -69,7 +69,7 @@ class ComponentAtomAttachmentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            ComponentAtomAttachmentGroupingExpressionOperator.list(),
+            ComponentAtomAttachmentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -122,9 +122,9 @@ class ComponentAtomAttachmentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ComponentAtomAttachmentSimpleExpressionOperator.list(), "operator"
+            operator, ComponentAtomAttachmentSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ComponentAtomAttachmentSimpleExpressionProperty.list(), "property"
+            property, ComponentAtomAttachmentSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class ComponentBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ComponentBulkRequestType.list(), "type_"
+                type_, ComponentBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class ComponentDiffRequestBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ComponentDiffRequestBulkRequestType.list(), "type_"
+                type_, ComponentDiffRequestBulkRequestType, "type_"
             )
         self._kwargs = kwargs
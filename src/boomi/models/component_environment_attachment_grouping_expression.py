@@ -69,7 +69,7 @@ class ComponentEnvironmentAttachmentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            ComponentEnvironmentAttachmentGroupingExpressionOperator.list(),
+            ComponentEnvironmentAttachmentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
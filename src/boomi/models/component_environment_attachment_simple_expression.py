@@ -123,12 +123,12 @@ class ComponentEnvironmentAttachmentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            ComponentEnvironmentAttachmentSimpleExpressionOperator.list(),
+            ComponentEnvironmentAttachmentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            ComponentEnvironmentAttachmentSimpleExpressionProperty.list(),
+            ComponentEnvironmentAttachmentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
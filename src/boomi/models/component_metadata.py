@@ -254,7 +254,7 @@ class ComponentMetadata(BaseModel):
             self.sub_type = sub_type
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ComponentMetadataType.list(), "type_"
+                type_, ComponentMetadataType, "type_"
             )
         if version is not SENTINEL:
             self.version = version
@@ -67,6 +67,6 @@ class ComponentMetadataBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ComponentMetadataBulkRequestType.list(), "type_"
+                type_, ComponentMetadataBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class ComponentMetadataGroupingExpression(BaseModel):
                 nested_expression, ComponentMetadataExpression
             )
         self.operator = self._enum_matching(
-            operator, ComponentMetadataGroupingExpressionOperator.list(), "operator"
+            operator, ComponentMetadataGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
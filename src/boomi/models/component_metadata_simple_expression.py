@@ -167,9 +167,9 @@ class ComponentMetadataSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ComponentMetadataSimpleExpressionOperator.list(), "operator"
+            operator, ComponentMetadataSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ComponentMetadataSimpleExpressionProperty.list(), "property"
+            property, ComponentMetadataSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class ComponentReferenceBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ComponentReferenceBulkRequestType.list(), "type_"
+                type_, ComponentReferenceBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -63,6 +63,6 @@ class ComponentReferenceGroupingExpression(BaseModel):
                 nested_expression, ComponentReferenceSimpleExpression
             )
         self.operator = self._enum_matching(
-            operator, ComponentReferenceGroupingExpressionOperator.list(), "operator"
+            operator, ComponentReferenceGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
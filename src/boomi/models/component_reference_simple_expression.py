@@ -125,9 +125,9 @@ class ComponentReferenceSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ComponentReferenceSimpleExpressionOperator.list(), "operator"
+            operator, ComponentReferenceSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ComponentReferenceSimpleExpressionProperty.list(), "property"
+            property, ComponentReferenceSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class ConnectorBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ConnectorBulkRequestType.list(), "type_"
+                type_, ConnectorBulkRequestType, "type_"
             )
         self._kwargs = kwargs
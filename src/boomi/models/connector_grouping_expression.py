@@ -66,6 +66,6 @@ class ConnectorGroupingExpression(BaseModel):
                 nested_expression, ConnectorExpression
             )
         self.operator = self._enum_matching(
-            operator, ConnectorGroupingExpressionOperator.list(), "operator"
+            operator, ConnectorGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
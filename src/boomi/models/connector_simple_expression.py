@@ -119,9 +119,9 @@ class ConnectorSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ConnectorSimpleExpressionOperator.list(), "operator"
+            operator, ConnectorSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ConnectorSimpleExpressionProperty.list(), "property"
+            property, ConnectorSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -70,7 +70,7 @@ class CustomOptions(BaseModel):
         if outbound_validation_option is not SENTINEL:
             self.outbound_validation_option = self._enum_matching(
                 outbound_validation_option,
-                OutboundValidationOptionCustom.list(),
+                OutboundValidationOptionCustom,
                 "outbound_validation_option",
             )
         if reject_duplicate_message is not SENTINEL:
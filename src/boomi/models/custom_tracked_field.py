@@ -65,6 +65,6 @@ class CustomTrackedField(BaseModel):
             self.position = position
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, CustomTrackedFieldType.list(), "type_"
+                type_, CustomTrackedFieldType, "type_"
             )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class CustomTrackedFieldGroupingExpression(BaseModel):
                 nested_expression, CustomTrackedFieldExpression
             )
         self.operator = self._enum_matching(
-            operator, CustomTrackedFieldGroupingExpressionOperator.list(), "operator"
+            operator, CustomTrackedFieldGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
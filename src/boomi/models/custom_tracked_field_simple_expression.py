@@ -93,7 +93,7 @@ class CustomTrackedFieldSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, CustomTrackedFieldSimpleExpressionOperator.list(), "operator"
+            operator, CustomTrackedFieldSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class DeployedExpiredCertificateGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            DeployedExpiredCertificateGroupingExpressionOperator.list(),
+            DeployedExpiredCertificateGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -96,12 +96,12 @@ class DeployedExpiredCertificateSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            DeployedExpiredCertificateSimpleExpressionOperator.list(),
+            DeployedExpiredCertificateSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            DeployedExpiredCertificateSimpleExpressionProperty.list(),
+            DeployedExpiredCertificateSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
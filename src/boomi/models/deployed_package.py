@@ -150,7 +150,7 @@ class DeployedPackage(BaseModel):
             self.environment_id = environment_id
         if listener_status is not SENTINEL:
             self.listener_status = self._enum_matching(
-                listener_status, DeployedPackageListenerStatus.list(), "listener_status"
+                listener_status, DeployedPackageListenerStatus, "listener_status"
             )
         if message is not SENTINEL:
             self.message = message
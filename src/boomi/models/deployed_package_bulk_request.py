@@ -64,6 +64,6 @@ class DeployedPackageBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, DeployedPackageBulkRequestType.list(), "type_"
+                type_, DeployedPackageBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -65,6 +65,6 @@ class DeployedPackageGroupingExpression(BaseModel):
                 nested_expression, DeployedPackageExpression
             )
         self.operator = self._enum_matching(
-            operator, DeployedPackageGroupingExpressionOperator.list(), "operator"
+            operator, DeployedPackageGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -170,9 +170,9 @@ class DeployedPackageSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, DeployedPackageSimpleExpressionOperator.list(), "operator"
+            operator, DeployedPackageSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, DeployedPackageSimpleExpressionProperty.list(), "property"
+            property, DeployedPackageSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -128,7 +128,7 @@ class Deployment(BaseModel):
         self.id_ = id_
         if listener_status is not SENTINEL:
             self.listener_status = self._enum_matching(
-                listener_status, DeploymentListenerStatus.list(), "listener_status"
+                listener_status, DeploymentListenerStatus, "listener_status"
             )
         if message is not SENTINEL:
             self.message = message
@@ -64,6 +64,6 @@ class DeploymentBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, DeploymentBulkRequestType.list(), "type_"
+                type_, DeploymentBulkRequestType, "type_"
             )
         self._kwargs = kwargs
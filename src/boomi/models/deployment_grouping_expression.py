@@ -66,6 +66,6 @@ class DeploymentGroupingExpression(BaseModel):
                 nested_expression, DeploymentExpression
             )
         self.operator = self._enum_matching(
-            operator, DeploymentGroupingExpressionOperator.list(), "operator"
+            operator, DeploymentGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
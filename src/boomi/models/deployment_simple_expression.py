@@ -128,9 +128,9 @@ class DeploymentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, DeploymentSimpleExpressionOperator.list(), "operator"
+            operator, DeploymentSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, DeploymentSimpleExpressionProperty.list(), "property"
+            property, DeploymentSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
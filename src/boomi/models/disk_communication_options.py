@@ -81,7 +81,7 @@ class DiskCommunicationOptions(BaseModel):
         if communication_setting is not SENTINEL:
             self.communication_setting = self._enum_matching(
                 communication_setting,
-                DiskCommunicationOptionsCommunicationSetting.list(),
+                DiskCommunicationOptionsCommunicationSetting,
                 "communication_setting",
             )
         if disk_get_options is not SENTINEL:
@@ -83,7 +83,7 @@ class DiskGetOptions(BaseModel):
         self.file_filter = file_filter
         if filter_match_type is not SENTINEL:
             self.filter_match_type = self._enum_matching(
-                filter_match_type, FilterMatchType.list(), "filter_match_type"
+                filter_match_type, FilterMatchType, "filter_match_type"
             )
         self.get_directory = get_directory
         if max_file_count is not SENTINEL:
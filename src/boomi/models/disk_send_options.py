@@ -79,6 +79,6 @@ class DiskSendOptions(BaseModel):
             self.use_default_send_options = use_default_send_options
         if write_option is not SENTINEL:
             self.write_option = self._enum_matching(
-                write_option, WriteOption.list(), "write_option"
+                write_option, WriteOption, "write_option"
             )
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class DocumentCountAccountGroupGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            DocumentCountAccountGroupGroupingExpressionOperator.list(),
+            DocumentCountAccountGroupGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
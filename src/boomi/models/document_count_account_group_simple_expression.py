@@ -120,12 +120,12 @@ class DocumentCountAccountGroupSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            DocumentCountAccountGroupSimpleExpressionOperator.list(),
+            DocumentCountAccountGroupSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            DocumentCountAccountGroupSimpleExpressionProperty.list(),
+            DocumentCountAccountGroupSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
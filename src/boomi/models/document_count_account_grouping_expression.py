@@ -68,6 +68,6 @@ class DocumentCountAccountGroupingExpression(BaseModel):
                 nested_expression, DocumentCountAccountExpression
             )
         self.operator = self._enum_matching(
-            operator, DocumentCountAccountGroupingExpressionOperator.list(), "operator"
+            operator, DocumentCountAccountGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
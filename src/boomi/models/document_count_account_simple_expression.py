@@ -122,9 +122,9 @@ class DocumentCountAccountSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, DocumentCountAccountSimpleExpressionOperator.list(), "operator"
+            operator, DocumentCountAccountSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, DocumentCountAccountSimpleExpressionProperty.list(), "property"
+            property, DocumentCountAccountSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class EdiCustomConnectorRecordGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            EdiCustomConnectorRecordGroupingExpressionOperator.list(),
+            EdiCustomConnectorRecordGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
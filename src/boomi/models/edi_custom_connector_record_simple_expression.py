@@ -79,7 +79,7 @@ class EdiCustomConnectorRecordSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            EdiCustomConnectorRecordSimpleExpressionOperator.list(),
+            EdiCustomConnectorRecordSimpleExpressionOperator,
             "operator",
         )
         self.property = property
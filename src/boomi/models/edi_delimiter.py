@@ -80,6 +80,6 @@ class EdiDelimiter(BaseModel):
             self.delimiter_special = delimiter_special
         if delimiter_value is not SENTINEL:
             self.delimiter_value = self._enum_matching(
-                delimiter_value, DelimiterValue.list(), "delimiter_value"
+                delimiter_value, DelimiterValue, "delimiter_value"
             )
         self._kwargs = kwargs
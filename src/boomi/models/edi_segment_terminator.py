@@ -73,7 +73,7 @@ class EdiSegmentTerminator(BaseModel):
         if segment_terminator_value is not SENTINEL:
             self.segment_terminator_value = self._enum_matching(
                 segment_terminator_value,
-                SegmentTerminatorValue.list(),
+                SegmentTerminatorValue,
                 "segment_terminator_value",
             )
         self._kwargs = kwargs
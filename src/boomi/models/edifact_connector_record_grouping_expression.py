@@ -69,7 +69,7 @@ class EdifactConnectorRecordGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            EdifactConnectorRecordGroupingExpressionOperator.list(),
+            EdifactConnectorRecordGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -170,9 +170,9 @@ class EdifactConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, EdifactConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, EdifactConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, EdifactConnectorRecordSimpleExpressionProperty.list(), "property"
+            property, EdifactConnectorRecordSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -162,7 +162,7 @@ class EdifactOptions(BaseModel):
         if acknowledgementoption is not SENTINEL:
             self.acknowledgementoption = self._enum_matching(
                 acknowledgementoption,
-                EdifactOptionsAcknowledgementoption.list(),
+                EdifactOptionsAcknowledgementoption,
                 "acknowledgementoption",
             )
         if composite_delimiter is not SENTINEL:
@@ -173,7 +173,7 @@ class EdifactOptions(BaseModel):
             self.element_delimiter = self._define_object(element_delimiter, EdiDelimiter)
         if envelopeoption is not SENTINEL:
             self.envelopeoption = self._enum_matching(
-                envelopeoption, EdifactOptionsEnvelopeoption.list(), "envelopeoption"
+                envelopeoption, EdifactOptionsEnvelopeoption, "envelopeoption"
             )
         if filteracknowledgements is not SENTINEL:
             self.filteracknowledgements = filteracknowledgements
@@ -184,7 +184,7 @@ class EdifactOptions(BaseModel):
         if outbound_validation_option is not SENTINEL:
             self.outbound_validation_option = self._enum_matching(
                 outbound_validation_option,
-                EdifactOptionsOutboundValidationOption.list(),
+                EdifactOptionsOutboundValidationOption,
                 "outbound_validation_option",
             )
         if reject_duplicate_unb is not SENTINEL:
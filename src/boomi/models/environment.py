@@ -74,7 +74,7 @@ class Environment(BaseModel):
         """
         if classification is not SENTINEL:
             self.classification = self._enum_matching(
-                classification, EnvironmentClassification.list(), "classification"
+                classification, EnvironmentClassification, "classification"
             )
         if id_ is not SENTINEL:
             self.id_ = id_
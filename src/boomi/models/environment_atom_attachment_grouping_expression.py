@@ -69,7 +69,7 @@ class EnvironmentAtomAttachmentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            EnvironmentAtomAttachmentGroupingExpressionOperator.list(),
+            EnvironmentAtomAttachmentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
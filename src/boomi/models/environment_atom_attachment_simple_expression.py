@@ -120,12 +120,12 @@ class EnvironmentAtomAttachmentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            EnvironmentAtomAttachmentSimpleExpressionOperator.list(),
+            EnvironmentAtomAttachmentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            EnvironmentAtomAttachmentSimpleExpressionProperty.list(),
+            EnvironmentAtomAttachmentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class EnvironmentBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, EnvironmentBulkRequestType.list(), "type_"
+                type_, EnvironmentBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -71,7 +71,7 @@ class EnvironmentConnectionFieldExtensionSummaryGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            EnvironmentConnectionFieldExtensionSummaryGroupingExpressionOperator.list(),
+            EnvironmentConnectionFieldExtensionSummaryGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
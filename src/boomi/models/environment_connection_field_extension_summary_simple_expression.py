@@ -126,12 +126,12 @@ class EnvironmentConnectionFieldExtensionSummarySimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            EnvironmentConnectionFieldExtensionSummarySimpleExpressionOperator.list(),
+            EnvironmentConnectionFieldExtensionSummarySimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            EnvironmentConnectionFieldExtensionSummarySimpleExpressionProperty.list(),
+            EnvironmentConnectionFieldExtensionSummarySimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class EnvironmentExtensionsBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, EnvironmentExtensionsBulkRequestType.list(), "type_"
+                type_, EnvironmentExtensionsBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -68,6 +68,6 @@ class EnvironmentExtensionsGroupingExpression(BaseModel):
                 nested_expression, EnvironmentExtensionsExpression
             )
         self.operator = self._enum_matching(
-            operator, EnvironmentExtensionsGroupingExpressionOperator.list(), "operator"
+            operator, EnvironmentExtensionsGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -119,9 +119,9 @@ class EnvironmentExtensionsSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, EnvironmentExtensionsSimpleExpressionOperator.list(), "operator"
+            operator, EnvironmentExtensionsSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, EnvironmentExtensionsSimpleExpressionProperty.list(), "property"
+            property, EnvironmentExtensionsSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
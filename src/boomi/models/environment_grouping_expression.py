@@ -66,6 +66,6 @@ class EnvironmentGroupingExpression(BaseModel):
                 nested_expression, EnvironmentExpression
             )
         self.operator = self._enum_matching(
-            operator, EnvironmentGroupingExpressionOperator.list(), "operator"
+            operator, EnvironmentGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class EnvironmentMapExtensionBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, EnvironmentMapExtensionBulkRequestType.list(), "type_"
+                type_, EnvironmentMapExtensionBulkRequestType, "type_"
             )
         self._kwargs = kwargs
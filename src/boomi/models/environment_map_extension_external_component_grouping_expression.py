@@ -71,7 +71,7 @@ class EnvironmentMapExtensionExternalComponentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            EnvironmentMapExtensionExternalComponentGroupingExpressionOperator.list(),
+            EnvironmentMapExtensionExternalComponentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -135,12 +135,12 @@ class EnvironmentMapExtensionExternalComponentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            EnvironmentMapExtensionExternalComponentSimpleExpressionOperator.list(),
+            EnvironmentMapExtensionExternalComponentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            EnvironmentMapExtensionExternalComponentSimpleExpressionProperty.list(),
+            EnvironmentMapExtensionExternalComponentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
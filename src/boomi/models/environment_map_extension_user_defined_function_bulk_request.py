@@ -73,7 +73,7 @@ class EnvironmentMapExtensionUserDefinedFunctionBulkRequest(BaseModel):
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
                 type_,
-                EnvironmentMapExtensionUserDefinedFunctionBulkRequestType.list(),
+                EnvironmentMapExtensionUserDefinedFunctionBulkRequestType,
                 "type_",
             )
         self._kwargs = kwargs
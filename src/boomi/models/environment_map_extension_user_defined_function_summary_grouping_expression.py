@@ -72,7 +72,7 @@ class EnvironmentMapExtensionUserDefinedFunctionSummaryGroupingExpression(BaseMo
             )
         self.operator = self._enum_matching(
             operator,
-            EnvironmentMapExtensionUserDefinedFunctionSummaryGroupingExpressionOperator.list(),
+            EnvironmentMapExtensionUserDefinedFunctionSummaryGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -126,12 +126,12 @@ class EnvironmentMapExtensionUserDefinedFunctionSummarySimpleExpression(BaseMode
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            EnvironmentMapExtensionUserDefinedFunctionSummarySimpleExpressionOperator.list(),
+            EnvironmentMapExtensionUserDefinedFunctionSummarySimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            EnvironmentMapExtensionUserDefinedFunctionSummarySimpleExpressionProperty.list(),
+            EnvironmentMapExtensionUserDefinedFunctionSummarySimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
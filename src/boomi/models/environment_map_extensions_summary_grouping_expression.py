@@ -69,7 +69,7 @@ class EnvironmentMapExtensionsSummaryGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            EnvironmentMapExtensionsSummaryGroupingExpressionOperator.list(),
+            EnvironmentMapExtensionsSummaryGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
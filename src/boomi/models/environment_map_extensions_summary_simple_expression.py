@@ -120,12 +120,12 @@ class EnvironmentMapExtensionsSummarySimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            EnvironmentMapExtensionsSummarySimpleExpressionOperator.list(),
+            EnvironmentMapExtensionsSummarySimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            EnvironmentMapExtensionsSummarySimpleExpressionProperty.list(),
+            EnvironmentMapExtensionsSummarySimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
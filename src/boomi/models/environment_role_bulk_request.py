@@ -64,6 +64,6 @@ class EnvironmentRoleBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, EnvironmentRoleBulkRequestType.list(), "type_"
+                type_, EnvironmentRoleBulkRequestType, "type_"
             )
         self._kwargs = kwargs
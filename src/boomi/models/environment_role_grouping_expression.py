@@ -66,6 +66,6 @@ class EnvironmentRoleGroupingExpression(BaseModel):
                 nested_expression, EnvironmentRoleExpression
             )
         self.operator = self._enum_matching(
-            operator, EnvironmentRoleGroupingExpressionOperator.list(), "operator"
+            operator, EnvironmentRoleGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
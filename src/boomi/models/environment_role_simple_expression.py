@@ -119,9 +119,9 @@ class EnvironmentRoleSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, EnvironmentRoleSimpleExpressionOperator.list(), "operator"
+            operator, EnvironmentRoleSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, EnvironmentRoleSimpleExpressionProperty.list(), "property"
+            property, EnvironmentRoleSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
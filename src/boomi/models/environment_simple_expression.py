@@ -122,9 +122,9 @@ class EnvironmentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, EnvironmentSimpleExpressionOperator.list(), "operator"
+            operator, EnvironmentSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, EnvironmentSimpleExpressionProperty.list(), "property"
+            property, EnvironmentSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -65,6 +65,6 @@ class EventGroupingExpression(BaseModel):
                 nested_expression, EventExpression
             )
         self.operator = self._enum_matching(
-            operator, EventGroupingExpressionOperator.list(), "operator"
+            operator, EventGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
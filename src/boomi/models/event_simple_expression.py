@@ -170,9 +170,9 @@ class EventSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, EventSimpleExpressionOperator.list(), "operator"
+            operator, EventSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, EventSimpleExpressionProperty.list(), "property"
+            property, EventSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
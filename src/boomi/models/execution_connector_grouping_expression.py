@@ -66,6 +66,6 @@ class ExecutionConnectorGroupingExpression(BaseModel):
                 nested_expression, ExecutionConnectorExpression
             )
         self.operator = self._enum_matching(
-            operator, ExecutionConnectorGroupingExpressionOperator.list(), "operator"
+            operator, ExecutionConnectorGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
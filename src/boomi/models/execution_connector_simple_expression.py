@@ -137,9 +137,9 @@ class ExecutionConnectorSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ExecutionConnectorSimpleExpressionOperator.list(), "operator"
+            operator, ExecutionConnectorSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ExecutionConnectorSimpleExpressionProperty.list(), "property"
+            property, ExecutionConnectorSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class ExecutionCountAccountGroupGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            ExecutionCountAccountGroupGroupingExpressionOperator.list(),
+            ExecutionCountAccountGroupGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -120,12 +120,12 @@ class ExecutionCountAccountGroupSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            ExecutionCountAccountGroupSimpleExpressionOperator.list(),
+            ExecutionCountAccountGroupSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            ExecutionCountAccountGroupSimpleExpressionProperty.list(),
+            ExecutionCountAccountGroupSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
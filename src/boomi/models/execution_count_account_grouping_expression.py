@@ -68,6 +68,6 @@ class ExecutionCountAccountGroupingExpression(BaseModel):
                 nested_expression, ExecutionCountAccountExpression
             )
         self.operator = self._enum_matching(
-            operator, ExecutionCountAccountGroupingExpressionOperator.list(), "operator"
+            operator, ExecutionCountAccountGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
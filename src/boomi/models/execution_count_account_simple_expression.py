@@ -122,9 +122,9 @@ class ExecutionCountAccountSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ExecutionCountAccountSimpleExpressionOperator.list(), "operator"
+            operator, ExecutionCountAccountSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ExecutionCountAccountSimpleExpressionProperty.list(), "property"
+            property, ExecutionCountAccountSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -215,7 +215,7 @@ class ExecutionRecord(BaseModel):
         self.execution_id = execution_id
         self.execution_time = execution_time
         self.execution_type = self._enum_matching(
-            execution_type, ExecutionType.list(), "execution_type"
+            execution_type, ExecutionType, "execution_type"
         )
         if inbound_document_count is not SENTINEL:
             self.inbound_document_count = inbound_document_count
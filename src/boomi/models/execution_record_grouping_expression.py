@@ -59,6 +59,6 @@ class ExecutionRecordGroupingExpression(BaseModel):
             # For now, store them as raw dicts since they're used in query construction
             self.nested_expression = nested_expression
         self.operator = self._enum_matching(
-            operator, ExecutionRecordGroupingExpressionOperator.list(), "operator"
+            operator, ExecutionRecordGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -167,9 +167,9 @@ class ExecutionRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ExecutionRecordSimpleExpressionOperator.list(), "operator"
+            operator, ExecutionRecordSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ExecutionRecordSimpleExpressionProperty.list(), "property"
+            property, ExecutionRecordSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class ExecutionSummaryRecordGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            ExecutionSummaryRecordGroupingExpressionOperator.list(),
+            ExecutionSummaryRecordGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
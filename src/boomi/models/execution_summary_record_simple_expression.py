@@ -131,9 +131,9 @@ class ExecutionSummaryRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ExecutionSummaryRecordSimpleExpressionOperator.list(), "operator"
+            operator, ExecutionSummaryRecordSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ExecutionSummaryRecordSimpleExpressionProperty.list(), "property"
+            property, ExecutionSummaryRecordSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
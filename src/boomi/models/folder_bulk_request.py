@@ -62,6 +62,6 @@ class FolderBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, FolderBulkRequestType.list(), "type_"
+                type_, FolderBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class FolderGroupingExpression(BaseModel):
                 nested_expression, FolderExpression
             )
         self.operator = self._enum_matching(
-            operator, FolderGroupingExpressionOperator.list(), "operator"
+            operator, FolderGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -131,9 +131,9 @@ class FolderSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, FolderSimpleExpressionOperator.list(), "operator"
+            operator, FolderSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, FolderSimpleExpressionProperty.list(), "property"
+            property, FolderSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
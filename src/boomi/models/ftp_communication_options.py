@@ -88,7 +88,7 @@ class FtpCommunicationOptions(BaseModel):
         if communication_setting is not SENTINEL:
             self.communication_setting = self._enum_matching(
                 communication_setting,
-                FtpCommunicationOptionsCommunicationSetting.list(),
+                FtpCommunicationOptionsCommunicationSetting,
                 "communication_setting",
             )
         if ftp_get_options is not SENTINEL:
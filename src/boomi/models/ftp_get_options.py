@@ -110,7 +110,7 @@ class FtpGetOptions(BaseModel):
             self.file_to_move = file_to_move
         if ftp_action is not SENTINEL:
             self.ftp_action = self._enum_matching(
-                ftp_action, FtpGetOptionsFtpAction.list(), "ftp_action"
+                ftp_action, FtpGetOptionsFtpAction, "ftp_action"
             )
         if max_file_count is not SENTINEL:
             self.max_file_count = max_file_count
@@ -118,7 +118,7 @@ class FtpGetOptions(BaseModel):
             self.remote_directory = remote_directory
         if transfer_type is not SENTINEL:
             self.transfer_type = self._enum_matching(
-                transfer_type, FtpGetOptionsTransferType.list(), "transfer_type"
+                transfer_type, FtpGetOptionsTransferType, "transfer_type"
             )
         if use_default_get_options is not SENTINEL:
             self.use_default_get_options = use_default_get_options
@@ -105,7 +105,7 @@ class FtpSendOptions(BaseModel):
         """
         if ftp_action is not SENTINEL:
             self.ftp_action = self._enum_matching(
-                ftp_action, FtpSendOptionsFtpAction.list(), "ftp_action"
+                ftp_action, FtpSendOptionsFtpAction, "ftp_action"
             )
         if move_to_directory is not SENTINEL:
             self.move_to_directory = move_to_directory
@@ -113,7 +113,7 @@ class FtpSendOptions(BaseModel):
             self.remote_directory = remote_directory
         if transfer_type is not SENTINEL:
             self.transfer_type = self._enum_matching(
-                transfer_type, FtpSendOptionsTransferType.list(), "transfer_type"
+                transfer_type, FtpSendOptionsTransferType, "transfer_type"
             )
         if use_default_send_options is not SENTINEL:
             self.use_default_send_options = use_default_send_options
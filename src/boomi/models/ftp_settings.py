@@ -86,7 +86,7 @@ class FtpSettings(BaseModel):
             self.ftpssl_options = self._define_object(ftpssl_options, FtpsslOptions)
         if connection_mode is not SENTINEL:
             self.connection_mode = self._enum_matching(
-                connection_mode, ConnectionMode.list(), "connection_mode"
+                connection_mode, ConnectionMode, "connection_mode"
             )
         if host is not SENTINEL:
             self.host = host
@@ -69,7 +69,7 @@ class FtpsslOptions(BaseModel):
                 client_ssl_certificate, PrivateCertificate
             )
         if sslmode is not SENTINEL:
-            self.sslmode = self._enum_matching(sslmode, Sslmode.list(), "sslmode")
+            self.sslmode = self._enum_matching(sslmode, Sslmode, "sslmode")
         if use_client_authentication is not SENTINEL:
             self.use_client_authentication = use_client_authentication
         self._kwargs = kwargs
@@ -209,7 +209,7 @@ class GenericConnectorRecord(BaseModel):
             self.start_shape = start_shape
         if status is not SENTINEL:
             self.status = self._enum_matching(
-                status, GenericConnectorRecordStatus.list(), "status"
+                status, GenericConnectorRecordStatus, "status"
             )
         if tracked_fields is not SENTINEL:
             self.tracked_fields = self._define_object(tracked_fields, TrackedFields)
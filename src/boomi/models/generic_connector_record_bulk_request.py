@@ -67,6 +67,6 @@ class GenericConnectorRecordBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, GenericConnectorRecordBulkRequestType.list(), "type_"
+                type_, GenericConnectorRecordBulkRequestType, "type_"
             )
         self._kwargs = kwargs
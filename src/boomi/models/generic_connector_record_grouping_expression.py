@@ -69,7 +69,7 @@ class GenericConnectorRecordGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            GenericConnectorRecordGroupingExpressionOperator.list(),
+            GenericConnectorRecordGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
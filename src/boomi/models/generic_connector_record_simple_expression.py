@@ -134,9 +134,9 @@ class GenericConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, GenericConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, GenericConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, GenericConnectorRecordSimpleExpressionProperty.list(), "property"
+            property, GenericConnectorRecordSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
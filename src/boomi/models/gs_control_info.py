@@ -60,6 +60,6 @@ class GsControlInfo(BaseModel):
             self.gs_version = gs_version
         if respagencycode is not SENTINEL:
             self.respagencycode = self._enum_matching(
-                respagencycode, Respagencycode.list(), "respagencycode"
+                respagencycode, Respagencycode, "respagencycode"
             )
         self._kwargs = kwargs
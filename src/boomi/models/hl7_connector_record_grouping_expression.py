@@ -66,6 +66,6 @@ class Hl7ConnectorRecordGroupingExpression(BaseModel):
                 nested_expression, Hl7ConnectorRecordExpression
             )
         self.operator = self._enum_matching(
-            operator, Hl7ConnectorRecordGroupingExpressionOperator.list(), "operator"
+            operator, Hl7ConnectorRecordGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -78,7 +78,7 @@ class Hl7ConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, Hl7ConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, Hl7ConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -195,15 +195,15 @@ class Hl7Options(BaseModel):
         """
         if acceptackoption is not SENTINEL:
             self.acceptackoption = self._enum_matching(
-                acceptackoption, Acceptackoption.list(), "acceptackoption"
+                acceptackoption, Acceptackoption, "acceptackoption"
             )
         if appackoption is not SENTINEL:
             self.appackoption = self._enum_matching(
-                appackoption, Appackoption.list(), "appackoption"
+                appackoption, Appackoption, "appackoption"
             )
         if batchoption is not SENTINEL:
             self.batchoption = self._enum_matching(
-                batchoption, Batchoption.list(), "batchoption"
+                batchoption, Batchoption, "batchoption"
             )
         if composite_delimiter is not SENTINEL:
             self.composite_delimiter = self._define_object(
@@ -218,7 +218,7 @@ class Hl7Options(BaseModel):
         if outbound_validation_option is not SENTINEL:
             self.outbound_validation_option = self._enum_matching(
                 outbound_validation_option,
-                Hl7OptionsOutboundValidationOption.list(),
+                Hl7OptionsOutboundValidationOption,
                 "outbound_validation_option",
             )
         if reject_duplicates is not SENTINEL:
@@ -95,7 +95,7 @@ class HttpCommunicationOptions(BaseModel):
         if communication_setting is not SENTINEL:
             self.communication_setting = self._enum_matching(
                 communication_setting,
-                HttpCommunicationOptionsCommunicationSetting.list(),
+                HttpCommunicationOptionsCommunicationSetting,
                 "communication_setting",
             )
         if http_get_options is not SENTINEL:
@@ -197,7 +197,7 @@ class HttpGetOptions(BaseModel):
             self.follow_redirects = follow_redirects
         if method_type is not SENTINEL:
             self.method_type = self._enum_matching(
-                method_type, HttpGetOptionsMethodType.list(), "method_type"
+                method_type, HttpGetOptionsMethodType, "method_type"
             )
         if path_elements is not SENTINEL:
             self.path_elements = self._define_object(path_elements, HttpPathElements)
@@ -212,7 +212,7 @@ class HttpGetOptions(BaseModel):
         if request_profile_type is not SENTINEL:
             self.request_profile_type = self._enum_matching(
                 request_profile_type,
-                HttpGetOptionsRequestProfileType.list(),
+                HttpGetOptionsRequestProfileType,
                 "request_profile_type",
             )
         if response_header_mapping is not SENTINEL:
@@ -224,7 +224,7 @@ class HttpGetOptions(BaseModel):
         if response_profile_type is not SENTINEL:
             self.response_profile_type = self._enum_matching(
                 response_profile_type,
-                HttpGetOptionsResponseProfileType.list(),
+                HttpGetOptionsResponseProfileType,
                 "response_profile_type",
             )
         if return_errors is not SENTINEL:
@@ -203,7 +203,7 @@ class HttpSendOptions(BaseModel):
             self.follow_redirects = follow_redirects
         if method_type is not SENTINEL:
             self.method_type = self._enum_matching(
-                method_type, HttpSendOptionsMethodType.list(), "method_type"
+                method_type, HttpSendOptionsMethodType, "method_type"
             )
         if path_elements is not SENTINEL:
             self.path_elements = self._define_object(path_elements, HttpPathElements)
@@ -218,7 +218,7 @@ class HttpSendOptions(BaseModel):
         if request_profile_type is not SENTINEL:
             self.request_profile_type = self._enum_matching(
                 request_profile_type,
-                HttpSendOptionsRequestProfileType.list(),
+                HttpSendOptionsRequestProfileType,
                 "request_profile_type",
             )
         if response_header_mapping is not SENTINEL:
@@ -230,7 +230,7 @@ class HttpSendOptions(BaseModel):
         if response_profile_type is not SENTINEL:
             self.response_profile_type = self._enum_matching(
                 response_profile_type,
-                HttpSendOptionsResponseProfileType.list(),
+                HttpSendOptionsResponseProfileType,
                 "response_profile_type",
             )
         if return_errors is not SENTINEL:
@@ -173,14 +173,14 @@ class HttpSettings(BaseModel):
         if authentication_type is not SENTINEL:
             self.authentication_type = self._enum_matching(
                 authentication_type,
-                HttpSettingsAuthenticationType.list(),
+                HttpSettingsAuthenticationType,
                 "authentication_type",
             )
         if connect_timeout is not SENTINEL:
             self.connect_timeout = connect_timeout
         if cookie_scope is not SENTINEL:
             self.cookie_scope = self._enum_matching(
-                cookie_scope, CookieScope.list(), "cookie_scope"
+                cookie_scope, CookieScope, "cookie_scope"
             )
         if read_timeout is not SENTINEL:
             self.read_timeout = read_timeout
@@ -109,7 +109,7 @@ class HttpoAuth2Settings(BaseModel):
             self.credentials = self._define_object(credentials, HttpoAuthCredentials)
         if grant_type is not SENTINEL:
             self.grant_type = self._enum_matching(
-                grant_type, GrantType.list(), "grant_type"
+                grant_type, GrantType, "grant_type"
             )
         if scope is not SENTINEL:
             self.scope = scope
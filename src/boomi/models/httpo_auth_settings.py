@@ -117,7 +117,7 @@ class HttpoAuthSettings(BaseModel):
             self.request_token_url = request_token_url
         if signature_method is not SENTINEL:
             self.signature_method = self._enum_matching(
-                signature_method, SignatureMethod.list(), "signature_method"
+                signature_method, SignatureMethod, "signature_method"
             )
         if suppress_blank_access_token is not SENTINEL:
             self.suppress_blank_access_token = suppress_blank_access_token
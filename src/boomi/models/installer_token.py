@@ -102,7 +102,7 @@ class InstallerToken(BaseModel):
             self.expiration = expiration
         if install_type is not SENTINEL:
             self.install_type = self._enum_matching(
-                install_type, InstallType.list(), "install_type"
+                install_type, InstallType, "install_type"
             )
         if token is not SENTINEL:
             self.token = token
@@ -71,7 +71,7 @@ class IntegrationPack(BaseModel):
         if installation_type is not SENTINEL:
             self.installation_type = self._enum_matching(
                 installation_type,
-                IntegrationPackInstallationType.list(),
+                IntegrationPackInstallationType,
                 "installation_type",
             )
         if name is not SENTINEL:
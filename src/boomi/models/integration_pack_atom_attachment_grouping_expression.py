@@ -69,7 +69,7 @@ class IntegrationPackAtomAttachmentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            IntegrationPackAtomAttachmentGroupingExpressionOperator.list(),
+            IntegrationPackAtomAttachmentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -120,12 +120,12 @@ class IntegrationPackAtomAttachmentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            IntegrationPackAtomAttachmentSimpleExpressionOperator.list(),
+            IntegrationPackAtomAttachmentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            IntegrationPackAtomAttachmentSimpleExpressionProperty.list(),
+            IntegrationPackAtomAttachmentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class IntegrationPackBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, IntegrationPackBulkRequestType.list(), "type_"
+                type_, IntegrationPackBulkRequestType, "type_"
             )
         self._kwargs = kwargs
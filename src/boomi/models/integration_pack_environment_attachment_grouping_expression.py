@@ -71,7 +71,7 @@ class IntegrationPackEnvironmentAttachmentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            IntegrationPackEnvironmentAttachmentGroupingExpressionOperator.list(),
+            IntegrationPackEnvironmentAttachmentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
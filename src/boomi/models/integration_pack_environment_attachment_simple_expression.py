@@ -120,12 +120,12 @@ class IntegrationPackEnvironmentAttachmentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            IntegrationPackEnvironmentAttachmentSimpleExpressionOperator.list(),
+            IntegrationPackEnvironmentAttachmentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            IntegrationPackEnvironmentAttachmentSimpleExpressionProperty.list(),
+            IntegrationPackEnvironmentAttachmentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
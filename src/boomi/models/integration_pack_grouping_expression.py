@@ -66,6 +66,6 @@ class IntegrationPackGroupingExpression(BaseModel):
                 nested_expression, IntegrationPackExpression
             )
         self.operator = self._enum_matching(
-            operator, IntegrationPackGroupingExpressionOperator.list(), "operator"
+            operator, IntegrationPackGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
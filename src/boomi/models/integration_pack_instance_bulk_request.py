@@ -67,6 +67,6 @@ class IntegrationPackInstanceBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, IntegrationPackInstanceBulkRequestType.list(), "type_"
+                type_, IntegrationPackInstanceBulkRequestType, "type_"
             )
         self._kwargs = kwargs
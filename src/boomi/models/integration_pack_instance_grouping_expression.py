@@ -69,7 +69,7 @@ class IntegrationPackInstanceGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            IntegrationPackInstanceGroupingExpressionOperator.list(),
+            IntegrationPackInstanceGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
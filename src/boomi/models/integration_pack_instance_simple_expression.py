@@ -122,9 +122,9 @@ class IntegrationPackInstanceSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, IntegrationPackInstanceSimpleExpressionOperator.list(), "operator"
+            operator, IntegrationPackInstanceSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, IntegrationPackInstanceSimpleExpressionProperty.list(), "property"
+            property, IntegrationPackInstanceSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -122,9 +122,9 @@ class IntegrationPackSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, IntegrationPackSimpleExpressionOperator.list(), "operator"
+            operator, IntegrationPackSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, IntegrationPackSimpleExpressionProperty.list(), "property"
+            property, IntegrationPackSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
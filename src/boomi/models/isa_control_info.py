@@ -292,7 +292,7 @@ class IsaControlInfo(BaseModel):
         if authorization_information_qualifier is not SENTINEL:
             self.authorization_information_qualifier = self._enum_matching(
                 authorization_information_qualifier,
-                AuthorizationInformationQualifier.list(),
+                AuthorizationInformationQualifier,
                 "authorization_information_qualifier",
             )
         if component_element_separator is not SENTINEL:
@@ -302,7 +302,7 @@ class IsaControlInfo(BaseModel):
         if interchange_id_qualifier is not SENTINEL:
             self.interchange_id_qualifier = self._enum_matching(
                 interchange_id_qualifier,
-                InterchangeIdQualifier.list(),
+                InterchangeIdQualifier,
                 "interchange_id_qualifier",
             )
         if security_information is not SENTINEL:
@@ -310,14 +310,14 @@ class IsaControlInfo(BaseModel):
         if security_information_qualifier is not SENTINEL:
             self.security_information_qualifier = self._enum_matching(
                 security_information_qualifier,
-                SecurityInformationQualifier.list(),
+                SecurityInformationQualifier,
                 "security_information_qualifier",
             )
         if standard_identification is not SENTINEL:
             self.standard_identification = standard_identification
         if testindicator is not SENTINEL:
             self.testindicator = self._enum_matching(
-                testindicator, Testindicator.list(), "testindicator"
+                testindicator, Testindicator, "testindicator"
             )
         if version is not SENTINEL:
             self.version = version
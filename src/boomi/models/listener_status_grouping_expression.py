@@ -66,6 +66,6 @@ class ListenerStatusGroupingExpression(BaseModel):
                 nested_expression, ListenerStatusExpression
             )
         self.operator = self._enum_matching(
-            operator, ListenerStatusGroupingExpressionOperator.list(), "operator"
+            operator, ListenerStatusGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -119,9 +119,9 @@ class ListenerStatusSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ListenerStatusSimpleExpressionOperator.list(), "operator"
+            operator, ListenerStatusSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ListenerStatusSimpleExpressionProperty.list(), "property"
+            property, ListenerStatusSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -222,12 +222,12 @@ class MapExtensionsFunction(BaseModel):
         self.outputs = self._define_object(outputs, MapExtensionsOutputs)
         if cache_type is not SENTINEL:
             self.cache_type = self._enum_matching(
-                cache_type, MapExtensionsFunctionCacheType.list(), "cache_type"
+                cache_type, MapExtensionsFunctionCacheType, "cache_type"
             )
         if id_ is not SENTINEL:
             self.id_ = id_
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, MapExtensionsFunctionType.list(), "type_"
+                type_, MapExtensionsFunctionType, "type_"
             )
         self._kwargs = kwargs
@@ -230,7 +230,7 @@ class MapExtensionsFunctionStep(BaseModel):
         self.outputs = self._define_object(outputs, MapExtensionsOutputs)
         if cache_type is not SENTINEL:
             self.cache_type = self._enum_matching(
-                cache_type, MapExtensionsFunctionStepCacheType.list(), "cache_type"
+                cache_type, MapExtensionsFunctionStepCacheType, "cache_type"
             )
         if id_ is not SENTINEL:
             self.id_ = id_
@@ -238,6 +238,6 @@ class MapExtensionsFunctionStep(BaseModel):
             self.position = position
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, MapExtensionsFunctionStepType.list(), "type_"
+                type_, MapExtensionsFunctionStepType, "type_"
             )
         self._kwargs = kwargs
@@ -69,5 +69,5 @@ class MapExtensionsScripting(BaseModel):
         self.outputs = self._define_object(outputs, ScriptingOutputs)
         self.script = script
         if language is not SENTINEL:
-            self.language = self._enum_matching(language, Language.list(), "language")
+            self.language = self._enum_matching(language, Language, "language")
         self._kwargs = kwargs
@@ -337,7 +337,7 @@ class MergeRequest(BaseModel):
             self.locked_date = locked_date
         if merge_request_action is not SENTINEL:
             self.merge_request_action = self._enum_matching(
-                merge_request_action, MergeRequestAction.list(), "merge_request_action"
+                merge_request_action, MergeRequestAction, "merge_request_action"
             )
         if modified_by is not SENTINEL:
             self.modified_by = modified_by
@@ -347,18 +347,18 @@ class MergeRequest(BaseModel):
             self.note = note
         if previous_stage is not SENTINEL:
             self.previous_stage = self._enum_matching(
-                previous_stage, PreviousStage.list(), "previous_stage"
+                previous_stage, PreviousStage, "previous_stage"
             )
         if priority_branch is not SENTINEL:
             self.priority_branch = self._enum_matching(
-                priority_branch, PriorityBranch.list(), "priority_branch"
+                priority_branch, PriorityBranch, "priority_branch"
             )
         if source_branch_id is not SENTINEL:
             self.source_branch_id = source_branch_id
         if source_branch_name is not SENTINEL:
             self.source_branch_name = source_branch_name
         if stage is not SENTINEL:
-            self.stage = self._enum_matching(stage, MergeRequestStage.list(), "stage")
+            self.stage = self._enum_matching(stage, MergeRequestStage, "stage")
         if strategy is not SENTINEL:
-            self.strategy = self._enum_matching(strategy, Strategy.list(), "strategy")
+            self.strategy = self._enum_matching(strategy, Strategy, "strategy")
         self._kwargs = kwargs
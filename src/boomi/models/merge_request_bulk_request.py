@@ -69,6 +69,6 @@ class MergeRequestBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, MergeRequestBulkRequestType.list(), "type_"
+                type_, MergeRequestBulkRequestType, "type_"
             )
         self._kwargs = kwargs
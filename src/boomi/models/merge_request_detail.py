@@ -180,7 +180,7 @@ class MergeRequestDetail(BaseModel):
         """
         if change_type is not SENTINEL:
             self.change_type = self._enum_matching(
-                change_type, ChangeType.list(), "change_type"
+                change_type, ChangeType, "change_type"
             )
         if component_guid is not SENTINEL:
             self.component_guid = component_guid
@@ -204,12 +204,12 @@ class MergeRequestDetail(BaseModel):
             self.modified_date = modified_date
         if resolution is not SENTINEL:
             self.resolution = self._enum_matching(
-                resolution, Resolution.list(), "resolution"
+                resolution, Resolution, "resolution"
             )
         if source_revision is not SENTINEL:
             self.source_revision = source_revision
         if stage is not SENTINEL:
             self.stage = self._enum_matching(
-                stage, MergeRequestDetailStage.list(), "stage"
+                stage, MergeRequestDetailStage, "stage"
             )
         self._kwargs = kwargs
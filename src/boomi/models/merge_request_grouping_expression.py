@@ -66,6 +66,6 @@ class MergeRequestGroupingExpression(BaseModel):
                 nested_expression, MergeRequestExpression
             )
         self.operator = self._enum_matching(
-            operator, MergeRequestGroupingExpressionOperator.list(), "operator"
+            operator, MergeRequestGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
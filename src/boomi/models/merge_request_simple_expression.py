@@ -93,7 +93,7 @@ class MergeRequestSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, MergeRequestSimpleExpressionOperator.list(), "operator"
+            operator, MergeRequestSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -56,7 +56,7 @@ class ObservabilityEndpointAuthentication(BaseModel):
         :type fields: List[ObservabilityAuthenticationFields], optional
         """
         self.auth_type = self._enum_matching(
-            auth_type, AuthType.list(), "auth_type"
+            auth_type, AuthType, "auth_type"
         )
         if fields is not SENTINEL:
             self.fields = self._define_list(
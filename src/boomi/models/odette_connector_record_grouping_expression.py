@@ -68,6 +68,6 @@ class OdetteConnectorRecordGroupingExpression(BaseModel):
                 nested_expression, OdetteConnectorRecordExpression
             )
         self.operator = self._enum_matching(
-            operator, OdetteConnectorRecordGroupingExpressionOperator.list(), "operator"
+            operator, OdetteConnectorRecordGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
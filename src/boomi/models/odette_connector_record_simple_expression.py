@@ -78,7 +78,7 @@ class OdetteConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, OdetteConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, OdetteConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -159,7 +159,7 @@ class OdetteOptions(BaseModel):
         if acknowledgementoption is not SENTINEL:
             self.acknowledgementoption = self._enum_matching(
                 acknowledgementoption,
-                OdetteOptionsAcknowledgementoption.list(),
+                OdetteOptionsAcknowledgementoption,
                 "acknowledgementoption",
             )
         self.composite_delimiter = self._define_object(
@@ -168,7 +168,7 @@ class OdetteOptions(BaseModel):
         self.element_delimiter = self._define_object(element_delimiter, EdiDelimiter)
         if envelopeoption is not SENTINEL:
             self.envelopeoption = self._enum_matching(
-                envelopeoption, OdetteOptionsEnvelopeoption.list(), "envelopeoption"
+                envelopeoption, OdetteOptionsEnvelopeoption, "envelopeoption"
             )
         if filteracknowledgements is not SENTINEL:
             self.filteracknowledgements = filteracknowledgements
@@ -179,7 +179,7 @@ class OdetteOptions(BaseModel):
         if outbound_validation_option is not SENTINEL:
             self.outbound_validation_option = self._enum_matching(
                 outbound_validation_option,
-                OdetteOptionsOutboundValidationOption.list(),
+                OdetteOptionsOutboundValidationOption,
                 "outbound_validation_option",
             )
         if reject_duplicate_unb is not SENTINEL:
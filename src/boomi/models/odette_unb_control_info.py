@@ -411,37 +411,37 @@ class OdetteUnbControlInfo(BaseModel):
         if interchange_id_qual is not SENTINEL:
             self.interchange_id_qual = self._enum_matching(
                 interchange_id_qual,
-                OdetteUnbControlInfoInterchangeIdQual.list(),
+                OdetteUnbControlInfoInterchangeIdQual,
                 "interchange_id_qual",
             )
         if interchange_sub_address is not SENTINEL:
             self.interchange_sub_address = interchange_sub_address
         if priority is not SENTINEL:
             self.priority = self._enum_matching(
-                priority, OdetteUnbControlInfoPriority.list(), "priority"
+                priority, OdetteUnbControlInfoPriority, "priority"
             )
         if reference_password is not SENTINEL:
             self.reference_password = reference_password
         if reference_password_qualifier is not SENTINEL:
             self.reference_password_qualifier = self._enum_matching(
                 reference_password_qualifier,
-                OdetteUnbControlInfoReferencePasswordQualifier.list(),
+                OdetteUnbControlInfoReferencePasswordQualifier,
                 "reference_password_qualifier",
             )
         if syntax_id is not SENTINEL:
             self.syntax_id = self._enum_matching(
-                syntax_id, OdetteUnbControlInfoSyntaxId.list(), "syntax_id"
+                syntax_id, OdetteUnbControlInfoSyntaxId, "syntax_id"
             )
         if syntax_version is not SENTINEL:
             self.syntax_version = self._enum_matching(
                 syntax_version,
-                OdetteUnbControlInfoSyntaxVersion.list(),
+                OdetteUnbControlInfoSyntaxVersion,
                 "syntax_version",
             )
         if test_indicator is not SENTINEL:
             self.test_indicator = self._enum_matching(
                 test_indicator,
-                OdetteUnbControlInfoTestIndicator.list(),
+                OdetteUnbControlInfoTestIndicator,
                 "test_indicator",
             )
         self._kwargs = kwargs
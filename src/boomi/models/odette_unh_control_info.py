@@ -317,15 +317,15 @@ class OdetteUnhControlInfo(BaseModel):
         if controlling_agency is not SENTINEL:
             self.controlling_agency = self._enum_matching(
                 controlling_agency,
-                OdetteUnhControlInfoControllingAgency.list(),
+                OdetteUnhControlInfoControllingAgency,
                 "controlling_agency",
             )
         if release is not SENTINEL:
             self.release = self._enum_matching(
-                release, OdetteUnhControlInfoRelease.list(), "release"
+                release, OdetteUnhControlInfoRelease, "release"
             )
         if version is not SENTINEL:
             self.version = self._enum_matching(
-                version, OdetteUnhControlInfoVersion.list(), "version"
+                version, OdetteUnhControlInfoVersion, "version"
             )
         self._kwargs = kwargs
@@ -68,6 +68,6 @@ class Oftp2ConnectorRecordGroupingExpression(BaseModel):
                 nested_expression, Oftp2ConnectorRecordExpression
             )
         self.operator = self._enum_matching(
-            operator, Oftp2ConnectorRecordGroupingExpressionOperator.list(), "operator"
+            operator, Oftp2ConnectorRecordGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
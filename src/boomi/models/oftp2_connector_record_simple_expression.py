@@ -188,9 +188,9 @@ class Oftp2ConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, Oftp2ConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, Oftp2ConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, Oftp2ConnectorRecordSimpleExpressionProperty.list(), "property"
+            property, Oftp2ConnectorRecordSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
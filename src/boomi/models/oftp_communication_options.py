@@ -95,7 +95,7 @@ class OftpCommunicationOptions(BaseModel):
         if communication_setting is not SENTINEL:
             self.communication_setting = self._enum_matching(
                 communication_setting,
-                OftpCommunicationOptionsCommunicationSetting.list(),
+                OftpCommunicationOptionsCommunicationSetting,
                 "communication_setting",
             )
         if oftp_connection_settings is not SENTINEL:
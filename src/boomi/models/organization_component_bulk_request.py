@@ -67,6 +67,6 @@ class OrganizationComponentBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, OrganizationComponentBulkRequestType.list(), "type_"
+                type_, OrganizationComponentBulkRequestType, "type_"
             )
         self._kwargs = kwargs
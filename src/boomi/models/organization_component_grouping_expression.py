@@ -68,6 +68,6 @@ class OrganizationComponentGroupingExpression(BaseModel):
                 nested_expression, OrganizationComponentExpression
             )
         self.operator = self._enum_matching(
-            operator, OrganizationComponentGroupingExpressionOperator.list(), "operator"
+            operator, OrganizationComponentGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
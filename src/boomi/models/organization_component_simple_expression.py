@@ -125,9 +125,9 @@ class OrganizationComponentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, OrganizationComponentSimpleExpressionOperator.list(), "operator"
+            operator, OrganizationComponentSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, OrganizationComponentSimpleExpressionProperty.list(), "property"
+            property, OrganizationComponentSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class PackagedComponentBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, PackagedComponentBulkRequestType.list(), "type_"
+                type_, PackagedComponentBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class PackagedComponentGroupingExpression(BaseModel):
                 nested_expression, PackagedComponentExpression
             )
         self.operator = self._enum_matching(
-            operator, PackagedComponentGroupingExpressionOperator.list(), "operator"
+            operator, PackagedComponentGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class PackagedComponentManifestBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, PackagedComponentManifestBulkRequestType.list(), "type_"
+                type_, PackagedComponentManifestBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -93,7 +93,7 @@ class PackagedComponentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, PackagedComponentSimpleExpressionOperator.list(), "operator"
+            operator, PackagedComponentSimpleExpressionOperator, "operator"
         )
         self.property = property
         self._kwargs = kwargs
@@ -102,7 +102,7 @@ class PartnerDocumentType(BaseModel):
         if invalid_document_routing is not SENTINEL:
             self.invalid_document_routing = self._enum_matching(
                 invalid_document_routing,
-                InvalidDocumentRouting.list(),
+                InvalidDocumentRouting,
                 "invalid_document_routing",
             )
         if name is not SENTINEL:
@@ -68,6 +68,6 @@ class ProcessAtomAttachmentGroupingExpression(BaseModel):
                 nested_expression, ProcessAtomAttachmentExpression
             )
         self.operator = self._enum_matching(
-            operator, ProcessAtomAttachmentGroupingExpressionOperator.list(), "operator"
+            operator, ProcessAtomAttachmentGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
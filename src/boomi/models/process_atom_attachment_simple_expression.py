@@ -122,9 +122,9 @@ class ProcessAtomAttachmentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ProcessAtomAttachmentSimpleExpressionOperator.list(), "operator"
+            operator, ProcessAtomAttachmentSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ProcessAtomAttachmentSimpleExpressionProperty.list(), "property"
+            property, ProcessAtomAttachmentSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -64,6 +64,6 @@ class ProcessBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ProcessBulkRequestType.list(), "type_"
+                type_, ProcessBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class ProcessEnvironmentAttachmentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            ProcessEnvironmentAttachmentGroupingExpressionOperator.list(),
+            ProcessEnvironmentAttachmentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -123,12 +123,12 @@ class ProcessEnvironmentAttachmentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            ProcessEnvironmentAttachmentSimpleExpressionOperator.list(),
+            ProcessEnvironmentAttachmentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            ProcessEnvironmentAttachmentSimpleExpressionProperty.list(),
+            ProcessEnvironmentAttachmentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class ProcessGroupingExpression(BaseModel):
                 nested_expression, ProcessExpression
             )
         self.operator = self._enum_matching(
-            operator, ProcessGroupingExpressionOperator.list(), "operator"
+            operator, ProcessGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
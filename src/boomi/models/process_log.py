@@ -68,6 +68,6 @@ class ProcessLog(BaseModel):
             self.execution_id = execution_id
         if log_level is not SENTINEL:
             self.log_level = self._enum_matching(
-                log_level, LogLevel.list(), "log_level"
+                log_level, LogLevel, "log_level"
             )
         self._kwargs = kwargs
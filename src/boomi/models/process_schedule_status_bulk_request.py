@@ -67,6 +67,6 @@ class ProcessScheduleStatusBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ProcessScheduleStatusBulkRequestType.list(), "type_"
+                type_, ProcessScheduleStatusBulkRequestType, "type_"
             )
         self._kwargs = kwargs
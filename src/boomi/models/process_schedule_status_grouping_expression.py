@@ -68,6 +68,6 @@ class ProcessScheduleStatusGroupingExpression(BaseModel):
                 nested_expression, ProcessScheduleStatusExpression
             )
         self.operator = self._enum_matching(
-            operator, ProcessScheduleStatusGroupingExpressionOperator.list(), "operator"
+            operator, ProcessScheduleStatusGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -119,9 +119,9 @@ class ProcessScheduleStatusSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ProcessScheduleStatusSimpleExpressionOperator.list(), "operator"
+            operator, ProcessScheduleStatusSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ProcessScheduleStatusSimpleExpressionProperty.list(), "property"
+            property, ProcessScheduleStatusSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
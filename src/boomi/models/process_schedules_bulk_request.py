@@ -66,6 +66,6 @@ class ProcessSchedulesBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ProcessSchedulesBulkRequestType.list(), "type_"
+                type_, ProcessSchedulesBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class ProcessSchedulesGroupingExpression(BaseModel):
                 nested_expression, ProcessSchedulesExpression
             )
         self.operator = self._enum_matching(
-            operator, ProcessSchedulesGroupingExpressionOperator.list(), "operator"
+            operator, ProcessSchedulesGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
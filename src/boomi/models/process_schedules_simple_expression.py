@@ -119,9 +119,9 @@ class ProcessSchedulesSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ProcessSchedulesSimpleExpressionOperator.list(), "operator"
+            operator, ProcessSchedulesSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ProcessSchedulesSimpleExpressionProperty.list(), "property"
+            property, ProcessSchedulesSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -123,9 +123,9 @@ class ProcessSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ProcessSimpleExpressionOperator.list(), "operator"
+            operator, ProcessSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ProcessSimpleExpressionProperty.list(), "property"
+            property, ProcessSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -86,7 +86,7 @@ class ProcessingGroupDocumentStandardRoute(BaseModel):
         if standard is not SENTINEL:
             self.standard = self._enum_matching(
                 standard,
-                ProcessingGroupDocumentStandardRouteStandard.list(),
+                ProcessingGroupDocumentStandardRouteStandard,
                 "standard",
             )
         self._kwargs = kwargs
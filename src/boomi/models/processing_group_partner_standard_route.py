@@ -85,6 +85,6 @@ class ProcessingGroupPartnerStandardRoute(BaseModel):
             self.process_id = process_id
         if standard is not SENTINEL:
             self.standard = self._enum_matching(
-                standard, ProcessingGroupPartnerStandardRouteStandard.list(), "standard"
+                standard, ProcessingGroupPartnerStandardRouteStandard, "standard"
             )
         self._kwargs = kwargs
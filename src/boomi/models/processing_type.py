@@ -84,10 +84,10 @@ class ProcessingType(BaseModel):
         """
         if processing_id is not SENTINEL:
             self.processing_id = self._enum_matching(
-                processing_id, ProcessingId.list(), "processing_id"
+                processing_id, ProcessingId, "processing_id"
             )
         if processing_mode is not SENTINEL:
             self.processing_mode = self._enum_matching(
-                processing_mode, ProcessingMode.list(), "processing_mode"
+                processing_mode, ProcessingMode, "processing_mode"
             )
         self._kwargs = kwargs
@@ -115,13 +115,13 @@ class PublisherIntegrationPack(BaseModel):
         if installation_type is not SENTINEL:
             self.installation_type = self._enum_matching(
                 installation_type,
-                PublisherIntegrationPackInstallationType.list(),
+                PublisherIntegrationPackInstallationType,
                 "installation_type",
             )
         if name is not SENTINEL:
             self.name = name
         if operation_type is not SENTINEL:
             self.operation_type = self._enum_matching(
-                operation_type, OperationType.list(), "operation_type"
+                operation_type, OperationType, "operation_type"
             )
         self._kwargs = kwargs
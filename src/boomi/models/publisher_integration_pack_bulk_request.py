@@ -67,6 +67,6 @@ class PublisherIntegrationPackBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, PublisherIntegrationPackBulkRequestType.list(), "type_"
+                type_, PublisherIntegrationPackBulkRequestType, "type_"
             )
         self._kwargs = kwargs
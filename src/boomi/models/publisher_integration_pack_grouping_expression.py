@@ -76,7 +76,7 @@ class PublisherIntegrationPackGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            PublisherIntegrationPackGroupingExpressionOperator.list(),
+            PublisherIntegrationPackGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
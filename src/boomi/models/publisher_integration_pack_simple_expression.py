@@ -123,12 +123,12 @@ class PublisherIntegrationPackSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            PublisherIntegrationPackSimpleExpressionOperator.list(),
+            PublisherIntegrationPackSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            PublisherIntegrationPackSimpleExpressionProperty.list(),
+            PublisherIntegrationPackSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -79,7 +79,7 @@ class References(BaseModel):
         if parent_version is not SENTINEL:
             self.parent_version = parent_version
         if type_ is not SENTINEL:
-            self.type_ = self._enum_matching(type_, ReferencesType.list(), "type_")
+            self.type_ = self._enum_matching(type_, ReferencesType, "type_")
         if branch_id is not SENTINEL:
             self.branch_id = branch_id
         self._kwargs = kwargs
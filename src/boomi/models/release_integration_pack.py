@@ -131,7 +131,7 @@ class ReleaseIntegrationPack(BaseModel):
         if installation_type is not SENTINEL:
             self.installation_type = self._enum_matching(
                 installation_type,
-                ReleaseIntegrationPackInstallationType.list(),
+                ReleaseIntegrationPackInstallationType,
                 "installation_type",
             )
         if name is not SENTINEL:
@@ -141,7 +141,7 @@ class ReleaseIntegrationPack(BaseModel):
         if release_schedule is not SENTINEL:
             self.release_schedule = self._enum_matching(
                 release_schedule,
-                ReleaseIntegrationPackReleaseSchedule.list(),
+                ReleaseIntegrationPackReleaseSchedule,
                 "release_schedule",
             )
         if release_status_url is not SENTINEL:
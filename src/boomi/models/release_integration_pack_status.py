@@ -162,7 +162,7 @@ class ReleaseIntegrationPackStatus(BaseModel):
         if installation_type is not SENTINEL:
             self.installation_type = self._enum_matching(
                 installation_type,
-                ReleaseIntegrationPackStatusInstallationType.list(),
+                ReleaseIntegrationPackStatusInstallationType,
                 "installation_type",
             )
         if integration_pack_id is not SENTINEL:
@@ -174,12 +174,12 @@ class ReleaseIntegrationPackStatus(BaseModel):
         if release_schedule is not SENTINEL:
             self.release_schedule = self._enum_matching(
                 release_schedule,
-                ReleaseIntegrationPackStatusReleaseSchedule.list(),
+                ReleaseIntegrationPackStatusReleaseSchedule,
                 "release_schedule",
             )
         if release_status is not SENTINEL:
             self.release_status = self._enum_matching(
-                release_status, ReleaseStatus.list(), "release_status"
+                release_status, ReleaseStatus, "release_status"
             )
         if request_id is not SENTINEL:
             self.request_id = request_id
@@ -67,6 +67,6 @@ class ReleaseIntegrationPackStatusBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, ReleaseIntegrationPackStatusBulkRequestType.list(), "type_"
+                type_, ReleaseIntegrationPackStatusBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -74,7 +74,7 @@ class Resource(BaseModel):
         """
         if object_type is not SENTINEL:
             self.object_type = self._enum_matching(
-                object_type, ObjectType.list(), "object_type"
+                object_type, ObjectType, "object_type"
             )
         self.resource_id = resource_id
         self.resource_name = resource_name
@@ -63,6 +63,6 @@ class RoleGroupingExpression(BaseModel):
                 nested_expression, RoleExpression
             )
         self.operator = self._enum_matching(
-            operator, RoleGroupingExpressionOperator.list(), "operator"
+            operator, RoleGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
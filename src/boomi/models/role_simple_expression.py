@@ -113,9 +113,9 @@ class RoleSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, RoleSimpleExpressionOperator.list(), "operator"
+            operator, RoleSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, RoleSimpleExpressionProperty.list(), "property"
+            property, RoleSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
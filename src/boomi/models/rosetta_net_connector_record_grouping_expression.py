@@ -69,7 +69,7 @@ class RosettaNetConnectorRecordGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            RosettaNetConnectorRecordGroupingExpressionOperator.list(),
+            RosettaNetConnectorRecordGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -225,12 +225,12 @@ class RosettaNetConnectorRecordSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            RosettaNetConnectorRecordSimpleExpressionOperator.list(),
+            RosettaNetConnectorRecordSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            RosettaNetConnectorRecordSimpleExpressionProperty.list(),
+            RosettaNetConnectorRecordSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -118,13 +118,13 @@ class RosettaNetControlInfo(BaseModel):
             self.global_partner_classification_code = global_partner_classification_code
         if global_usage_code is not SENTINEL:
             self.global_usage_code = self._enum_matching(
-                global_usage_code, GlobalUsageCode.list(), "global_usage_code"
+                global_usage_code, GlobalUsageCode, "global_usage_code"
             )
         if partner_id is not SENTINEL:
             self.partner_id = partner_id
         if partner_id_type is not SENTINEL:
             self.partner_id_type = self._enum_matching(
-                partner_id_type, PartnerIdType.list(), "partner_id_type"
+                partner_id_type, PartnerIdType, "partner_id_type"
             )
         if partner_location is not SENTINEL:
             self.partner_location = partner_location
@@ -175,7 +175,7 @@ class RosettaNetMessageOptions(BaseModel):
         if content_transfer_encoding is not SENTINEL:
             self.content_transfer_encoding = self._enum_matching(
                 content_transfer_encoding,
-                ContentTransferEncoding.list(),
+                ContentTransferEncoding,
                 "content_transfer_encoding",
             )
         if encrypt_service_header is not SENTINEL:
@@ -185,13 +185,13 @@ class RosettaNetMessageOptions(BaseModel):
         if encryption_algorithm is not SENTINEL:
             self.encryption_algorithm = self._enum_matching(
                 encryption_algorithm,
-                RosettaNetMessageOptionsEncryptionAlgorithm.list(),
+                RosettaNetMessageOptionsEncryptionAlgorithm,
                 "encryption_algorithm",
             )
         if signature_digest_algorithm is not SENTINEL:
             self.signature_digest_algorithm = self._enum_matching(
                 signature_digest_algorithm,
-                SignatureDigestAlgorithm.list(),
+                SignatureDigestAlgorithm,
                 "signature_digest_algorithm",
             )
         if signed is not SENTINEL:
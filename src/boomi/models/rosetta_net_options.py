@@ -75,6 +75,6 @@ class RosettaNetOptions(BaseModel):
             self.reject_duplicate_transactions = reject_duplicate_transactions
         if version is not SENTINEL:
             self.version = self._enum_matching(
-                version, RosettaNetOptionsVersion.list(), "version"
+                version, RosettaNetOptionsVersion, "version"
             )
         self._kwargs = kwargs
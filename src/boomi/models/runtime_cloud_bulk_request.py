@@ -62,6 +62,6 @@ class RuntimeCloudBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, RuntimeCloudBulkRequestType.list(), "type_"
+                type_, RuntimeCloudBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -65,6 +65,6 @@ class RuntimeCloudGroupingExpression(BaseModel):
                 nested_expression, RuntimeCloudExpression
             )
         self.operator = self._enum_matching(
-            operator, RuntimeCloudGroupingExpressionOperator.list(), "operator"
+            operator, RuntimeCloudGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -140,9 +140,9 @@ class RuntimeCloudSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, RuntimeCloudSimpleExpressionOperator.list(), "operator"
+            operator, RuntimeCloudSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, RuntimeCloudSimpleExpressionProperty.list(), "property"
+            property, RuntimeCloudSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
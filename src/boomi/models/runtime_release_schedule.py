@@ -83,7 +83,7 @@ class RuntimeReleaseSchedule(BaseModel):
             self.hour_of_day = hour_of_day
         if schedule_type is not SENTINEL:
             self.schedule_type = self._enum_matching(
-                schedule_type, ScheduleType.list(), "schedule_type"
+                schedule_type, ScheduleType, "schedule_type"
             )
         if time_zone is not SENTINEL:
             self.time_zone = time_zone
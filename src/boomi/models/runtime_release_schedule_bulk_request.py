@@ -67,6 +67,6 @@ class RuntimeReleaseScheduleBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, RuntimeReleaseScheduleBulkRequestType.list(), "type_"
+                type_, RuntimeReleaseScheduleBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -62,7 +62,7 @@ class ScriptingParameter(BaseModel):
         """
         if data_type is not SENTINEL:
             self.data_type = self._enum_matching(
-                data_type, DataType.list(), "data_type"
+                data_type, DataType, "data_type"
             )
         if index is not SENTINEL:
             self.index = index
@@ -41,5 +41,5 @@ class SecretsManagerRefreshRequest(BaseModel):
         :type provider: Provider, optional
         """
         if provider is not SENTINEL:
-            self.provider = self._enum_matching(provider, Provider.list(), "provider")
+            self.provider = self._enum_matching(provider, Provider, "provider")
         self._kwargs = kwargs
@@ -88,7 +88,7 @@ class SftpCommunicationOptions(BaseModel):
         if communication_setting is not SENTINEL:
             self.communication_setting = self._enum_matching(
                 communication_setting,
-                SftpCommunicationOptionsCommunicationSetting.list(),
+                SftpCommunicationOptionsCommunicationSetting,
                 "communication_setting",
             )
         if sftp_get_options is not SENTINEL:
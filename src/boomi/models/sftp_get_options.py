@@ -93,7 +93,7 @@ class SftpGetOptions(BaseModel):
             self.file_to_move = file_to_move
         if ftp_action is not SENTINEL:
             self.ftp_action = self._enum_matching(
-                ftp_action, SftpGetOptionsFtpAction.list(), "ftp_action"
+                ftp_action, SftpGetOptionsFtpAction, "ftp_action"
             )
         if max_file_count is not SENTINEL:
             self.max_file_count = max_file_count
@@ -82,7 +82,7 @@ class SftpProxySettings(BaseModel):
             self.proxy_enabled = proxy_enabled
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, SftpProxySettingsType.list(), "type_"
+                type_, SftpProxySettingsType, "type_"
             )
         self.user = user
         self._kwargs = kwargs
@@ -82,7 +82,7 @@ class SftpSendOptions(BaseModel):
         """
         if ftp_action is not SENTINEL:
             self.ftp_action = self._enum_matching(
-                ftp_action, SftpSendOptionsFtpAction.list(), "ftp_action"
+                ftp_action, SftpSendOptionsFtpAction, "ftp_action"
             )
         if move_to_directory is not SENTINEL:
             self.move_to_directory = move_to_directory
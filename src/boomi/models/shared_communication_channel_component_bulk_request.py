@@ -68,7 +68,7 @@ class SharedCommunicationChannelComponentBulkRequest(BaseModel):
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
                 type_,
-                SharedCommunicationChannelComponentBulkRequestType.list(),
+                SharedCommunicationChannelComponentBulkRequestType,
                 "type_",
             )
         self._kwargs = kwargs
@@ -71,7 +71,7 @@ class SharedCommunicationChannelComponentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            SharedCommunicationChannelComponentGroupingExpressionOperator.list(),
+            SharedCommunicationChannelComponentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -120,12 +120,12 @@ class SharedCommunicationChannelComponentSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            SharedCommunicationChannelComponentSimpleExpressionOperator.list(),
+            SharedCommunicationChannelComponentSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            SharedCommunicationChannelComponentSimpleExpressionProperty.list(),
+            SharedCommunicationChannelComponentSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
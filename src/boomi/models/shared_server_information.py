@@ -182,11 +182,11 @@ class SharedServerInformation(BaseModel):
         :type url: str, optional
         """
         if api_type is not SENTINEL:
-            self.api_type = self._enum_matching(api_type, ApiType.list(), "api_type")
+            self.api_type = self._enum_matching(api_type, ApiType, "api_type")
         if atom_id is not SENTINEL:
             self.atom_id = atom_id
         if auth is not SENTINEL:
-            self.auth = self._enum_matching(auth, Auth.list(), "auth")
+            self.auth = self._enum_matching(auth, Auth, "auth")
         if auth_token is not SENTINEL:
             self.auth_token = auth_token
         if check_forwarded_headers is not SENTINEL:
@@ -206,7 +206,7 @@ class SharedServerInformation(BaseModel):
         if max_threads is not SENTINEL:
             self.max_threads = max_threads
         if min_auth is not SENTINEL:
-            self.min_auth = self._enum_matching(min_auth, MinAuth.list(), "min_auth")
+            self.min_auth = self._enum_matching(min_auth, MinAuth, "min_auth")
         if override_url is not SENTINEL:
             self.override_url = override_url
         if ssl_certificate_id is not SENTINEL:
@@ -67,6 +67,6 @@ class SharedServerInformationBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, SharedServerInformationBulkRequestType.list(), "type_"
+                type_, SharedServerInformationBulkRequestType, "type_"
             )
         self._kwargs = kwargs
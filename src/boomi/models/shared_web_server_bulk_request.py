@@ -64,6 +64,6 @@ class SharedWebServerBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, SharedWebServerBulkRequestType.list(), "type_"
+                type_, SharedWebServerBulkRequestType, "type_"
             )
         self._kwargs = kwargs
@@ -756,7 +756,7 @@ class StandardProperties(BaseModel):
         if cluster_network_transport_type is not SENTINEL:
             self.cluster_network_transport_type = self._enum_matching(
                 cluster_network_transport_type,
-                ClusterNetworkTransportType.list(),
+                ClusterNetworkTransportType,
                 "cluster_network_transport_type",
             )
         if cluster_problem_automatic_delete_delay is not SENTINEL:
@@ -828,7 +828,7 @@ class StandardProperties(BaseModel):
         if debug_log_level_threshold is not SENTINEL:
             self.debug_log_level_threshold = self._enum_matching(
                 debug_log_level_threshold,
-                DebugLogLevelThreshold.list(),
+                DebugLogLevelThreshold,
                 "debug_log_level_threshold",
             )
         if debug_logging is not SENTINEL:
@@ -874,7 +874,7 @@ class StandardProperties(BaseModel):
         if execute_processes_as_forked_jvms is not SENTINEL:
             self.execute_processes_as_forked_jvms = self._enum_matching(
                 execute_processes_as_forked_jvms,
-                ExecuteProcessesAsForkedJvms.list(),
+                ExecuteProcessesAsForkedJvms,
                 "execute_processes_as_forked_jvms",
             )
         if execution_worker_idle_timeout is not SENTINEL:
@@ -914,7 +914,7 @@ class StandardProperties(BaseModel):
         if listener_startup_mode is not SENTINEL:
             self.listener_startup_mode = self._enum_matching(
                 listener_startup_mode,
-                ListenerStartupMode.list(),
+                ListenerStartupMode,
                 "listener_startup_mode",
             )
         if logger_queue_size is not SENTINEL:
@@ -1033,7 +1033,7 @@ class StandardProperties(BaseModel):
             )
         if security_policy is not SENTINEL:
             self.security_policy = self._enum_matching(
-                security_policy, SecurityPolicy.list(), "security_policy"
+                security_policy, SecurityPolicy, "security_policy"
             )
         if sequential_processing_of_custom_script_engine_data is not SENTINEL:
             self.sequential_processing_of_custom_script_engine_data = (
@@ -1046,7 +1046,7 @@ class StandardProperties(BaseModel):
         if standard_error_log_level is not SENTINEL:
             self.standard_error_log_level = self._enum_matching(
                 standard_error_log_level,
-                StandardErrorLogLevel.list(),
+                StandardErrorLogLevel,
                 "standard_error_log_level",
             )
         if standard_output_and_error_logging is not SENTINEL:
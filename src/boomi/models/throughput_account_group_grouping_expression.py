@@ -69,7 +69,7 @@ class ThroughputAccountGroupGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            ThroughputAccountGroupGroupingExpressionOperator.list(),
+            ThroughputAccountGroupGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
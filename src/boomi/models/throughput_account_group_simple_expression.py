@@ -119,9 +119,9 @@ class ThroughputAccountGroupSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ThroughputAccountGroupSimpleExpressionOperator.list(), "operator"
+            operator, ThroughputAccountGroupSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ThroughputAccountGroupSimpleExpressionProperty.list(), "property"
+            property, ThroughputAccountGroupSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -66,6 +66,6 @@ class ThroughputAccountGroupingExpression(BaseModel):
                 nested_expression, ThroughputAccountExpression
             )
         self.operator = self._enum_matching(
-            operator, ThroughputAccountGroupingExpressionOperator.list(), "operator"
+            operator, ThroughputAccountGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
@@ -122,9 +122,9 @@ class ThroughputAccountSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, ThroughputAccountSimpleExpressionOperator.list(), "operator"
+            operator, ThroughputAccountSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, ThroughputAccountSimpleExpressionProperty.list(), "property"
+            property, ThroughputAccountSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -69,7 +69,7 @@ class TradacomsConnectorRecordGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            TradacomsConnectorRecordGroupingExpressionOperator.list(),
+            TradacomsConnectorRecordGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
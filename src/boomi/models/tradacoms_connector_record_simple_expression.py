@@ -174,12 +174,12 @@ class TradacomsConnectorRecordSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            TradacomsConnectorRecordSimpleExpressionOperator.list(),
+            TradacomsConnectorRecordSimpleExpressionOperator,
             "operator",
         )
         self.property = self._enum_matching(
             property,
-            TradacomsConnectorRecordSimpleExpressionProperty.list(),
+            TradacomsConnectorRecordSimpleExpressionProperty,
             "property",
         )
         self._kwargs = kwargs
@@ -207,7 +207,7 @@ class TradingPartnerComponent(BaseModel):
         if classification is not SENTINEL:
             self.classification = self._enum_matching(
                 classification,
-                TradingPartnerComponentClassification.list(),
+                TradingPartnerComponentClassification,
                 "classification",
             )
         if component_id is not SENTINEL:
@@ -228,7 +228,7 @@ class TradingPartnerComponent(BaseModel):
             self.organization_id = organization_id
         if standard is not SENTINEL:
             self.standard = self._enum_matching(
-                standard, TradingPartnerComponentStandard.list(), "standard"
+                standard, TradingPartnerComponentStandard, "standard"
             )
         if branch_id is not SENTINEL:
             self.branch_id = branch_id
@@ -67,6 +67,6 @@ class TradingPartnerComponentBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, TradingPartnerComponentBulkRequestType.list(), "type_"
+                type_, TradingPartnerComponentBulkRequestType, "type_"
             )
         self._kwargs = kwargs
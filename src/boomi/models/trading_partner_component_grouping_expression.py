@@ -69,7 +69,7 @@ class TradingPartnerComponentGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            TradingPartnerComponentGroupingExpressionOperator.list(),
+            TradingPartnerComponentGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -146,9 +146,9 @@ class TradingPartnerComponentSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, TradingPartnerComponentSimpleExpressionOperator.list(), "operator"
+            operator, TradingPartnerComponentSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, TradingPartnerComponentSimpleExpressionProperty.list(), "property"
+            property, TradingPartnerComponentSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -67,6 +67,6 @@ class TradingPartnerProcessingGroupBulkRequest(BaseModel):
             self.request = self._define_list(request, BulkId)
         if type_ is not SENTINEL:
             self.type_ = self._enum_matching(
-                type_, TradingPartnerProcessingGroupBulkRequestType.list(), "type_"
+                type_, TradingPartnerProcessingGroupBulkRequestType, "type_"
             )
         self._kwargs = kwargs
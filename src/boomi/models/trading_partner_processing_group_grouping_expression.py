@@ -69,7 +69,7 @@ class TradingPartnerProcessingGroupGroupingExpression(BaseModel):
             )
         self.operator = self._enum_matching(
             operator,
-            TradingPartnerProcessingGroupGroupingExpressionOperator.list(),
+            TradingPartnerProcessingGroupGroupingExpressionOperator,
             "operator",
         )
         self._kwargs = kwargs
@@ -94,7 +94,7 @@ class TradingPartnerProcessingGroupSimpleExpression(BaseModel):
             self.argument = argument
         self.operator = self._enum_matching(
             operator,
-            TradingPartnerProcessingGroupSimpleExpressionOperator.list(),
+            TradingPartnerProcessingGroupSimpleExpressionOperator,
             "operator",
         )
         self.property = property
@@ -404,33 +404,33 @@ class UnbControlInfo(BaseModel):
         if interchange_id_qual is not SENTINEL:
             self.interchange_id_qual = self._enum_matching(
                 interchange_id_qual,
-                UnbControlInfoInterchangeIdQual.list(),
+                UnbControlInfoInterchangeIdQual,
                 "interchange_id_qual",
             )
         if interchange_sub_address is not SENTINEL:
             self.interchange_sub_address = interchange_sub_address
         if priority is not SENTINEL:
             self.priority = self._enum_matching(
-                priority, UnbControlInfoPriority.list(), "priority"
+                priority, UnbControlInfoPriority, "priority"
             )
         if reference_password is not SENTINEL:
             self.reference_password = reference_password
         if reference_password_qualifier is not SENTINEL:
             self.reference_password_qualifier = self._enum_matching(
                 reference_password_qualifier,
-                UnbControlInfoReferencePasswordQualifier.list(),
+                UnbControlInfoReferencePasswordQualifier,
                 "reference_password_qualifier",
             )
         if syntax_id is not SENTINEL:
             self.syntax_id = self._enum_matching(
-                syntax_id, UnbControlInfoSyntaxId.list(), "syntax_id"
+                syntax_id, UnbControlInfoSyntaxId, "syntax_id"
             )
         if syntax_version is not SENTINEL:
             self.syntax_version = self._enum_matching(
-                syntax_version, UnbControlInfoSyntaxVersion.list(), "syntax_version"
+                syntax_version, UnbControlInfoSyntaxVersion, "syntax_version"
             )
         if test_indicator is not SENTINEL:
             self.test_indicator = self._enum_matching(
-                test_indicator, UnbControlInfoTestIndicator.list(), "test_indicator"
+                test_indicator, UnbControlInfoTestIndicator, "test_indicator"
             )
         self._kwargs = kwargs
@@ -196,7 +196,7 @@ class UngControlInfo(BaseModel):
             self.application_id = application_id
         if application_id_qual is not SENTINEL:
             self.application_id_qual = self._enum_matching(
-                application_id_qual, ApplicationIdQual.list(), "application_id_qual"
+                application_id_qual, ApplicationIdQual, "application_id_qual"
             )
         if use_functional_groups is not SENTINEL:
             self.use_functional_groups = use_functional_groups
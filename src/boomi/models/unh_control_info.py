@@ -312,15 +312,15 @@ class UnhControlInfo(BaseModel):
         if controlling_agency is not SENTINEL:
             self.controlling_agency = self._enum_matching(
                 controlling_agency,
-                UnhControlInfoControllingAgency.list(),
+                UnhControlInfoControllingAgency,
                 "controlling_agency",
             )
         if release is not SENTINEL:
             self.release = self._enum_matching(
-                release, UnhControlInfoRelease.list(), "release"
+                release, UnhControlInfoRelease, "release"
             )
         if version is not SENTINEL:
             self.version = self._enum_matching(
-                version, UnhControlInfoVersion.list(), "version"
+                version, UnhControlInfoVersion, "version"
             )
         self._kwargs = kwargs
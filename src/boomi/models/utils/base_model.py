@@ -1,7 +1,8 @@
 
 import re
 import operator
-from typing import List, Union, Type, Any, TypeVar, Optional
+from functools import lru_cache
+from typing import Collection, Dict, List, Union, Type, Any, TypeVar, Optional
 from enum import Enum
 from .one_of_base_model import OneOfBaseModel
 from .sentinel import SENTINEL
@@ -9,6 +10,28 @@ from .sentinel import SENTINEL
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def _compiled_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a field pattern once; the models share a small, fixed set."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_class: Type[Enum]) -> Dict[str, None]:
+    """The values of an enum in definition order, with constant-time lookups."""
+    return dict.fromkeys(enum_class.list())
+
+
+@lru_cache(maxsize=None)
+def _class_map(union_type: Any) -> Dict[str, Any]:
+    """Map class names to the classes of a Union type, once per type."""
+    class_map = {}
+    for arg in union_type.__args__:
+        if arg.__name__:
+            class_map[arg.__name__] = arg
+    return class_map
+
+
 class BaseModel:
     """
     A base class that most of the models in the SDK inherited from.
@@ -69,22 +92,28 @@ class BaseModel:
         if isinstance(input_data, dict):
             input_data = [input_data]
 
+        # The kind of list_class is resolved once, not per item.
         result: List[T] = []
-        for item in input_data:
-            if hasattr(list_class, "__args__") and len(list_class.__args__) > 0:
-                class_list = self.__create_class_map(list_class)
+        if hasattr(list_class, "__args__") and len(list_class.__args__) > 0:
+            class_list = self.__create_class_map(list_class)
+            for item in input_data:
+                # Set for every item: nested oneOf models replace the class list.
                 OneOfBaseModel.class_list = class_list
                 result.append(OneOfBaseModel.return_one_of(item))
-            elif issubclass(list_class, Enum):
+        elif issubclass(list_class, Enum):
+            enum_values = _enum_values(list_class)
+            for item in input_data:
                 result.append(
-                    self._enum_matching(item, list_class.list(), list_class.__name__)
+                    self._enum_matching(item, enum_values, list_class.__name__)
                 )
-            elif isinstance(item, list_class):
-                result.append(item)
-            elif isinstance(item, dict):
-                result.append(list_class._unmap(item))
-            else:
-                result.append(list_class(item))
+        else:
+            for item in input_data:
+                if isinstance(item, list_class):
+                    result.append(item)
+                elif isinstance(item, dict):
+                    result.append(list_class._unmap(item))
+                else:
+                    result.append(list_class(item))
         return result
 
     def _define_str(
@@ -293,7 +322,7 @@ class BaseModel:
         if value is None:
             return None
 
-        if re.match(r"{}".format(pattern), value):
+        if _compiled_pattern(pattern).match(value):
             return value
         else:
             raise ValueError(
@@ -301,15 +330,18 @@ class BaseModel:
             )
 
     def _enum_matching(
-        self, value: Union[str, Enum], enum_values: List[str], variable_name: str
+        self,
+        value: Union[str, Enum],
+        enum_values: Union[Type[Enum], Collection[str]],
+        variable_name: str,
     ) -> Union[str, Enum]:
         """
         Checks if a value (str or enum) matches the required enum values and returns the value if there's a match.
 
         :param value: The value to be checked.
         :type value: Union[str, Enum]
-        :param enum_values: The list of valid enum values.
-        :type enum_values: List[str]
+        :param enum_values: The enum class, or its valid values.
+        :type enum_values: Union[Type[Enum], Collection[str]]
         :param variable_name: The variable name.
         :type variable_name: str
         :return: The value if it matches one of the enum values.
@@ -319,12 +351,17 @@ class BaseModel:
         if value is None:
             return None
 
+        if isinstance(enum_values, type):
+            if isinstance(value, enum_values):
+                return value
+            enum_values = _enum_values(enum_values)
+
         str_value = value.value if isinstance(value, Enum) else value
         if str_value in enum_values:
             return value
         else:
             raise ValueError(
-                f"Invalid value for {variable_name}: must match one of {enum_values}, received {value}"
+                f"Invalid value for {variable_name}: must match one of {list(enum_values)}, received {value}"
             )
 
     def _get_representation(self, level: int = 0) -> str:
@@ -368,8 +405,4 @@ class BaseModel:
         :return: A dictionary mapping class names to classes.
         :rtype: dict
         """
-        class_map = {}
-        for arg in union_type.__args__:
-            if arg.__name__:
-                class_map[arg.__name__] = arg
-        return class_map
+        return _class_map(union_type)
@@ -1,9 +1,16 @@
 
+from functools import lru_cache
 from typing import Any, List, Dict, Optional, Union, Type, TypeVar, get_origin, get_args
 
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def _get_origin(class_constructor: Any) -> Any:
+    """``typing.get_origin`` of a oneOf member, resolved once per member."""
+    return get_origin(class_constructor)
+
+
 class OneOfBaseModel:
     """
     A base class for handling 'oneOf' models where multiple class constructors are available,
@@ -42,6 +49,9 @@ class OneOfBaseModel:
             except Exception as e:
                 exception_list.append({"class": class_constructor, "exception": e})
 
+        # A single match needs no attribute count (which maps the instance).
+        if len(success_list) == 1:
+            return success_list[0]
         if success_list:
             return max(success_list, key=cls._count_non_none_attributes)
 
@@ -70,7 +80,7 @@ class OneOfBaseModel:
             or can be used to initialize the class, None otherwise.
         """
         # Check if the class is only a TypeHint.
-        origin = get_origin(class_constructor)
+        origin = _get_origin(class_constructor)
         if origin is not None and isinstance(input_data, list):
             list_instance = cls._get_list_instance(
                 input_data, class_constructor, origin
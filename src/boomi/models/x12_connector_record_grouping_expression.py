@@ -66,6 +66,6 @@ class X12ConnectorRecordGroupingExpression(BaseModel):
                 nested_expression, X12ConnectorRecordExpression
             )
         self.operator = self._enum_matching(
-            operator, X12ConnectorRecordGroupingExpressionOperator.list(), "operator"
+            operator, X12ConnectorRecordGroupingExpressionOperator, "operator"
         )
         self._kwargs = kwargs
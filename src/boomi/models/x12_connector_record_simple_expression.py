@@ -206,9 +206,9 @@ class X12ConnectorRecordSimpleExpression(BaseModel):
         if argument is not SENTINEL:
             self.argument = argument
         self.operator = self._enum_matching(
-            operator, X12ConnectorRecordSimpleExpressionOperator.list(), "operator"
+            operator, X12ConnectorRecordSimpleExpressionOperator, "operator"
         )
         self.property = self._enum_matching(
-            property, X12ConnectorRecordSimpleExpressionProperty.list(), "property"
+            property, X12ConnectorRecordSimpleExpressionProperty, "property"
         )
         self._kwargs = kwargs
@@ -152,14 +152,14 @@ class X12Options(BaseModel):
         if acknowledgementoption is not SENTINEL:
             self.acknowledgementoption = self._enum_matching(
                 acknowledgementoption,
-                X12OptionsAcknowledgementoption.list(),
+                X12OptionsAcknowledgementoption,
                 "acknowledgementoption",
             )
         if element_delimiter is not SENTINEL:
             self.element_delimiter = self._define_object(element_delimiter, EdiDelimiter)
         if envelopeoption is not SENTINEL:
             self.envelopeoption = self._enum_matching(
-                envelopeoption, X12OptionsEnvelopeoption.list(), "envelopeoption"
+                envelopeoption, X12OptionsEnvelopeoption, "envelopeoption"
             )
         if filteracknowledgements is not SENTINEL:
             self.filteracknowledgements = filteracknowledgements
@@ -168,7 +168,7 @@ class X12Options(BaseModel):
         if outbound_validation_option is not SENTINEL:
             self.outbound_validation_option = self._enum_matching(
                 outbound_validation_option,
-                X12OptionsOutboundValidationOption.list(),
+                X12OptionsOutboundValidationOption,
                 "outbound_validation_option",
             )
         if reject_duplicate_interchange is not SENTINEL:
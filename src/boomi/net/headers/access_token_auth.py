@@ -10,9 +10,12 @@ class AccessTokenAuth(BaseHeader):
 
     :ivar str _token_prefix: The prefix for the token in the header.
     :ivar str token_value: The value of the token.
+    :ivar Dict[str, str] _headers: The headers, built once per token change.
     """
 
     _token_prefix = "Bearer"
+    _headers = None
+    _headers_token = None
 
     def __init__(self, token_value: str):
         """
@@ -36,9 +39,19 @@ class AccessTokenAuth(BaseHeader):
         """
         Get the headers with the Authorization field set to the Access token.
 
+        The same dictionary is returned until the token changes; callers must
+        not modify it.
+
         :return: A dictionary with the Authorization field set to the Access token.
         :rtype: Dict[str, str]
         """
-        if self.token_value is None:
-            return {}
-        return {"Authorization": f"{self._token_prefix} {self.token_value}"}
+        # token_value is a public attribute, so a change is detected on read.
+        if self._headers is None or self._headers_token is not self.token_value:
+            self._headers_token = self.token_value
+            if self.token_value is None:
+                self._headers = {}
+            else:
+                self._headers = {
+                    "Authorization": f"{self._token_prefix} {self.token_value}"
+                }
+        return self._headers
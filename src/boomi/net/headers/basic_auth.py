@@ -11,10 +11,12 @@ class BasicAuth(BaseHeader):
 
     :ivar str _username: The username for Basic authentication.
     :ivar str _password: The password for Basic authentication.
+    :ivar Dict[str, str] _headers: The headers, encoded once per credential change.
     """
 
     _username = ""
     _password = ""
+    _headers = None
 
     def __init__(self, username: str, password: str):
         """
@@ -27,6 +29,7 @@ class BasicAuth(BaseHeader):
         """
         self._username = username
         self._password = password
+        self._headers = None
 
     def set_value(self, value: dict[str, str]) -> None:
         """
@@ -37,17 +40,25 @@ class BasicAuth(BaseHeader):
         """
         self._username = value.get("username")
         self._password = value.get("password")
+        self._headers = None
 
     def get_headers(self) -> Dict[str, str]:
         """
         Get the headers with the Authorization field set to the Basic authentication token.
 
+        The token is encoded on the first call after the credentials change and
+        the same dictionary is returned until then; callers must not modify it.
+
         :return: A dictionary with the Authorization field set to the Basic authentication token.
         :rtype: Dict[str, str]
         """
-        if self._username is None and self._password is None:
-            return {}
-        token = (
-            "Basic " + b64encode(f"{self._username}:{self._password}".encode()).decode()
-        )
-        return {"Authorization": token}
+        if self._headers is None:
+            if self._username is None and self._password is None:
+                self._headers = {}
+            else:
+                token = (
+                    "Basic "
+                    + b64encode(f"{self._username}:{self._password}".encode()).decode()
+                )
+                self._headers = {"Authorization": token}
+        return self._headers
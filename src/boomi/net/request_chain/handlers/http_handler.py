@@ -4,6 +4,9 @@ import requests
 from requests.exceptions import Timeout
 from typing import Generator, Optional, Tuple
 from .base_handler import BaseHandler
+from ...transport.compression import Compression
+from ...transport.event_stream import DEFAULT_STREAM_CHUNK_SIZE
+from ...transport.json_codec import get_json_codec
 from ...transport.request import Request
 from ...transport.response import Response
 from ...transport.api_error import ApiError
@@ -15,14 +18,23 @@ class HttpHandler(BaseHandler):
     This handler sends the request to the specified URL and returns the response.
 
     :ivar int _timeout_in_seconds: The timeout for the HTTP request in seconds.
+    :ivar Compression _compression: The request and response compression settings.
+    :ivar int _stream_chunk_size: The number of bytes read per chunk of a streamed response.
     """
 
-    def __init__(self, timeout=60000):
+    def __init__(
+        self,
+        timeout=60000,
+        compression: Optional[Compression] = None,
+        stream_chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ):
         """
         Initialize a new instance of HttpHandler.
         """
         super().__init__()
         self._timeout_in_seconds = timeout / 1000
+        self._compression = compression or Compression()
+        self._stream_chunk_size = stream_chunk_size
 
     def handle(
         self, request: Request
@@ -35,13 +47,11 @@ class HttpHandler(BaseHandler):
         :rtype: Tuple[Optional[Response], Optional[Exception]]
         """
         try:
-            request_args = self._get_request_data(request)
-
             # Ensure Accept header is set to request JSON responses
             # This preserves proper types (integers, booleans) and @type annotations
-            headers = request.headers.copy() if request.headers else {}
-            if 'Accept' not in headers:
-                headers['Accept'] = 'application/json'
+            headers = self._get_headers(request)
+            request_args = self._get_request_data(request, headers)
+            self._compress_request_data(request_args, headers)
 
             result = requests.request(
                 request.method,
@@ -81,13 +91,12 @@ class HttpHandler(BaseHandler):
         self, request: Request
     ) -> Generator[Tuple[Optional[Response], Optional[Exception]], None, None]:
         try:
-            request_args = self._get_request_data(request)
-
             # Ensure Accept header is set to request JSON responses
-            headers = request.headers.copy() if request.headers else {}
-            if 'Accept' not in headers:
-                headers['Accept'] = 'application/json'
+            headers = self._get_headers(request)
+            request_args = self._get_request_data(request, headers)
+            self._compress_request_data(request_args, headers)
 
+            # Compressed responses are decoded incrementally by iter_content.
             result = requests.request(
                 request.method,
                 request.url,
@@ -109,22 +118,66 @@ class HttpHandler(BaseHandler):
                 )
 
             else:
-                for chunk in result.iter_content(chunk_size=8192):
-                    for response in Response.from_chunk(result, chunk):
+                # Chunks are read only as the caller advances; lines, events and
+                # characters split across chunks are reassembled by from_stream.
+                try:
+                    for response in Response.from_stream(
+                        result, self._stream_chunk_size
+                    ):
                         yield response, None
+                finally:
+                    result.close()
 
         except Timeout:
             yield None, ApiError("Request timed out", status=408)
 
-    def _get_request_data(self, request: Request) -> dict:
+    def _get_headers(self, request: Request) -> dict:
+        """
+        Get the headers to send, with the ``Accept`` and ``Accept-Encoding`` defaults.
+
+        :param Request request: The request object.
+        :return: A copy of the request headers.
+        :rtype: dict
+        """
+        headers = request.headers.copy() if request.headers else {}
+        if "Accept" not in headers:
+            headers["Accept"] = "application/json"
+        if "Accept-Encoding" not in headers:
+            headers["Accept-Encoding"] = self._compression.accept_encoding
+        return headers
+
+    def _compress_request_data(self, request_args: dict, headers: dict) -> None:
+        """
+        Gzip the request body in place if request compression applies to it.
+
+        :param dict request_args: The request arguments from :meth:`_get_request_data`.
+        :param dict headers: The headers to send.
+        """
+        if not self._compression.requests or "Content-Encoding" in headers:
+            return
+        body = request_args.get("data")
+        if not isinstance(body, (bytes, bytearray, str)):
+            return
+        body = body.encode("utf-8") if isinstance(body, str) else bytes(body)
+
+        compressed = self._compression.compress(body)
+        if compressed is None:
+            return
+        request_args["data"] = compressed
+        headers["Content-Encoding"] = "gzip"
+
+    def _get_request_data(self, request: Request, headers: dict) -> dict:
         """
         Get the request arguments based on the request headers and data.
 
+        JSON bodies are encoded here with the configured :class:`JsonCodec`
+        rather than by requests.
+
         :param Request request: The request object.
+        :param dict headers: The headers to send, from :meth:`_get_headers`.
         :return: The request arguments.
         :rtype: dict
         """
-        headers = request.headers or {}
         # Preserve falsy-but-present raw bodies (e.g. empty bytes) verbatim;
         # only substitute {} when there is genuinely no body. Using ``or {}``
         # would silently turn an empty raw payload into a JSON object.
@@ -135,7 +188,8 @@ class HttpHandler(BaseHandler):
             return {}
 
         if content_type.startswith("application/") and "json" in content_type:
-            return {"json": data}
+            headers["Content-Type"] = content_type
+            return {"data": get_json_codec().dumps(data)}
 
         if "multipart/form-data" in content_type:
             headers.pop("Content-Type", None)
@@ -0,0 +1,178 @@
+import gzip
+import zlib
+from typing import Callable, Generator, Optional
+
+#: The content codings the SDK decodes.
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+class Compression:
+    """
+    HTTP compression settings of a client.
+
+    Response compression is negotiated with ``Accept-Encoding`` and decoded
+    incrementally, so streamed responses and downloads are decompressed chunk
+    by chunk. Request compression gzips large request bodies (bulk requests,
+    queries with big filters, extension and component updates) and is off by
+    default.
+
+    Example Usage:
+    ```python
+    sdk = Boomi(
+        username="USERNAME",
+        password="PASSWORD",
+        compression=Compression(requests=True, min_request_size=8 * 1024),
+    )
+    ```
+
+    :ivar bool responses: Accept gzip/deflate encoded responses.
+    :ivar bool requests: Gzip request bodies of at least ``min_request_size`` bytes.
+    :ivar int min_request_size: The smallest body, in bytes, that is compressed.
+    :ivar int level: The gzip compression level (1-9).
+    """
+
+    def __init__(
+        self,
+        responses: bool = True,
+        requests: bool = False,
+        min_request_size: int = 16 * 1024,
+        level: int = 6,
+    ):
+        """
+        Initialize a new instance of Compression.
+
+        :param bool responses: Accept gzip/deflate encoded responses.
+        :param bool requests: Gzip request bodies of at least ``min_request_size`` bytes.
+        :param int min_request_size: The smallest body, in bytes, that is compressed.
+        :param int level: The gzip compression level (1-9).
+        """
+        self.responses = responses
+        self.requests = requests
+        self.min_request_size = min_request_size
+        self.level = level
+
+    @property
+    def accept_encoding(self) -> str:
+        """
+        The ``Accept-Encoding`` header value.
+
+        :rtype: str
+        """
+        return ACCEPT_ENCODING if self.responses else "identity"
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """
+        Gzip a request body if request compression applies to it.
+
+        :param bytes body: The encoded request body.
+        :return: The compressed body, or ``None`` to send ``body`` as is.
+        :rtype: Optional[bytes]
+        """
+        if not self.requests or len(body) < self.min_request_size:
+            return None
+        # mtime=0 keeps the output deterministic for identical bodies.
+        return gzip.compress(body, compresslevel=self.level, mtime=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"Compression(responses={self.responses}, requests={self.requests}, "
+            f"min_request_size={self.min_request_size}, level={self.level})"
+        )
+
+
+class StreamDecoder:
+    """
+    Incremental decoder for one ``Content-Encoding``.
+
+    ``deflate`` bodies are accepted both zlib-wrapped (as specified) and as raw
+    deflate streams (as some servers send them).
+
+    :ivar str encoding: The content coding being decoded.
+    """
+
+    def __init__(self, encoding: str):
+        """
+        Initialize a new instance of StreamDecoder.
+
+        :param str encoding: ``gzip``, ``x-gzip`` or ``deflate``.
+        :raises ValueError: If the coding is not supported.
+        """
+        self.encoding = encoding
+        if encoding in ("gzip", "x-gzip"):
+            self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._decoder = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+        self._started = False
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """
+        Decode the next chunk of the body.
+
+        :param bytes chunk: Encoded bytes.
+        :return: The decoded bytes available so far.
+        :rtype: bytes
+        """
+        if not chunk:
+            return b""
+        if self._started or self.encoding != "deflate":
+            self._started = True
+            return self._decoder.decompress(chunk)
+        self._started = True
+        try:
+            return self._decoder.decompress(chunk)
+        except zlib.error:
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decoder.decompress(chunk)
+
+    def flush(self) -> bytes:
+        """
+        Decode whatever is buffered at the end of the body.
+
+        :rtype: bytes
+        """
+        return self._decoder.flush()
+
+
+def content_decoder(content_encoding: Optional[str]) -> Optional[StreamDecoder]:
+    """
+    Create the decoder for a ``Content-Encoding`` header value.
+
+    :param Optional[str] content_encoding: The header value.
+    :return: A decoder, or ``None`` if the body is not encoded.
+    :rtype: Optional[StreamDecoder]
+    :raises ValueError: If the coding is not supported.
+    """
+    encoding = (content_encoding or "").strip().lower()
+    if encoding in ("", "identity"):
+        return None
+    return StreamDecoder(encoding)
+
+
+def iter_decoded(
+    read: Callable[[int], bytes],
+    content_encoding: Optional[str],
+    chunk_size: int = 64 * 1024,
+) -> Generator[bytes, None, None]:
+    """
+    Read a body in chunks, decoding its ``Content-Encoding`` on the fly.
+
+    :param Callable[[int], bytes] read: The ``read`` method of the response.
+    :param Optional[str] content_encoding: The response ``Content-Encoding``.
+    :param int chunk_size: Bytes read per call.
+    :return: A generator of decoded, non-empty chunks.
+    :rtype: Generator[bytes, None, None]
+    """
+    decoder = content_decoder(content_encoding)
+    chunk = read(chunk_size)
+    while chunk:
+        if decoder is not None:
+            chunk = decoder.decompress(chunk)
+        if chunk:
+            yield chunk
+        chunk = read(chunk_size)
+    if decoder is not None:
+        tail = decoder.flush()
+        if tail:
+            yield tail
@@ -0,0 +1,188 @@
+import codecs
+import re
+from typing import List, Optional
+
+#: Bytes read from the socket per streamed chunk.
+DEFAULT_STREAM_CHUNK_SIZE = 8192
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class LineDecoder:
+    """
+    Incrementally decodes a byte stream into text lines.
+
+    Multi-byte characters and lines split across chunks are carried over to
+    the next chunk, so the lines are the same however the stream is chunked.
+    Lines end at ``\\n``, ``\\r\\n`` or ``\\r``; the line breaks are removed.
+
+    :ivar str encoding: The text encoding of the stream.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        """
+        Initialize a new instance of LineDecoder.
+
+        :param str encoding: The text encoding of the stream.
+        """
+        self.encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._parts: List[str] = []
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Decode a chunk and return the lines it completes.
+
+        :param bytes data: The next chunk of the stream.
+        :return: The completed lines, in order.
+        :rtype: List[str]
+        """
+        return self._lines(self._decoder.decode(data))
+
+    def flush(self) -> List[str]:
+        """
+        Decode the end of the stream and return the remaining lines.
+
+        :return: The last lines, including an unterminated last line.
+        :rtype: List[str]
+        """
+        lines = self._lines(self._decoder.decode(b"", True))
+        rest = "".join(self._parts)
+        self._parts = []
+        if rest:
+            lines.extend(_LINE_BREAK.split(rest[:-1] if rest.endswith("\r") else rest))
+        return lines
+
+    def _lines(self, text: str) -> List[str]:
+        held = bool(self._parts) and self._parts[-1].endswith("\r")
+        if "\n" not in text and "\r" not in text and not (held and text):
+            # Most chunks of a long line: keep them without re-joining.
+            if text:
+                self._parts.append(text)
+            return []
+        self._parts.append(text)
+        buffer = "".join(self._parts)
+        # A trailing "\r" may be the first half of a "\r\n" in the next chunk.
+        held = buffer.endswith("\r")
+        lines = _LINE_BREAK.split(buffer[:-1] if held else buffer)
+        rest = lines.pop()
+        self._parts = [rest + "\r"] if held else ([rest] if rest else [])
+        return lines
+
+
+class ServerSentEvent:
+    """
+    One event of a ``text/event-stream`` response.
+
+    :ivar str event: The event type; ``message`` when the server sent none.
+    :ivar str data: The event data; the data lines joined with ``\\n``.
+    :ivar Optional[str] id_: The last event id seen on the stream.
+    :ivar Optional[int] retry: The reconnection time the server requested, in milliseconds.
+    """
+
+    __slots__ = ("event", "data", "id_", "retry")
+
+    def __init__(
+        self,
+        event: str,
+        data: str,
+        id_: Optional[str] = None,
+        retry: Optional[int] = None,
+    ):
+        self.event = event
+        self.data = data
+        self.id_ = id_
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, data={self.data!r}, id_={self.id_!r})"
+
+
+class EventStreamDecoder:
+    """
+    Incrementally frames a ``text/event-stream`` byte stream into events.
+
+    Follows the server-sent events format: ``field: value`` lines accumulate
+    until a blank line dispatches the event, comment lines (``:``) are
+    ignored, and an event still open when the stream ends is dispatched too.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        """
+        Initialize a new instance of EventStreamDecoder.
+
+        :param str encoding: The text encoding of the stream.
+        """
+        self._lines = LineDecoder(encoding)
+        self._data: List[str] = []
+        self._event: Optional[str] = None
+        self._id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, data: bytes) -> List[ServerSentEvent]:
+        """
+        Decode a chunk and return the events it completes.
+
+        :param bytes data: The next chunk of the stream.
+        :return: The completed events, in order.
+        :rtype: List[ServerSentEvent]
+        """
+        return self._events(self._lines.feed(data))
+
+    def flush(self) -> List[ServerSentEvent]:
+        """
+        Decode the end of the stream and return the remaining events.
+
+        :rtype: List[ServerSentEvent]
+        """
+        return self._events(self._lines.flush() + [""])
+
+    def _events(self, lines: List[str]) -> List[ServerSentEvent]:
+        events = []
+        for line in lines:
+            if not line:
+                if self._data:
+                    events.append(
+                        ServerSentEvent(
+                            self._event or "message",
+                            "\n".join(self._data),
+                            self._id,
+                            self._retry,
+                        )
+                    )
+                self._data = []
+                self._event = None
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "data":
+                self._data.append(value)
+            elif field == "event":
+                self._event = value
+            elif field == "id" and "\0" not in value:
+                self._id = value
+            elif field == "retry" and value.isdigit():
+                self._retry = int(value)
+        return events
+
+
+def content_charset(content_type: str, default: str = "utf-8") -> str:
+    """
+    Get the ``charset`` parameter of a Content-Type, if it names a known codec.
+
+    :param str content_type: A raw, already-lowercased Content-Type header value.
+    :param str default: The encoding used when none (or an unknown one) is given.
+    :rtype: str
+    """
+    for parameter in content_type.split(";")[1:]:
+        name, _, value = parameter.partition("=")
+        if name.strip() == "charset":
+            charset = value.strip().strip('"')
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                return default
+    return default
@@ -0,0 +1,291 @@
+import codecs
+import json
+import math
+import re
+from typing import Any, Dict, Generator, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib codec is used without it.
+    orjson = None
+
+#: Anything a codec decodes: response bytes (preferred) or text.
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """
+    The JSON encoder/decoder used for request and response bodies.
+
+    Responses are decoded straight from the received bytes, without building
+    an intermediate ``str``. The default codec uses ``orjson`` when it is
+    installed and the standard library otherwise; subclass this class and
+    register it with :func:`set_json_codec` to plug in another library.
+
+    Example Usage:
+    ```python
+    import simdjson
+    from boomi.net.transport.json_codec import JsonCodec, set_json_codec
+
+    class SimdJsonCodec(JsonCodec):
+        name = "simdjson"
+
+        def __init__(self):
+            self._parser = simdjson.Parser()
+
+        def loads(self, data):
+            return self._parser.parse(bytes(data)).as_dict()
+
+    set_json_codec(SimdJsonCodec())
+    ```
+
+    :ivar str name: The name of the JSON library.
+    """
+
+    name = "json"
+
+    def loads(self, data: JsonInput) -> Any:
+        """
+        Decode a JSON document.
+
+        :param JsonInput data: UTF-8 (or UTF-16/32) encoded bytes, or text.
+        :return: The decoded value.
+        :rtype: Any
+        :raises ValueError: If the document is not valid JSON.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as a compact UTF-8 JSON document.
+
+        :param Any value: The value, made of JSON compatible types.
+        :return: The encoded document.
+        :rtype: bytes
+        :raises TypeError: If the value is not JSON serializable.
+        :raises ValueError: If the value contains NaN or infinite floats.
+        """
+        return json.dumps(value, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    :class:`JsonCodec` backed by ``orjson``.
+
+    Documents ``orjson`` rejects but the standard library accepts (integers
+    beyond 64 bits, ``NaN`` literals) are decoded with the standard library,
+    so both codecs decode the same documents.
+
+    Encoding is not identical. ``orjson`` also serializes ``datetime``,
+    ``date``, ``time``, ``UUID``, dataclass and ``Enum`` values, which
+    :class:`JsonCodec` rejects with ``TypeError``; values ``orjson`` cannot
+    serialize are handed to the standard library. Non-``str`` dict keys are
+    accepted (``OPT_NON_STR_KEYS``) as the standard library accepts them, and
+    non-ASCII text is written as UTF-8 instead of ``\\u`` escapes. ``NaN`` and
+    infinite floats, which ``orjson`` writes as ``null``, are rejected with
+    ``ValueError`` like :class:`JsonCodec` does.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        Initialize a new instance of OrjsonCodec.
+
+        :raises ImportError: If ``orjson`` is not installed.
+        """
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install orjson")
+
+    def loads(self, data: JsonInput) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().dumps(value)
+        # Non-finite floats come out as null: only then is the value walked.
+        if b"null" in encoded and _has_non_finite(value):
+            return super().dumps(value)
+        return encoded
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a value holds a NaN or infinite float, as a key or a value."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(key) or _has_non_finite(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _default_codec() -> JsonCodec:
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+_codec = _default_codec()
+
+
+def get_json_codec() -> JsonCodec:
+    """
+    Get the JSON codec used by every client.
+
+    :rtype: JsonCodec
+    """
+    return _codec
+
+
+def set_json_codec(codec: Optional[JsonCodec]) -> None:
+    """
+    Replace the JSON codec used by every client.
+
+    :param Optional[JsonCodec] codec: The codec, or ``None`` to restore the
+        default (``orjson`` when installed, else the standard library).
+    """
+    global _codec
+    _codec = codec if codec is not None else _default_codec()
+
+
+# Skips string literals and everything that is not a bracket; stops at a
+# bracket, at an incomplete string literal or at the end of the buffer.
+_SKIP = re.compile(r'(?:[^\[\]{}"]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.S)
+# Whitespace and the commas separating array items.
+_SEPARATORS = re.compile(r"[\s,]*")
+# Characters that continue a number the scanner stopped before.
+_NUMBER_CONTINUATIONS = frozenset(".eE+-")
+
+_BEFORE, _INSIDE, _AFTER = range(3)
+
+
+class JsonArrayStream:
+    """
+    Incremental decoder for a JSON document holding one large array.
+
+    Items of the array are decoded and yielded one at a time as the chunks of
+    the document arrive, so a very large query page never has to be held in
+    memory as a whole. The other top-level members (``queryToken``,
+    ``numberOfResults``, ...) are available in :attr:`fields` once the stream
+    is exhausted.
+
+    Items are decoded with the standard library scanner, which reports where
+    each item ends; the rest of the document with the configured codec.
+
+    Example Usage:
+    ```python
+    stream = JsonArrayStream(service.stream_request_raw(request), key="result")
+    for record in stream:
+        ...
+    token = stream.fields.get("queryToken")
+    ```
+
+    :ivar Optional[str] key: The top-level member holding the array, or ``None``
+        when the document itself is the array.
+    :ivar Dict[str, Any] fields: The other top-level members of the document.
+    :ivar int count: The number of items decoded so far.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: Optional[str] = "result"):
+        """
+        Initialize a new instance of JsonArrayStream.
+
+        :param Iterable[bytes] chunks: The UTF-8 document, in chunks of any size.
+        :param Optional[str] key: The top-level member holding the array, or
+            ``None`` when the document itself is the array.
+        """
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+        self.count = 0
+        self._chunks = chunks
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        if self.key is None:
+            target_depth, key_suffix = 1, None
+        else:
+            target_depth = 2
+            key_suffix = re.compile(re.escape(json.dumps(self.key)) + r"\s*:\s*\Z")
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        raw_decode = json.JSONDecoder().raw_decode
+
+        buffer, skeleton = "", []
+        pos, depth, state = 0, 0, _BEFORE
+        # An item cut by the end of the buffer is retried once the buffer has
+        # doubled, which keeps items larger than a chunk linear to decode.
+        retry_at = 0
+        chunks = iter(self._chunks)
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            final = chunk is None
+            buffer += decoder.decode(chunk or b"", final)
+            if len(buffer) < retry_at and not final:
+                continue
+            while True:
+                if state == _INSIDE and depth == target_depth:
+                    pos = _SEPARATORS.match(buffer, pos).end()
+                    if pos == len(buffer):
+                        break
+                    if buffer[pos] != "]":
+                        try:
+                            item, end = raw_decode(buffer, pos)
+                        except ValueError:
+                            if final:
+                                raise
+                            retry_at = 2 * (len(buffer) - pos)
+                            break
+                        if not final and (
+                            end == len(buffer) or buffer[end] in _NUMBER_CONTINUATIONS
+                        ):
+                            # A number cut after its digits, or after a ".",
+                            # "e" or sign, continues in the next chunk.
+                            break
+                        pos, retry_at = end, 0
+                        self.count += 1
+                        yield item
+                        continue
+                    skeleton.append("]")
+                    buffer, pos = buffer[pos + 1 :], 0
+                    depth -= 1
+                    state = _AFTER
+                    continue
+
+                end = _SKIP.match(buffer, pos).end()
+                if end == len(buffer) or buffer[end] == '"':
+                    pos = end
+                    break
+                char, pos = buffer[end], end + 1
+                if char in "[{":
+                    depth += 1
+                    if (
+                        state == _BEFORE
+                        and depth == target_depth
+                        and char == "["
+                        and (key_suffix is None or key_suffix.search("".join(skeleton)[-1024:] + buffer[:end]))
+                    ):
+                        state = _INSIDE
+                        skeleton.append(buffer[:pos])
+                        buffer, pos = buffer[pos:], 0
+                else:
+                    depth -= 1
+            if state != _INSIDE:
+                skeleton.append(buffer[:pos])
+            buffer, pos = buffer[pos:], 0
+
+        if state == _INSIDE:
+            raise ValueError(f"Truncated JSON document after {self.count} items")
+        document = "".join(skeleton) + buffer
+        document = get_json_codec().loads(document) if document.strip() else {}
+        if isinstance(document, dict):
+            if state == _AFTER:
+                document.pop(self.key, None)
+            self.fields = document
@@ -0,0 +1,169 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from .request import Request
+from .utils import extract_original_data
+
+_PLACEHOLDER = re.compile(r"\{([^{}/]+)\}")
+
+
+@lru_cache(maxsize=1024)
+def compile_url(url: str) -> Tuple[str, ...]:
+    """
+    Split a URL pattern once into literal text and ``{name}`` placeholders.
+
+    ``https://host/Folder/{id}`` -> ``("https://host/Folder/", "id", "")``:
+    literals at even indexes, placeholder names at odd indexes.
+
+    :param str url: The URL pattern.
+    :return: The compiled parts.
+    :rtype: Tuple[str, ...]
+    """
+    return tuple(_PLACEHOLDER.split(url))
+
+
+def render_url(parts: Tuple[str, ...], path: Optional[Mapping[str, str]] = None) -> str:
+    """
+    Fill the placeholders of a compiled URL pattern.
+
+    Placeholders without a value are left in place, as ``Serializer`` does.
+
+    :param Tuple[str, ...] parts: The parts from :func:`compile_url`.
+    :param Optional[Mapping[str, str]] path: The serialized path parameters.
+    :return: The URL.
+    :rtype: str
+    """
+    if len(parts) == 1:
+        return parts[0]
+    rendered = [parts[0]]
+    for index in range(1, len(parts), 2):
+        name = parts[index]
+        value = path.get(name) if path else None
+        rendered.append(f"{{{name}}}" if value is None else value)
+        rendered.append(parts[index + 1])
+    return "".join(rendered)
+
+
+class RequestTemplate:
+    """
+    The precompiled shape of one API operation's requests.
+
+    Holds what every call of an operation shares: the URL pattern (split into
+    literals and placeholders once), the method, the body content type and any
+    static headers. :meth:`build` only fills in the path parameters, the
+    credentials and the body, so building a small GET or query request costs
+    a few dictionary operations. :meth:`get` caches one template per pattern.
+
+    Example Usage:
+    ```python
+    template = RequestTemplate.get(f"{base_url}/Folder/{{id}}", "GET")
+    request = template.build(service.get_auth_headers(), path={"id": folder_id})
+    response, status, content = service.send_request(request)
+    ```
+
+    :ivar str url: The URL pattern, with ``{name}`` path placeholders.
+    :ivar str method: The HTTP method.
+    :ivar Optional[str] content_type: The body content type; ``None`` for
+        operations without a body.
+    :ivar Dict[str, str] headers: Headers sent with every request.
+    """
+
+    __slots__ = ("url", "method", "content_type", "headers", "_parts")
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "GET",
+        content_type: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize a new instance of RequestTemplate.
+
+        :param str url: The URL pattern, with ``{name}`` path placeholders.
+        :param str method: The HTTP method.
+        :param Optional[str] content_type: The body content type; ``None`` for
+            operations without a body.
+        :param Optional[Dict[str, str]] headers: Headers sent with every request.
+        """
+        self.url = url
+        self.method = method
+        self.content_type = content_type
+        self.headers = dict(headers or {})
+        self._parts = compile_url(url)
+
+    @classmethod
+    def get(
+        cls, url: str, method: str = "GET", content_type: Optional[str] = None
+    ) -> "RequestTemplate":
+        """
+        Get the cached template of an operation.
+
+        :param str url: The URL pattern, with ``{name}`` path placeholders.
+        :param str method: The HTTP method.
+        :param Optional[str] content_type: The body content type.
+        :rtype: RequestTemplate
+        """
+        return _cached_template(cls, url, method, content_type)
+
+    def build(
+        self,
+        auth_headers: Optional[Mapping[str, str]] = None,
+        path: Optional[Mapping[str, Any]] = None,
+        body: Any = None,
+    ) -> Request:
+        """
+        Build a request from the template.
+
+        :param Optional[Mapping[str, str]] auth_headers: The credentials, e.g.
+            from ``BaseService.get_auth_headers``.
+        :param Optional[Mapping[str, Any]] path: The path parameters; values are
+            serialized and quoted like ``Serializer.add_path``.
+        :param Any body: The body (model, dict, or text); ignored for templates
+            without a content type.
+        :return: The request.
+        :rtype: Request
+        """
+        headers = dict(auth_headers) if auth_headers else {}
+        if self.headers:
+            headers.update(self.headers)
+
+        request = Request()
+        request.url = render_url(
+            self._parts,
+            {key: _path_value(value) for key, value in path.items() if value is not None}
+            if path
+            else None,
+        )
+        request.method = self.method
+        request.headers = headers
+        request.errors = {}
+        if self.content_type is not None:
+            request.set_body(body, self.content_type)
+        return request
+
+    def __repr__(self) -> str:
+        return f"RequestTemplate({self.method} {self.url})"
+
+
+@lru_cache(maxsize=1024)
+def _cached_template(
+    cls: type, url: str, method: str, content_type: Optional[str]
+) -> RequestTemplate:
+    return cls(url, method, content_type)
+
+
+def _path_value(value: Any) -> str:
+    """Serialize a path parameter like ``Serializer`` does for the simple style."""
+    value = extract_original_data(value)
+    if isinstance(value, str):
+        return quote(value)
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        return ",".join(_path_value(item) for item in value)
+    return value
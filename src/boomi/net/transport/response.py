@@ -1,10 +1,26 @@
 
-import json
+import codecs
 import re
+from functools import lru_cache
 from typing import Generator, Optional, Union
 from requests import Response as RequestsResponse
 from urllib.parse import parse_qs
 
+from .event_stream import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    EventStreamDecoder,
+    ServerSentEvent,
+    content_charset,
+)
+from .json_codec import get_json_codec
+
+# Body kinds, in the order _parse_response_body has always matched them.
+_JSON, _EVENT_STREAM, _TEXT, _FORM, _BINARY = range(5)
+_JSON_CONTENT_TYPE = re.compile(r"application\/.*json")
+
+# Marks a body that has not been parsed yet.
+_UNPARSED = object()
+
 
 def base_media_type(content_type: str) -> str:
     """Return the bare media type, stripped of parameters and whitespace.
@@ -33,13 +49,34 @@ def is_xml_content_type(content_type: str) -> bool:
     return media_type.endswith("/xml") or media_type.endswith("+xml")
 
 
+@lru_cache(maxsize=256)
+def _body_kind(content_type: str) -> int:
+    """Classify a lowercased Content-Type once; a client sees only a few."""
+    if _JSON_CONTENT_TYPE.search(content_type):
+        return _JSON
+    if "text/event-stream" in content_type:
+        return _EVENT_STREAM
+    if "text/" in content_type or is_xml_content_type(content_type):
+        return _TEXT
+    if content_type == "application/x-www-form-urlencoded":
+        return _FORM
+    return _BINARY
+
+
 class Response:
     """
     A simple HTTP response wrapper class using the requests library.
 
+    The body is kept as the undecoded bytes (``raw_body``). It is only decoded
+    and parsed by content type on the first access to ``body``, so raw
+    endpoints (see :meth:`BaseService.send_request_raw`) never pay for text
+    decoding or parsing.
+
     :ivar int status: The status code of the HTTP response.
     :ivar dict headers: The headers of the HTTP response.
-    :ivar str body: The body of the HTTP response.
+    :ivar bytes raw_body: The undecoded body of the HTTP response.
+    :ivar str body: The body of the HTTP response, parsed on first access.
+    :ivar Optional[ServerSentEvent] event: The event, for a streamed ``text/event-stream`` response.
     :var str chunk: The chunk of the HTTP response.
     """
 
@@ -48,14 +85,20 @@ class Response:
         response: RequestsResponse,
         chunk: Optional[str] = None,
         raw_chunk: Optional[bytes] = None,
+        event: Optional[ServerSentEvent] = None,
     ) -> None:
         """
         Initializes a Response object.
 
         :param RequestsResponse response: The requests.Response object.
+        :param Optional[str] chunk: The decoded text of a streamed chunk.
+        :param Optional[bytes] raw_chunk: The bytes of a streamed chunk or event.
+        :param Optional[ServerSentEvent] event: The server-sent event of a streamed chunk.
         """
+        # Streamed chunks share the status and headers of their stream.
         self.status = response.status_code
         self.headers = response.headers
+        self.event = event
 
         # Retain the undecoded response bytes so opaque/raw endpoints can be
         # returned byte-for-byte identical to a direct API call (see
@@ -63,11 +106,98 @@ class Response:
         # decoded body for typed endpoints.
         self.raw_body = raw_chunk if raw_chunk is not None else response.content
 
-        self.body = self._parse_response_body(
-            content_type=response.headers.get("Content-Type", "").lower(),
-            body=chunk if chunk else response.text,
-            raw_body=raw_chunk if raw_chunk else response.content,
-        )
+        # Parsing is deferred to the first ``body`` access; until then only
+        # what is needed to decode the text later is kept.
+        self._body = _UNPARSED
+        self._chunk = chunk
+        self._response = None if raw_chunk is not None else response
+
+    @property
+    def body(self) -> Union[str, dict, bytes]:
+        """
+        The body parsed by content type, decoded on first access.
+
+        JSON is decoded straight from the bytes; the text is only decoded
+        (from the chunk, or by requests) for the content types that need it.
+
+        :rtype: Union[str, dict, bytes]
+        """
+        if self._body is _UNPARSED and self.event is not None:
+            # The data of a server-sent event is expected to be JSON.
+            try:
+                self._body = get_json_codec().loads(self.event.data)
+            except ValueError:
+                self._body = self.raw_body
+        if self._body is _UNPARSED:
+            self._body = self._parse_response_body(
+                content_type=self.headers.get("Content-Type", "").lower(),
+                body=self._chunk,
+                raw_body=self.raw_body,
+                response=self._response,
+            )
+            self._chunk = self._response = None
+        return self._body
+
+    @body.setter
+    def body(self, body: Union[str, dict, bytes]) -> None:
+        self._body = body
+        self._chunk = self._response = None
+
+    @property
+    def raw_view(self) -> memoryview:
+        """
+        A read-only view of the undecoded body, for slicing without copies.
+
+        :rtype: memoryview
+        """
+        return memoryview(self.raw_body).toreadonly()
+
+    @staticmethod
+    def from_stream(
+        response: RequestsResponse, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> Generator["Response", None, None]:
+        """
+        Create Response objects from a streamed response, as it is read.
+
+        Chunks are read from the socket only as the generator is advanced.
+        ``text/event-stream`` bodies yield one Response per server-sent event;
+        text bodies yield one Response per chunk with its text decoded
+        incrementally, so multi-byte characters and lines split across chunks
+        are reassembled. Other bodies yield the raw chunks, undecoded.
+
+        :param RequestsResponse response: The requests.Response object, opened with ``stream=True``.
+        :param int chunk_size: The number of bytes read per chunk.
+        :return: A generator of Response objects.
+        :rtype: Generator[Response, None, None]
+        """
+        content_type = response.headers.get("Content-Type", "").lower()
+        kind = _body_kind(content_type)
+        chunks = response.iter_content(chunk_size=chunk_size)
+
+        if kind == _EVENT_STREAM:
+            encoding = content_charset(content_type)
+            decoder = EventStreamDecoder(encoding)
+            for raw_chunk in chunks:
+                for event in decoder.feed(raw_chunk):
+                    yield Response._from_event(response, event, encoding)
+            for event in decoder.flush():
+                yield Response._from_event(response, event, encoding)
+
+        elif kind == _TEXT:
+            decoder = codecs.getincrementaldecoder(content_charset(content_type))(
+                errors="replace"
+            )
+            for raw_chunk in chunks:
+                yield Response(
+                    response, chunk=decoder.decode(raw_chunk), raw_chunk=raw_chunk
+                )
+            tail = decoder.decode(b"", True)
+            if tail:
+                yield Response(response, chunk=tail, raw_chunk=b"")
+
+        else:
+            for raw_chunk in chunks:
+                yield Response(response, raw_chunk=raw_chunk)
 
     @staticmethod
     def from_chunk(
@@ -76,19 +206,28 @@ class Response:
         """
         Create a Response object from a chunk of data.
 
+        The chunk is decoded on its own; prefer :meth:`from_stream`, which
+        carries partial characters, lines and events over to the next chunk.
+
         :param RequestsResponse response: The requests.Response object.
         :param bytes chunk: The chunk of data.
         :return: A Response object.
         :rtype: Response
         """
         content_type = response.headers.get("Content-Type", "").lower()
-        chunk_str = raw_chunk.decode()
         if "text/event-stream" not in content_type:
-            yield Response(response, chunk=chunk_str, raw_chunk=raw_chunk)
+            yield Response(response, raw_chunk=raw_chunk)
         else:
-            for chunk_line in chunk_str.split("\n"):
-                if "data: " in chunk_line:
-                    yield Response(response, chunk=chunk_line, raw_chunk=raw_chunk)
+            encoding = content_charset(content_type)
+            decoder = EventStreamDecoder(encoding)
+            for event in decoder.feed(raw_chunk) + decoder.flush():
+                yield Response._from_event(response, event, encoding)
+
+    @staticmethod
+    def _from_event(
+        response: RequestsResponse, event: ServerSentEvent, encoding: str
+    ) -> "Response":
+        return Response(response, raw_chunk=event.data.encode(encoding), event=event)
 
     def __str__(self) -> str:
         """
@@ -102,38 +241,50 @@ class Response:
         )
 
     def _parse_response_body(
-        self, content_type: str, body: str, raw_body: bytes
+        self,
+        content_type: str,
+        body: Optional[str],
+        raw_body: bytes,
+        response: Optional[RequestsResponse] = None,
     ) -> Union[str, dict, bytes]:
         """
         Extracts the response body from a given HTTP response.
 
         This method attempts to parse the response body based on its content type.
-        If the content type is JSON, it tries to parse the body as JSON.
+        If the content type is JSON, it tries to parse the raw bytes as JSON
+        with the configured :class:`JsonCodec`.
         If the content type is text or XML, it returns the raw text.
         If the content type is 'application/x-www-form-urlencoded', it parses the body as a query string.
         For all other content types, it returns the raw binary content.
 
-        :param RequestsResponse response: The HTTP response received from a request.
+        :param str content_type: The lowercased Content-Type header.
+        :param Optional[str] body: The decoded text, if already known.
+        :param bytes raw_body: The undecoded body.
+        :param Optional[RequestsResponse] response: The response whose text is
+            decoded on demand when ``body`` is not given; ``None`` for chunks.
         :return: The parsed response body.
         :rtype: str or dict or bytes
         """
+        kind = _body_kind(content_type)
+        if kind == _BINARY:
+            return raw_body
         try:
-            if re.search(r"application\/.*json", content_type):
-                return json.loads(body)
+            if kind == _JSON:
+                return get_json_codec().loads(raw_body)
+
+            if body is None:
+                body = response.text if response is not None else raw_body.decode()
 
-            if "text/event-stream" in content_type and "data: " in body:
+            if kind == _EVENT_STREAM and "data: " in body:
                 json_body = body[6:]
                 # Note: this assumes that the content of data is a valid JSON string
-                return json.loads(json_body)
+                return get_json_codec().loads(json_body)
 
-            if "text/" in content_type or is_xml_content_type(content_type):
-                return body
-
-            if content_type == "application/x-www-form-urlencoded":
+            if kind == _FORM:
                 parsed_response = parse_qs(body)
                 return {k: v[0] for k, v in parsed_response.items()}
 
-            return raw_body
+            return body
 
-        except json.JSONDecodeError:
+        except ValueError:
             return raw_body
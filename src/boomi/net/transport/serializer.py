@@ -3,6 +3,7 @@ from typing import Any, List
 from urllib.parse import quote
 
 from .request import Request
+from .request_template import compile_url, render_url
 from .utils import extract_original_data
 from ...models.utils.sentinel import was_value_set
 from ...net.headers.base_header import BaseHeader
@@ -35,9 +36,9 @@ class Serializer:
         self.query: list[str] = []
         self.errors: dict[int, ApiError] = {}
 
+        # Default (auth) headers are already strings; copy them as they are.
         for header in default_headers:
-            for key, value in header.get_headers().items():
-                self.add_header(key, value)
+            self.headers.update(header.get_headers())
 
     def add_header(
         self, key: str, data: Any, explode: bool = False, nullable: bool = False
@@ -229,10 +230,8 @@ class Serializer:
         :return: The final URL.
         :rtype: str
         """
-        final_url = self.url
-
-        for key, value in self.path.items():
-            final_url = final_url.replace(f"{{{key}}}", value)
+        # The URL pattern is split into literals and placeholders once.
+        final_url = render_url(compile_url(self.url), self.path)
 
         if len(self.query) > 0:
             final_url += "?" + "&".join(self.query)
@@ -2,9 +2,9 @@
 from enum import Enum
 from typing import Any
 
-# BaseModel is imported lazily inside extract_original_data to avoid
-# importing the entire sdk.models package during module import which can
-# introduce circular dependencies when only XML utilities are required.
+# BaseModel is imported lazily by extract_original_data (once, then cached)
+# to avoid importing the entire sdk.models package during module import which
+# can introduce circular dependencies when only XML utilities are required.
 try:
     import xmltodict
     ExpatError = xmltodict.expat.ExpatError
@@ -14,11 +14,29 @@ except Exception:  # pragma: no cover - if xmltodict is unavailable
     import xml.etree.ElementTree as _ET
 
 
+# Types passed through unchanged, checked before any subclass test.
+_PLAIN_TYPES = frozenset((str, int, float, bool, bytes, dict))
+
+_base_model = None
+
+
+def _get_base_model():
+    """Import ``BaseModel`` on first use and remember it (``False`` if unavailable)."""
+    global _base_model
+    if _base_model is None:
+        try:
+            from ...models.utils.base_model import BaseModel  # type: ignore
+        except Exception:  # pragma: no cover - defensive fallback
+            BaseModel = False
+        _base_model = BaseModel
+    return _base_model
+
+
 def extract_original_data(data: Any) -> Any:
     """Extract the original data from internal models and enums.
 
-    ``BaseModel`` is imported lazily to prevent importing the whole
-    :mod:`sdk.models` package unless this function is actually used.
+    ``BaseModel`` is imported lazily, on the first call, to prevent importing
+    the whole :mod:`sdk.models` package unless this function is actually used.
 
     :param Any data: The data to be extracted.
     :return: The extracted data.
@@ -28,13 +46,11 @@ def extract_original_data(data: Any) -> Any:
         return None
 
     data_type = type(data)
+    if data_type in _PLAIN_TYPES:
+        return data
 
-    try:
-        from ...models.utils.base_model import BaseModel  # type: ignore
-    except Exception:  # pragma: no cover - defensive fallback
-        BaseModel = None
-
-    if BaseModel is not None and issubclass(data_type, BaseModel):
+    BaseModel = _get_base_model()
+    if BaseModel and issubclass(data_type, BaseModel):
         return data._map()
 
     if issubclass(data_type, Enum):
@@ -429,3 +445,187 @@ def extract_component_xml_metadata(xml) -> dict:
         return {}
     return found
 
+
+
+class BulkEnvelopeEntry:
+    """One ``<response>`` entry of a raw XML bulk-response envelope.
+
+    ``xml`` is the exact byte slice of the entry's ``<Result>`` element inside
+    the envelope — nothing is parsed into a model or re-serialized. Because the
+    namespace prefixes used by the slice (``bns:``, ``xsi:``) are declared on the
+    envelope root, :meth:`standalone` returns the same bytes with the in-scope
+    ``xmlns`` declarations added to the root start tag so the slice can be parsed
+    on its own.
+
+    :ivar Optional[int] status_code: The entry's ``statusCode``.
+    :ivar Optional[str] id_: The entry's ``id`` (``componentId`` for components).
+    :ivar Optional[str] version: The result's ``version`` attribute, if any.
+    :ivar Optional[str] error_message: The entry's ``errorMessage``, if any.
+    :ivar Optional[bytes] xml: The exact ``<Result>`` slice, or None for failed entries.
+    :ivar dict namespaces: The ``xmlns`` declarations in scope at the envelope root.
+    """
+
+    def __init__(self, status_code, id_, version, error_message, xml, namespaces):
+        self.status_code = status_code
+        self.id_ = id_
+        self.version = version
+        self.error_message = error_message
+        self.xml = xml
+        self.namespaces = namespaces
+
+    @property
+    def ok(self) -> bool:
+        """Whether the entry carries a 2xx result."""
+        return self.xml is not None and (
+            self.status_code is None or 200 <= self.status_code < 300
+        )
+
+    def standalone(self) -> bytes:
+        """Return the slice with the envelope's namespace declarations inlined.
+
+        Only ``xmlns`` attributes the slice does not already declare are
+        inserted, directly after the root element name. The rest of the bytes
+        are untouched.
+
+        :return: A self-contained XML element, or ``b""`` for failed entries.
+        :rtype: bytes
+        """
+        if self.xml is None:
+            return b""
+        name_end = 1
+        while name_end < len(self.xml) and self.xml[name_end] not in b" \t\r\n/>":
+            name_end += 1
+        declarations = b"".join(
+            f' {key}="{_escape_attribute(value)}"'.encode()
+            for key, value in self.namespaces.items()
+            if f"{key}=".encode() not in self.xml[: _tag_end(self.xml, 0)]
+        )
+        return self.xml[:name_end] + declarations + self.xml[name_end:]
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkEnvelopeEntry(id_={self.id_!r}, status_code={self.status_code}, "
+            f"version={self.version!r}, size={len(self.xml or b'')})"
+        )
+
+
+def _escape_attribute(value: str) -> str:
+    """Escape a parsed attribute value for re-insertion inside double quotes."""
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;")
+
+
+def _tag_end(data: bytes, start: int) -> int:
+    """Return the offset just past the tag starting at ``start``.
+
+    Quote-aware, so a ``>`` inside an attribute value does not end the tag.
+    """
+    quote = None
+    for index in range(start, len(data)):
+        char = data[index]
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in (0x22, 0x27):  # '"' or "'"
+            quote = char
+        elif char == 0x3E:  # '>'
+            return index + 1
+    return len(data)
+
+
+def split_bulk_envelope(envelope) -> list:
+    """Split a raw XML bulk-response envelope into per-entry byte slices.
+
+    The envelope returned by raw bulk endpoints such as
+    ``ComponentService.bulk_component`` looks like::
+
+        <bns:BulkResult xmlns:bns="..." xmlns:xsi="...">
+          <bns:response statusCode="200">
+            <bns:Result xsi:type="bns:Component" componentId="..." version="3">...</bns:Result>
+          </bns:response>
+          <bns:response statusCode="400" id="..." errorMessage="..."/>
+        </bns:BulkResult>
+
+    expat reports the byte offset of every tag, so each ``<Result>`` element is
+    cut out of the original bytes as-is: the byte-for-byte guarantee of the raw
+    endpoints carries over to every slice. Hardened like
+    :func:`extract_component_xml_metadata`: a DOCTYPE is refused and external
+    entities are never resolved.
+
+    :param envelope: The raw envelope as ``bytes`` (or ``str``, encoded as UTF-8).
+    :return: One :class:`BulkEnvelopeEntry` per ``<response>``, in envelope order.
+    :rtype: List[BulkEnvelopeEntry]
+    :raises ValueError: If the envelope is not well-formed or declares a DOCTYPE.
+    """
+    import xml.parsers.expat as expat
+
+    if isinstance(envelope, str):
+        data = envelope.encode("utf-8")
+    elif isinstance(envelope, (bytes, bytearray, memoryview)):
+        data = bytes(envelope)
+    else:
+        raise TypeError(
+            f"Expected a raw XML envelope, but got type {type(envelope).__name__}."
+        )
+
+    entries = []
+    namespaces = {}
+    stack = []
+    current = {}
+
+    def _local(name):
+        return name.split(":", 1)[-1]
+
+    def _start(name, attrs):
+        depth = len(stack)
+        offset = parser.CurrentByteIndex
+        stack.append((name, offset, _tag_end(data, offset)))
+        local = _local(name)
+
+        if depth == 0:
+            namespaces.update(
+                (key, value)
+                for key, value in attrs.items()
+                if key == "xmlns" or key.startswith("xmlns:")
+            )
+        elif depth == 1 and local == "response":
+            status = attrs.get("statusCode")
+            current.clear()
+            current.update(
+                status_code=int(status) if status and status.isdigit() else None,
+                id_=attrs.get("id"),
+                version=None,
+                error_message=attrs.get("errorMessage"),
+                xml=None,
+            )
+        elif depth == 2 and local == "Result" and current:
+            current["id_"] = (
+                attrs.get("componentId") or attrs.get("id") or current["id_"]
+            )
+            current["version"] = attrs.get("version")
+
+    def _end(name):
+        name, start, start_tag_end = stack.pop()
+        depth = len(stack)
+        if depth == 2 and _local(name) == "Result" and current:
+            if data[start_tag_end - 2 : start_tag_end] == b"/>":
+                end = start_tag_end
+            else:
+                end = _tag_end(data, parser.CurrentByteIndex)
+            current["xml"] = data[start:end]
+        elif depth == 1 and _local(name) == "response" and current:
+            entries.append(BulkEnvelopeEntry(namespaces=dict(namespaces), **current))
+            current.clear()
+
+    def _refuse_doctype(*_args, **_kwargs):
+        raise ValueError("Bulk envelopes declaring a DOCTYPE are not accepted")
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = _start
+    parser.EndElementHandler = _end
+    parser.StartDoctypeDeclHandler = _refuse_doctype
+    parser.ExternalEntityRefHandler = lambda *args: False
+    try:
+        parser.Parse(data, True)
+    except expat.ExpatError as error:
+        raise ValueError(f"Malformed bulk envelope: {error}") from error
+    return entries
@@ -1,5 +1,5 @@
 
-from typing import Union
+from typing import Optional, Union
 from .services.as2_connector_record import As2ConnectorRecordService
 from .services.account import AccountService
 from .services.account_cloud_attachment_properties import (
@@ -152,6 +152,7 @@ from .services.cloud_attachment_secrets_configuration import (
     CloudAttachmentSecretsConfigurationService,
 )
 from .net.environment import Environment
+from .net.transport.compression import Compression
 
 
 class Boomi:
@@ -163,6 +164,7 @@ class Boomi:
         base_url: Union[Environment, str, None] = None,
         timeout: int = 60000,
         account_id: str = "platform_account_ID",
+        compression: Optional[Compression] = None,
     ):
         """
         Initializes Boomi the SDK class.
@@ -415,6 +417,7 @@ class Boomi:
         self._base_url_account_id = account_id
         self.set_base_url(self._base_url)
         self.set_timeout(timeout)
+        self.set_compression(compression or Compression())
 
     def set_base_url(self, base_url: Union[Environment, str]):
         """
@@ -1041,6 +1044,264 @@ class Boomi:
 
         return self
 
+    def set_compression(self, compression: Compression):
+        """
+        Sets the HTTP compression settings for the entire SDK.
+
+        :param Compression compression: The compression settings to be set.
+        :return: The SDK instance.
+        """
+        self.as2_connector_record.set_compression(compression)
+        self.account.set_compression(compression)
+        self.account_cloud_attachment_properties.set_compression(compression)
+        self.account_cloud_attachment_quota.set_compression(compression)
+        self.account_group.set_compression(compression)
+        self.account_group_account.set_compression(compression)
+        self.account_group_user_role.set_compression(compression)
+        self.account_sso_config.set_compression(compression)
+        self.account_user_federation.set_compression(compression)
+        self.account_user_role.set_compression(compression)
+        self.api_usage_count.set_compression(compression)
+        self.atom.set_compression(compression)
+        self.atom_as2_artifacts.set_compression(compression)
+        self.atom_connection_field_extension_summary.set_compression(compression)
+        self.atom_connector_versions.set_compression(compression)
+        self.atom_counters.set_compression(compression)
+        self.atom_log.set_compression(compression)
+        self.atom_purge.set_compression(compression)
+        self.atom_security_policies.set_compression(compression)
+        self.atom_startup_properties.set_compression(compression)
+        self.atom_worker_log.set_compression(compression)
+        self.audit_log.set_compression(compression)
+        self.branch.set_compression(compression)
+        self.change_listener_status.set_compression(compression)
+        self.clear_queue.set_compression(compression)
+        self.cloud.set_compression(compression)
+        self.cloud_attachment_properties.set_compression(compression)
+        self.component.set_compression(compression)
+        self.component_atom_attachment.set_compression(compression)
+        self.component_diff_request.set_compression(compression)
+        self.component_environment_attachment.set_compression(compression)
+        self.component_metadata.set_compression(compression)
+        self.component_reference.set_compression(compression)
+        self.connection_licensing_report.set_compression(compression)
+        self.connector.set_compression(compression)
+        self.connector_document.set_compression(compression)
+        self.custom_tracked_field.set_compression(compression)
+        self.deployed_expired_certificate.set_compression(compression)
+        self.deployed_package.set_compression(compression)
+        self.deployment.set_compression(compression)
+        self.document_count_account.set_compression(compression)
+        self.document_count_account_group.set_compression(compression)
+        self.edifact_connector_record.set_compression(compression)
+        self.edi_custom_connector_record.set_compression(compression)
+        self.environment.set_compression(compression)
+        self.environment_atom_attachment.set_compression(compression)
+        self.environment_connection_field_extension_summary.set_compression(compression)
+        self.environment_extensions.set_compression(compression)
+        self.environment_map_extension.set_compression(compression)
+        self.environment_map_extension_external_component.set_compression(compression)
+        self.environment_map_extension_user_defined_function.set_compression(compression)
+        self.environment_map_extension_user_defined_function_summary.set_compression(
+            compression
+        )
+        self.environment_map_extensions_summary.set_compression(compression)
+        self.environment_role.set_compression(compression)
+        self.event.set_compression(compression)
+        self.execution_artifacts.set_compression(compression)
+        self.execution_connector.set_compression(compression)
+        self.execution_count_account.set_compression(compression)
+        self.execution_count_account_group.set_compression(compression)
+        self.execution_record.set_compression(compression)
+        self.execution_request.set_compression(compression)
+        self.execution_summary_record.set_compression(compression)
+        self.folder.set_compression(compression)
+        self.generic_connector_record.set_compression(compression)
+        self.get_assignable_roles.set_compression(compression)
+        self.hl7_connector_record.set_compression(compression)
+        self.installer_token.set_compression(compression)
+        self.integration_pack.set_compression(compression)
+        self.integration_pack_atom_attachment.set_compression(compression)
+        self.integration_pack_environment_attachment.set_compression(compression)
+        self.integration_pack_instance.set_compression(compression)
+        self.java_rollback.set_compression(compression)
+        self.java_upgrade.set_compression(compression)
+        self.merge_request.set_compression(compression)
+        self.move_queue_request.set_compression(compression)
+        self.node_offboard.set_compression(compression)
+        self.odette_connector_record.set_compression(compression)
+        self.oftp2_connector_record.set_compression(compression)
+        self.packaged_component.set_compression(compression)
+        self.packaged_component_manifest.set_compression(compression)
+        self.persisted_process_properties.set_compression(compression)
+        self.process.set_compression(compression)
+        self.process_atom_attachment.set_compression(compression)
+        self.process_environment_attachment.set_compression(compression)
+        self.process_log.set_compression(compression)
+        self.process_schedule_status.set_compression(compression)
+        self.process_schedules.set_compression(compression)
+        self.rerun_document.set_compression(compression)
+        self.role.set_compression(compression)
+        self.rosetta_net_connector_record.set_compression(compression)
+        self.runtime_release_schedule.set_compression(compression)
+        self.cancel_execution.set_compression(compression)
+        self.shared_server_information.set_compression(compression)
+        self.shared_web_server.set_compression(compression)
+        self.throughput_account.set_compression(compression)
+        self.throughput_account_group.set_compression(compression)
+        self.tradacoms_connector_record.set_compression(compression)
+        self.trading_partner_component.set_compression(compression)
+        self.trading_partner_processing_group.set_compression(compression)
+        self.x12_connector_record.set_compression(compression)
+        self.atom_disk_space.set_compression(compression)
+        self.list_queues.set_compression(compression)
+        self.listener_status.set_compression(compression)
+        self.organization_component.set_compression(compression)
+        self.shared_communication_channel_component.set_compression(compression)
+        self.account_group_integration_pack.set_compression(compression)
+        self.publisher_integration_pack.set_compression(compression)
+        self.release_integration_pack.set_compression(compression)
+        self.release_integration_pack_status.set_compression(compression)
+        self.runtime_restart_request.set_compression(compression)
+        self.refresh_secrets_manager.set_compression(compression)
+        self.runtime_cloud.set_compression(compression)
+        self.account_cloud_attachment_summary.set_compression(compression)
+        self.account_cloud_attachment_properties_default.set_compression(compression)
+        self.runtime_properties.set_compression(compression)
+        self.runtime_observability_settings.set_compression(compression)
+        self.cloud_attachment_secrets_configuration.set_compression(compression)
+
+        return self
+
+    def set_stream_chunk_size(self, stream_chunk_size: int):
+        """
+        Sets the number of bytes read per chunk of streamed responses for the entire SDK.
+
+        :param int stream_chunk_size: The chunk size in bytes.
+        :return: The SDK instance.
+        """
+        self.as2_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.account.set_stream_chunk_size(stream_chunk_size)
+        self.account_cloud_attachment_properties.set_stream_chunk_size(stream_chunk_size)
+        self.account_cloud_attachment_quota.set_stream_chunk_size(stream_chunk_size)
+        self.account_group.set_stream_chunk_size(stream_chunk_size)
+        self.account_group_account.set_stream_chunk_size(stream_chunk_size)
+        self.account_group_user_role.set_stream_chunk_size(stream_chunk_size)
+        self.account_sso_config.set_stream_chunk_size(stream_chunk_size)
+        self.account_user_federation.set_stream_chunk_size(stream_chunk_size)
+        self.account_user_role.set_stream_chunk_size(stream_chunk_size)
+        self.api_usage_count.set_stream_chunk_size(stream_chunk_size)
+        self.atom.set_stream_chunk_size(stream_chunk_size)
+        self.atom_as2_artifacts.set_stream_chunk_size(stream_chunk_size)
+        self.atom_connection_field_extension_summary.set_stream_chunk_size(stream_chunk_size)
+        self.atom_connector_versions.set_stream_chunk_size(stream_chunk_size)
+        self.atom_counters.set_stream_chunk_size(stream_chunk_size)
+        self.atom_log.set_stream_chunk_size(stream_chunk_size)
+        self.atom_purge.set_stream_chunk_size(stream_chunk_size)
+        self.atom_security_policies.set_stream_chunk_size(stream_chunk_size)
+        self.atom_startup_properties.set_stream_chunk_size(stream_chunk_size)
+        self.atom_worker_log.set_stream_chunk_size(stream_chunk_size)
+        self.audit_log.set_stream_chunk_size(stream_chunk_size)
+        self.branch.set_stream_chunk_size(stream_chunk_size)
+        self.change_listener_status.set_stream_chunk_size(stream_chunk_size)
+        self.clear_queue.set_stream_chunk_size(stream_chunk_size)
+        self.cloud.set_stream_chunk_size(stream_chunk_size)
+        self.cloud_attachment_properties.set_stream_chunk_size(stream_chunk_size)
+        self.component.set_stream_chunk_size(stream_chunk_size)
+        self.component_atom_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.component_diff_request.set_stream_chunk_size(stream_chunk_size)
+        self.component_environment_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.component_metadata.set_stream_chunk_size(stream_chunk_size)
+        self.component_reference.set_stream_chunk_size(stream_chunk_size)
+        self.connection_licensing_report.set_stream_chunk_size(stream_chunk_size)
+        self.connector.set_stream_chunk_size(stream_chunk_size)
+        self.connector_document.set_stream_chunk_size(stream_chunk_size)
+        self.custom_tracked_field.set_stream_chunk_size(stream_chunk_size)
+        self.deployed_expired_certificate.set_stream_chunk_size(stream_chunk_size)
+        self.deployed_package.set_stream_chunk_size(stream_chunk_size)
+        self.deployment.set_stream_chunk_size(stream_chunk_size)
+        self.document_count_account.set_stream_chunk_size(stream_chunk_size)
+        self.document_count_account_group.set_stream_chunk_size(stream_chunk_size)
+        self.edifact_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.edi_custom_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.environment.set_stream_chunk_size(stream_chunk_size)
+        self.environment_atom_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.environment_connection_field_extension_summary.set_stream_chunk_size(stream_chunk_size)
+        self.environment_extensions.set_stream_chunk_size(stream_chunk_size)
+        self.environment_map_extension.set_stream_chunk_size(stream_chunk_size)
+        self.environment_map_extension_external_component.set_stream_chunk_size(stream_chunk_size)
+        self.environment_map_extension_user_defined_function.set_stream_chunk_size(stream_chunk_size)
+        self.environment_map_extension_user_defined_function_summary.set_stream_chunk_size(
+            stream_chunk_size
+        )
+        self.environment_map_extensions_summary.set_stream_chunk_size(stream_chunk_size)
+        self.environment_role.set_stream_chunk_size(stream_chunk_size)
+        self.event.set_stream_chunk_size(stream_chunk_size)
+        self.execution_artifacts.set_stream_chunk_size(stream_chunk_size)
+        self.execution_connector.set_stream_chunk_size(stream_chunk_size)
+        self.execution_count_account.set_stream_chunk_size(stream_chunk_size)
+        self.execution_count_account_group.set_stream_chunk_size(stream_chunk_size)
+        self.execution_record.set_stream_chunk_size(stream_chunk_size)
+        self.execution_request.set_stream_chunk_size(stream_chunk_size)
+        self.execution_summary_record.set_stream_chunk_size(stream_chunk_size)
+        self.folder.set_stream_chunk_size(stream_chunk_size)
+        self.generic_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.get_assignable_roles.set_stream_chunk_size(stream_chunk_size)
+        self.hl7_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.installer_token.set_stream_chunk_size(stream_chunk_size)
+        self.integration_pack.set_stream_chunk_size(stream_chunk_size)
+        self.integration_pack_atom_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.integration_pack_environment_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.integration_pack_instance.set_stream_chunk_size(stream_chunk_size)
+        self.java_rollback.set_stream_chunk_size(stream_chunk_size)
+        self.java_upgrade.set_stream_chunk_size(stream_chunk_size)
+        self.merge_request.set_stream_chunk_size(stream_chunk_size)
+        self.move_queue_request.set_stream_chunk_size(stream_chunk_size)
+        self.node_offboard.set_stream_chunk_size(stream_chunk_size)
+        self.odette_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.oftp2_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.packaged_component.set_stream_chunk_size(stream_chunk_size)
+        self.packaged_component_manifest.set_stream_chunk_size(stream_chunk_size)
+        self.persisted_process_properties.set_stream_chunk_size(stream_chunk_size)
+        self.process.set_stream_chunk_size(stream_chunk_size)
+        self.process_atom_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.process_environment_attachment.set_stream_chunk_size(stream_chunk_size)
+        self.process_log.set_stream_chunk_size(stream_chunk_size)
+        self.process_schedule_status.set_stream_chunk_size(stream_chunk_size)
+        self.process_schedules.set_stream_chunk_size(stream_chunk_size)
+        self.rerun_document.set_stream_chunk_size(stream_chunk_size)
+        self.role.set_stream_chunk_size(stream_chunk_size)
+        self.rosetta_net_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.runtime_release_schedule.set_stream_chunk_size(stream_chunk_size)
+        self.cancel_execution.set_stream_chunk_size(stream_chunk_size)
+        self.shared_server_information.set_stream_chunk_size(stream_chunk_size)
+        self.shared_web_server.set_stream_chunk_size(stream_chunk_size)
+        self.throughput_account.set_stream_chunk_size(stream_chunk_size)
+        self.throughput_account_group.set_stream_chunk_size(stream_chunk_size)
+        self.tradacoms_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.trading_partner_component.set_stream_chunk_size(stream_chunk_size)
+        self.trading_partner_processing_group.set_stream_chunk_size(stream_chunk_size)
+        self.x12_connector_record.set_stream_chunk_size(stream_chunk_size)
+        self.atom_disk_space.set_stream_chunk_size(stream_chunk_size)
+        self.list_queues.set_stream_chunk_size(stream_chunk_size)
+        self.listener_status.set_stream_chunk_size(stream_chunk_size)
+        self.organization_component.set_stream_chunk_size(stream_chunk_size)
+        self.shared_communication_channel_component.set_stream_chunk_size(stream_chunk_size)
+        self.account_group_integration_pack.set_stream_chunk_size(stream_chunk_size)
+        self.publisher_integration_pack.set_stream_chunk_size(stream_chunk_size)
+        self.release_integration_pack.set_stream_chunk_size(stream_chunk_size)
+        self.release_integration_pack_status.set_stream_chunk_size(stream_chunk_size)
+        self.runtime_restart_request.set_stream_chunk_size(stream_chunk_size)
+        self.refresh_secrets_manager.set_stream_chunk_size(stream_chunk_size)
+        self.runtime_cloud.set_stream_chunk_size(stream_chunk_size)
+        self.account_cloud_attachment_summary.set_stream_chunk_size(stream_chunk_size)
+        self.account_cloud_attachment_properties_default.set_stream_chunk_size(stream_chunk_size)
+        self.runtime_properties.set_stream_chunk_size(stream_chunk_size)
+        self.runtime_observability_settings.set_stream_chunk_size(stream_chunk_size)
+        self.cloud_attachment_secrets_configuration.set_stream_chunk_size(stream_chunk_size)
+
+        return self
+
     def set_account_id(self, account_id: str):
         """
         Sets the account_id server variable for the entire SDK.
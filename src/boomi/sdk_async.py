@@ -1,6 +1,7 @@
 
-from typing import Union
+from typing import Optional, Union
 from .net.environment import Environment
+from .net.transport.compression import Compression
 from .sdk import Boomi
 from .services.async_.as2_connector_record import As2ConnectorRecordServiceAsync
 from .services.async_.account import AccountServiceAsync
@@ -208,6 +209,7 @@ class BoomiAsync(Boomi):
         base_url: Union[Environment, str, None] = None,
         timeout: int = 60000,
         account_id: str = "platform_account_ID",
+        compression: Optional[Compression] = None,
     ):
         super().__init__(
             access_token=access_token,
@@ -216,6 +218,7 @@ class BoomiAsync(Boomi):
             base_url=base_url,
             timeout=timeout,
             account_id=account_id,
+            compression=compression,
         )
 
         self.as2_connector_record = As2ConnectorRecordServiceAsync(
@@ -484,9 +487,10 @@ class BoomiAsync(Boomi):
             base_url=self._base_url
         )
 
-        # Re-apply auth, URL, and timeout to the new async service instances
+        # Re-apply auth, URL, timeout, and compression to the new async service instances
         # (super().__init__ applied these to sync services that were just replaced)
         self.set_access_token(access_token)
         self.set_basic_auth(username=username, password=password)
         self.set_base_url(self._base_url)
         self.set_timeout(timeout)
+        self.set_compression(compression or Compression())
@@ -32,3 +32,17 @@ class ConnectorDocumentServiceAsync(ConnectorDocumentService):
         return await to_async(self._poll_download_url)(
             result.url, max_retries=max_retries, initial_delay=initial_delay
         )
+
+    async def download_connector_document_to_file(
+        self,
+        path: str,
+        request_body: ConnectorDocument = None,
+        max_retries: int = 10,
+        initial_delay: float = 2.0,
+    ) -> int:
+        result = await self.create_connector_document(request_body=request_body)
+        if not hasattr(result, "url") or not result.url:
+            raise ApiError("No download URL in response", 0, result)
+        return await to_async(self._poll_download_url_to_file)(
+            result.url, path, max_retries=max_retries, initial_delay=initial_delay
+        )
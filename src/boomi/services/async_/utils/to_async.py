@@ -1,9 +1,14 @@
 
 import asyncio
-from typing import TypeVar, Awaitable, Callable
+import functools
+from typing import TypeVar, AsyncGenerator, Awaitable, Callable, Iterable
 
 T = TypeVar("T")
 
+# How long a cancelled to_async_iterator waits for a stalled next() call
+# before leaving the iterator to be closed in the background.
+_CLOSE_WAIT_SECONDS = 1.0
+
 
 def to_async(sync_func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
     """
@@ -19,3 +24,52 @@ def to_async(sync_func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
         return await asyncio.to_thread(sync_func, *args, **kwargs)
 
     return async_func
+
+
+async def to_async_iterator(sync_iterable: Iterable[T]) -> AsyncGenerator[T, None]:
+    """
+    Converts a synchronous iterable to an asynchronous generator.
+
+    Each item is produced in a worker thread only when the consumer asks for
+    it, so a blocking iterator (e.g. a streamed response) is read no faster
+    than it is consumed. Closing the generator closes the iterator.
+
+    :param sync_iterable: The synchronous iterable to convert.
+    :type sync_iterable: Iterable[T]
+    :return: The asynchronous generator.
+    :rtype: AsyncGenerator[T, None]
+    """
+    iterator = iter(sync_iterable)
+    done = object()
+    pending = None
+    try:
+        while True:
+            pending = asyncio.ensure_future(asyncio.to_thread(next, iterator, done))
+            # Shielded, so a cancelled consumer leaves the running next() call
+            # in place instead of losing track of it.
+            item = await asyncio.shield(pending)
+            if item is done:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if pending is not None and not pending.done():
+            # Cancelled while the worker thread is inside next(): closing an
+            # executing generator fails, so give that call a moment to return.
+            await asyncio.wait({pending}, timeout=_CLOSE_WAIT_SECONDS)
+        if pending is not None and not pending.done():
+            # Still stalled: close once next() returns instead of holding up
+            # the cancelled caller.
+            pending.add_done_callback(functools.partial(_close_after, close))
+        else:
+            if pending is not None and not pending.cancelled():
+                pending.exception()
+            if close is not None:
+                await asyncio.to_thread(close)
+
+
+def _close_after(close: Callable[[], None], pending: asyncio.Future) -> None:
+    if not pending.cancelled():
+        pending.exception()
+    if close is not None:
+        asyncio.get_running_loop().run_in_executor(None, close)
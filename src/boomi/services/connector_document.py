@@ -68,3 +68,33 @@ class ConnectorDocumentService(BaseService):
         return self._poll_download_url(
             result.url, max_retries=max_retries, initial_delay=initial_delay
         )
+
+    def download_connector_document_to_file(
+        self,
+        path: str,
+        request_body: ConnectorDocument = None,
+        max_retries: int = 10,
+        initial_delay: float = 2.0,
+    ) -> int:
+        """Request raw document data for a specific Generic Connector Record and stream it to a file.
+
+        Same two-phase download as download_connector_document(), but the content is
+        written to ``path`` in chunks instead of being held in memory.
+
+        :param path: The destination file.
+        :type path: str
+        :param request_body: The request body., defaults to None
+        :type request_body: ConnectorDocument, optional
+        :param max_retries: Maximum number of polling attempts., defaults to 10
+        :type max_retries: int
+        :param initial_delay: Initial delay in seconds between retries., defaults to 2.0
+        :type initial_delay: float
+        :return: The number of bytes written.
+        :rtype: int
+        """
+        result = self.create_connector_document(request_body=request_body)
+        if not hasattr(result, "url") or not result.url:
+            raise ApiError("No download URL in response", 0, result)
+        return self._poll_download_url_to_file(
+            result.url, path, max_retries=max_retries, initial_delay=initial_delay
+        )
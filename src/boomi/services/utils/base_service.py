@@ -1,14 +1,17 @@
 
+import os
 import time
 import urllib.request
 import urllib.error
-from typing import Any, Dict, Tuple, Generator
+from typing import Any, AsyncGenerator, Dict, Tuple, Generator, Union
 from enum import Enum
 
 from .default_headers import DefaultHeaders, DefaultHeadersKeys
 
 from ...net.headers.base_header import BaseHeader
 
+from ...net.transport.compression import Compression, iter_decoded
+from ...net.transport.event_stream import DEFAULT_STREAM_CHUNK_SIZE
 from ...net.transport.request import Request
 from ...net.transport.response import base_media_type
 from ...net.transport.api_error import ApiError
@@ -19,6 +22,7 @@ from ...net.request_chain.handlers.http_handler import HttpHandler
 from ...net.headers.access_token_auth import AccessTokenAuth
 from ...net.headers.basic_auth import BasicAuth
 from ...net.request_chain.handlers.retry_handler import RetryHandler
+from ..async_.utils.to_async import to_async_iterator
 
 
 class BaseService:
@@ -38,6 +42,9 @@ class BaseService:
         self.base_url = base_url
         self._default_headers = DefaultHeaders()
         self._timeout = 60000
+        self._compression = Compression()
+        self._stream_chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+        self._auth_headers = None
 
         self._update_request_handler()
 
@@ -79,6 +86,30 @@ class BaseService:
         """
         return self._default_headers.get_header(DefaultHeadersKeys.BASIC_AUTH)
 
+    def get_auth_headers(self) -> Dict[str, str]:
+        """
+        Get the headers of every configured credential, merged in the order a
+        ``Serializer`` applies them.
+
+        The merged dictionary is rebuilt only after a credential changes; the
+        same dictionary is returned until then, so callers must not modify it.
+
+        :return: The authentication headers.
+        :rtype: Dict[str, str]
+        """
+        sources = [header.get_headers() for header in self._default_headers.get_headers()]
+        cached = self._auth_headers
+        if (
+            cached is None
+            or len(cached[0]) != len(sources)
+            or any(old is not new for old, new in zip(cached[0], sources))
+        ):
+            merged = {}
+            for headers in sources:
+                merged.update(headers)
+            self._auth_headers = cached = (sources, merged)
+        return cached[1]
+
     def set_timeout(self, timeout: int):
         """
         Sets the timeout for the service.
@@ -100,6 +131,50 @@ class BaseService:
         """
         return self._timeout
 
+    def set_compression(self, compression: Compression):
+        """
+        Sets the HTTP compression settings for the service.
+
+        :param Compression compression: The compression settings to be set.
+        :return: The service instance.
+        """
+        self._compression = compression
+        self._update_request_handler()
+
+        return self
+
+    def get_compression(self) -> Compression:
+        """
+        Get the HTTP compression settings.
+
+        :return: The compression settings.
+        :rtype: Compression
+        """
+        return self._compression
+
+    def set_stream_chunk_size(self, stream_chunk_size: int):
+        """
+        Sets the number of bytes read per chunk of a streamed response.
+
+        :param int stream_chunk_size: The chunk size in bytes.
+        :return: The service instance.
+        """
+        if stream_chunk_size < 1:
+            raise ValueError("stream_chunk_size must be a positive number of bytes")
+        self._stream_chunk_size = stream_chunk_size
+        self._update_request_handler()
+
+        return self
+
+    def get_stream_chunk_size(self) -> int:
+        """
+        Get the number of bytes read per chunk of a streamed response.
+
+        :return: The chunk size in bytes.
+        :rtype: int
+        """
+        return self._stream_chunk_size
+
     def set_base_url(self, base_url: str):
         """
         Sets the base URL for the service.
@@ -128,21 +203,25 @@ class BaseService:
             base_media_type(response.headers.get("Content-Type", "").lower()),
         )
 
-    def send_request_raw(self, request: Request) -> Tuple[bytes, int, str]:
+    def send_request_raw(
+        self, request: Request, view: bool = False
+    ) -> Tuple[Union[bytes, memoryview], int, str]:
         """Send a request and return the raw, undecoded response body bytes.
 
         Unlike :meth:`send_request`, this bypasses all content-type-based body
-        parsing and text decoding, so opaque payloads (e.g. Component XML) are
-        returned byte-for-byte identical to a direct API call. Used by the
-        raw-only Component endpoints.
+        parsing and text decoding (the response body is never decoded), so
+        opaque payloads (e.g. Component XML) are returned byte-for-byte
+        identical to a direct API call. Used by the raw-only Component endpoints.
 
         :param Request request: The request to be sent.
+        :param bool view: Return a read-only ``memoryview`` of the body instead
+            of the bytes, for slicing large payloads without copies.
         :return: ``(raw_bytes, status, content_type)``.
-        :rtype: Tuple[bytes, int, str]
+        :rtype: Tuple[Union[bytes, memoryview], int, str]
         """
         response = self._request_handler.send(request)
         return (
-            response.raw_body,
+            response.raw_view if view else response.raw_body,
             response.status,
             base_media_type(response.headers.get("Content-Type", "").lower()),
         )
@@ -220,12 +299,53 @@ class BaseService:
         :return: A generator of the response data.
         :rtype: Generator[Dict, None, None]
         """
+        media_type = None
         for response in self._request_handler.stream(request):
-            yield (
-                response.body,
-                response.status,
-                base_media_type(response.headers.get("Content-Type", "").lower()),
-            )
+            # Every chunk of a stream shares its headers.
+            if media_type is None:
+                media_type = base_media_type(
+                    response.headers.get("Content-Type", "").lower()
+                )
+            yield response.body, response.status, media_type
+
+    def stream_request_async(
+        self, request: Request
+    ) -> AsyncGenerator[Tuple[Any, int, str], None]:
+        """
+        Async variant of :meth:`stream_request`.
+
+        Each chunk is read in a worker thread only when the consumer asks for
+        it, so a slow consumer applies back-pressure to the connection.
+
+        :param Request request: The request to be streamed.
+        :return: An async generator of the response data.
+        :rtype: AsyncGenerator[Tuple[Any, int, str], None]
+        """
+        return to_async_iterator(self.stream_request(request))
+
+    def stream_request_raw(self, request: Request) -> Generator[bytes, None, None]:
+        """Stream a request and yield the raw, undecoded body chunks.
+
+        The streaming counterpart of :meth:`send_request_raw` for large JSON
+        documents decoded incrementally (see :class:`JsonArrayStream`).
+
+        :param Request request: The request to be streamed.
+        :return: A generator of body chunks.
+        :rtype: Generator[bytes, None, None]
+        """
+        for response in self._request_handler.stream(request):
+            yield response.raw_body
+
+    def stream_request_raw_async(self, request: Request) -> AsyncGenerator[bytes, None]:
+        """
+        Async variant of :meth:`stream_request_raw`, read on demand like
+        :meth:`stream_request_async`.
+
+        :param Request request: The request to be streamed.
+        :return: An async generator of body chunks.
+        :rtype: AsyncGenerator[bytes, None]
+        """
+        return to_async_iterator(self.stream_request_raw(request))
 
     def get_default_headers(self) -> list:
         """
@@ -247,7 +367,9 @@ class BaseService:
             RequestChain()
             .add_handler(HookHandler())
             .add_handler(RetryHandler())
-            .add_handler(HttpHandler(self._timeout))
+            .add_handler(
+                HttpHandler(self._timeout, self._compression, self._stream_chunk_size)
+            )
         )
 
     def _poll_download_url(
@@ -265,16 +387,7 @@ class BaseService:
         :return: The raw downloaded content.
         :rtype: bytes
         """
-        auth_headers = {}
-        basic_auth = self.get_basic_auth()
-        if basic_auth is not None:
-            auth_headers = basic_auth.get_headers()
-        if not auth_headers:
-            access_token = self.get_access_token()
-            if access_token is not None:
-                auth_headers = access_token.get_headers()
-        if not auth_headers:
-            raise ApiError("No authentication configured for download", 401, None)
+        auth_headers = self._download_auth_headers()
 
         delay = initial_delay
         for attempt in range(max_retries):
@@ -296,7 +409,12 @@ class BaseService:
                             202,
                             None,
                         )
-                    content = response.read()
+                    content = b"".join(
+                        iter_decoded(
+                            response.read,
+                            response.headers.get("Content-Encoding"),
+                        )
+                    )
                     if len(content) == 0 and attempt < max_retries - 1:
                         continue
                     return content
@@ -305,6 +423,94 @@ class BaseService:
 
         raise ApiError(f"Download timed out after {max_retries} retries", 408, None)
 
+    def _poll_download_url_to_file(
+        self,
+        url: str,
+        path: str,
+        max_retries: int = 10,
+        initial_delay: float = 2.0,
+        chunk_size: int = 64 * 1024,
+    ) -> int:
+        """
+        Poll a Boomi download URL like :meth:`_poll_download_url`, streaming the
+        content to ``path`` instead of holding it in memory.
+
+        The content is written to ``<path>.partial`` in ``chunk_size`` reads and
+        moved into place only once complete, so ``path`` never holds a
+        truncated download.
+
+        :param str url: The absolute download URL returned by a create_* method.
+        :param str path: The destination file.
+        :param int max_retries: Maximum number of polling attempts. Defaults to 10.
+        :param float initial_delay: Initial delay in seconds between retries. Defaults to 2.0.
+        :param int chunk_size: Bytes read per chunk. Defaults to 64 KiB.
+        :return: The number of bytes written.
+        :rtype: int
+        """
+        auth_headers = self._download_auth_headers()
+        temporary_path = f"{path}.partial"
+
+        delay = initial_delay
+        for attempt in range(max_retries):
+            if attempt > 0:
+                time.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+            req = urllib.request.Request(url, headers=auth_headers)
+            try:
+                with urllib.request.urlopen(
+                    req, timeout=self._timeout / 1000
+                ) as response:
+                    if response.status == 202:
+                        if attempt < max_retries - 1:
+                            continue
+                        raise ApiError(
+                            f"Download not ready after {max_retries} attempts",
+                            202,
+                            None,
+                        )
+                    size = 0
+                    with open(temporary_path, "wb") as file:
+                        for chunk in iter_decoded(
+                            response.read,
+                            response.headers.get("Content-Encoding"),
+                            chunk_size,
+                        ):
+                            file.write(chunk)
+                            size += len(chunk)
+                    if size == 0 and attempt < max_retries - 1:
+                        continue
+                    os.replace(temporary_path, path)
+                    return size
+            except urllib.error.HTTPError as e:
+                raise ApiError(f"Download failed with HTTP {e.code}", e.code, None)
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+        raise ApiError(f"Download timed out after {max_retries} retries", 408, None)
+
+    def _download_auth_headers(self) -> Dict[str, str]:
+        """
+        Get the authentication headers sent with download URL requests.
+
+        :return: The basic auth headers, or the bearer token headers, with
+            the negotiated ``Accept-Encoding``.
+        :rtype: Dict[str, str]
+        :raises ApiError: If no authentication is configured.
+        """
+        auth_headers = {}
+        basic_auth = self.get_basic_auth()
+        if basic_auth is not None:
+            auth_headers = basic_auth.get_headers()
+        if not auth_headers:
+            access_token = self.get_access_token()
+            if access_token is not None:
+                auth_headers = access_token.get_headers()
+        if not auth_headers:
+            raise ApiError("No authentication configured for download", 401, None)
+        return {**auth_headers, "Accept-Encoding": self._compression.accept_encoding}
+
     def _update_request_handler(self) -> None:
         """
         Update the request handler.
@@ -1,7 +1,8 @@
 
 import re
 import operator
-from typing import Union, Any, Type, Pattern, get_args
+from functools import lru_cache
+from typing import Dict, Union, Any, Type, Pattern, get_args
 from ...models.utils.sentinel import was_value_set
 from ...models.utils.one_of_base_model import OneOfBaseModel
 
@@ -21,6 +22,7 @@ class Validator:
     :ivar bool _min_exclusive: Flag indicating whether the minimum value is exclusive.
     :ivar int _max: The maximum value for validating the value.
     :ivar bool _max_exclusive: Flag indicating whether the maximum value is exclusive.
+    :ivar bool _has_rules: Flag indicating whether any value rule was specified.
     """
 
     def __init__(self, _type: Type[Any] = None):
@@ -40,6 +42,7 @@ class Validator:
         self._min_exclusive: bool = False
         self._max: int = None
         self._max_exclusive: bool = False
+        self._has_rules: bool = False
 
     def is_array(self) -> "Validator":
         """
@@ -79,7 +82,8 @@ class Validator:
         :return: The Validator instance for method chaining.
         :rtype: Validator
         """
-        self._pattern = re.compile(pattern)
+        self._pattern = _compiled_pattern(pattern)
+        self._has_rules = True
         return self
 
     def min(self, min: int, exclusive=False) -> "Validator":
@@ -93,6 +97,7 @@ class Validator:
         """
         self._min = min
         self._min_exclusive = exclusive
+        self._has_rules = True
         return self
 
     def max(self, max: int, exclusive=False) -> "Validator":
@@ -106,6 +111,7 @@ class Validator:
         """
         self._max = max
         self._max_exclusive = exclusive
+        self._has_rules = True
         return self
 
     def min_length(self, min_length: int) -> "Validator":
@@ -117,6 +123,7 @@ class Validator:
         :rtype: Validator
         """
         self._min_length = min_length
+        self._has_rules = True
         return self
 
     def max_length(self, max_length: int) -> "Validator":
@@ -128,6 +135,7 @@ class Validator:
         :rtype: Validator
         """
         self._max_length = max_length
+        self._has_rules = True
         return self
 
     def validate(self, value: Any) -> None:
@@ -147,7 +155,8 @@ class Validator:
             return
 
         self._validate_type(value)
-        self._validate_rules(value)
+        if self._has_rules:
+            self._validate_rules(value)
 
     def _validate_type(self, value: Any) -> None:
         """
@@ -170,12 +179,7 @@ class Validator:
         :param Any value: The input that needs to be checked
         :raises ValueError: If the value does not match the oneOf rules.
         """
-        class_list = {
-            arg.__name__: arg
-            for arg in get_args(self._type)
-            if hasattr(arg, "__name__")
-        }
-        OneOfBaseModel.class_list = class_list
+        OneOfBaseModel.class_list = _one_of_class_list(self._type)
         OneOfBaseModel.return_one_of(value)
 
     def _validate_array_type(self, value: Any) -> None:
@@ -240,3 +244,17 @@ class Validator:
         :rtype: bool
         """
         return hasattr(cls_type, "__origin__") and cls_type.__origin__ is Union
+
+
+@lru_cache(maxsize=None)
+def _compiled_pattern(pattern: str) -> Pattern[str]:
+    """Compile a validation pattern once."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def _one_of_class_list(one_of_type: Any) -> Dict[str, Any]:
+    """Map class names to the classes of a oneOf type, once per type."""
+    return {
+        arg.__name__: arg for arg in get_args(one_of_type) if hasattr(arg, "__name__")
+    }